@@ -4,8 +4,10 @@
 # Written by andi mcc with help from agg23 and whitequark
 # Covered by BSD0 license in src/fpga/amaranth_core/LICENSE.txt
 
-# Usage: python resolution.py WIDTH HEIGHT
+# Usage: python resolution.py WIDTH HEIGHT [HZ]
 # Then wait for prompt
+# Or, without prompting: python resolution.py WIDTHxHEIGHT[@HZ] [WIDTHxHEIGHT[@HZ] ...] [options]
+# See --help. Can also be imported, see solve(), configure() and write_config()
 
 FRAMERATE_HZ_DEFAULT = 60
 MHZ = 1_000_000
@@ -30,84 +32,308 @@ PORCH_MIN = 8
 PORCHED_MAX = 1024
 
 import sys
+import json
 import math
 import fractions
+import argparse
+import concurrent.futures
+from pathlib import Path
+import numpy as np
 
-# Import args
-# Todo get click in here
-_, display_x, display_y, *hz = sys.argv
-display_x = int(display_x)
-display_y = int(display_y)
-display_hz = float(hz[0]) if hz else 60
+# How many options to offer
+QUEUE_MAX = 10
 
-assert display_x >= RES_X_MIN and display_y>=RES_Y_MIN, f"Minimum resolution {RES_X_MIN}x{RES_Y_MIN}"
-assert display_x <= RES_X_MAX and display_y<=RES_Y_MAX, f"Maximum resolution {RES_X_MAX}x{RES_Y_MAX}"
-assert display_hz >= FRAMERATE_HZ_MIN, "Minimum framerate {FRAMERATE_HZ_MIN}hz"
-assert display_hz <= FRAMERATE_HZ_MAX, "Maximum framerate {FRAMERATE_HZ_MAX}hz"
+ROOT = Path(__file__).resolve().parent.parent
+RESOLUTION_PATH = ROOT / "src" / "fpga" / "amaranth_core" / "embed_amaranth_core" / "resolution.py"
+VIDEO_JSON_PATH = ROOT / "video.json"
 
-# Organize options in a duct-taped priority queue
-QUEUE_MAX = 10
-found_queue = []
-
-# Brute force
-for candidate_x in range(display_x + PORCH_MIN, PORCHED_MAX):
-	for candidate_y in range(display_y + PORCH_MIN, PORCHED_MAX):
-		for candidate_divisor in range(4, 64, 4):
-			clock_hz = REFERENCE_MHZ * MHZ / (candidate_divisor*candidate_y*candidate_x)
-			if clock_hz < FRAMERATE_HZ_MIN or clock_hz > FRAMERATE_HZ_MAX:
-				continue
-			clock_error_hz = math.fabs(display_hz - clock_hz)
-
-			underflow = len(found_queue) < QUEUE_MAX
-			if underflow or found_queue[QUEUE_MAX-1][0] < clock_error_hz:
-				candidate = (clock_error_hz, clock_hz, candidate_x, candidate_y, candidate_divisor)
-				found_queue.append(candidate)
-				found_queue.sort(key=lambda x:x[0])
-				if not underflow:
-					found_queue.pop()
-
-# Results
-for found_idx, found in enumerate(found_queue):
+# Fewest clocks per pixel. PixelClockDiv divides by any fraction above this, but shorter pixels leave
+# no room for the 90 degree clock
+DIVISOR_MIN = 4
+
+# Widest divider (see divider_bits) a fractional divisor may need. The display PLL can't make them
+# (see divisor_path), and past this they cost more logic than an exact framerate in simulation is worth
+FRACTION_BITS_MAX = 16
+
+# Total heights tried for each total width at a fractional divisor, from the shortest allowed
+FRACTION_HEIGHTS = 32
+
+# Bits of phase accumulator PixelClockDiv needs for `divisor`, which grow with its numerator
+def divider_bits(divisor):
+	numerator = fractions.Fraction(divisor).numerator
+	return (numerator * (4 // math.gcd(numerator, 4)) - 1).bit_length()
+
+# Whether the display PLL can make the pixel clock for `divisor`, and so what running on hardware
+# takes. With USE_EXTERNAL_DISPLAY_CLOCK (toplevel.py), the default, the pixel clock comes from the
+# first output of the PLL in core_top.v, which has to be set to REFERENCE_MHZ / divisor; only whole
+# divisors are sure to come out exactly. PixelClockDiv divides the reference by any of them exactly,
+# but only drives the display with USE_EXTERNAL_DISPLAY_CLOCK = False
+def divisor_path(divisor):
+	if fractions.Fraction(divisor).denominator == 1:
+		return "exact with the PLL or PixelClockDiv"
+	return "exact with PixelClockDiv (USE_EXTERNAL_DISPLAY_CLOCK = False), the PLL only gets close"
+
+# Returns the (at most) `count` configurations whose framerate is closest to display_hz, best first,
+# as (clock_error_hz, clock_hz, total_x, total_y, divisor) tuples, the divisor being a Fraction.
+# Exact fits come first, then ties go to whole divisors, which the display PLL can make (see
+# divisor_path), then to the smallest total size, as before. bits_max rules out divisors that need
+# a bigger divider than that, and whole=True any but whole divisors.
+def solve(display_x, display_y, display_hz=FRAMERATE_HZ_DEFAULT, count=QUEUE_MAX, bits_max=None, whole=False):
+	reference_hz = REFERENCE_MHZ * MHZ
+	divisor_min = max(DIVISOR_MIN, REFERENCE_MHZ / PIXEL_MHZ_MAX)
+	divisor_max = REFERENCE_MHZ / PIXEL_MHZ_MIN
+	y_min = display_y + PORCH_MIN
+
+	# Whole divisors. For a fixed total width and divisor the framerate only gets further from
+	# display_hz as total height moves away from its ideal value, so rather than trying every height,
+	# try only the `count` heights either side of the ideal one (kept inside the allowed range), and
+	# only for the width/divisor pairs whose closest height is among the `count` best of them. The
+	# smallest divisor also gives sizes too big for display_hz the closest framerate they can get
+	x = np.arange(display_x + PORCH_MIN, PORCHED_MAX)[:, None]
+	divisor = np.arange(math.ceil(divisor_min), math.floor(divisor_max) + 1)
+	if bits_max is not None:
+		divisor = divisor[[divider_bits(int(d)) <= bits_max for d in divisor]]
+	frame_hz = reference_hz / (divisor[None, :] * x) # Framerate is this over total height
+	y_lo = np.maximum(y_min, np.ceil(frame_hz / FRAMERATE_HZ_MAX)).astype(np.int64)
+	y_hi = np.minimum(PORCHED_MAX, np.floor(frame_hz / FRAMERATE_HZ_MIN) + 1).astype(np.int64)
+	y_ideal = np.floor(frame_hz / display_hz).astype(np.int64)
+
+	y_near = np.clip(np.stack([y_ideal, y_ideal + 1]), y_lo, np.maximum(y_lo, y_hi - 1))
+	near_error = np.abs(display_hz - frame_hz / y_near).min(axis=0).round(9)
+	near_error[y_lo >= y_hi] = np.inf
+	if near_error.size > count:
+		near_error[near_error > np.partition(near_error.ravel(), count - 1)[count - 1]] = np.inf
+	pairs = np.isfinite(near_error)
+	x, divisor, y_lo, y_hi, y_ideal = (np.broadcast_to(a, pairs.shape)[pairs][:, None]
+		for a in (x, divisor[None, :], y_lo, y_hi, y_ideal))
+
+	y_start = np.clip(y_ideal - count + 1, y_lo, np.maximum(y_lo, y_hi - 2*count))
+	y = y_start + np.arange(2*count)
+	valid = y < y_hi
+	x, divisor, y = np.broadcast_arrays(x, divisor, y)
+	candidates = [(divisor * x * y)[valid], x[valid], y[valid]]
+
+	# Fractional divisors. As PixelClockDiv divides by fractions, any total size can be given either
+	# frame length around display_hz, so long as the divisor stays in range: for every width, try the
+	# FRACTION_HEIGHTS shortest heights the divisor range allows, at both. Divisors needing a divider
+	# wider than FRACTION_BITS_MAX are dropped below
+	if not whole:
+		frame_clocks = reference_hz / display_hz
+		frame_clocks = np.unique([math.floor(frame_clocks), math.ceil(frame_clocks)])[:, None, None]
+		x = np.arange(display_x + PORCH_MIN, PORCHED_MAX)[None, :, None]
+		y = np.maximum(y_min, np.ceil(frame_clocks / (divisor_max * x))).astype(np.int64) + \
+			np.arange(FRACTION_HEIGHTS)[None, None, :]
+		# Those that come out whole are among the whole divisors already
+		valid = (y < PORCHED_MAX) & (frame_clocks >= divisor_min * x * y) & (frame_clocks % (x * y) != 0)
+		frame_clocks, x, y = np.broadcast_arrays(frame_clocks, x, y)
+		candidates = [np.concatenate([a, b[valid]]) for a, b in zip(candidates, (frame_clocks, x, y))]
+
+	frame_clocks, x, y = candidates
+	clock_hz = reference_hz / frame_clocks
+	valid = (clock_hz >= FRAMERATE_HZ_MIN) & (clock_hz <= FRAMERATE_HZ_MAX)
+	frame_clocks, clock_hz, x, y = frame_clocks[valid], clock_hz[valid], x[valid], y[valid]
+	clock_error_hz = np.abs(display_hz - clock_hz).round(9) # So exact matches tie despite float noise
+
+	# Divisor is frame_clocks / (x * y), reduced. Fractions need a divider as wide as their numerator
+	common = np.gcd(frame_clocks, x * y)
+	numerator, denominator = frame_clocks // common, x * y // common
+	bits = np.ceil(np.log2(numerator * (4 // np.gcd(numerator, 4)))).astype(np.int64)
+	fits = (denominator == 1) | (bits <= FRACTION_BITS_MAX)
+	if bits_max is not None:
+		fits &= bits <= bits_max
+	clock_error_hz, clock_hz, x, y, numerator, denominator, bits = \
+		(a[fits] for a in (clock_error_hz, clock_hz, x, y, numerator, denominator, bits))
+
+	# Partition out everything at least as good as the count-th best, then order just those
+	if len(clock_error_hz) > count:
+		worst = np.partition(clock_error_hz, count - 1)[count - 1]
+		best = clock_error_hz <= worst
+		clock_error_hz, clock_hz, x, y, numerator, denominator, bits = \
+			(a[best] for a in (clock_error_hz, clock_hz, x, y, numerator, denominator, bits))
+	order = np.lexsort((bits, y, x, denominator != 1, clock_error_hz))[:count]
+
+	return [(float(clock_error_hz[i]), float(clock_hz[i]), int(x[i]), int(y[i]),
+		fractions.Fraction(int(numerator[i]), int(denominator[i]))) for i in order]
+
+def check_target(display_x, display_y, display_hz):
+	assert display_x >= RES_X_MIN and display_y>=RES_Y_MIN, f"Minimum resolution {RES_X_MIN}x{RES_Y_MIN}"
+	assert display_x <= RES_X_MAX and display_y<=RES_Y_MAX, f"Maximum resolution {RES_X_MAX}x{RES_Y_MAX}"
+	assert display_hz >= FRAMERATE_HZ_MIN, f"Minimum framerate {FRAMERATE_HZ_MIN}hz"
+	assert display_hz <= FRAMERATE_HZ_MAX, f"Maximum framerate {FRAMERATE_HZ_MAX}hz"
+
+# Turns one of solve()'s results into the values for resolution.py
+def configure(display_x, display_y, found):
 	(_, hz, x, y, divisor) = found
-	print(f"({found_idx}) Divisor {divisor} ({REFERENCE_MHZ/divisor:0.3f} mhz), {x}x{y}, {hz:0.3f} fps")
+	return {
+		"VID_DIV_RATIO": int(divisor) if divisor.denominator == 1 else divisor,
+		"VID_H_BPORCH": (x-display_x) // 2,
+		"VID_H_ACTIVE": display_x,
+		"VID_H_TOTAL": x,
+		"VID_V_BPORCH": (y-display_y) // 2,
+		"VID_V_ACTIVE": display_y,
+		"VID_V_TOTAL": y,
+		"hz": hz,
+	}
 
-picked = int(input("\nSelect preferred configuration: "))
+def divisor_source(divisor):
+	divisor = fractions.Fraction(divisor)
+	return str(divisor) if divisor.denominator == 1 else f"Fraction({divisor.numerator}, {divisor.denominator})"
 
-(_, hz, x, y, divisor) = found_queue[picked]
+def divisor_text(divisor):
+	return f"Divisor {fractions.Fraction(divisor)} ({REFERENCE_MHZ/divisor:0.6f} mhz, {divider_bits(divisor)}-bit divider; {divisor_path(divisor)})"
 
-porch_x = (x-display_x) // 2
-porch_y = (y-display_y) // 2
+def resolution_source(config):
+	header = "" if fractions.Fraction(config["VID_DIV_RATIO"]).denominator == 1 else "from fractions import Fraction\n\n"
+	return f"""{header}# ~{REFERENCE_MHZ/config['VID_DIV_RATIO']:0.3f} mhz clock; {config['hz']:0.3f} fps
+VID_DIV_RATIO = {divisor_source(config['VID_DIV_RATIO'])}
+VID_H_BPORCH = {config['VID_H_BPORCH']}
+VID_H_ACTIVE = {config['VID_H_ACTIVE']}
+VID_H_TOTAL  = {config['VID_H_TOTAL']}
+VID_V_BPORCH = {config['VID_V_BPORCH']}
+VID_V_ACTIVE = {config['VID_V_ACTIVE']}
+VID_V_TOTAL  = {config['VID_V_TOTAL']}"""
 
-aspect = fractions.Fraction(display_x, display_y)
+def scaler_mode(config):
+	aspect = fractions.Fraction(config["VID_H_ACTIVE"], config["VID_V_ACTIVE"])
+	return {
+		"width": config["VID_H_ACTIVE"],
+		"height": config["VID_V_ACTIVE"],
+		"aspect_w": aspect.numerator,
+		"aspect_h": aspect.denominator,
+		"rotation": 0,
+		"mirror": 0,
+	}
 
-print(f"""
-# Top of toplevel.py
+def video_json_source(config, template_path=VIDEO_JSON_PATH):
+	try:
+		video = json.loads(Path(template_path).read_text())
+	except FileNotFoundError:
+		video = {"video": {"magic": "APF_VER_1"}}
+	video["video"]["scaler_modes"] = [scaler_mode(config)]
+	return json.dumps(video, indent=4)
 
-# ~{REFERENCE_MHZ/divisor:0.3f} mhz clock; {hz:0.3f} fps
-VID_DIV_RATIO = {divisor}
-VID_H_BPORCH = {porch_x}
-VID_H_ACTIVE = {display_x}
-VID_H_TOTAL  = {x}
-VID_V_BPORCH = {porch_y}
-VID_V_ACTIVE = {display_y}
-VID_V_TOTAL  = {y}
+# Writes resolution.py and video.json for one configuration. Files that already hold the same
+# text are left alone, so nothing downstream sees a change.
+def write_config(config, resolution_path=RESOLUTION_PATH, video_json_path=VIDEO_JSON_PATH):
+	for path, text in ((resolution_path, resolution_source(config)),
+	                   (video_json_path, video_json_source(config, video_json_path))):
+		path = Path(path)
+		newline = None
+		if path.exists():
+			old = path.read_bytes().decode()
+			if old.replace("\r\n", "\n") == text:
+				continue
+			if "\r\n" in old: # Keep the line endings the file already has
+				newline = "\r\n"
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_text(text, newline=newline)
+
+def _solve_target(target):
+	display_x, display_y, display_hz, pick, bits_max, whole = target
+	found_queue = solve(display_x, display_y, display_hz, pick + 1, bits_max, whole)
+	if len(found_queue) <= pick:
+		return None
+	return configure(display_x, display_y, found_queue[pick])
+
+# Solves each (display_x, display_y, display_hz) target, taking the pick-th best candidate of each.
+# Targets with no such candidate (the pixel clock can't go fast enough) come back as None.
+def solve_many(targets, pick=0, jobs=None, bits_max=None, whole=False):
+	with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+		return list(pool.map(_solve_target, [(*target, pick, bits_max, whole) for target in targets]))
+
+def parse_target(text):
+	size, _, hz = text.partition("@")
+	display_x, _, display_y = size.partition("x")
+	return int(display_x), int(display_y), float(hz) if hz else FRAMERATE_HZ_DEFAULT
+
+def target_name(display_x, display_y, display_hz):
+	name = f"{display_x}x{display_y}"
+	if display_hz != FRAMERATE_HZ_DEFAULT:
+		name += f"@{display_hz:g}"
+	return name
+
+def interactive(display_x, display_y, display_hz):
+	check_target(display_x, display_y, display_hz)
+	found_queue = solve(display_x, display_y, display_hz)
+	if all(found[4].denominator != 1 for found in found_queue):
+		# Offer the best the display PLL can make too
+		found_queue += solve(display_x, display_y, display_hz, count=3, whole=True)
+
+	# Results
+	for found_idx, found in enumerate(found_queue):
+		(_, hz, x, y, divisor) = found
+		print(f"({found_idx}) {divisor_text(divisor)}, {x}x{y}, {hz:0.3f} fps")
+
+	picked = int(input("\nSelect preferred configuration: "))
+	config = configure(display_x, display_y, found_queue[picked])
+
+	print(f"""
+# embed_amaranth_core/resolution.py
+
+{resolution_source(config)}
 
 # video.json
 
-{{
-    "video": {{
-        "magic": "APF_VER_1",
-        "scaler_modes": [
-            {{
-                "width": {display_x},
-                "height": {display_y},
-                "aspect_w": {aspect.numerator},
-                "aspect_h": {aspect.denominator},
-                "rotation": 0,
-                "mirror": 0
-            }}
-        ]
-    }}
-}}
-
-""")
\ No newline at end of file
+{video_json_source(config)}
+""")
+
+def batch(argv):
+	parser = argparse.ArgumentParser(prog="resolution.py",
+		description="Pick video timings for one or more target resolutions without prompting")
+	parser.add_argument("targets", nargs="+", type=parse_target, metavar="WIDTHxHEIGHT[@HZ]",
+		help=f"resolution and framerate (default {FRAMERATE_HZ_DEFAULT}hz) to solve for")
+	parser.add_argument("--pick", type=int, default=0,
+		help="use the Nth closest configuration instead of the closest")
+	parser.add_argument("--max-divider-bits", type=int, metavar="BITS",
+		help="only use pixel clock divisors whose divider fits in BITS bits of accumulator")
+	parser.add_argument("--whole-divisor", action="store_true",
+		help="only use whole pixel clock divisors, which the display PLL in core_top.v can make exactly")
+	parser.add_argument("--write", action="store_true",
+		help="write the (single) target into embed_amaranth_core/resolution.py and video.json")
+	parser.add_argument("--output-dir", type=Path,
+		help="write each target's resolution.py and video.json into OUTPUT_DIR/WIDTHxHEIGHT[@HZ]/")
+	parser.add_argument("--json", action="store_true",
+		help="print the configurations as JSON instead of a table")
+	parser.add_argument("--jobs", type=int,
+		help="worker processes (default: one per CPU)")
+	args = parser.parse_args(argv)
+
+	if args.write and len(args.targets) != 1:
+		parser.error("--write takes exactly one target; use --output-dir for several")
+	for target in args.targets:
+		try:
+			check_target(*target)
+		except AssertionError as e:
+			parser.error(f"{target_name(*target)}: {e}")
+
+	configs = solve_many(args.targets, args.pick, args.jobs, args.max_divider_bits, args.whole_divisor)
+	names = [target_name(*target) for target in args.targets]
+
+	if args.json:
+		print(json.dumps(dict(zip(names, configs)), indent=4, default=str))
+	else:
+		for name, config in zip(names, configs):
+			if config is None:
+				print(f"{name:16} No configuration")
+				continue
+			print(f"{name:16} {divisor_text(config['VID_DIV_RATIO'])}, "
+				f"{config['VID_H_TOTAL']}x{config['VID_V_TOTAL']}, {config['hz']:0.3f} fps")
+
+	solved = [(name, config) for name, config in zip(names, configs) if config is not None]
+	if args.write and solved:
+		write_config(solved[0][1])
+	if args.output_dir:
+		for name, config in solved:
+			write_config(config, args.output_dir / name / "resolution.py", args.output_dir / name / "video.json")
+
+	if len(solved) < len(configs):
+		sys.exit(f"{len(configs) - len(solved)} target(s) had no configuration")
+
+if __name__ == "__main__":
+	argv = sys.argv[1:]
+	if 2 <= len(argv) <= 3 and all(arg.replace(".", "", 1).isdigit() for arg in argv):
+		# Original form: WIDTH HEIGHT [HZ], then prompt
+		display_x, display_y, *hz = argv
+		interactive(int(display_x), int(display_y), float(hz[0]) if hz else FRAMERATE_HZ_DEFAULT)
+	else:
+		batch(argv)
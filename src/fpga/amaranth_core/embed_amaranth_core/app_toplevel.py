@@ -2,11 +2,14 @@
 
 from amaranth import *
 from amaranth.lib import wiring, data
+from amaranth.lib.cdc import ResetSynchronizer
 from amaranth.lib.wiring import In, Out
 import enum
 
 from .resolution import *
 from .toplevel import Toplevel
+from .line_buffer import LineBufferEngine
+from .compute import ComputeEngine
 
 
 DEBUG_NO_OPENING_PAUSE = False
@@ -28,15 +31,48 @@ class AutoKind(enum.IntEnum):
     rule106 = 2 # Weird diagonal
     rule14 = 3 # Ultra normal diagonal
 
-AUTO_RULE_BITS = [ # Lookup byte for above. (FIXME: Generate from rule number)
-    0b00011110,
-    0b01101110,
-    0b01101010,
-    0b00001110
-]
+# Lookup byte for a rule: bit n is the next state of a cell whose neighbourhood Cat(left, cell, right)
+# is n. Any rule 0-255 can also be loaded at runtime through the bridge, see RULE_BRIDGE_ADDR.
+# (Wolfram's numbering reads the neighbourhood the other way round, so rules come out mirrored
+# left-to-right compared to the usual pictures of them.)
+def rule_table(rule):
+    assert 0 <= rule < 256, "Elementary rules are 0-255"
+    return rule
+
+AUTO_RULE_BITS = [rule_table(int(kind.name.removeprefix("rule"))) for kind in AutoKind] # Lookup byte for above
 
 AUTO_DEFAULT = AutoKind.rule30
 
+RULE_BRIDGE_ADDR = 0x10000000 # Write a rule number here to switch to it at the next frame; reads back the current rule
+
+# Generations each row is ahead of the row above it, at most. How many (1 up to this) is set at
+# runtime through the bridge, see LINE_GENERATIONS_BRIDGE_ADDR; 1 is the usual picture, more makes
+# patterns scroll by that many generations a frame. The extra generations are stepped in the
+# horizontal blanking after each row, so this has to fit in there.
+LINE_GENERATIONS_MAX = 4
+LINE_GENERATIONS_BRIDGE_ADDR = 0x10000004 # Write generations per row here to switch at the next frame
+
+# Keep CA rows in block RAM (line_buffer.py) rather than registers. The register engine's logic
+# grows with the width of the screen, and past this width gets too big to fit and meet timing.
+USE_LINE_RAM = VID_H_ACTIVE > 160
+
+# Step CA rows in a `compute` clock domain of their own, from the PLL (compute.py), instead of in
+# time with the display. Takes the place of USE_LINE_RAM
+USE_COMPUTE_DOMAIN = False
+
+# (cell, value) pairs a scribble writes to the topline
+def scribble_cells(kind, width=VID_H_ACTIVE):
+    many = 5
+    match kind:
+        case ScribbleKind.SINGLE_BLACK:
+            return [(width//2, 1)]
+        case ScribbleKind.SINGLE_WHITE:
+            return [(width//2+1, 0)]
+        case ScribbleKind.MANY_BLACK:
+            return [(off*width//many+off, 1) for off in range(many)]
+        case ScribbleKind.MANY_WHITE:
+            return [(off*width//many+off*2+1, 0) for off in range(many)]
+
 class AppToplevel(Toplevel):
     def app_elaborate(self, platform, m,
             video_pixel_stb, video_hsync_stb, video_vsync_stb, video_x_count, video_y_count, video_active, video_rgb_out,
@@ -72,13 +108,15 @@ class AppToplevel(Toplevel):
 
         # Automaton
         #automata = Signal(Shape.cast(AutoKind), reset=AUTO_DEFAULT)
-        automata_next = Signal(Shape.cast(AutoKind), reset=AUTO_DEFAULT)
-        automata_table = Signal(8, reset=AUTO_RULE_BITS[AutoKind.rule30])
+        automata_next = Signal(8, reset=AUTO_RULE_BITS[AUTO_DEFAULT]) # Lookup byte to switch to
+        automata_table = Signal(8, reset=AUTO_RULE_BITS[AUTO_DEFAULT])
         need_automata_next = Signal(1)
+        line_generations = Signal(range(LINE_GENERATIONS_MAX+1), reset=1)
+        line_generations_next = Signal(range(LINE_GENERATIONS_MAX+1), reset=1)
 
         # Scribble
-        scribble_hold = [Signal(1) for _ in range(4)]
-        scribble_single = [Signal(1) for _ in range(4)]
+        scribble_hold = [Signal(1, name=f"scribble_hold_{idx}") for idx in range(4)]
+        scribble_single = [Signal(1, name=f"scribble_single_{idx}") for idx in range(4)]
         need_scribble = Signal(1)
 
         # Audio mechanics
@@ -87,6 +125,22 @@ class AppToplevel(Toplevel):
 
         line_reset_value = None # Take me unto thine arms, GC
 
+        # What decides whether frames are frozen, for sim.frame_skipper to fast-forward over them
+        self.freeze_registers = {
+            "frame_frozen": frame_frozen,
+            "opening_countdown_timer": opening_countdown_timer,
+            "opening_countdown_timer_late_reset": opening_countdown_timer_late_reset,
+            "pause_key_wants_frozen": pause_key_wants_frozen,
+            "need_frozen_exception": need_frozen_exception,
+            "speed_counter": speed_counter,
+            "speed_counter_mask": speed_counter_mask,
+            "need_automata_next": need_automata_next,
+            "line_generations": line_generations,
+            "line_generations_next": line_generations_next,
+            **{f"scribble_hold_{idx}": signal for idx, signal in enumerate(scribble_hold)},
+            **{f"scribble_single_{idx}": signal for idx, signal in enumerate(scribble_single)},
+        }
+
         # Controls
 
         if DEBUG_NO_CONTROLS:
@@ -165,18 +219,64 @@ class AppToplevel(Toplevel):
             for idx,press in enumerate(d_press):
                 with m.Elif(press):
                     m.d.sync += [
-                        automata_next.eq(idx),
+                        automata_next.eq(AUTO_RULE_BITS[idx]),
                         need_automata_next.eq(1)
                     ]
             # TODO: Also release behavior
 
+            # Rule from the host (interact.json)
+            with m.If(self.bridge_wr & (self.bridge_addr == RULE_BRIDGE_ADDR)):
+                m.d.sync += [
+                    automata_next.eq(self.bridge_wr_data[:8]),
+                    need_automata_next.eq(1)
+                ]
+            with m.If(self.bridge_wr & (self.bridge_addr == LINE_GENERATIONS_BRIDGE_ADDR)):
+                with m.If(self.bridge_wr_data == 0):
+                    m.d.sync += line_generations_next.eq(1)
+                with m.Elif(self.bridge_wr_data > LINE_GENERATIONS_MAX):
+                    m.d.sync += line_generations_next.eq(LINE_GENERATIONS_MAX)
+                with m.Else():
+                    m.d.sync += line_generations_next.eq(self.bridge_wr_data)
+
+            with m.If(self.bridge_addr == RULE_BRIDGE_ADDR):
+                m.d.sync += self.bridge_rd_data.eq(automata_table)
+            with m.Elif(self.bridge_addr == LINE_GENERATIONS_BRIDGE_ADDR):
+                m.d.sync += self.bridge_rd_data.eq(line_generations)
+
+
+        # Block RAM or compute domain engine, if used, stands in for topline_state/active_state/audgen_state
+
+        use_engine = USE_COMPUTE_DOMAIN or USE_LINE_RAM
+        if USE_COMPUTE_DOMAIN:
+            m.domains.compute = compute = ClockDomain(async_reset=True)
+            m.d.comb += compute.clk.eq(self.pll_clk_2)
+            m.submodules.compute_reset = ResetSynchronizer(self.rst, domain="compute")
+
+            m.submodules.compute_engine = engine = ComputeEngine(VID_H_ACTIVE, [scribble_cells(kind) for kind in ScribbleKind],
+                LINE_GENERATIONS_MAX)
+            m.d.comb += engine.advance.eq(video_pixel_stb & video_active)
+        elif USE_LINE_RAM:
+            m.submodules.line_buffer = engine = LineBufferEngine(VID_H_ACTIVE, [scribble_cells(kind) for kind in ScribbleKind],
+                LINE_GENERATIONS_MAX)
+        if use_engine:
+            m.d.comb += [
+                engine.table.eq(automata_table),
+                engine.generations.eq(line_generations),
+                engine.x_count.eq(video_x_count),
+            ]
 
         # Partial results for colors
 
         flash_color = Signal(24)
+        display_cell = Signal(1) # Cell under the beam
+
+        if use_engine:
+            m.d.comb += display_cell.eq(engine.pixel)
+        else:
+            m.d.comb += display_cell.eq(active_state[0]) # We are always displaying the least significant bit
 
         # flash_color is our 1 bit video output (black/white)
-        with m.If(active_state[0]):
+        with m.If(display_cell):
             m.d.comb += flash_color.eq(0x0)
         with m.Else():
             m.d.comb += flash_color.eq(0xFFFFFF)
@@ -190,6 +290,22 @@ class AppToplevel(Toplevel):
         m.d.sync += [
             need_topline_backcopy.eq(0)
         ]
+
+        line_step = Signal(1) # Step active_state one generation
+
+        # Generations after the first, stepped one per clock straight after hsync, and whether the
+        # result becomes the topline
+        line_steps_left = Signal(range(LINE_GENERATIONS_MAX))
+        line_steps_backcopy = Signal(1)
+        if not use_engine and LINE_GENERATIONS_MAX > 1:
+            assert LINE_GENERATIONS_MAX - 1 < (VID_H_TOTAL - VID_H_ACTIVE) * VID_DIV_RATIO, \
+                "LINE_GENERATIONS_MAX too high to finish stepping in horizontal blanking"
+            with m.If(line_steps_left != 0):
+                m.d.comb += line_step.eq(1)
+                m.d.sync += line_steps_left.eq(line_steps_left - 1)
+                with m.If((line_steps_left == 1) & line_steps_backcopy):
+                    m.d.sync += need_topline_backcopy.eq(1)
+
         with m.If(video_pixel_stb):            # inactive screen areas must be black
             m.d.sync += [
                 video_rgb_out.eq(0)
@@ -197,34 +313,32 @@ class AppToplevel(Toplevel):
 
             # Color selection for live pixels
             with m.If(video_active):
-                m.d.sync += [
-                    video_rgb_out.eq(flash_color),
-                    active_state.eq(active_state.rotate_right(1)) # We are always displaying the least significant bit
-                ]
+                m.d.sync += video_rgb_out.eq(flash_color)
+                if not use_engine:
+                    m.d.sync += active_state.eq(active_state.rotate_right(1))
 
             # Row finished
             with m.If(video_hsync_stb & (video_y_count >= VID_V_BPORCH) & (video_y_count < VID_V_ACTIVE + VID_V_BPORCH - 1)):
-                # Perform rule 30
-                for i in range(VID_H_ACTIVE): # For each col
-                    # Calculate indices
-                    pre = (i+(VID_H_ACTIVE-1))%VID_H_ACTIVE
-                    nex = (i+1)%VID_H_ACTIVE
-                    # Output signal
-                    at = active_state[i]
-                    # Input signal
-                    cat = Cat(Cat(active_state[pre], at), active_state[nex])
-                    # Cellular automaton definition
-                    with m.Switch(cat):
-                        for idx in range(8): # Case applies each possible neighbor bit combination to a bit in the register
-                            with m.Case(idx):
-                                m.d.sync += at.eq(automata_table[idx])
-
-                # 1 cycle after first row is done performing CA, make that the new topline
-                # (Unless we are in first second and frozen)
-                with m.If(
-                        (video_y_count == VID_V_BPORCH) & 
-                        (~frame_frozen)):
-                    m.d.sync += need_topline_backcopy.eq(1)
+                if use_engine: # Engine has the next row ready; same backcopy condition as below
+                    m.d.comb += [
+                        engine.step.eq(1),
+                        engine.backcopy.eq((video_y_count == VID_V_BPORCH) & (~frame_frozen)),
+                    ]
+                else:
+                    m.d.comb += line_step.eq(1)
+                    m.d.sync += line_steps_left.eq(line_generations - 1)
+
+                    # 1 cycle after first row is done performing CA (all generations of it), make
+                    # that the new topline (Unless we are in first second and frozen)
+                    with m.If(
+                            (video_y_count == VID_V_BPORCH) & 
+                            (~frame_frozen)):
+                        m.d.sync += [
+                            need_topline_backcopy.eq(line_generations == 1),
+                            line_steps_backcopy.eq(1),
+                        ]
+                    with m.Else():
+                        m.d.sync += line_steps_backcopy.eq(0)
 
             # Screen finished
             with m.If(video_vsync_stb):
@@ -242,6 +356,12 @@ class AppToplevel(Toplevel):
                 with m.If(need_frozen_exception): # Note this means you can step more quickly than the speed counter
                     m.d.sync += frame_frozen.eq(0)
 
+                if use_engine: # Engine scribbles, then restarts from the topline
+                    m.d.comb += [
+                        engine.frame.eq(1),
+                        engine.snapshot.eq(~frame_frozen),
+                    ]
+
                 if DEBUG_NO_CONTROLS:
                     m.d.comb += need_topline_copy.eq(1)
                 else:
@@ -259,59 +379,62 @@ class AppToplevel(Toplevel):
                             m.d.sync += scribble_single[idx].eq(0)
                         with m.If(scribble_hold[idx]):
                             m.d.comb += scribble_now.eq(1)
-                        with m.If(scribble_now):
-                            many = 5
-                            match idx:
-                                case ScribbleKind.SINGLE_BLACK:
-                                    m.d.sync += topline_state[VID_H_ACTIVE//2].eq(1)
-                                case ScribbleKind.SINGLE_WHITE:
-                                    m.d.sync += topline_state[VID_H_ACTIVE//2+1].eq(0)
-                                case ScribbleKind.MANY_BLACK:
-                                    m.d.sync += [
-                                        topline_state[off*VID_H_ACTIVE//many+off].eq(1)
-                                        for off in range(many) 
-                                    ]
-                                case ScribbleKind.MANY_WHITE:
-                                    m.d.sync += [
-                                        topline_state[off*VID_H_ACTIVE//many+off*2+1].eq(0)
-                                        for off in range(many) 
-                                    ]
+                        if use_engine:
+                            m.d.comb += engine.scribble[idx].eq(scribble_now)
+                        else:
+                            with m.If(scribble_now):
+                                m.d.sync += [topline_state[cell].eq(value) for cell, value in scribble_cells(idx)]
 
                     # Activate automata change
                     with m.If(need_automata_next):
                         m.d.sync += [
-                            need_automata_next.eq(0)
+                            need_automata_next.eq(0),
+                            automata_table.eq(automata_next)
                         ]
-                        with m.Switch(automata_next):
-                            for idx in range(4):
-                                with m.Case(idx):
-                                    m.d.sync += [
-                                        automata_table.eq(AUTO_RULE_BITS[idx])
-                                    ]
 
-                    m.d.sync += need_topline_copy.eq(1)
+                    m.d.sync += line_generations.eq(line_generations_next)
+
+                    if not use_engine:
+                        m.d.sync += need_topline_copy.eq(1)
 
                 # Service opening timer
                 with m.If(opening_countdown_timer != 0):
                     m.d.sync += opening_countdown_timer.eq(opening_countdown_timer - 1)
 
                 # Set audio state and new active state from most recent topline state
-                with m.If(~frame_frozen): # Notice frozen for *just-finished* frame
-                    m.d.sync += [
-                        audgen_state.eq(topline_state),
-                    ]
-
-        with m.If(need_topline_copy): # Do last because can be driven multiple ways
-            m.d.sync += active_state.eq(topline_state) # Reset line renderer to frame
-
-            if not DEBUG_NO_CONTROLS:
-                m.d.sync += need_topline_copy.eq(0)
+                if not use_engine:
+                    with m.If(~frame_frozen): # Notice frozen for *just-finished* frame
+                        m.d.sync += [
+                            audgen_state.eq(topline_state),
+                        ]
 
-        with m.If(need_topline_backcopy): # Do last to override
-            m.d.sync += [
-                topline_state.eq(active_state),
-                need_topline_backcopy.eq(0)
-            ]
+        if not use_engine:
+            # Perform rule 30
+            # Each cell's neighbourhood (left, self, right) indexes straight into the rule table.
+            # Selecting from each half of the table by (left, self) first makes each half exactly
+            # one 6-input LUT, which synthesizes smaller than a single 8-way bit_select.
+            def rule(left, at, right):
+                return Mux(right,
+                    automata_table[4:].bit_select(Cat(left, at), 1),
+                    automata_table[:4].bit_select(Cat(left, at), 1))
+
+            with m.If(line_step):
+                m.d.sync += active_state.eq(Cat(
+                    rule(active_state[(i+(VID_H_ACTIVE-1))%VID_H_ACTIVE], active_state[i], active_state[(i+1)%VID_H_ACTIVE])
+                    for i in range(VID_H_ACTIVE) # For each col
+                ))
+
+            with m.If(need_topline_copy): # Do last because can be driven multiple ways
+                m.d.sync += active_state.eq(topline_state) # Reset line renderer to frame
+
+                if not DEBUG_NO_CONTROLS:
+                    m.d.sync += need_topline_copy.eq(0)
+
+            with m.If(need_topline_backcopy): # Do last to override
+                m.d.sync += [
+                    topline_state.eq(active_state),
+                    need_topline_backcopy.eq(0)
+                ]
 
         with m.If(opening_countdown_timer_late_reset): # Do last to override
             m.d.sync += [
@@ -327,7 +450,10 @@ class AppToplevel(Toplevel):
         m.d.comb += audio_output_word_bit.eq(audio_channel_internal <= 5) # 1 bit dac state
 
         m.d.comb += audio_divide_stb.eq(audio_divide_counter == 0)
-        m.d.comb += audio_high.eq( audgen_state[0] )  # Audio play is always lowest bit of audio state
+        if use_engine:
+            m.d.comb += audio_high.eq( engine.audio )
+        else:
+            m.d.comb += audio_high.eq( audgen_state[0] )  # Audio play is always lowest bit of audio state
 
         with m.If(audio_bit_update_stb):
             # Convert above state logic to a waveform—- alternate 0b0000011111111111 and 0b1111100000000000 words
@@ -337,7 +463,10 @@ class AppToplevel(Toplevel):
             # Audio generation app logic
             with m.If(~(video_pixel_stb & video_vsync_stb)): # Don't collide with end-of-screen copy
                 with m.If(audio_divide_stb):
-                    m.d.sync += audgen_state.eq( audgen_state.rotate_right(1) ) # After playing a bit, move to the next bit
+                    if use_engine:
+                        m.d.comb += engine.audio_rotate.eq(1)
+                    else:
+                        m.d.sync += audgen_state.eq( audgen_state.rotate_right(1) ) # After playing a bit, move to the next bit
 
                 if AUDIO_DIVISOR_BITS>0:
                     m.d.sync += audio_divide_counter.eq( audio_divide_counter+1 )
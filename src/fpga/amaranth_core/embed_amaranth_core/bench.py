@@ -0,0 +1,185 @@
+# Simulation throughput benchmarks
+# Each case (resolution x rule) runs in a fresh process, because the resolution constants are read
+# at import time. Nothing here may import the design at module level for the same reason.
+
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from pathlib import Path
+
+
+# Resolutions to benchmark besides whatever resolution.py currently holds. Made with scripts/resolution.py
+BENCH_RESOLUTIONS = {
+    "80x45": dict(VID_DIV_RATIO=60, VID_H_BPORCH=4, VID_H_ACTIVE=80, VID_H_TOTAL=88,
+                  VID_V_BPORCH=94, VID_V_ACTIVE=45, VID_V_TOTAL=234),
+    "320x180": dict(VID_DIV_RATIO=20, VID_H_BPORCH=4, VID_H_ACTIVE=320, VID_H_TOTAL=328,
+                    VID_V_BPORCH=4, VID_V_ACTIVE=180, VID_V_TOTAL=189),
+}
+
+# Throughput metrics are better when higher; everything measured in seconds is better when lower
+METRICS = {
+    "generate_s": -1,
+    "verilog_bytes": -1,
+    "synth_cells": -1,
+    "elaborate_s": -1,
+    "simulate_cycles_per_s": +1,
+    "capture_frame_frames_per_s": +1,
+    "capture_wav_samples_per_s": +1,
+}
+
+BASELINE_FILE = "bench_baseline.json"
+
+
+def _current_resolution():
+    from . import resolution
+    return {name: value for name, value in vars(resolution).items() if name.startswith("VID_")}
+
+
+def _run_case(case):
+    # Must happen before anything imports the design
+    from . import resolution
+    vars(resolution).update(case["timing"])
+
+    from . import app_toplevel
+    from .app_toplevel import AppToplevel, AutoKind
+    from .sim import CLK_PERIOD, simulator, frame_reader, i2s_reader
+    from .platform import IntelPlatform
+    from amaranth.back import rtlil, verilog
+    app_toplevel.AUTO_DEFAULT = AutoKind[case["rule"]]
+
+    def timed(process_kind, bench_of, run=None):
+        top = AppToplevel()
+        start = time.perf_counter()
+        sim = simulator(top, case["backend"])
+        elaborated = time.perf_counter()
+        if bench_of:
+            getattr(sim, process_kind)(bench_of(top))
+        if run:
+            run(sim)
+        else:
+            sim.run()
+        return elaborated - start, time.perf_counter() - elaborated
+
+    result = {}
+
+    start = time.perf_counter()
+    text = verilog.convert(AppToplevel(), platform=IntelPlatform(), name="amaranth_core", strip_internal_attrs=True)
+    result["generate_s"] = time.perf_counter() - start
+    result["verilog_bytes"] = len(text)
+
+    if case["synth"]:
+        from .synth import synthesize, cell_count
+        # No platform: yosys has no altera_std_synchronizer, and plain flip-flops synthesize the same
+        stat, _ = synthesize(rtlil.convert(AppToplevel(), name="amaranth_core"), "amaranth_core")
+        result["synth_cells"] = cell_count(stat)
+
+    elaborate, elapsed = timed(None, None, lambda sim: sim.run_until(case["cycles"] * CLK_PERIOD, run_passive=True))
+    result["elaborate_s"] = elaborate
+    result["simulate_cycles_per_s"] = case["cycles"] / elapsed
+
+    if case["frames"]:
+        _, elapsed = timed("add_process", lambda top: frame_reader(top, case["frames"], lambda index, rows: None))
+        result["capture_frame_frames_per_s"] = case["frames"] / elapsed
+
+    if case["samples"]:
+        _, elapsed = timed("add_process", lambda top: i2s_reader(top, case["samples"], lambda frames: None))
+        result["capture_wav_samples_per_s"] = case["samples"] / elapsed
+
+    return result
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, metrics in results.items():
+        for metric, sense in METRICS.items():
+            old = baseline.get(name, {}).get(metric)
+            new = metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            flag = ""
+            if sense * change < -tolerance:
+                flag = "  REGRESSION"
+                regressions.append((name, metric))
+            print(f"{name:24} {metric:28} {old:12.3f} -> {new:12.3f} ({change:+.1%}){flag}")
+    return regressions
+
+
+def run_benchmarks():
+    import argparse
+    from amaranth import __version__ as amaranth_version
+    from .app_toplevel import AutoKind
+    from .sim import SIM_BACKENDS
+
+    rules = [kind.name for kind in AutoKind]
+    resolutions = ["current", *BENCH_RESOLUTIONS]
+
+    parser = argparse.ArgumentParser(prog="bench")
+    parser.add_argument("--backend", choices=SIM_BACKENDS, default="pysim",
+        help="simulator to benchmark (default: %(default)s)")
+    parser.add_argument("--resolution", choices=resolutions, action="append",
+        help="resolution to run; may be repeated (default: all)")
+    parser.add_argument("--rule", choices=rules, action="append",
+        help="initial AutoKind rule to run; may be repeated (default: all)")
+    parser.add_argument("--cycles", type=int, default=50000,
+        help="cycles to run for the simulate benchmark (default: %(default)s)")
+    parser.add_argument("--frames", type=int, default=1,
+        help="frames to read for the capture_frame benchmark, 0 to skip (default: %(default)s)")
+    parser.add_argument("--samples", type=int, default=100,
+        help="stereo samples to read for the capture_wav benchmark, 0 to skip (default: %(default)s)")
+    parser.add_argument("--synth", action="store_true",
+        help="also count cells after synthesis (needs a full yosys, see synth.py)")
+    parser.add_argument("--output", default="bench.json",
+        help="where to write results (default: %(default)s)")
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+        help="results to compare against (default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+        help="fractional change counted as a regression (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+        help="also store these results as the new baseline")
+    args = parser.parse_args()
+
+    cases = []
+    for resolution in args.resolution or resolutions:
+        timing = _current_resolution() if resolution == "current" else BENCH_RESOLUTIONS[resolution]
+        name = f"{timing['VID_H_ACTIVE']}x{timing['VID_V_ACTIVE']}"
+        for rule in args.rule or rules:
+            cases.append((f"{name}/{rule}", dict(timing=timing, rule=rule, backend=args.backend,
+                cycles=args.cycles, frames=args.frames, samples=args.samples, synth=args.synth)))
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name, case in cases: # One at a time, so cases don't compete for the CPU
+        print(f"Running {name} on {args.backend}...")
+        with context.Pool(1) as pool:
+            results[name] = pool.apply(_run_case, (case,))
+        print("    " + ", ".join(f"{metric} {value:.3f}" for metric, value in results[name].items()))
+
+    report = {
+        "backend": args.backend,
+        "amaranth": amaranth_version,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=4) + "\n")
+    print(f"Results written to {args.output}")
+
+    regressions = []
+    baseline_path = Path(args.baseline)
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text())
+        if baseline.get("backend") != args.backend:
+            print(f"Baseline {args.baseline} is for backend {baseline.get('backend')}, not comparing")
+        else:
+            print(f"Compared to {args.baseline}:")
+            regressions = compare(results, baseline["results"], args.tolerance)
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=4) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
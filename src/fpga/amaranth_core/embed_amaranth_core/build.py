@@ -8,35 +8,214 @@ import enum
 from .app_toplevel import AppToplevel
 
 
+# Command line shared by the simulation entry points
+def _sim_args(prog, *, setup=None):
+    import argparse
+    from pathlib import Path
+    from .sim import SIM_BACKENDS, parse_input_script
+
+    parser = argparse.ArgumentParser(prog=prog)
+    parser.add_argument("--backend", choices=SIM_BACKENDS, default="pysim",
+        help="simulator to run the design on (default: %(default)s)")
+    parser.add_argument("--set-rule", action="append", default=[], metavar="FRAME:RULE",
+        help="write automaton RULE (0-255) over the bridge during FRAME (counting from 0); repeatable")
+    parser.add_argument("--set-generations", action="append", default=[], metavar="FRAME:COUNT",
+        help="write generations per row over the bridge during FRAME; repeatable")
+    parser.add_argument("--input", type=Path, metavar="SCRIPT",
+        help="play controller input from SCRIPT (lines of FRAME BUTTON[+BUTTON...], or FRAME - to release)")
+    parser.add_argument("--save-checkpoint", metavar="FRAME:PATH",
+        help="save the simulation state at the start of FRAME to PATH")
+    parser.add_argument("--load-checkpoint", type=Path, metavar="PATH",
+        help="start from a saved checkpoint instead of from reset; frame numbers carry on from it")
+    if setup:
+        setup(parser)
+    args = parser.parse_args()
+
+    args.input_script = None
+    if args.input:
+        try:
+            args.input_script = parse_input_script(args.input.read_text())
+        except (OSError, ValueError) as e:
+            parser.error(f"--input: {e}")
+
+    args.checkpoint = None
+    if args.load_checkpoint:
+        from .checkpoint import read_checkpoint
+        try:
+            args.checkpoint = read_checkpoint(args.load_checkpoint)
+        except (OSError, ValueError) as e:
+            parser.error(f"--load-checkpoint: {e}")
+
+    args.save_frame = None
+    if args.save_checkpoint:
+        frame, _, path = args.save_checkpoint.partition(":")
+        try:
+            args.save_frame, args.save_path = int(frame), Path(path)
+        except ValueError:
+            parser.error(f"--save-checkpoint: expected FRAME:PATH, got {args.save_checkpoint!r}")
+        if args.save_frame < 0 or not path:
+            parser.error(f"--save-checkpoint: expected FRAME:PATH, got {args.save_checkpoint!r}")
+
+    # As (frame, value) pairs
+    for option, metavar in (("set_rule", "FRAME:RULE"), ("set_generations", "FRAME:COUNT")):
+        pairs = []
+        for text in getattr(args, option):
+            frame, _, value = text.partition(":")
+            try:
+                pairs.append((int(frame), int(value, 0)))
+            except ValueError:
+                parser.error(f"--{option.replace('_', '-')}: expected {metavar}, got {text!r}")
+        setattr(args, option, pairs)
+    return args
+
+
+# Bench processes which restore and save the --load-checkpoint and --save-checkpoint, play the
+# --input script and carry out the --set-rule and --set-generations writes, if any. `clock` is the
+# FrameClock of a frame_skipper, if there is one; benches added after this share the returned one.
+def _add_inputs(sim, top, args, clock=None):
+    import sys
+    from .sim import FrameClock, bridge_writer, input_player
+    from .checkpoint import checkpoint_loader, checkpoint_saver
+    from .app_toplevel import RULE_BRIDGE_ADDR, LINE_GENERATIONS_BRIDGE_ADDR
+
+    clock = clock or FrameClock()
+    if args.checkpoint: # First, as it moves the clock on to the checkpoint's frame
+        try:
+            sim.add_process(checkpoint_loader(sim, top, args.checkpoint, clock))
+        except ValueError as e:
+            sys.exit(f"--load-checkpoint: {args.load_checkpoint} {e}")
+    if args.save_frame is not None:
+        sim.add_process(checkpoint_saver(sim, top, args.save_frame, args.save_path, clock))
+
+    if args.input_script:
+        sim.add_process(input_player(top, args.input_script, clock))
+
+    writes = []
+    for address, pairs in ((RULE_BRIDGE_ADDR, args.set_rule), (LINE_GENERATIONS_BRIDGE_ADDR, args.set_generations)):
+        for frame, value in pairs:
+            writes.append((frame, address, value))
+    if writes:
+        sim.add_process(bridge_writer(top, writes, clock))
+    return clock
+
+
 def simulate():
-    from amaranth.sim import Simulator
+    import fnmatch
+    import math
+    import sys
+    from .sim import CLK_PERIOD, FrameClock, simulator, design_signals, visible, tracer
+    from .sinks import TraceWriter
+
+    def setup(parser):
+        parser.add_argument("--output", default="dump.vcd",
+            help="where to write the trace; .vcd.gz is compressed, .fst needs gtkwave's vcd2fst (default: %(default)s)")
+        parser.add_argument("--trace", action="append", metavar="PATTERN",
+            help="only trace signals whose hierarchical name matches this glob, e.g. '*video*'; repeatable")
+        parser.add_argument("--start-frame", type=int, default=0,
+            help="frame to start tracing at (default: %(default)s)")
+        parser.add_argument("--trace-frames", type=int, default=1,
+            help="how many frames to trace for (default: %(default)s)")
+        parser.add_argument("--trigger", metavar="NAME",
+            help="start tracing at the first clock from --start-frame on where signal NAME is nonzero")
+        parser.add_argument("--list-signals", action="store_true",
+            help="print the names --trace and --trigger match against, and exit")
+        parser.add_argument("--seconds", type=float, default=21e-3,
+            help="how long to trace for from the start, when no --trace or window is given (default: %(default)s)")
+    args = _sim_args("simulate", setup=setup)
+
+    top = AppToplevel()
+    sim = simulator(top, args.backend)
+    signals = {name: signal for name, (signal, kind) in design_signals(sim, top).items() if visible(sim, signal)}
+    if args.list_signals:
+        for name, signal in signals.items():
+            print(f"{name} [{len(signal)}]")
+        return
+
+    windowed = args.trace or args.trigger or args.start_frame or args.trace_frames != 1
+    if not windowed and args.output.endswith(".vcd"):
+        # Everything, for --seconds
+        _add_inputs(sim, top, args)
+        with sim.write_vcd(args.output):
+            sim.run_until(args.seconds, run_passive=True)
+        return
+
+    traced = {name: signal for name, signal in signals.items()
+        if not args.trace or any(fnmatch.fnmatchcase(name, pattern) for pattern in args.trace)}
+    if not traced:
+        sys.exit("No signals match --trace; see --list-signals")
+    if args.trigger and args.trigger not in signals:
+        sys.exit(f"No signal {args.trigger}; see --list-signals")
+    if args.output.endswith(".fst") and not TraceWriter.vcd2fst():
+        sys.exit("FST output needs vcd2fst (from gtkwave) on PATH")
 
-    sim = Simulator(AppToplevel())
-    sim.add_clock(1/74.25e6)
-    with sim.write_vcd("dump.vcd"):
-        sim.run_until(21e-3, run_passive=True)
+    # .vcd.gz and .fst go through the tracer even without a window, for --seconds from the start
+    cycles = None if windowed else math.ceil(args.seconds / CLK_PERIOD)
+    clock = _add_inputs(sim, top, args, FrameClock())
+    with TraceWriter(args.output, {name: len(signal) for name, signal in traced.items()}) as writer:
+        sim.add_process(tracer(top, list(traced.values()), writer.sample, args.start_frame, args.trace_frames,
+            args.trigger and signals[args.trigger], clock, cycles))
+        sim.run()
+    print(f"Traced {len(traced)} signals to {args.output}")
 
 
 def capture_frame():
+    import contextlib
+    import sys
     import png
-    from amaranth.sim import Simulator
+    from amaranth.sim import Delay
+    from .resolution import VID_H_ACTIVE, VID_V_ACTIVE
+    from .sim import CLK_PERIOD, FRAME_RATE, Until, simulator, frame_reader, FrameClock, frame_skipper
+    from .sinks import VIDEO_FORMATS
+
+    def setup(parser):
+        parser.add_argument("--poll", action="store_true",
+            help="follow video_hs/video_de/clk90 edges as they happen, instead of sampling once per visible pixel")
+        parser.add_argument("--frames", type=int, default=2,
+            help="how many frames to capture (default: %(default)s)")
+        parser.add_argument("--no-fast-forward", action="store_true",
+            help="simulate every frame, rather than skipping over frozen ones (the opening pause, slowed or paused frames)")
+        parser.add_argument("--video", metavar="PATH",
+            help="stream every frame into one video file instead of writing frameN.png files; - for stdout")
+        parser.add_argument("--format", choices=VIDEO_FORMATS,
+            help="video format (default: from the --video extension, .y4m, .png/.apng or raw RGB otherwise; y4m for stdout)")
+    args = _sim_args("capture_frame", setup=setup)
+
+    FRAMES = args.frames
+
+    video = contextlib.nullcontext()
+    if args.video:
+        suffix = args.video.rpartition(".")[2].lower()
+        kind = args.format or ("y4m" if args.video == "-" or suffix == "y4m" else "apng" if suffix in ("png", "apng") else "raw")
+        if kind == "apng" and args.video == "-":
+            sys.exit("APNG cannot be written to stdout")
+        video = VIDEO_FORMATS[kind](args.video, VID_H_ACTIVE, VID_V_ACTIVE, FRAME_RATE)
+        if kind == "raw":
+            print(f"Raw rgb24 video, {VID_H_ACTIVE}x{VID_V_ACTIVE} at {FRAME_RATE} fps", file=sys.stderr)
 
     top = AppToplevel()
-    def bench():
-        written = 0
-        for _frame in range(2):
-            frame = _frame + 1
+    def write_frame(index, rows):
+        frame = index + 1
+        print(f"frame {frame}, {len(rows)} rows")
+        if args.video:
+            video.write(rows)
+        else:
+            with open(f"frame{frame}.png", "wb") as file:
+                png.Writer(len(rows[0]) // 3, len(rows), greyscale=False).write(file, rows)
 
+    def bench():
+        yield Delay(CLK_PERIOD * 5 / 4) # From after the first clock edge, clear of the rest
+        for index in range(FRAMES):
             rows = []
             while True:
                 cols = []
-                while not (yield top.video_hs): yield
-                while not ((yield top.video_vs) or (yield top.video_de)): yield
+                yield Until(top.video_hs, 1)
+                while not ((yield top.video_vs) or (yield top.video_de)): # Only the back porch
+                    yield Delay(CLK_PERIOD)
                 if (yield top.video_vs):
                     break
                 while True:
-                    while (yield top.video_rgb_clk90): yield
-                    while not (yield top.video_rgb_clk90): yield
+                    yield Until(top.video_rgb_clk90, 0)
+                    yield Until(top.video_rgb_clk90, 1)
                     # at posedge of clk90
                     if (yield top.video_de):
                         cols.append((yield top.video_rgb.r))
@@ -44,89 +223,113 @@ def capture_frame():
                         cols.append((yield top.video_rgb.b))
                     else:
                         break
-                print(f"frame {frame}, row {len(rows)}: {len(cols) // 3} cols")
+                print(f"frame {index + 1}, row {len(rows)}: {len(cols) // 3} cols")
                 rows.append(cols)
-                with open(f"frame{frame}.png", "wb") as file:
-                    png.Writer(len(rows[0]) // 3, len(rows), greyscale=False).write(file, rows)
-            print(f"frame {frame}, {len(rows)} rows")
+            write_frame(index, rows)
 
-    sim = Simulator(top)
-    sim.add_clock(1/74.25e6)
-    sim.add_sync_process(bench)
-    sim.run()
+    sim = simulator(top, args.backend)
+    if args.poll:
+        _add_inputs(sim, top, args)
+        sim.add_process(bench)
+    else:
+        clock = FrameClock()
+        if not args.no_fast_forward:
+            sim.add_process(frame_skipper(top, clock))
+        _add_inputs(sim, top, args, clock)
+        sim.add_process(frame_reader(top, FRAMES, write_frame, clock))
+
+    # Progress goes to stderr while the video goes to stdout
+    with video, contextlib.redirect_stdout(sys.stderr) if args.video == "-" else contextlib.nullcontext():
+        sim.run()
 
 
 def capture_wav():
-    import numpy as np
-    import soundfile as sf
-    from amaranth.sim import Simulator
+    from .sim import AUDIO_SAMPLE_RATE, simulator, i2s_reader
+    from .sinks import WavWriter
+
+    args = _sim_args("capture_wav", setup=lambda parser:
+        parser.add_argument("--seconds", type=float,
+            help="stop after this much audio (default: run until interrupted)"))
 
     FILE_NAME = "log.wav"
-    SAMPLE_RATE = 48000
-    CHUNK_SIZE = SAMPLE_RATE//200
-    SHRT_MAX = 32767 # No python library source for this?
-    USHRT_CONVERT = 1<<16
+
+    limit = None if args.seconds is None else int(args.seconds * AUDIO_SAMPLE_RATE)
+
+    last_printed = 0
+    def write_samples(frames):
+        nonlocal last_printed
+        outfile.write(frames)
+        if outfile.written >= last_printed+AUDIO_SAMPLE_RATE:
+            print(f"{outfile.written//AUDIO_SAMPLE_RATE} seconds written")
+            last_printed = outfile.written
 
     top = AppToplevel()
-    def bench():
-        written = 0
-        last_printed = 0
-
-        while not (yield top.audio_mclk): yield
-
-        while True:
-            frames = []
-
-            # Do i2s from the speaker end
-            for _ in range(CHUNK_SIZE):
-                frame = []
-                for channel in range(2):
-                    sample = 0
-
-                    for _ in range(16):
-                        sample <<= 1
-                        sample |= yield top.audio_dac
-                        lrck = yield top.audio_lrck
-                        assert lrck == channel, f"Unexpected lrck [channel select] value (wanted {channel}, got {lrck})"
-                        for _ in range(4): # Serial step
-                            while (yield top.audio_mclk): yield
-                            while not (yield top.audio_mclk): yield
-
-                    if sample > SHRT_MAX: # Reinterpret unsigned as signed
-                        sample -= USHRT_CONVERT
-                    frame.append(sample)
-
-                    for _ in range(16): # Blank space
-                        for _ in range(4): # Serial step
-                            while (yield top.audio_mclk): yield
-                            while not (yield top.audio_mclk): yield
-                frames.append(frame)
-
-            # If this is first byte open write to truncate, otherwise open readwrite...
-            with sf.SoundFile(FILE_NAME, mode = 'w', samplerate=SAMPLE_RATE, channels=2, subtype='PCM_16') \
-                    if written == 0 \
-                    else sf.SoundFile(FILE_NAME, mode = 'r+') \
-                    as outfile:
-                if written > 0: # ... then seek to end to append
-                    outfile.seek(0,sf.SEEK_END)
-                outfile.write(np.array(frames, dtype=np.int16))
-
-            written += CHUNK_SIZE
-            if written >= last_printed+SAMPLE_RATE:
-                print(f"{written//SAMPLE_RATE} seconds written")
-                last_printed = written
-
-    sim = Simulator(top)
-    sim.add_clock(1/74.25e6)
-    sim.add_sync_process(bench)
-    sim.run()
+    sim = simulator(top, args.backend)
+    _add_inputs(sim, top, args)
+    reader = i2s_reader(top, limit, write_samples)
+    sim.add_process(reader)
+    with WavWriter(FILE_NAME, AUDIO_SAMPLE_RATE) as outfile:
+        try:
+            sim.run()
+        except KeyboardInterrupt:
+            print("Interrupted")
+        finally:
+            reader.flush() # The samples since the last whole block, before the file is closed
+    print(f"{outfile.written/AUDIO_SAMPLE_RATE:.2f} seconds written")
+
+
+def bench():
+    from .bench import run_benchmarks
+
+    run_benchmarks()
+
+
+def check():
+    from .check import run_check
+
+    run_check()
+
+
+def report():
+    from .report import run_report
+
+    run_report()
+
+
+def sweep():
+    from .sweep import run_sweep
+
+    run_sweep()
+
+
+def variants():
+    from .variants import run_variants
+
+    run_variants()
 
 
 def generate():
+    import argparse
     from pathlib import Path
+    from . import cache
+
+    parser = argparse.ArgumentParser(prog="generate")
+    parser.add_argument("--force", action="store_true",
+        help="elaborate even if the cached output is up to date")
+    args = parser.parse_args()
+
+    output = Path(__file__).parent.parent.parent / "core" / "amaranth_core.v"
+    key = cache.design_key()
+    if not args.force and cache.is_fresh(output, key):
+        print(f"{output.name} is up to date")
+        return
+
     from amaranth.back import verilog
     from .platform import IntelPlatform
 
     toplevel = AppToplevel()
-    with open(Path(__file__).parent.parent.parent / "core" / "amaranth_core.v", "w") as f:
-        f.write(verilog.convert(toplevel, platform=IntelPlatform, name="amaranth_core", strip_internal_attrs=True))
+    text = verilog.convert(toplevel, platform=IntelPlatform(), name="amaranth_core", strip_internal_attrs=True)
+    if cache.store(output, key, text):
+        print(f"Wrote {output.name}")
+    else:
+        print(f"{output.name} is unchanged")
@@ -0,0 +1,65 @@
+# Content-addressed cache for generated outputs, so that rebuilding an unchanged design neither
+# re-elaborates it nor touches the output file (whose mtime would otherwise trigger a full Quartus
+# compile).
+
+import hashlib
+import json
+from pathlib import Path
+
+
+PACKAGE_DIR = Path(__file__).parent
+CACHE_FILE = PACKAGE_DIR.parent / "build" / "generate_cache.json"
+
+
+# Everything the generated design depends on: every source file in this package, the resolution
+# constants actually in effect (which may have been overridden at runtime), the toolchain versions,
+# and anything else the caller passes in `extra`.
+def design_key(**extra):
+    from amaranth import __version__ as amaranth_version
+    from amaranth._toolchain.yosys import find_yosys
+    from . import resolution
+
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.glob("*.py")):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes() + b"\0")
+    inputs = {
+        "resolution": {name: value for name, value in vars(resolution).items() if name.startswith("VID_")},
+        "amaranth": amaranth_version,
+        "yosys": ".".join(str(part) for part in find_yosys(lambda ver: True).version()),
+        "extra": extra,
+    }
+    digest.update(json.dumps(inputs, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _file_digest(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _records():
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+# True if `output` was produced from `key` and has not been modified since
+def is_fresh(output, key):
+    output = Path(output)
+    record = _records().get(str(output.resolve()))
+    return bool(record and record["key"] == key and output.exists() and _file_digest(output) == record["digest"])
+
+
+# Write `text` to `output` unless it already holds exactly that, and remember `key` for it.
+# Returns True if the file was written.
+def store(output, key, text):
+    output = Path(output)
+    changed = not output.exists() or output.read_text() != text
+    if changed:
+        output.write_text(text)
+
+    records = _records()
+    records[str(output.resolve())] = {"key": key, "digest": _file_digest(output)}
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(records, indent=4) + "\n")
+    return changed
@@ -0,0 +1,182 @@
+# Golden-model equivalence check
+# Simulates AppToplevel over a grid of starting rules, input scripts (given, and random ones made
+# from seeds) and CA engines, and compares every frame of video against AutomatonModel as it
+# arrives, reporting the first pixel that differs with its frame and clock cycle. Meant to be run
+# after touching the CA path in app_elaborate. Cases run in parallel, each in a process of its own,
+# so the rest carry on if one of them dies (CXXRTL aborts on some errors in the design).
+
+import concurrent.futures
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+from pathlib import Path
+
+
+ENGINES = ["register", "ram", "compute"] # USE_LINE_RAM False, True; USE_COMPUTE_DOMAIN
+
+
+class _Mismatch(Exception):
+    pass
+
+
+# Random controller input and bridge writes for `frames` frames, the same for the same seed: short
+# presses of random buttons (chords included), and a few rule and generations writes
+def random_inputs(seed, frames):
+    from .sim import BUTTONS
+    from .app_toplevel import RULE_BRIDGE_ADDR, LINE_GENERATIONS_BRIDGE_ADDR
+
+    rng = random.Random(seed)
+    script = []
+    frame = rng.randrange(4)
+    while frame < frames - 1:
+        names = rng.sample(sorted(BUTTONS), rng.choice([1, 1, 2]))
+        script.append((frame, sum(1 << BUTTONS[name] for name in names)))
+        frame += rng.randrange(1, 4)
+        script.append((frame, 0))
+        frame += rng.randrange(1, 8)
+
+    writes = []
+    for _ in range(rng.randrange(4)):
+        if rng.randrange(2):
+            writes.append((rng.randrange(frames), RULE_BRIDGE_ADDR, rng.randrange(256)))
+        else:
+            writes.append((rng.randrange(frames), LINE_GENERATIONS_BRIDGE_ADDR, rng.randrange(6)))
+    return script, sorted(writes)
+
+
+def _run(case):
+    import numpy as np
+    from . import app_toplevel, model
+    from .app_toplevel import AppToplevel, AutoKind, RULE_BRIDGE_ADDR
+    from .model import AutomatonModel, frame_rgb
+    from .resolution import VID_H_ACTIVE, VID_V_ACTIVE
+    from .sim import FrameClock, simulator, frame_skipper, frame_reader, input_player, bridge_writer, \
+        script_keys
+
+    # Set every override, whatever the defaults are
+    app_toplevel.USE_LINE_RAM = case["engine"] == "ram"
+    app_toplevel.USE_COMPUTE_DOMAIN = case["engine"] == "compute"
+    app_toplevel.AUTO_DEFAULT = model.AUTO_DEFAULT = AutoKind[case["auto"]]
+
+    script = case["script"]
+    writes = case["writes"]
+    if case["rule"] is not None:
+        writes = sorted(writes + [(0, RULE_BRIDGE_ADDR, case["rule"])])
+
+    top = AppToplevel()
+    sim = simulator(top, case["backend"])
+    clock = FrameClock()
+    if case["fast_forward"]:
+        sim.add_process(frame_skipper(top, clock))
+    sim.add_process(input_player(top, script, clock))
+    sim.add_process(bridge_writer(top, writes, clock))
+
+    golden = AutomatonModel()
+    keys = script_keys(script)
+    def check_frame(index, rows):
+        golden.press(keys(index)) # Input changes as the frame starts, bridge writes land halfway through
+        for frame, address, data in writes:
+            if frame == index:
+                (golden.write_rule if address == RULE_BRIDGE_ADDR else golden.write_line_generations)(data)
+        expected = frame_rgb(golden.frame())
+        actual = np.array(rows, dtype=np.uint8).reshape(VID_V_ACTIVE, VID_H_ACTIVE, 3)
+        differ = np.argwhere((actual != expected[..., None]).any(axis=-1))
+        if len(differ):
+            y, x = map(int, differ[0])
+            raise _Mismatch(f"frame {index}, pixel ({x}, {y}) at cycle {clock.pixel_cycle(x, y)}: "
+                f"RTL {actual[y, x].tolist()}, model {[int(expected[y, x])] * 3}; {len(differ)} pixels differ")
+    sim.add_process(frame_reader(top, case["frames"], check_frame, clock))
+
+    start = time.perf_counter()
+    result = {}
+    try:
+        sim.run()
+    except _Mismatch as mismatch:
+        result["mismatch"] = str(mismatch)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    result["skipped_frames"] = clock.skipped
+    return result
+
+
+# Runs `case` in a process of its own, so only it is lost if the simulator dies outright
+def _run_isolated(context, case):
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        try:
+            return pool.submit(_run, case).result()
+        except concurrent.futures.process.BrokenProcessPool:
+            return {"error": "The worker process died"}
+
+
+def run_check():
+    import argparse
+    from .app_toplevel import AutoKind, AUTO_DEFAULT, USE_LINE_RAM, USE_COMPUTE_DOMAIN
+    from .sim import SIM_BACKENDS, parse_input_script
+
+    def rule(text):
+        if text in AutoKind.__members__ or text.isdigit() and int(text) < 256:
+            return text
+        raise argparse.ArgumentTypeError(f"expected an AutoKind name or 0-255, got {text!r}")
+
+    parser = argparse.ArgumentParser(prog="check")
+    parser.add_argument("--backend", choices=SIM_BACKENDS, default="pysim",
+        help="simulator to run on (default: %(default)s)")
+    default_engine = "compute" if USE_COMPUTE_DOMAIN else ENGINES[USE_LINE_RAM]
+    parser.add_argument("--engine", choices=ENGINES, action="append",
+        help=f"CA engine (USE_LINE_RAM, USE_COMPUTE_DOMAIN) to check; may be repeated (default: {default_engine})")
+    parser.add_argument("--rule", type=rule, action="append",
+        help="starting rule, an AutoKind name or 0-255 written over the bridge; may be repeated (default: every AutoKind)")
+    parser.add_argument("--seeds", type=int, default=2,
+        help="how many random input scripts to check, besides no input (default: %(default)s)")
+    parser.add_argument("--input", type=Path, action="append", metavar="SCRIPT",
+        help="controller input script to check (see capture_frame --input); may be repeated")
+    parser.add_argument("--frames", type=int, default=80,
+        help="frames to compare per case (default: %(default)s)")
+    parser.add_argument("--no-fast-forward", action="store_true",
+        help="simulate frozen frames too, rather than skipping them as capture_frame does")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+        help="cases to simulate at once (default: one per core, %(default)s)")
+    args = parser.parse_args()
+
+    inputs = {"noinput": ([], [])}
+    for seed in range(args.seeds):
+        inputs[f"seed{seed}"] = random_inputs(seed, args.frames)
+    for path in args.input or []:
+        try:
+            inputs[path.stem] = (parse_input_script(path.read_text()), [])
+        except (OSError, ValueError) as e:
+            parser.error(f"--input: {e}")
+
+    cases = {}
+    for engine in args.engine or [default_engine]:
+        for rule in args.rule or [kind.name for kind in AutoKind]:
+            for name, (script, writes) in inputs.items():
+                numbered = rule not in AutoKind.__members__
+                cases[f"{engine}-rule{rule.removeprefix('rule')}-{name}"] = dict(engine=engine,
+                    auto=AUTO_DEFAULT.name if numbered else rule, rule=int(rule) if numbered else None,
+                    script=script, writes=writes, frames=args.frames, backend=args.backend,
+                    fast_forward=not args.no_fast_forward)
+
+    print(f"Checking {len(cases)} cases of {args.frames} frames on {args.backend}, {args.jobs} at a time...")
+    failed = []
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ThreadPoolExecutor(args.jobs) as threads:
+        pending = {name: threads.submit(_run_isolated, context, case) for name, case in cases.items()}
+        for name, future in pending.items():
+            result = future.result()
+            if "mismatch" in result:
+                print(f"FAIL  {name}: {result['mismatch']}")
+            elif "error" in result:
+                print(f"ERROR {name}:\n{result['error']}")
+            else:
+                print(f"ok    {name} ({result['seconds']:.1f}s, {result['skipped_frames']} frames skipped)")
+            if "mismatch" in result or "error" in result:
+                failed.append(name)
+
+    if failed:
+        sys.exit(f"{len(failed)} of {len(cases)} case(s) failed")
+    print(f"All {len(cases)} cases match the model")
@@ -0,0 +1,110 @@
+# Simulation checkpoints
+# A checkpoint holds the value of every register in the design (memory contents included) and of
+# the inputs the benches drive, taken at the start of a frame. Restoring one at the start of another
+# run carries on from that frame instead of from reset, so an interesting state only has to be
+# reached once. Frames are a whole number of clocks long, so the restored run is in step with the
+# video timing just as the saving one was.
+
+import itertools
+import json
+import warnings
+from pathlib import Path
+
+from amaranth.sim import Delay
+
+from .sim import CLK_PERIOD, FRAME_PERIOD, FrameClock, design_signals, visible
+
+
+CHECKPOINT_VERSION = 3 # 2: comb signals count towards the #n name suffixes; 3: counter PixelClockDiv
+
+
+# The state of a simulator's design, as {name: signal}: everything a clock domain drives and the
+# undriven inputs (see design_signals). Signals a compiled model has optimized away are left out, as
+# nothing depends on them.
+def state_signals(sim, top):
+    state = {}
+    for name, (signal, kind) in design_signals(sim, top).items():
+        if kind == "comb":
+            continue
+        if not visible(sim, signal):
+            if kind == "memory":
+                raise NotImplementedError("Checkpoints of designs with memories need the pysim backend")
+            continue
+        state[name] = signal
+    return state
+
+
+def _design_key():
+    from .cache import design_key
+    return design_key()
+
+
+# Bench process which saves a checkpoint of design frame `frame` to `path`. The frame before it is
+# always simulated rather than skipped, so its state is exactly what frame `frame` starts from.
+def checkpoint_saver(sim, top, frame, path, clock=None):
+    clock = clock or FrameClock()
+    clock.busy.update({frame - 1, frame})
+
+    def bench():
+        yield Delay(CLK_PERIOD / 4) # Keep clear of clock edges
+        for sim_frame in itertools.count():
+            current = clock.frame(sim_frame)
+            assert current <= frame, f"Checkpoint frame {frame} is before this run's frame {current}"
+            if current == frame:
+                break
+            yield Delay(FRAME_PERIOD)
+
+        values = {}
+        for name, signal in state_signals(sim, top).items():
+            values[name] = yield signal
+
+        Path(path).write_text(json.dumps({
+            "version": CHECKPOINT_VERSION,
+            "design": _design_key(),
+            "frame": frame,
+            "state": values,
+        }) + "\n")
+        print(f"Saved checkpoint of frame {frame} to {path}")
+
+    return bench
+
+
+# The checkpoint in `path`, checked for everything that does not need the design: raises OSError if
+# it cannot be read and ValueError if it is not a checkpoint of this version, and warns if it was
+# saved from a different version of the design
+def read_checkpoint(path):
+    try:
+        checkpoint = json.loads(Path(path).read_text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path} is not JSON: {e}")
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a version {CHECKPOINT_VERSION} checkpoint")
+    frame, state = checkpoint.get("frame"), checkpoint.get("state")
+    if not isinstance(frame, int) or frame < 0 or not isinstance(state, dict) \
+            or not all(isinstance(value, int) for value in state.values()):
+        raise ValueError(f"{path} is not a valid checkpoint")
+    if checkpoint.get("design") != _design_key():
+        warnings.warn(f"{path} was saved from a different version of the design")
+    return checkpoint
+
+
+# Bench process which restores `checkpoint` (from read_checkpoint) before anything else happens, so
+# the run carries on from the frame it was taken at. Raises ValueError straight away if it names
+# signals this design does not have. `clock` is advanced to the checkpoint's frame, so benches
+# created after this one are scheduled in the checkpoint's frame numbers.
+def checkpoint_loader(sim, top, checkpoint, clock=None):
+    state = state_signals(sim, top)
+    unknown = sorted(set(checkpoint["state"]) - set(state))
+    if unknown:
+        raise ValueError(f"does not match this design, which has no {', '.join(unknown[:5])}")
+
+    clock = clock or FrameClock()
+    clock.skipped += checkpoint["frame"]
+
+    def bench():
+        yield Delay(CLK_PERIOD / 8) # Ahead of every other bench's first step, and clear of clock edges
+        for name, signal in state.items():
+            if name in checkpoint["state"]: # Anything else was optimized away when it was saved
+                yield signal.eq(checkpoint["state"][name])
+
+    return bench
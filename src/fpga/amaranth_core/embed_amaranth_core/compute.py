@@ -0,0 +1,363 @@
+# Cellular automaton engine which steps rows in a clock domain of its own
+# The register and block RAM engines step rows in `sync`, in time with the display: the register
+# engine a whole row in the hsync cycle, the block RAM one while the row before is on screen. This
+# one steps them in the `compute` domain (clocked from the PLL, see COMPUTE_CLK_RATIO),
+# COMPUTE_WORD_CELLS cells per clock, and hands finished rows to the display through an AsyncFIFO, so
+# its clock and word width can change without regard to the video timing. The display tells it
+# about each new frame through a second AsyncFIFO. The first word of each frame is tagged, so that
+# should the two ever fall out of step, the display drops what it has left over at vsync and starts
+# the frame in the right place. At the outputs it behaves exactly like the register engine.
+
+from amaranth import *
+from amaranth.lib import wiring, data
+from amaranth.lib.wiring import In, Out
+from amaranth.lib.fifo import AsyncFIFO
+
+from .resolution import *
+from .toplevel import COMPUTE_CLK_RATIO
+
+
+COMPUTE_WORD_CELLS = 8 # Cells stepped per compute clock, so also FIFO word width. Must be a power of 2
+
+# What the display sends the engine at the start of each frame
+FRAME_COMMAND = data.StructLayout({
+    "table": 8,
+    "generations": 8,
+    "scribble": 4,
+    "backcopy": 1, # The frame before made the topline's next generation the topline
+    "parity": 1, # Alternates frame to frame, for ROW_WORD.parity
+})
+
+# What the engine sends the display for each word of a row
+ROW_WORD = data.StructLayout({
+    "cells": COMPUTE_WORD_CELLS,
+    "first": 1, # First word of a frame
+    "parity": 1, # With first: that of the frame's command
+})
+
+
+class ComputeEngine(wiring.Component):
+    table           : In(8) # Rule lookup, indexed by Cat(left, cell, right)
+    generations     : In(8) # Generations each row is ahead of the one above, 1 up to generations_max
+    x_count         : In(10)
+    advance         : In(1) # Pixel strobe in the active area: the cell under x_count is on its way out
+    step            : In(1) # Hsync of a row that steps: display the next generation from now on
+    backcopy        : In(1) # With step: the next generation also becomes the topline
+    frame           : In(1) # Vsync: scribble on the topline and display from it again
+    snapshot        : In(1) # With frame: audio restarts from the topline (as it was before scribbling)
+    scribble        : In(4) # With frame: which ScribbleKinds to apply
+    audio_rotate    : In(1) # Move audio on to the next cell
+    pixel           : Out(1) # Cell under x_count, while a row is on display
+    audio           : Out(1) # Current audio cell
+
+    # `scribble_cells` is a list, in ScribbleKind order, of the (cell, value) pairs each kind writes
+    def __init__(self, width, scribble_cells, generations_max=1):
+        super().__init__()
+
+        assert COMPUTE_WORD_CELLS >= 2 and COMPUTE_WORD_CELLS & (COMPUTE_WORD_CELLS - 1) == 0
+        self.width = width
+        self.words = -(-width // COMPUTE_WORD_CELLS)
+        self.scribble_cells = scribble_cells
+        self.generations_max = generations_max
+
+        # Every generation of a row has to be computed in the time the display takes over a row,
+        # and the first row of a frame in the vertical blanking after the frame is sent over
+        row_clocks = VID_H_TOTAL * VID_DIV_RATIO // COMPUTE_CLK_RATIO
+        assert generations_max * (self.words + 3) + 1 <= row_clocks, \
+            "Too many generations per row to compute in the time of a row"
+        assert 2 * self.words + 16 <= (VID_V_TOTAL - VID_V_ACTIVE) * row_clocks, \
+            "Vertical blanking too short to compute the first row in"
+
+    def elaborate(self, platform):
+        m = Module()
+
+        cells = COMPUTE_WORD_CELLS
+        words = self.words
+        shift = cells.bit_length() - 1
+        last_cell = (self.width - 1) % cells # Position of the final cell in the final word
+
+        initial = 1 << (self.width//2) # Initial state value of first line
+        initial_words = [(initial >> (word*cells)) & ((1 << cells) - 1) for word in range(words)]
+
+        m.submodules.commands = commands = AsyncFIFO(width=FRAME_COMMAND.size, depth=4,
+            w_domain="sync", r_domain="compute")
+        # Room for the row on display and the one after it
+        m.submodules.row_fifo = row_fifo = AsyncFIFO(width=ROW_WORD.size, depth=2*words,
+            w_domain="compute", r_domain="sync")
+
+        # Display
+
+        # Sent the cycle after vsync, once the table and generations for the new frame are in place,
+        # and straight after reset, to start the first frame
+        send = Signal(1, reset=1)
+        send_scribble = Signal(4)
+        send_backcopy = Signal(1)
+        stepped_topline = Signal(1) # This frame's backcopy, for the next command
+        frame_parity = Signal(1) # Of the frame on display, as sent in its command
+
+        sent = FRAME_COMMAND(commands.w_data)
+        with m.If(send):
+            m.d.comb += [
+                sent.table.eq(self.table),
+                sent.generations.eq(self.generations),
+                sent.scribble.eq(send_scribble),
+                sent.backcopy.eq(send_backcopy),
+                sent.parity.eq(frame_parity),
+                commands.w_en.eq(1),
+            ]
+            m.d.sync += send.eq(0)
+
+        with m.If(self.step & self.backcopy):
+            m.d.sync += stepped_topline.eq(1)
+
+        with m.If(self.frame):
+            m.d.sync += [
+                send.eq(1),
+                send_scribble.eq(self.scribble),
+                send_backcopy.eq(stepped_topline),
+                stepped_topline.eq(0),
+                frame_parity.eq(~frame_parity),
+            ]
+
+        # Each word leaves the FIFO as the display moves off its last cell. From vsync on, words are
+        # dropped until the first of the new frame's is at the head, which in step is straight away
+        x = Signal(10)
+        word_done = Signal(1)
+        popped = Signal(1) # word_done, with the word there to take
+        resync = Signal(1, reset=1)
+        row_word = ROW_WORD(row_fifo.r_data)
+        frame_start = Signal(1)
+        m.d.comb += [
+            x.eq(self.x_count - VID_H_BPORCH),
+            word_done.eq(self.advance & ((x[:shift] == cells - 1) | (x == self.width - 1))),
+            popped.eq(~resync & word_done & row_fifo.r_rdy),
+            frame_start.eq(row_fifo.r_rdy & row_word.first & (row_word.parity == frame_parity)),
+            self.pixel.eq(~resync & row_fifo.r_rdy & row_word.cells.bit_select(x[:shift], 1)),
+        ]
+        with m.If(resync):
+            m.d.comb += row_fifo.r_en.eq(row_fifo.r_rdy & ~frame_start)
+            with m.If(frame_start):
+                m.d.sync += resync.eq(0)
+        with m.Else():
+            m.d.comb += row_fifo.r_en.eq(popped)
+        with m.If(self.frame):
+            m.d.sync += resync.eq(1)
+
+        # Audio
+        # Plays from one half of audio_cells while the second row of each frame (the topline's next
+        # generation) is copied into the other as it goes by. A snapshot swaps the halves over, as
+        # the topline is that row by then.
+
+        audio_cells = Memory(width=cells, depth=2*words, init=initial_words*2)
+        m.submodules.audio_rd = audio_rd = audio_cells.read_port(transparent=False)
+        m.submodules.audio_wr = audio_wr = audio_cells.write_port()
+
+        first_row = Signal(1, reset=1)
+        second_row = Signal(1)
+        with m.If(self.step):
+            m.d.sync += [
+                first_row.eq(0),
+                second_row.eq(first_row),
+            ]
+        with m.If(self.frame):
+            m.d.sync += [
+                first_row.eq(1),
+                second_row.eq(0),
+            ]
+
+        audio_half = Signal(1) # Half playing
+        audio_pos = Signal(range(self.width)) # Audio cell
+        with m.If(popped & second_row):
+            m.d.comb += [
+                audio_wr.addr.eq(Mux(audio_half, 0, words) + x[shift:]),
+                audio_wr.data.eq(row_word.cells),
+                audio_wr.en.eq(1),
+            ]
+
+        # Read from where audio will be next cycle, so the cell is there as soon as it moves
+        audio_half_next = Signal(1)
+        audio_pos_next = Signal(range(self.width))
+        m.d.comb += [
+            audio_half_next.eq(audio_half),
+            audio_pos_next.eq(audio_pos),
+        ]
+        with m.If(self.frame):
+            with m.If(self.snapshot):
+                m.d.comb += [
+                    audio_half_next.eq(~audio_half),
+                    audio_pos_next.eq(0),
+                ]
+        with m.Elif(self.audio_rotate):
+            m.d.comb += audio_pos_next.eq(Mux(audio_pos == self.width - 1, 0, audio_pos + 1))
+
+        m.d.sync += [
+            audio_half.eq(audio_half_next),
+            audio_pos.eq(audio_pos_next),
+        ]
+        m.d.comb += [
+            audio_rd.addr.eq(Mux(audio_half_next, words, 0) + audio_pos_next[shift:]),
+            self.audio.eq(audio_rd.data.bit_select(audio_pos[:shift], 1)),
+        ]
+
+        # Engine, in the compute domain from here on
+
+        # Rows
+        # Three slots: the topline, its next generation (which the next frame's command can make the
+        # topline, freeing the old one) and the rest of the frame's rows, stepped in place.
+        rows = Memory(width=cells, depth=3*words, init=initial_words)
+        m.submodules.engine_rd = engine_rd = rows.read_port(domain="compute", transparent=False)
+        m.submodules.engine_wr = engine_wr = rows.write_port(domain="compute")
+
+        top_slot = Signal(2, reset=0)
+        next_slot = Signal(2, reset=1)
+        work_slot = Signal(2)
+        m.d.comb += work_slot.eq((3 - top_slot - next_slot)[:2])
+
+        def slot_base(slot):
+            return (slot * words)[:len(engine_rd.addr)]
+
+        # Frame: take the command, then one read-modify-write pass over the topline to apply scribbles
+
+        table = Signal(8)
+        generations = Signal(8)
+        scribble = Signal(4)
+        parity = Signal(1)
+
+        waiting = Signal(1, reset=1) # For the next frame's command
+        passing = Signal(1)
+        pass_count = Signal(range(words + 1))
+        row = Signal(range(VID_V_ACTIVE)) # Row whose next generation is being stepped
+        row_wait = Signal(1) # For room in row_fifo to start stepping
+
+        received = FRAME_COMMAND(commands.r_data)
+        with m.If(waiting & commands.r_rdy):
+            m.d.comb += commands.r_en.eq(1)
+            m.d.compute += [
+                table.eq(received.table),
+                generations.eq(received.generations),
+                scribble.eq(received.scribble),
+                parity.eq(received.parity),
+                waiting.eq(0),
+                passing.eq(1),
+                pass_count.eq(0),
+            ]
+            with m.If(received.backcopy):
+                m.d.compute += [
+                    top_slot.eq(next_slot),
+                    next_slot.eq(top_slot),
+                ]
+
+        scribbled = Signal(cells)
+        m.d.comb += scribbled.eq(engine_rd.data)
+        for kind, kind_cells in enumerate(self.scribble_cells): # Later kinds win, as in app_elaborate
+            for cell, value in kind_cells:
+                with m.If(scribble[kind] & (pass_count == cell // cells + 1)):
+                    m.d.comb += scribbled[cell % cells].eq(value)
+
+        with m.If(passing):
+            m.d.compute += pass_count.eq(pass_count + 1)
+            with m.If(pass_count != words):
+                m.d.comb += engine_rd.addr.eq(slot_base(top_slot) + pass_count)
+
+            with m.If(pass_count != 0): # engine_rd.data is word pass_count-1
+                m.d.comb += [
+                    engine_wr.addr.eq(slot_base(top_slot) + pass_count - 1),
+                    engine_wr.data.eq(scribbled),
+                    engine_wr.en.eq(1),
+                ]
+            with m.If(pass_count == words):
+                m.d.compute += [
+                    passing.eq(0),
+                    row_wait.eq(1),
+                    row.eq(0),
+                ]
+
+        # Step: compute the next generation of each row, sending the row to the display as it is read
+        # As in LineBufferEngine: reads the final word (for the left neighbour of cell 0), then words 0
+        # onward, writing each output word once the word after it (for the right neighbour) has
+        # arrived. Each word is read two cycles before it is written, so further generations step
+        # in place. Addresses are only driven when used, as out of range ones are errors in simulation.
+
+        stepping = Signal(1)
+        step_count = Signal(range(words + 3))
+        steps_left = Signal(range(self.generations_max)) # Generations still to go after this one
+        step_in_place = Signal(1)
+        from_slot = Signal(2)
+        to_slot = Signal(2)
+        m.d.comb += [
+            to_slot.eq(Mux(row == 0, next_slot, work_slot)),
+            from_slot.eq(Mux(step_in_place | (row > 1), to_slot, Mux(row == 0, top_slot, next_slot))),
+        ]
+        first_word = Signal(cells) # Word 0, for the right neighbour of the final cell
+        this_word = Signal(cells)
+        left_cell = Signal(1) # Cell before this_word
+
+        def rule(neighbours): # neighbours is cells+2 bits, giving one output cell per inner bit
+            return Cat(table.bit_select(neighbours[i:i+3], 1) for i in range(cells))
+
+        # Start a row only once the FIFO has room for all of it, so sending it never has to wait
+        with m.If(row_wait & (row_fifo.w_level <= row_fifo.depth - words)):
+            m.d.compute += [
+                row_wait.eq(0),
+                stepping.eq(1),
+                step_count.eq(0),
+                steps_left.eq(generations - 1),
+                step_in_place.eq(0),
+            ]
+
+        with m.If(stepping):
+            m.d.compute += step_count.eq(step_count + 1)
+
+            with m.If(step_count == 0):
+                m.d.comb += engine_rd.addr.eq(slot_base(from_slot) + words - 1)
+            with m.Elif(step_count <= words):
+                m.d.comb += engine_rd.addr.eq(slot_base(from_slot) + step_count - 1)
+
+            with m.If(step_count == 1): # engine_rd.data is the final word
+                m.d.compute += left_cell.eq(engine_rd.data[last_cell])
+            with m.If(step_count == 2): # engine_rd.data is word 0
+                m.d.compute += [
+                    first_word.eq(engine_rd.data),
+                    this_word.eq(engine_rd.data),
+                ]
+            with m.If(~step_in_place & (step_count >= 2) & (step_count <= words + 1)): # Word step_count-2
+                sent_word = ROW_WORD(row_fifo.w_data)
+                m.d.comb += [
+                    sent_word.cells.eq(engine_rd.data),
+                    sent_word.first.eq((row == 0) & (step_count == 2)),
+                    sent_word.parity.eq(parity),
+                    row_fifo.w_en.eq(1),
+                ]
+            with m.If((step_count >= 3) & (step_count <= words + 2)): # Write word step_count-3
+                m.d.comb += engine_wr.addr.eq(slot_base(to_slot) + step_count - 3)
+            with m.If((step_count >= 3) & (step_count < words + 2)):
+                m.d.comb += [
+                    engine_wr.data.eq(rule(Cat(left_cell, this_word, engine_rd.data[0]))),
+                    engine_wr.en.eq(1),
+                ]
+                m.d.compute += [
+                    left_cell.eq(this_word[-1]),
+                    this_word.eq(engine_rd.data),
+                ]
+            with m.If(step_count == words + 2): # Write the final word, wrapping around to cell 0
+                m.d.comb += [
+                    engine_wr.data.eq(rule(Cat(left_cell, this_word[:last_cell+1], first_word[0], Const(0, cells - last_cell - 1)))),
+                    engine_wr.en.eq(1),
+                ]
+                with m.If(steps_left != 0):
+                    m.d.compute += [
+                        steps_left.eq(steps_left - 1),
+                        step_in_place.eq(1),
+                        step_count.eq(0),
+                    ]
+                with m.Else():
+                    m.d.compute += stepping.eq(0)
+                    with m.If(row == VID_V_ACTIVE - 1): # Sent the whole frame
+                        m.d.compute += waiting.eq(1)
+                    with m.Else():
+                        m.d.compute += [
+                            row.eq(row + 1),
+                            row_wait.eq(1),
+                        ]
+
+        return m
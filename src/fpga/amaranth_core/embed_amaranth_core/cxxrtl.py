@@ -0,0 +1,378 @@
+# Compiled simulation backend: the design is converted to C++ with yosys' CXXRTL backend, built
+# into a shared library and driven through the CXXRTL C API with ctypes. CxxrtlSimulator accepts
+# the same bench processes as amaranth.sim.Simulator (the subset of commands our benches use), and
+# runs stretches where no bench needs to look at the design entirely in native code.
+
+import ctypes
+import hashlib
+import heapq
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+from amaranth import *
+from amaranth.hdl import ast, ir
+from amaranth.back import cxxrtl
+from amaranth.sim import Settle, Delay, Tick, Passive, Active
+from amaranth._toolchain.yosys import find_yosys
+
+from .sim import Until, expand_until
+
+
+BUILD_DIR = Path(__file__).parent.parent / "build" / "cxxrtl"
+
+# First yosys whose CXXRTL runtime is laid out as DRIVER_SOURCE includes it (runtime/cxxrtl/capi/);
+# older ones keep it all in backends/cxxrtl/. Also pinned in pyproject.toml
+YOSYS_MIN = (0, 37)
+
+# Runs whole clock cycles natively, so Python is only involved when a bench wakes up. Nothing in the
+# design uses the falling edge, so that is only committed rather than evaluated (unless tracing).
+# Given an `until` object, stops early after the first cycle where (its value & mask) == value is
+# `equal`, and returns how many cycles it ran.
+DRIVER_SOURCE = """
+#include <cxxrtl/capi/cxxrtl_capi.cc>
+#include <cxxrtl/capi/cxxrtl_capi_vcd.cc>
+
+extern "C" size_t sim_cycles(cxxrtl_handle handle, cxxrtl_object *clk, size_t cycles,
+                             cxxrtl_vcd vcd, uint64_t time, uint64_t half_period,
+                             cxxrtl_object *until, uint32_t mask, uint32_t value, int equal) {
+    for (size_t cycle = 0; cycle < cycles; cycle++) {
+        *clk->next = 1;
+        cxxrtl_step(handle);
+        if (vcd)
+            cxxrtl_vcd_sample(vcd, time);
+        *clk->next = 0;
+        if (vcd) {
+            cxxrtl_step(handle);
+            cxxrtl_vcd_sample(vcd, time + half_period);
+        } else {
+            cxxrtl_commit(handle);
+        }
+        time += 2 * half_period;
+        if (until) {
+            if (until->outline)
+                cxxrtl_outline_eval(until->outline);
+            if (((until->curr[0] & mask) == value) == (equal != 0))
+                return cycle + 1;
+        }
+    }
+    return cycles;
+}
+"""
+
+
+class _Object(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("width", ctypes.c_size_t),
+        ("lsb_at", ctypes.c_size_t),
+        ("depth", ctypes.c_size_t),
+        ("zero_at", ctypes.c_size_t),
+        ("curr", ctypes.POINTER(ctypes.c_uint32)),
+        ("next", ctypes.POINTER(ctypes.c_uint32)),
+        ("outline", ctypes.c_void_p),
+        ("attrs", ctypes.c_void_p),
+    ]
+
+
+def _compile(source):
+    compiler = os.environ.get("CXX", "c++")
+    flags = ["-std=c++14", "-O2", "-shared", "-fPIC", "-Wno-deprecated-declarations"]
+    # find_yosys is private to Amaranth, so check what it hands back too
+    yosys = find_yosys(lambda ver: ver >= YOSYS_MIN)
+    version = yosys.version()
+    if version is None or version < YOSYS_MIN:
+        raise RuntimeError(f"CXXRTL models need yosys {'.'.join(map(str, YOSYS_MIN))} or newer, found {version}")
+    include = yosys.data_dir() / "include" / "backends" / "cxxrtl" / "runtime"
+    if not (include / "cxxrtl" / "capi" / "cxxrtl_capi.cc").exists():
+        raise RuntimeError(f"No CXXRTL runtime in {include}")
+
+    digest = hashlib.sha256("\0".join([source, DRIVER_SOURCE, compiler, *flags]).encode()).hexdigest()[:16]
+    library = BUILD_DIR / f"{digest}{'.dll' if sys.platform == 'win32' else '.so'}"
+    if not library.exists():
+        # Per-process names, as parallel runs (see sweep.py) may compile the same model at once
+        BUILD_DIR.mkdir(parents=True, exist_ok=True)
+        temp_source = BUILD_DIR / f"{digest}.{os.getpid()}.cc"
+        temp_library = BUILD_DIR / f"{digest}.{os.getpid()}.tmp"
+        temp_source.write_text(source + DRIVER_SOURCE)
+        print(f"Compiling CXXRTL model {library.name}...")
+        subprocess.run([compiler, *flags, f"-I{include}", str(temp_source), "-o", str(temp_library)], check=True)
+        os.replace(temp_source, BUILD_DIR / f"{digest}.cc")
+        os.replace(temp_library, library)
+    return ctypes.CDLL(str(library))
+
+
+class CxxrtlSimulator:
+    def __init__(self, fragment, clock_domain, clock_period):
+        fragment = ir.Fragment.get(fragment, platform=None).prepare()
+        source, name_map = cxxrtl.convert_fragment(fragment, "top")
+        self._names = ast.SignalDict((signal, " ".join(path[1:])) for signal, path in name_map.items())
+
+        lib = self._lib = _compile(source)
+        lib.cxxrtl_design_create.restype = ctypes.c_void_p
+        lib.cxxrtl_create.restype = ctypes.c_void_p
+        lib.cxxrtl_create.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_get_parts.restype = ctypes.POINTER(_Object)
+        lib.cxxrtl_get_parts.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)]
+        lib.cxxrtl_eval.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_commit.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_step.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_outline_eval.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_vcd_create.restype = ctypes.c_void_p
+        lib.cxxrtl_vcd_timescale.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p]
+        lib.cxxrtl_vcd_add_from.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        lib.cxxrtl_vcd_sample.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+        lib.cxxrtl_vcd_read.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t)]
+        lib.cxxrtl_vcd_destroy.argtypes = [ctypes.c_void_p]
+        lib.sim_cycles.restype = ctypes.c_size_t
+        lib.sim_cycles.argtypes = [ctypes.c_void_p, ctypes.POINTER(_Object), ctypes.c_size_t,
+                                   ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint64,
+                                   ctypes.POINTER(_Object), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_int]
+
+        self._handle = lib.cxxrtl_create(lib.cxxrtl_design_create())
+        self._objects = ast.SignalDict()
+        self._clk = self._object(fragment.domains[clock_domain].clk)
+        assert self._clk.next, "Clock must be a wire in the CXXRTL model"
+        self._clk_pointer = ctypes.pointer(self._clk)
+
+        # Same timeline as pysim: integer picoseconds, first rising edge half a period in
+        self._period = int(clock_period * 1e12)
+        self._phase = self._period // 2
+        self._cycles = 0 # Rising edges so far
+        self._now = 0
+
+        self._processes = [] # [generator, passive]
+        self._delayed = [] # Heap of (wake time, order, process, None or (Until, clocks waited))
+        self._ticking = [] # Processes waiting for the next rising edge
+        self._order = 0
+        self._vcd = None
+
+        # Signals nothing drives are inputs of the model, which start at 0 rather than at their reset
+        # value (e.g. the `en` of a memory read port)
+        for signal, direction in fragment.ports.items():
+            if direction == "i" and signal.reset and signal in self._names:
+                self._write(signal.eq(signal.reset))
+        lib.cxxrtl_step(self._handle) # Settle reset values
+
+    def _object(self, signal):
+        if signal not in self._objects:
+            if signal not in self._names:
+                raise NameError(f"Signal {signal!r} is not part of the simulated design")
+            parts = ctypes.c_size_t()
+            obj = self._lib.cxxrtl_get_parts(self._handle, self._names[signal].encode(), ctypes.byref(parts))
+            if not obj or parts.value != 1:
+                raise NameError(f"Signal {signal!r} ({self._names[signal]}) is not visible in the CXXRTL model")
+            self._objects[signal] = obj.contents
+        return self._objects[signal]
+
+    # Whether benches can read and write `signal`, which the compiled model may have optimized away
+    def is_visible(self, signal):
+        try:
+            self._object(signal)
+            return True
+        except NameError:
+            return False
+
+    def _read(self, value):
+        if isinstance(value, ast.ValueCastable):
+            value = Value.cast(value)
+        if isinstance(value, Const):
+            return value.value
+        if isinstance(value, ast.Slice):
+            raw = self._read(value.value) & ((1 << len(value.value)) - 1)
+            result = (raw >> value.start) & ((1 << (value.stop - value.start)) - 1)
+        elif isinstance(value, Signal):
+            obj = self._object(value)
+            if obj.outline:
+                self._lib.cxxrtl_outline_eval(obj.outline)
+            result = 0
+            for chunk in range((obj.width + 31) // 32):
+                result |= obj.curr[chunk] << (32 * chunk)
+        else:
+            raise NotImplementedError(f"Reading {value!r} is not supported by the cxxrtl backend")
+        return Const(result, value.shape()).value
+
+    def _write(self, stmt):
+        lhs, rhs = stmt.lhs, self._read(stmt.rhs)
+        if isinstance(lhs, ast.Slice):
+            width = lhs.stop - lhs.start
+            mask = ((1 << width) - 1) << lhs.start
+            rhs = (self._read(lhs.value) & ~mask) | ((rhs << lhs.start) & mask)
+            lhs = lhs.value
+        if not isinstance(lhs, Signal):
+            raise NotImplementedError(f"Assigning to {lhs!r} is not supported by the cxxrtl backend")
+        obj = self._object(lhs)
+        target = obj.next or obj.curr # Wires take the new value in `next`, plain values only have `curr`
+        rhs &= (1 << obj.width) - 1
+        for chunk in range((obj.width + 31) // 32):
+            target[chunk] = (rhs >> (32 * chunk)) & 0xFFFFFFFF
+
+    def _settle(self):
+        self._lib.cxxrtl_step(self._handle)
+        if self._vcd:
+            self._lib.cxxrtl_vcd_sample(self._vcd, self._now)
+            self._vcd_drain()
+
+    def add_process(self, process):
+        entry = [process(), False]
+        self._processes.append(entry)
+        self._order += 1
+        heapq.heappush(self._delayed, (self._now, self._order, entry, None))
+
+    def add_sync_process(self, process, *, domain="sync"):
+        # Like pysim, a sync process starts after the first clock edge. Until is only native
+        # for other processes, as these have to see every edge anyway
+        entry = [expand_until(process, None)(), False]
+        self._processes.append(entry)
+        self._ticking.append(entry)
+
+    # Run a process until it blocks. Sync processes see the values from just before a clock edge
+    # and their writes land after it, so they collect writes in `deferred`.
+    def _resume(self, entry, deferred, response=None):
+        generator, _ = entry
+        while True:
+            try:
+                command = generator.send(response)
+            except StopIteration:
+                entry[1] = True
+                self._processes.remove(entry)
+                return
+            response = None
+            if command is None or isinstance(command, Tick):
+                self._ticking.append(entry)
+                return
+            elif isinstance(command, Delay):
+                self._order += 1
+                interval = 0 if command.interval is None else int(command.interval * 1e12)
+                heapq.heappush(self._delayed, (self._now + interval, self._order, entry, None))
+                return
+            elif isinstance(command, Until):
+                if command.met(self._read(command.signal)):
+                    response = 0
+                    continue
+                self._order += 1
+                heapq.heappush(self._delayed, (self._now + self._period, self._order, entry, (command, 1)))
+                return
+            elif isinstance(command, Settle):
+                pass
+            elif isinstance(command, Passive):
+                entry[1] = True
+            elif isinstance(command, Active):
+                entry[1] = False
+            elif isinstance(command, ast.Assign):
+                if deferred is None:
+                    self._write(command)
+                    self._settle()
+                else:
+                    deferred.append(command)
+            elif isinstance(command, (Value, ast.ValueCastable)):
+                response = self._read(command)
+            else:
+                raise TypeError(f"Received unsupported command {command!r} from process {generator!r}")
+
+    def _edge_time(self, cycle):
+        return self._phase + cycle * self._period
+
+    def _run_cycles(self, count, until=None):
+        if count <= 0:
+            return 0
+        if until is None:
+            watch = (None, 0, 0, 1)
+        else:
+            obj = self._object(until.signal)
+            mask = (1 << obj.width) - 1
+            watch = (ctypes.pointer(obj), mask, 0, 0) if until.value is None else \
+                (ctypes.pointer(obj), mask, until.value & mask, 1)
+        count = self._lib.sim_cycles(self._handle, self._clk_pointer, count, self._vcd,
+                                     self._edge_time(self._cycles), self._period // 2, *watch)
+        self._cycles += count
+        self._now = self._edge_time(self._cycles - 1) + self._period // 2
+        if self._vcd:
+            self._vcd_drain()
+        return count
+
+    # A process waiting on `until` for `clocks` so far looks again. If that is not enough, the design
+    # runs natively until it is or anything else is due, and the process looks in once per clock
+    # from there on.
+    def _wake_until(self, entry, until, clocks, deadline):
+        if until.met(self._read(until.signal)):
+            self._resume(entry, deferred=None, response=clocks)
+            return
+        due = [time for time in (self._delayed[0][0] if self._delayed else None, deadline) if time is not None]
+        checks = (min(due) - self._now - 1) // self._period if due else 1 << 20 # That land before then
+        if self._ticking or checks <= 0 or len(until.signal) > 32: # Wider ones are only checked from here
+            self._order += 1
+            heapq.heappush(self._delayed, (self._now + self._period, self._order, entry, (until, clocks + 1)))
+            return
+        now = self._now
+        ran = self._run_cycles(checks, until)
+        self._now = now + ran * self._period
+        self._order += 1
+        heapq.heappush(self._delayed, (self._now, self._order, entry, (until, clocks + ran)))
+
+    def _active(self):
+        return any(not passive for _, passive in self._processes)
+
+    def advance(self, deadline=None):
+        next_edge = self._edge_time(self._cycles)
+        next_wake = self._delayed[0][0] if self._delayed else None
+
+        if next_wake is not None and next_wake < next_edge:
+            _, _, entry, waiting = heapq.heappop(self._delayed)
+            self._now = next_wake
+            if waiting:
+                self._wake_until(entry, *waiting, deadline)
+            else:
+                self._resume(entry, deferred=None)
+        elif self._ticking:
+            ticking, self._ticking = self._ticking, []
+            self._now = next_edge
+            deferred = []
+            for entry in ticking:
+                self._resume(entry, deferred)
+            self._run_cycles(1)
+            for stmt in deferred:
+                self._write(stmt)
+            if deferred:
+                self._settle()
+        else:
+            # Nothing needs the design until the next wakeup (or deadline); run straight there
+            until = min((t for t in (next_wake, deadline) if t is not None), default=None)
+            if until is None:
+                return False
+            self._run_cycles(max(1, (until - self._phase) // self._period + 1 - self._cycles))
+        return self._active()
+
+    def run(self):
+        while self._active() and self.advance():
+            pass
+
+    def run_until(self, deadline, *, run_passive=False):
+        deadline = int(deadline * 1e12)
+        while (self._active() or run_passive) and self._now < deadline:
+            if not self.advance(deadline) and not run_passive:
+                break
+
+    @contextmanager
+    def write_vcd(self, vcd_file, gtkw_file=None, *, traces=()):
+        lib = self._lib
+        with open(vcd_file, "wb") as file:
+            def drain():
+                data, size = ctypes.c_char_p(), ctypes.c_size_t()
+                lib.cxxrtl_vcd_read(self._vcd, ctypes.byref(data), ctypes.byref(size))
+                file.write(ctypes.string_at(data, size.value))
+
+            self._vcd = lib.cxxrtl_vcd_create()
+            self._vcd_drain = drain
+            lib.cxxrtl_vcd_timescale(self._vcd, 1, b"ps")
+            lib.cxxrtl_vcd_add_from(self._vcd, self._handle)
+            lib.cxxrtl_vcd_sample(self._vcd, self._now)
+            try:
+                yield
+                drain()
+            finally:
+                lib.cxxrtl_vcd_destroy(self._vcd)
+                self._vcd = None
@@ -0,0 +1,245 @@
+# Cellular automaton engine which keeps its rows in block RAM instead of VID_H_ACTIVE-bit registers
+# The register engine in app_toplevel.py steps a whole row combinationally in the hsync cycle, so its
+# logic grows with the width of the screen. This one computes the next row while the current one is
+# on screen, LINE_WORD_CELLS cells per clock, and swaps it in at hsync; at the outputs it behaves
+# exactly like the register engine.
+
+from amaranth import *
+from amaranth.lib import wiring
+from amaranth.lib.wiring import In, Out
+
+from .resolution import *
+
+
+LINE_WORD_CELLS = 8 # RAM word width, so also cells stepped per clock. Must be a power of 2
+
+
+class LineBufferEngine(wiring.Component):
+    table           : In(8) # Rule lookup, indexed by Cat(left, cell, right)
+    generations     : In(8) # Generations each row is ahead of the one above, 1 up to generations_max
+    x_count         : In(10)
+    step            : In(1) # Hsync of a row that steps: display the next generation from now on
+    backcopy        : In(1) # With step: the next generation also becomes the topline
+    frame           : In(1) # Vsync: scribble on the topline and display from it again
+    snapshot        : In(1) # With frame: audio restarts from the topline (as it was before scribbling)
+    scribble        : In(4) # With frame: which ScribbleKinds to apply
+    audio_rotate    : In(1) # Move audio on to the next cell
+    pixel           : Out(1) # Cell under x_count; valid from one cycle after x_count changes
+    audio           : Out(1) # Current audio cell
+
+    # `scribble_cells` is a list, in ScribbleKind order, of the (cell, value) pairs each kind writes
+    def __init__(self, width, scribble_cells, generations_max=1):
+        super().__init__()
+
+        assert LINE_WORD_CELLS >= 2 and LINE_WORD_CELLS & (LINE_WORD_CELLS - 1) == 0
+        self.width = width
+        self.words = -(-width // LINE_WORD_CELLS)
+        self.scribble_cells = scribble_cells
+        self.generations_max = generations_max
+
+        # Every generation of the next row has to be computed while the current one is on screen
+        assert generations_max * (self.words + 3) <= VID_H_TOTAL * VID_DIV_RATIO, \
+            "Too many generations per row to compute in the time of a row"
+
+    def elaborate(self, platform):
+        m = Module()
+
+        cells = LINE_WORD_CELLS
+        words = self.words
+        shift = cells.bit_length() - 1
+        last_cell = (self.width - 1) % cells # Position of the final cell in the final word
+
+        initial = 1 << (self.width//2) # Initial state value of first line
+        initial_words = [(initial >> (word*cells)) & ((1 << cells) - 1) for word in range(words)]
+        initial_head = initial & 0b11
+
+        # Rows
+        # Three slots: topline, row on display and row being computed. Just after vsync the row on
+        # display *is* the topline, and the backcopy makes the topline the row on display, so
+        # there is always a free slot to compute into.
+        rows = Memory(width=cells, depth=3*words, init=initial_words)
+        m.submodules.display_rd = display_rd = rows.read_port(transparent=False)
+        m.submodules.engine_rd = engine_rd = rows.read_port(transparent=False)
+        m.submodules.engine_wr = engine_wr = rows.write_port()
+
+        top_slot = Signal(2, reset=0)
+        cur_slot = Signal(2, reset=0)
+        nxt_slot = Signal(2, reset=1)
+
+        def slot_base(slot):
+            return (slot * words)[:len(engine_rd.addr)]
+
+        def free_slot(a, b): # Slot which is neither a nor b
+            return Mux(a == b, Mux(a == 2, 0, a + 1), 3 - a - b)[:2]
+
+        # Cells 0 and 1 of the topline and of the row being computed, kept in registers so audio
+        # can restart from the topline instantly at vsync
+        top_head = Signal(2, reset=initial_head)
+        nxt_head = Signal(2)
+
+        # Display
+
+        x = Signal(10)
+        m.d.comb += x.eq(self.x_count - VID_H_BPORCH)
+        with m.If(x < self.width):
+            m.d.comb += display_rd.addr.eq(slot_base(cur_slot) + x[shift:])
+        m.d.comb += self.pixel.eq(display_rd.data.bit_select(x[:shift], 1))
+
+        # Step: compute the next generation of cur_slot into nxt_slot
+        # Reads the final word (for the left neighbour of cell 0), then words 0 onward, writing each
+        # output word once the word after it (for the right neighbour) has arrived. Each word is
+        # read two cycles before it is written, so further generations step nxt_slot in place.
+        # Addresses are only driven when used, as out of range ones are errors in simulation.
+
+        stepping = Signal(1, reset=1) # Compute the generation after the initial line straight away
+        step_count = Signal(range(words + 3))
+        steps_left = Signal(range(self.generations_max)) # Generations still to go after this one
+        step_in_place = Signal(1) # Stepping nxt_slot rather than cur_slot
+        step_slot = Signal(2)
+        m.d.comb += step_slot.eq(Mux(step_in_place, nxt_slot, cur_slot))
+        first_word = Signal(cells) # Word 0, for the right neighbour of the final cell
+        this_word = Signal(cells)
+        left_cell = Signal(1) # Cell before this_word
+
+        def rule(neighbours): # neighbours is cells+2 bits, giving one output cell per inner bit
+            return Cat(self.table.bit_select(neighbours[i:i+3], 1) for i in range(cells))
+
+        with m.If(stepping):
+            m.d.sync += step_count.eq(step_count + 1)
+
+            with m.If(step_count == 0):
+                m.d.comb += engine_rd.addr.eq(slot_base(step_slot) + words - 1)
+            with m.Elif(step_count <= words):
+                m.d.comb += engine_rd.addr.eq(slot_base(step_slot) + step_count - 1)
+
+            with m.If(step_count == 1): # engine_rd.data is the final word
+                m.d.sync += left_cell.eq(engine_rd.data[last_cell])
+            with m.If(step_count == 2): # engine_rd.data is word 0
+                m.d.sync += [
+                    first_word.eq(engine_rd.data),
+                    this_word.eq(engine_rd.data),
+                ]
+            with m.If((step_count >= 3) & (step_count <= words + 2)): # Write word step_count-3
+                m.d.comb += engine_wr.addr.eq(slot_base(nxt_slot) + step_count - 3)
+            with m.If((step_count >= 3) & (step_count < words + 2)):
+                m.d.comb += [
+                    engine_wr.data.eq(rule(Cat(left_cell, this_word, engine_rd.data[0]))),
+                    engine_wr.en.eq(1),
+                ]
+                m.d.sync += [
+                    left_cell.eq(this_word[-1]),
+                    this_word.eq(engine_rd.data),
+                ]
+            with m.If(step_count == words + 2): # Write the final word, wrapping around to cell 0
+                m.d.comb += [
+                    engine_wr.data.eq(rule(Cat(left_cell, this_word[:last_cell+1], first_word[0], Const(0, cells - last_cell - 1)))),
+                    engine_wr.en.eq(1),
+                ]
+                with m.If(steps_left != 0):
+                    m.d.sync += [
+                        steps_left.eq(steps_left - 1),
+                        step_in_place.eq(1),
+                        step_count.eq(0),
+                    ]
+                with m.Else():
+                    m.d.sync += stepping.eq(0)
+            with m.If(step_count == 3): # Word 0
+                m.d.sync += nxt_head.eq(engine_wr.data[:2])
+
+        with m.If(self.step):
+            new_top = Mux(self.backcopy, nxt_slot, top_slot)
+            m.d.sync += [
+                cur_slot.eq(nxt_slot),
+                top_slot.eq(new_top),
+                nxt_slot.eq(free_slot(nxt_slot, new_top)),
+                stepping.eq(1),
+                step_count.eq(0),
+                steps_left.eq(self.generations - 1),
+                step_in_place.eq(0),
+            ]
+            with m.If(self.backcopy):
+                m.d.sync += top_head.eq(nxt_head)
+
+        # Frame: one read-modify-write pass over the topline, applying scribbles and (for a
+        # snapshot) copying the unscribbled words to audio, then compute the topline's next generation
+
+        audio_cells = Memory(width=cells, depth=words, init=initial_words)
+        m.submodules.audio_rd = audio_rd = audio_cells.read_port(transparent=False)
+        m.submodules.audio_wr = audio_wr = audio_cells.write_port()
+
+        audio_pos = Signal(range(self.width)) # Audio cell
+        audio_head = Signal(2, reset=initial_head) # Cells 0 and 1 of audio_cells
+
+        passing = Signal(1)
+        pass_count = Signal(range(words + 1))
+        pass_scribble = Signal(4)
+        pass_snapshot = Signal(1)
+
+        scribbled = Signal(cells)
+        m.d.comb += scribbled.eq(engine_rd.data)
+        for kind, kind_cells in enumerate(self.scribble_cells): # Later kinds win, as in app_elaborate
+            for cell, value in kind_cells:
+                with m.If(pass_scribble[kind] & (pass_count == cell // cells + 1)):
+                    m.d.comb += scribbled[cell % cells].eq(value)
+
+        with m.If(passing):
+            m.d.sync += pass_count.eq(pass_count + 1)
+            with m.If(pass_count != words):
+                m.d.comb += engine_rd.addr.eq(slot_base(top_slot) + pass_count)
+
+            with m.If(pass_count != 0): # engine_rd.data is word pass_count-1
+                m.d.comb += [
+                    engine_wr.addr.eq(slot_base(top_slot) + pass_count - 1),
+                    engine_wr.data.eq(scribbled),
+                    engine_wr.en.eq(1),
+                    audio_wr.addr.eq(pass_count - 1),
+                    audio_wr.data.eq(engine_rd.data),
+                    audio_wr.en.eq(pass_snapshot),
+                ]
+            with m.If(pass_count == words):
+                m.d.sync += [
+                    passing.eq(0),
+                    stepping.eq(1),
+                    step_count.eq(0),
+                    steps_left.eq(self.generations - 1),
+                    step_in_place.eq(0),
+                ]
+
+        with m.If(self.frame):
+            m.d.sync += [
+                cur_slot.eq(top_slot),
+                nxt_slot.eq(free_slot(top_slot, top_slot)),
+                passing.eq(1),
+                pass_count.eq(0),
+                pass_scribble.eq(self.scribble),
+                pass_snapshot.eq(self.snapshot),
+            ]
+            for kind, kind_cells in enumerate(self.scribble_cells):
+                for cell, value in kind_cells:
+                    if cell < 2:
+                        with m.If(self.scribble[kind]):
+                            m.d.sync += top_head[cell].eq(value)
+
+            with m.If(self.snapshot):
+                m.d.sync += [
+                    audio_pos.eq(0),
+                    audio_head.eq(top_head),
+                ]
+
+        # Audio
+        # Cells 0 and 1 come from audio_head: a rotation can land right after vsync, before the pass
+        # has refilled audio_cells, but the next one is always several thousand cycles later.
+
+        with m.Elif(self.audio_rotate):
+            m.d.sync += audio_pos.eq(Mux(audio_pos == self.width - 1, 0, audio_pos + 1))
+
+        m.d.comb += audio_rd.addr.eq(audio_pos[shift:])
+        with m.Switch(audio_pos):
+            with m.Case(0):
+                m.d.comb += self.audio.eq(audio_head[0])
+            with m.Case(1):
+                m.d.comb += self.audio.eq(audio_head[1])
+            with m.Default():
+                m.d.comb += self.audio.eq(audio_rd.data.bit_select(audio_pos[:shift], 1))
+
+        return m
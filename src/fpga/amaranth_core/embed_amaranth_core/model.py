@@ -0,0 +1,207 @@
+# Software reference ("golden") model of the AppToplevel cellular automaton
+# Works a frame at a time on rows of cells held as NumPy bit arrays (one uint8 0/1 per cell,
+# bit i of the row is screen column i), instead of simulating the design cycle by cycle. Bytes
+# rather than packed words, so a generation is one table lookup over the row, and frames come out
+# ready to compare against captured pixels.
+
+import numpy as np
+
+from .resolution import *
+from .app_toplevel import DEBUG_NO_OPENING_PAUSE, DEBUG_NO_CONTROLS, \
+    SPEED_LEVELS, SPEED_INITIAL, ScribbleKind, AUTO_RULE_BITS, AUTO_DEFAULT, LINE_GENERATIONS_MAX, scribble_cells
+
+OPENING_COUNTDOWN = (1<<6)-1 # Matches opening_countdown_timer_reset_value
+
+# cont1_key bits, as decoded by app_elaborate
+KEY_START = 15
+KEY_SELECT = 14
+KEY_L = 8
+KEY_R = 9
+KEY_SCRIBBLE = [7, 6, 5, 4] # Y, X, B, A; index is ScribbleKind
+KEY_AUTOMATA = [0, 2, 3, 1] # Up, Left, Right, Down; index is AutoKind
+
+
+def rule_lut(table):
+    # 8-bit automata_table value -> lookup array indexed by neighbourhood
+    return np.array([(table >> idx) & 1 for idx in range(8)], dtype=np.uint8)
+
+
+def initial_line(width=VID_H_ACTIVE):
+    line = np.zeros(width, dtype=np.uint8)
+    line[width//2] = 1
+    return line
+
+
+def step(cells, lut):
+    # One CA generation. Neighbourhood index is Cat(cell[i-1], cell[i], cell[i+1]) with wraparound,
+    # exactly as in app_elaborate. Works on any leading batch dimensions.
+    index = np.roll(cells, 1, axis=-1) | (cells << 1) | (np.roll(cells, -1, axis=-1) << 2)
+    return lut[index]
+
+
+def generations(cells, lut, count):
+    # Stack `count` successive generations starting with `cells` itself. Same result as calling
+    # step() repeatedly, but works in place in one buffer with a wraparound column on each side.
+    width = cells.shape[-1]
+    buf = np.empty((count,) + cells.shape[:-1] + (width+2,), dtype=np.uint8)
+    buf[0, ..., 1:-1] = cells
+    index = np.empty(cells.shape, dtype=np.uint8)
+    for row in range(1, count):
+        prev = buf[row-1]
+        prev[..., 0] = prev[..., width]
+        prev[..., width+1] = prev[..., 1]
+        np.left_shift(prev[..., 1:-1], 1, out=index)
+        index |= prev[..., :-2]
+        index |= prev[..., 2:] << 2
+        np.take(lut, index, out=buf[row, ..., 1:-1])
+    return buf[..., 1:-1]
+
+
+def frame_rgb(frame):
+    # Cell bits -> 8-bit greyscale pixels as drawn by flash_color (set cell is black)
+    return (1 - frame) * 0xFF
+
+
+class AutomatonModel:
+    def __init__(self, width=VID_H_ACTIVE, height=VID_V_ACTIVE):
+        self.width = width
+        self.height = height
+
+        self.topline = initial_line(width)
+        self.audgen = self.topline.copy()
+        self.table = AUTO_RULE_BITS[AUTO_DEFAULT]
+        self.automata_next = self.table
+        self.need_automata_next = False
+        self.line_generations = 1
+        self.line_generations_next = 1
+
+        self.frame_frozen = not DEBUG_NO_OPENING_PAUSE
+        self.opening_countdown = 0 if DEBUG_NO_OPENING_PAUSE else OPENING_COUNTDOWN
+        self.pause = False
+        self.need_frozen_exception = False
+
+        self.speed_counter = 0
+        self.speed_mask = (1 << SPEED_INITIAL) - 1
+
+        self.scribble_hold = [False] * len(ScribbleKind)
+        self.scribble_single = [False] * len(ScribbleKind)
+
+        self.keys = 0
+        self.frame_count = 0
+
+        self._lut = rule_lut(self.table)
+        self._drawn = None # (table, line_generations, topline, frame) of the last frame drawn; frozen frames repeat it
+
+    # Controls. The model assumes a cont1_key change lands during a frame, before its vsync.
+    def press(self, keys):
+        if DEBUG_NO_CONTROLS:
+            self.keys = keys
+            return
+
+        pressed = keys & ~self.keys
+        released = self.keys & ~keys
+        select = bool(keys & (1 << KEY_SELECT))
+        self.keys = keys
+
+        if pressed & (1 << KEY_START):
+            if select:
+                if not self.pause: # Perform one step then freeze for 64 frames
+                    self.opening_countdown = OPENING_COUNTDOWN
+                self.need_frozen_exception = True
+            else:
+                self.pause = not self.pause
+
+        l_press = bool(pressed & (1 << KEY_L))
+        r_press = bool(pressed & (1 << KEY_R))
+        if l_press and not r_press:
+            self.speed_mask = ((self.speed_mask << 1) | 1) & ((1 << SPEED_LEVELS) - 1)
+        elif r_press and not l_press:
+            self.speed_mask >>= 1
+
+        for idx, bit in enumerate(KEY_SCRIBBLE):
+            if pressed & (1 << bit):
+                if select:
+                    self.scribble_single[idx] = True
+                else:
+                    self.scribble_hold[idx] = True
+            elif released & (1 << bit):
+                self.scribble_hold[idx] = False
+
+        for idx, bit in enumerate(KEY_AUTOMATA):
+            if pressed & (1 << bit):
+                self.automata_next = AUTO_RULE_BITS[idx]
+                self.need_automata_next = True
+                break
+
+    # Rule written through the bridge at RULE_BRIDGE_ADDR during the current frame
+    def write_rule(self, rule):
+        if not DEBUG_NO_CONTROLS:
+            self.automata_next = rule & 0xFF
+            self.need_automata_next = True
+
+    # Generations per row written through the bridge at LINE_GENERATIONS_BRIDGE_ADDR
+    def write_line_generations(self, count):
+        if not DEBUG_NO_CONTROLS:
+            self.line_generations_next = min(max(count, 1), LINE_GENERATIONS_MAX)
+
+    def scribble(self, line, kind):
+        for cell, value in scribble_cells(kind, self.width):
+            line[cell] = value
+
+    # Draw one frame, then perform the end-of-frame (vsync) update. Returns the (height, width)
+    # array of cell bits that was on screen.
+    def frame(self, keys=None):
+        if keys is not None:
+            self.press(keys)
+
+        stride = self.line_generations
+        if self._drawn and self._drawn[:2] == (self.table, stride) and np.array_equal(self._drawn[2], self.topline):
+            frame = self._drawn[3]
+        else:
+            frame = generations(self.topline, self._lut, (self.height-1)*stride + 1)[::stride]
+            self._drawn = (self.table, stride, self.topline, frame)
+
+        # First row's next generation becomes the new topline, unless frozen
+        if not self.frame_frozen and self.height > 1:
+            backcopy = frame[1].copy()
+        else:
+            backcopy = self.topline
+
+        # Screen finished
+        if (self.speed_counter & self.speed_mask) == 0:
+            frozen = (self.opening_countdown != 0) or self.pause
+        else:
+            frozen = True
+        if self.need_frozen_exception:
+            frozen = False
+        self.speed_counter = (self.speed_counter + 1) & ((1 << SPEED_LEVELS) - 1)
+
+        if not self.frame_frozen: # Audio takes the topline of the *just-finished* frame, pre-scribble
+            self.audgen = backcopy.copy()
+        self.topline = backcopy.copy()
+
+        if not DEBUG_NO_CONTROLS:
+            self.need_frozen_exception = False
+
+            for kind in ScribbleKind:
+                if self.scribble_single[kind] or self.scribble_hold[kind]:
+                    self.scribble(self.topline, kind)
+                self.scribble_single[kind] = False
+
+            if self.need_automata_next:
+                self.need_automata_next = False
+                self.table = self.automata_next
+                self._lut = rule_lut(self.table)
+
+            self.line_generations = self.line_generations_next
+
+        if self.opening_countdown != 0:
+            self.opening_countdown -= 1
+
+        self.frame_frozen = frozen
+        self.frame_count += 1
+        return frame
+
+    def frames(self, count, keys=None):
+        # `keys`, if given, is called with the frame number and returns cont1_key for that frame
+        return np.stack([self.frame(keys(self.frame_count) if keys else None) for _ in range(count)])
@@ -0,0 +1,333 @@
+# Synthesis resource and timing report
+# Synthesizes AppToplevel with yosys (see synth.py), for the Pocket's Cyclone V or for generic
+# 6-input LUTs, and breaks the LUT, flip-flop and memory counts down by submodule and by what the
+# logic is for, going by the names of the signals each cell drives. It also estimates the critical
+# path by walking the synthesized netlist with rough per-cell delays. None of this replaces Quartus'
+# fitter and timing analysis, but it moves the same way when VID_H_ACTIVE grows or rules are added,
+# in seconds rather than minutes. Every report goes into a history file and is compared with the
+# last one for the same target, resolution and engine.
+
+import datetime
+import json
+import re
+import sys
+from pathlib import Path
+
+from .synth import SYNTH_COMMAND
+
+
+TARGETS = {
+    "cyclonev": SYNTH_COMMAND,
+    "generic": "synth -flatten -lut 6", # yosys' own flip-flops and 6-input LUTs, no carry chains
+}
+
+# What a cell is, by its type
+CELL_KINDS = {
+    "lut": r"MISTRAL_ALUT|MISTRAL_NOT|\$lut$",
+    "ff": r"MISTRAL_FF|\$_\w*DFF|\$_DLATCH",
+    "ram": r"MISTRAL_M10K|MISTRAL_MLAB|\$mem",
+    "io": r"MISTRAL_(IB|OB|IO|CLKBUF)",
+}
+
+# What a cell is for, by the name of the signal it drives (after any submodule prefix); first match wins.
+# Memories are named after their first read port
+GROUPS = {
+    "audio i2s": r"audgen|audio",
+    "video timing": r"video|pll_clk|clk_phase|clk_reg|clk90_reg|stb_reg",
+    "controls": r"cont\d|select|[lr]_press|press|release|hold|scribble_hold|scribble_single|speed|frame_frozen|"
+                r"opening|pause|need_frozen|flash",
+    "ca engine": r"topline|active_state|automata|need_automata|need_topline|need_scribble|line_|display_cell|"
+                 r"scribble|rows|display_rd|engine_|top_|cur_|nxt_|x$|step|first_word|this_word|left_cell|pass|"
+                 r"row|_slot|waiting|send|word_done|table|generations|commands|r_port|produce_|consume_|stage\d|"
+                 r"_level|w_full|r_empty|r_rst",
+    "bridge": r"bridge",
+}
+OTHER_GROUP = "other"
+
+# Rough Cyclone V (-C8) delays, in ns. A LUT includes getting to it over local routing
+LUT_NS = 0.9
+CARRY_NS = 0.05 # Per bit, along a carry chain
+REGISTER_NS = 0.5 # Clock to output plus setup
+CARRY_PORTS = {("MISTRAL_ALUT_ARITH", "CI")}
+
+DEVICE_ALMS = 18480 # 5CEBA4F23C8
+DEVICE_M10KS = 308
+
+HISTORY_FILE = "report_history.json"
+
+
+def _cell_kind(cell_type):
+    for kind, pattern in CELL_KINDS.items():
+        if re.match(pattern, cell_type):
+            return kind
+    return "other"
+
+
+def _binary(value):
+    return int(value, 2) if isinstance(value, str) else value
+
+
+# Memories in the design as read, as {name: (depth, width)}
+def _memories(before, top):
+    memories = {}
+    for module_name, module in before.items():
+        prefix = module_name.removeprefix(top).lstrip(".")
+        for cell_name, cell in module["cells"].items():
+            if cell["type"] in ("$mem", "$mem_v2"):
+                name = cell["parameters"].get("MEMID", cell_name).lstrip("\\")
+                memories[".".join(filter(None, [prefix, name]))] = \
+                    (_binary(cell["parameters"]["SIZE"]), _binary(cell["parameters"]["WIDTH"]))
+    return memories
+
+
+# Names each cell of a synthesized module after a public signal it drives, or failing that one its
+# logic ends up in, preferring names from the design over ones yosys made up from its neighbours
+def _cell_names(module):
+    bit_names = {}
+    for name, net in module["netnames"].items():
+        if not net.get("hide_name"):
+            for bit in net["bits"]:
+                bit_names.setdefault(bit, []).append(name)
+
+    def rank(name):
+        return ("MISTRAL_" in name or "$" in name, len(name), name)
+
+    names = {}
+    consumers = {}
+    for cell_name, cell in module["cells"].items():
+        driven = []
+        for port, bits in cell["connections"].items():
+            direction = cell["port_directions"].get(port)
+            for bit in bits:
+                if direction == "output":
+                    driven += bit_names.get(bit, [])
+                elif isinstance(bit, int):
+                    consumers.setdefault(bit, []).append(cell_name)
+        if driven:
+            names[cell_name] = min(driven, key=rank)
+
+    outputs = {cell_name: [bit for port, bits in cell["connections"].items()
+                           if cell["port_directions"].get(port) == "output" for bit in bits]
+               for cell_name, cell in module["cells"].items()}
+    changed = True
+    while changed:
+        changed = False
+        for cell_name in module["cells"]:
+            if cell_name in names:
+                continue
+            inherited = [names[consumer] for bit in outputs[cell_name]
+                         for consumer in consumers.get(bit, []) if consumer in names]
+            if inherited:
+                names[cell_name] = min(inherited, key=rank)
+                changed = True
+    return names
+
+
+# A signal's name without what yosys added to it
+def _short_name(name):
+    return re.split(r"\$|_MISTRAL_", name)[0]
+
+
+def _split_name(name):
+    if name is None:
+        return "(top)", OTHER_GROUP
+    module, _, base = name.rpartition(".")
+    for group, pattern in GROUPS.items():
+        if re.match(pattern, base):
+            return module or "(top)", group
+    return module or "(top)", OTHER_GROUP
+
+
+# The longest register to register path through a synthesized module, as (ns, start, cells, end):
+# the cells it starts and ends at (None for ports of the module, which count as registers) and the
+# combinational cells along it.
+def _critical_path(module):
+    cells = module["cells"]
+    drivers = {}
+    for cell_name, cell in cells.items():
+        for port, bits in cell["connections"].items():
+            if cell["port_directions"].get(port) == "output":
+                for bit in bits:
+                    drivers[bit] = cell_name
+
+    combinational = {cell_name for cell_name, cell in cells.items() if _cell_kind(cell["type"]) in ("lut", "other")}
+    arrival = {}
+    visiting = set()
+
+    def arrive(cell_name):
+        if cell_name not in arrival:
+            if cell_name in visiting:
+                raise ValueError(f"Combinational loop through {cell_name}")
+            visiting.add(cell_name)
+            cell = cells[cell_name]
+            best = (0, None, [])
+            for port, bits in cell["connections"].items():
+                if cell["port_directions"].get(port) != "input":
+                    continue
+                step = CARRY_NS if (cell["type"], port) in CARRY_PORTS else LUT_NS
+                for bit in bits:
+                    ns, start, path = arrive(drivers[bit]) if drivers.get(bit) in combinational \
+                        else (0, drivers.get(bit), [])
+                    if ns + step > best[0]:
+                        best = (ns + step, start, path)
+            arrival[cell_name] = (best[0], best[1], best[2] + [cell_name])
+            visiting.discard(cell_name)
+        return arrival[cell_name]
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * len(cells)))
+    worst = (0, None, [], None)
+    endpoints = [(bit, cell_name) for cell_name, cell in cells.items() if cell_name not in combinational
+                 for port, bits in cell["connections"].items() if cell["port_directions"].get(port) == "input"
+                 for bit in bits]
+    endpoints += [(bit, None) for port in module["ports"].values() if port["direction"] == "output"
+                  for bit in port["bits"]]
+    for bit, end in endpoints:
+        if drivers.get(bit) in combinational:
+            ns, start, path = arrive(drivers[bit])
+            if ns > worst[0]:
+                worst = (ns, start, path, end)
+    return (worst[0] + REGISTER_NS, *worst[1:])
+
+
+def _report(before, after, top, target):
+    kinds = {cell_name: _cell_kind(cell["type"]) for cell_name, cell in after["cells"].items()}
+    names = _cell_names(after)
+    counts = {"modules": {}, "groups": {}}
+    for cell_name, kind in kinds.items():
+        if kind not in ("lut", "ff", "ram"):
+            continue
+        module, group = _split_name(names.get(cell_name))
+        for table, key in [("modules", module), ("groups", group)]:
+            entry = counts[table].setdefault(key, {"lut": 0, "ff": 0, "ram": 0})
+            entry[kind] += 1
+
+    types = {}
+    for cell in after["cells"].values():
+        types[cell["type"]] = types.get(cell["type"], 0) + 1
+
+    ns, start, path, end = _critical_path(after)
+    def short(cell_name):
+        return "(port)" if cell_name is None else _short_name(names.get(cell_name, cell_name))
+
+    report = {
+        "luts": sum(1 for kind in kinds.values() if kind == "lut"),
+        "ffs": sum(1 for kind in kinds.values() if kind == "ff"),
+        "ram_blocks": sum(1 for kind in kinds.values() if kind == "ram"),
+        "memory_bits": sum(depth * width for depth, width in _memories(before, top).values()),
+        **counts,
+        "critical_path_ns": round(ns, 2),
+        "critical_path_luts": sum(1 for cell_name in path if after["cells"][cell_name]["type"] != "MISTRAL_ALUT_ARITH"),
+        "critical_path_carry_bits": sum(1 for cell_name in path if after["cells"][cell_name]["type"] == "MISTRAL_ALUT_ARITH"),
+        "critical_path_from": short(start),
+        "critical_path_to": short(end),
+    }
+    if target == "cyclonev":
+        # Two LUTs of up to 5 inputs, or one of 6, or two bits of adder per ALM, if the fitter packs well
+        report["alms_estimate"] = types.get("MISTRAL_ALUT6", 0) + (report["luts"] - types.get("MISTRAL_ALUT6", 0) + 1) // 2
+
+    path_names = []
+    for cell_name in path:
+        name = short(cell_name)
+        if not path_names or path_names[-1][0] != name:
+            path_names.append([name, 0])
+        path_names[-1][1] += 1
+    return report, _memories(before, top), path_names
+
+
+def _print_table(title, table):
+    print(f"{title:24} {'LUTs':>8} {'FFs':>8} {'RAMs':>8}")
+    for key, entry in sorted(table.items(), key=lambda item: -item[1]["lut"] - item[1]["ff"]):
+        print(f"    {key:20} {entry['lut']:8} {entry['ff']:8} {entry['ram']:8}")
+
+
+def _compare(report, previous):
+    print(f"Compared to the report of {previous['time']}:")
+    changed = False
+    for metric in ["luts", "ffs", "ram_blocks", "memory_bits", "alms_estimate", "critical_path_ns",
+                   "critical_path_luts", "critical_path_carry_bits"]:
+        old, new = previous["report"].get(metric), report.get(metric)
+        if old is not None and new is not None and old != new:
+            print(f"    {metric:28} {old:10} -> {new:10} ({new - old:+.4g})")
+            changed = True
+    for group, entry in report["groups"].items():
+        old = previous["report"]["groups"].get(group, {"lut": 0, "ff": 0, "ram": 0})
+        for kind in entry:
+            if entry[kind] != old.get(kind, 0):
+                print(f"    {group + ' ' + kind + 's':28} {old.get(kind, 0):10} -> {entry[kind]:10} "
+                      f"({entry[kind] - old.get(kind, 0):+})")
+                changed = True
+    if not changed:
+        print("    no change")
+
+
+def run_report():
+    import argparse
+    from amaranth.back import rtlil
+    from . import app_toplevel
+    from .app_toplevel import AppToplevel, USE_LINE_RAM, USE_COMPUTE_DOMAIN
+    from .cache import design_key
+    from .resolution import VID_H_ACTIVE, VID_V_ACTIVE
+    from .sim import CLK_HZ
+    from .synth import synthesize_netlist
+
+    engines = ["register", "ram", "compute"] # USE_LINE_RAM False, True; USE_COMPUTE_DOMAIN
+
+    parser = argparse.ArgumentParser(prog="report")
+    parser.add_argument("--target", choices=TARGETS, default="cyclonev",
+        help="what to synthesize for (default: %(default)s)")
+    parser.add_argument("--engine", choices=engines, default="compute" if USE_COMPUTE_DOMAIN else engines[USE_LINE_RAM],
+        help="CA engine (USE_LINE_RAM, USE_COMPUTE_DOMAIN) to synthesize (default: %(default)s, for this resolution)")
+    parser.add_argument("--history", default=HISTORY_FILE,
+        help="reports to compare against and add this one to (default: %(default)s)")
+    parser.add_argument("--no-save", action="store_true",
+        help="compare against the history without adding this report to it")
+    args = parser.parse_args()
+
+    app_toplevel.USE_LINE_RAM = args.engine == "ram"
+    app_toplevel.USE_COMPUTE_DOMAIN = args.engine == "compute"
+    top = "amaranth_core"
+    print(f"Synthesizing {VID_H_ACTIVE}x{VID_V_ACTIVE} with the {args.engine} engine for {args.target}...")
+    # No platform: yosys has no altera_std_synchronizer, and plain flip-flops synthesize the same
+    before, after = synthesize_netlist(rtlil.convert(AppToplevel(), name=top), top,
+        synth_command=TARGETS[args.target])
+    report, memories, path = _report(before, after, top, args.target)
+
+    print(f"{report['luts']} LUTs, {report['ffs']} FFs, {report['ram_blocks']} RAM blocks", end="")
+    if "alms_estimate" in report:
+        print(f", about {report['alms_estimate']} ALMs ({report['alms_estimate'] / DEVICE_ALMS:.1%} of the device, "
+              f"{report['ram_blocks'] / DEVICE_M10KS:.1%} of M10Ks)", end="")
+    print()
+    _print_table("By submodule", report["modules"])
+    _print_table("By signal group", report["groups"])
+    for name, (depth, width) in memories.items():
+        print(f"Memory {name}: {depth} x {width} bits")
+    if memories and not report["ram_blocks"]:
+        print("    (synthesized as logic, not RAM blocks)")
+
+    period = 1e9 / CLK_HZ
+    print(f"Estimated critical path {report['critical_path_ns']:.2f} ns ({report['critical_path_luts']} LUTs, "
+          f"{report['critical_path_carry_bits']} carry bits), {1e3 / report['critical_path_ns']:.0f} MHz; "
+          f"the clock is {CLK_HZ / 1e6:g} MHz, {period:.2f} ns" +
+          ("  OVER BUDGET" if report["critical_path_ns"] > period else ""))
+    print(f"    from {report['critical_path_from']} through " +
+          ", ".join(name + (f" x{count}" if count > 1 else "") for name, count in path) +
+          f" to {report['critical_path_to']}")
+
+    history_path = Path(args.history)
+    history = json.loads(history_path.read_text()) if history_path.exists() else []
+    entry = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "design": design_key(engine=args.engine),
+        "target": args.target,
+        "resolution": f"{VID_H_ACTIVE}x{VID_V_ACTIVE}",
+        "engine": args.engine,
+        "report": report,
+    }
+    previous = [old for old in history if all(old[key] == entry[key] for key in ["target", "resolution", "engine"])]
+    if previous:
+        _compare(report, previous[-1])
+
+    if not args.no_save:
+        history.append(entry)
+        history_path.write_text(json.dumps(history, indent=4) + "\n")
+        print(f"Added to {args.history}")
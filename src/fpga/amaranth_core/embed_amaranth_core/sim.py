@@ -0,0 +1,477 @@
+# Simulation harness shared by the benches in build.py
+
+import bisect
+import itertools
+import math
+from fractions import Fraction
+
+from amaranth import *
+from amaranth.hdl.ast import SignalSet
+from amaranth.hdl.ir import Fragment, Instance
+from amaranth.lib.wiring import In
+from amaranth.sim import Simulator, Delay, Passive
+
+from .resolution import *
+from .toplevel import USE_EXTERNAL_DISPLAY_CLOCK, PixelClockDiv
+from .app_toplevel import SPEED_LEVELS
+
+
+CLK_HZ = 74.25e6
+CLK_PERIOD = 1/CLK_HZ
+PIXEL_PERIOD = VID_DIV_RATIO * CLK_PERIOD # VID_DIV_RATIO may be a Fraction, so this is only on average
+
+VID_FRAME_PIXELS = VID_H_TOTAL * VID_V_TOTAL # Pixel strobes per frame, blanking included
+VID_FRAME_CLOCKS = int(VID_FRAME_PIXELS * VID_DIV_RATIO) # Always whole, see toplevel.py
+FRAME_PERIOD = VID_FRAME_CLOCKS * CLK_PERIOD
+FRAME_RATE = Fraction(int(CLK_HZ), VID_FRAME_CLOCKS) # Exactly, for video containers
+
+AUDIO_SAMPLE_RATE = 48000
+
+# When, from the start of each frame, the benches scheduled by frame act (whole clocks, to which
+# each adds a quarter clock to keep clear of edges): checkpoints are restored and saved right at the
+# start, then frame_skipper, after the previous frame's vsync updates and before the first row is
+# stepped, then controller input. Bridge writes land halfway through.
+SKIP_OFFSET = (VID_H_TOTAL * VID_DIV_RATIO // 2) * CLK_PERIOD
+INPUT_OFFSET = SKIP_OFFSET + math.ceil(VID_DIV_RATIO) * CLK_PERIOD
+BRIDGE_OFFSET = (VID_FRAME_CLOCKS // 2) * CLK_PERIOD
+
+# Controller buttons by name, as bits of cont1_key
+BUTTONS = {
+    "up": 0, "down": 1, "left": 2, "right": 3,
+    "a": 4, "b": 5, "x": 6, "y": 7,
+    "l": 8, "r": 9, "l2": 10, "r2": 11, "l3": 12, "r3": 13,
+    "select": 14, "start": 15,
+}
+
+
+# Stands in for core_top.v around the toplevel. Toplevel derives its sync and boot domains from
+# the `clk` port, so drive that from a domain of our own rather than adding a clock to `sync`
+# directly. Also replaces the altera_pll feeding pll_clk_0/pll_clk_1 (clk / VID_DIV_RATIO, second
+# output 90 degrees behind), without which the video timing never advances. Its third output, the
+# compute clock, is just clk here rather than clk / COMPUTE_CLK_RATIO: CXXRTL misses the edges of
+# clocks made by logic, and a compute domain only has to keep up (which ComputeEngine checks for
+# the real ratio).
+class Harness(Elaboratable):
+    def __init__(self, top):
+        self.top = top
+
+    def elaborate(self, platform):
+        m = Module()
+
+        m.domains.clk_74a = ClockDomain()
+        m.submodules.top = top = self.top
+        m.d.comb += [
+            top.clk.eq(ClockSignal("clk_74a")),
+            top.pll_clk_2.eq(ClockSignal("clk_74a")),
+        ]
+
+        if USE_EXTERNAL_DISPLAY_CLOCK:
+            m.submodules.display_pll = display_pll = DomainRenamer("clk_74a")(PixelClockDiv(ratio=VID_DIV_RATIO))
+            m.d.comb += [
+                top.pll_clk_0.eq(display_pll.clk),
+                top.pll_clk_1.eq(display_pll.clk90),
+            ]
+
+        return m
+
+
+# Bench command which waits until `signal` equals `value` (or is nonzero, if None), looking at it
+# once per clock from now on, and answers with how many clocks that took. Most bench time went on
+# resuming Python every clock to see whether something had changed yet; CxxrtlSimulator runs these
+# waits in native code instead. pysim has no such wait, so simulator() expands them into a poll per
+# clock there.
+class Until:
+    def __init__(self, signal, value=None):
+        self.signal = signal
+        self.value = value
+
+    def met(self, current):
+        return current != 0 if self.value is None else current == self.value
+
+
+# Wraps a bench process so it can use Until on a simulator without it. `step` is what waits a clock:
+# None (a tick) in a sync process, a Delay in any other
+def expand_until(process, step):
+    def expanded():
+        generator = process()
+        response = None
+        while True:
+            try:
+                command = generator.send(response)
+            except StopIteration:
+                return
+            if isinstance(command, Until):
+                clocks = 0
+                while not command.met((yield command.signal)):
+                    yield step
+                    clocks += 1
+                response = clocks
+            else:
+                response = yield command
+    return expanded
+
+
+class _PysimSimulator(Simulator):
+    def add_process(self, process):
+        super().add_process(expand_until(process, Delay(CLK_PERIOD)))
+
+    def add_sync_process(self, process, *, domain="sync"):
+        super().add_sync_process(expand_until(process, None), domain=domain)
+
+
+SIM_BACKENDS = ["pysim", "cxxrtl"]
+
+# "pysim" is Amaranth's own simulator. "cxxrtl" compiles the design to a native model first (see
+# cxxrtl.py); it takes the same bench processes but needs a C++ compiler. Either way benches may
+# use Until, and the simulator's `fragment` is the elaborated design, for finding its registers
+# (see checkpoint.py).
+def simulator(top, backend="pysim"):
+    fragment = Fragment.get(Harness(top), platform=None)
+    if backend == "cxxrtl":
+        from .cxxrtl import CxxrtlSimulator
+        sim = CxxrtlSimulator(fragment, "clk_74a", CLK_PERIOD)
+    else:
+        sim = _PysimSimulator(fragment)
+        sim.add_clock(CLK_PERIOD, domain="clk_74a")
+    sim.fragment = fragment
+    return sim
+
+
+# Every signal of a simulator's design by hierarchical name, with a #n suffix on repeats, as
+# {name: (signal, kind)}. Kind is "register", "memory" (contents) or "comb" for whatever each
+# fragment drives, and "input" for the inputs of `top` which nothing in the design drives, named
+# under "top". Signals a compiled model has optimized away are left in; see `visible`.
+def design_signals(sim, top):
+    signals = {}
+    driven = SignalSet()
+
+    def add(name, entry):
+        key = name
+        for repeat in itertools.count(1):
+            if key not in signals:
+                break
+            key = f"{name}#{repeat}"
+        signals[key] = entry
+
+    def walk(fragment, path):
+        memory = isinstance(fragment, Instance) and fragment.type == "$mem_v2"
+        for domain, signal in fragment.iter_drivers():
+            if not isinstance(signal, Signal): # A domain's ResetSignal, driven by a ResetSynchronizer
+                continue
+            driven.add(signal)
+            kind = "comb" if domain is None else "memory" if memory else "register"
+            add(".".join(path + [signal.name]), (signal, kind))
+        for subfragment, name in fragment.subfragments:
+            walk(subfragment, path + [name or "unnamed"])
+
+    walk(sim.fragment, [])
+    for path, member, value in top.signature.flatten(top):
+        if member.flow == In and value not in driven:
+            add(".".join(["top", *map(str, path)]), (value, "input"))
+    return signals
+
+
+# Whether benches can read and write `signal` on `sim`
+def visible(sim, signal):
+    return sim.is_visible(signal) if hasattr(sim, "is_visible") else True
+
+
+# Design frames versus simulated frames. frame_skipper fast-forwards the design over frozen frames,
+# and a restored checkpoint starts from a later frame, after which simulated frame n is design frame
+# n + skipped. Benches scheduled by frame share one of these to stay in step, and add the frames they
+# do something in to `busy`, which are never skipped. frame_reader also notes where it sampled the
+# frame it last passed on, for pixel_cycle.
+class FrameClock:
+    def __init__(self):
+        self.skipped = 0
+        self.busy = set()
+        self.vsync_cycle = None
+        self.sampled = None
+
+    def frame(self, sim_frame):
+        return sim_frame + self.skipped
+
+    # Clock cycle of this run at which frame_reader sampled pixel (x, y) of the frame it last passed on
+    def pixel_cycle(self, x, y):
+        pixel = self.sampled * VID_FRAME_PIXELS + (VID_V_BPORCH + y) * VID_H_TOTAL + VID_H_BPORCH + x
+        return self.vsync_cycle + int((pixel + Fraction(1, 2)) * VID_DIV_RATIO)
+
+
+# Passive bench process which fast-forwards over frozen frames (the opening pause, frames held back
+# by the speed setting, pausing) by re-seeding the design's frame counters. A run of frozen frames
+# with nothing pending shows just what the frame after it will, so jumping the counters straight to
+# that frame skips simulating them without changing any image. Audio does not survive this.
+def frame_skipper(top, clock):
+    def bench():
+        yield Passive()
+        registers = top.freeze_registers # Exists once the design is elaborated
+
+        yield Delay(SKIP_OFFSET + CLK_PERIOD / 4)
+        for sim_frame in itertools.count():
+            frame = clock.frame(sim_frame)
+            horizon = min((busy for busy in clock.busy if busy >= frame), default=frame)
+
+            state = {}
+            for name, signal in registers.items():
+                state[name] = yield signal
+            pending = state["need_frozen_exception"] or state["opening_countdown_timer_late_reset"] or \
+                state["need_automata_next"] or state["line_generations"] != state["line_generations_next"] or \
+                any(value for name, value in state.items() if name.startswith("scribble_"))
+
+            # Step the frame counters the way each vsync would
+            frozen = state["frame_frozen"]
+            counter = state["speed_counter"]
+            countdown = state["opening_countdown_timer"]
+            skip = 0
+            while not pending and frozen and frame + skip < horizon:
+                frozen = bool(counter & state["speed_counter_mask"]) or countdown != 0 or bool(state["pause_key_wants_frozen"])
+                counter = (counter + 1) % (1 << SPEED_LEVELS)
+                countdown = max(countdown - 1, 0)
+                skip += 1
+
+            if skip:
+                yield registers["frame_frozen"].eq(frozen)
+                yield registers["speed_counter"].eq(counter)
+                yield registers["opening_countdown_timer"].eq(countdown)
+                clock.skipped += skip
+
+            yield Delay(FRAME_PERIOD)
+
+    return bench
+
+
+# Bench process which reads `frames` whole frames, calling on_frame(index, rows) with each one.
+# Rather than waiting on edges every cycle it samples video once per pixel strobe, and only
+# during the active area: the timing constants in resolution.py say where each pixel will be,
+# so horizontal and vertical blanking are skipped with a single Delay each. Given a FrameClock,
+# frames are numbered as the design's (from a restored checkpoint's, for one), and frames a
+# frame_skipper skipped are passed on as copies of the frame simulated after them.
+def frame_reader(top, frames, on_frame, clock=None):
+    clock = clock or FrameClock()
+    first = clock.skipped
+    clock.busy.add(first + frames - 1) # Nothing to skip to after the last frame
+
+    def bench():
+        yield Delay(CLK_PERIOD / 4) # Keep samples clear of clock edges
+
+        # Find the pixel where video_vs is high. Beam position (x, y) is then output
+        # exactly (y * VID_H_TOTAL + x) pixel periods later, as video_vs/video_de/video_rgb
+        # are all registered on the same strobe. Samples are taken halfway through each pixel, since
+        # with a fractional VID_DIV_RATIO strobes land up to a clock either side of the average.
+        clock.vsync_cycle = yield Until(top.video_vs, 1)
+        yield Delay(PIXEL_PERIOD / 2)
+
+        position = 0
+        def seek(target):
+            nonlocal position
+            yield Delay((target - position) * PIXEL_PERIOD)
+            position = target
+
+        emitted = first
+        for sim_frame in itertools.count():
+            if emitted >= first + frames:
+                break
+            frame = clock.frame(sim_frame)
+            base = sim_frame * VID_FRAME_PIXELS
+            rows = []
+            for y in range(VID_V_BPORCH, VID_V_BPORCH + VID_V_ACTIVE):
+                yield from seek(base + y * VID_H_TOTAL + VID_H_BPORCH)
+                row = []
+                for x in range(VID_H_ACTIVE):
+                    assert (yield top.video_de), f"Lost video timing at frame {frame}, x {x}, y {y}"
+                    rgb = yield top.video_rgb.as_value()
+                    row += [(rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF]
+                    yield Delay(PIXEL_PERIOD)
+                    position += 1
+                assert not (yield top.video_de), f"Lost video timing at frame {frame}, end of row {y}"
+                rows.append(row)
+
+            clock.sampled = sim_frame
+            while emitted <= clock.frame(sim_frame) and emitted < first + frames:
+                on_frame(emitted, rows)
+                emitted += 1
+
+    return bench
+
+
+# Bench process which writes to the APF bridge the way the host does, one clock per write. `writes`
+# are (frame, address, data), written halfway through that frame.
+def bridge_writer(top, writes, clock=None):
+    clock = clock or FrameClock()
+    by_frame = {}
+    for frame, address, data in writes:
+        by_frame.setdefault(frame, []).append((address, data))
+    clock.busy.update(by_frame)
+
+    def bench():
+        yield Delay(BRIDGE_OFFSET + CLK_PERIOD / 4) # Keep writes clear of clock edges
+        for sim_frame in itertools.count():
+            if not by_frame:
+                break
+            for frame in [frame for frame in by_frame if frame < clock.frame(sim_frame)]:
+                del by_frame[frame] # From before a restored checkpoint
+            elapsed = 0
+            for address, data in by_frame.pop(clock.frame(sim_frame), []):
+                yield top.bridge_addr.eq(address)
+                yield top.bridge_wr_data.eq(data)
+                yield top.bridge_wr.eq(1)
+                yield Delay(CLK_PERIOD)
+                yield top.bridge_wr.eq(0)
+                elapsed += CLK_PERIOD
+            yield Delay(FRAME_PERIOD - elapsed)
+
+    return bench
+
+
+# Input scripts give the buttons held on controller 1, frame by frame, one change per line:
+#   FRAME BUTTON[+BUTTON...]   from FRAME on, hold exactly these buttons (names as in BUTTONS)
+#   FRAME -                    from FRAME on, hold nothing
+# Frames count from 0, as frame_reader's do, and must increase. `#` starts a comment. Returns a
+# list of (frame, cont1_key).
+def parse_input_script(text):
+    script = []
+    for number, line in enumerate(text.splitlines(), 1):
+        fields = line.partition("#")[0].split()
+        if not fields:
+            continue
+        try:
+            frame, buttons = fields
+            frame = int(frame)
+            keys = 0
+            if buttons != "-":
+                for name in buttons.lower().split("+"):
+                    keys |= 1 << BUTTONS[name]
+        except (ValueError, KeyError):
+            raise ValueError(f"Input script line {number}: expected FRAME BUTTON[+BUTTON...] or FRAME -, "
+                f"got {line.strip()!r}") from None
+        if script and frame <= script[-1][0]:
+            raise ValueError(f"Input script line {number}: frame {frame} is not after frame {script[-1][0]}")
+        script.append((frame, keys))
+    return script
+
+
+# cont1_key held during `frame` under an input script, e.g. for AutomatonModel.frames()
+def script_keys(script):
+    frames = [frame for frame, _ in script]
+    def keys(frame):
+        idx = bisect.bisect_right(frames, frame) - 1
+        return script[idx][1] if idx >= 0 else 0
+    return keys
+
+
+# Bench process which plays an input script, changing cont1_key as each scripted frame starts (so
+# the design acts on the change at the end of that frame, as it would a player's)
+def input_player(top, script, clock=None):
+    clock = clock or FrameClock()
+    clock.busy.update(frame for frame, _ in script)
+    keys = script_keys(script)
+    last = script[-1][0] if script else -1
+
+    def bench():
+        yield Delay(INPUT_OFFSET + CLK_PERIOD / 4) # Keep changes clear of clock edges
+        for sim_frame in itertools.count():
+            frame = clock.frame(sim_frame)
+            yield top.cont1_key.eq(keys(frame))
+            if frame >= last:
+                break
+            yield Delay(FRAME_PERIOD)
+
+    return bench
+
+
+# Bench process which samples `signals` (a list) just after every clock edge, calling
+# on_sample(time, values) with the time of the edge in picoseconds. It starts with design frame
+# `start`, or given a `trigger` value, at the first clock from then on that it is nonzero, and
+# stops `frames` frames later, or `cycles` clocks later if that is given instead.
+def tracer(top, signals, on_sample, start=0, frames=1, trigger=None, clock=None, cycles=None):
+    if cycles is None:
+        cycles = frames * VID_FRAME_CLOCKS
+    clock = clock or FrameClock()
+    clock.busy.update(range(start, start + math.ceil(cycles / VID_FRAME_CLOCKS)))
+
+    def bench():
+        sim_frame = start - clock.skipped # Known once any checkpoint_loader has been created
+        assert sim_frame >= 0, f"Trace starts at frame {start}, before this run's first frame {clock.skipped}"
+        cycle = sim_frame * VID_FRAME_CLOCKS
+        yield Delay(cycle * CLK_PERIOD + CLK_PERIOD / 4) # Keep samples clear of clock edges
+
+        if trigger is not None:
+            cycle += yield Until(trigger)
+
+        for _ in range(cycles):
+            values = []
+            for signal in signals:
+                values.append((yield signal))
+            on_sample(round(cycle * CLK_PERIOD * 1e12), values)
+            yield Delay(CLK_PERIOD)
+            cycle += 1
+
+    return bench
+
+
+# Bench process which decodes `samples` stereo frames (or forever, if None) from the I2S output.
+# Each channel is 16 data bits, MSB first, then 16 blank bits, one bit per 4 master clocks. Rather
+# than follow the master clock one clock at a time, this finds each word by the lrck edge before it
+# (the very first by the first master clock, as it starts with reset) and samples the data bits
+# halfway through, which is far from any edge the design's jitter of a clock could move. Bits are
+# kept as bytes and decoded `block` stereo samples at a time with NumPy, calling on_samples with an
+# (n, 2) array of int16 frames; lrck must be steady through each data word. A run stopped early
+# leaves part of a block unread, which the returned bench's flush() hands on; call it before closing
+# whatever on_samples writes to (see capture_wav).
+I2S_DATA_BITS = 16
+I2S_BIT_PERIOD = 1 / (AUDIO_SAMPLE_RATE * 2 * 2 * I2S_DATA_BITS)
+I2S_BLOCK = 1024
+
+def i2s_reader(top, samples, on_samples, block=I2S_BLOCK):
+    import numpy as np
+
+    weights = 1 << np.arange(I2S_DATA_BITS - 1, -1, -1, dtype=np.uint32)
+    channels = np.arange(2, dtype=np.uint8)[:, None]
+
+    def decode(dac, lrck):
+        dac = np.frombuffer(dac, dtype=np.uint8).reshape(-1, 2, I2S_DATA_BITS)
+        lrck = np.frombuffer(lrck, dtype=np.uint8).reshape(-1, 2, I2S_DATA_BITS)
+        wrong = np.argwhere(lrck != channels)
+        if len(wrong):
+            _, channel, _ = wrong[0]
+            raise AssertionError(f"Unexpected lrck [channel select] value (wanted {channel}, got {1 - channel})")
+        return (dac @ weights).astype(np.uint16).view(np.int16) # Reinterpret unsigned as signed
+
+    dac, lrck = bytearray(), bytearray()
+    def flush():
+        whole = len(dac) // (2 * I2S_DATA_BITS) * (2 * I2S_DATA_BITS) # Not a frame cut short
+        if whole:
+            on_samples(decode(dac[:whole], lrck[:whole]))
+        del dac[:], lrck[:]
+
+    def bench():
+        yield Delay(CLK_PERIOD / 4) # Keep clear of clock edges while waiting on them
+        yield Until(top.audio_mclk, 1)
+        yield Delay(I2S_BIT_PERIOD / 4) # The first master clock is a quarter of the way into bit 0
+
+        count = 0
+        try:
+            while samples is None or count < samples:
+                for channel in range(2):
+                    if count or channel:
+                        yield Until(top.audio_lrck, channel)
+                        yield Delay(I2S_BIT_PERIOD / 2)
+
+                    for bit in range(I2S_DATA_BITS):
+                        if bit:
+                            yield Delay(I2S_BIT_PERIOD)
+                        dac.append((yield top.audio_dac))
+                        lrck.append((yield top.audio_lrck))
+
+                    # To a couple of clocks before the next lrck edge. Arriving late would only delay
+                    # the samples of the next word by as much, as Until looks at lrck's value
+                    yield Delay((I2S_DATA_BITS + 0.5) * I2S_BIT_PERIOD - 2 * CLK_PERIOD)
+
+                count += 1
+                if count % block == 0:
+                    flush()
+        finally: # Also when the simulation stops partway through, by an exception in here
+            flush()
+
+    bench.flush = flush
+    return bench
@@ -0,0 +1,192 @@
+# Output files for simulation captures
+
+import gzip
+import shutil
+import struct
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+
+# Keeps one PCM_16 file open for a whole run. Stereo frames arrive as int16 arrays of (n, channels)
+# a block at a time (see i2s_reader) and are written straight out; close() (or leaving the `with`,
+# including by Ctrl-C) lets soundfile fix up the header.
+class WavWriter:
+    def __init__(self, path, sample_rate, channels=2):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.written = 0 # Frames
+        self.file = None
+
+    def __enter__(self):
+        self.file = sf.SoundFile(self.path, mode='w', samplerate=self.sample_rate, channels=self.channels, subtype='PCM_16')
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, frames):
+        self.file.write(frames)
+        self.written += len(frames)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+# Streams video to one file a frame at a time, each frame written once as it completes, so memory
+# use is one frame however long the capture. Frames are rows of [r, g, b, r, g, b, ...] as
+# frame_reader produces them. `rate` is frames per second as a Fraction; `path` "-" is stdout.
+class VideoWriter:
+    def __init__(self, path, width, height, rate):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.rate = rate
+        self.written = 0
+        self.file = None
+
+    def __enter__(self):
+        self.file = sys.stdout.buffer if self.path == "-" else open(self.path, "wb")
+        self.begin()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, rows):
+        frame = np.asarray(rows, dtype=np.uint8).reshape(self.height, self.width, 3)
+        self.write_frame(frame)
+        self.written += 1
+
+    def close(self):
+        if self.file is not None:
+            self.end()
+            self.file.flush()
+            if self.file is not sys.stdout.buffer:
+                self.file.close()
+            self.file = None
+
+    def begin(self):
+        pass
+
+    def end(self):
+        pass
+
+
+# Headerless rgb24, for `ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r RATE -i ...`
+class RawVideoWriter(VideoWriter):
+    def write_frame(self, frame):
+        self.file.write(frame.tobytes())
+
+
+# YUV4MPEG2, which ffmpeg and most players read without being told the size or rate. Frames are
+# converted to full-resolution (4:4:4) BT.601 studio-range YCbCr.
+class Y4mWriter(VideoWriter):
+    YCBCR = np.array([
+        [65.481, 128.553, 24.966],
+        [-37.797, -74.203, 112.0],
+        [112.0, -93.786, -18.214],
+    ]) / 255
+    OFFSET = np.array([16, 128, 128])
+
+    def begin(self):
+        self.file.write(f"YUV4MPEG2 W{self.width} H{self.height} F{self.rate.numerator}:{self.rate.denominator} Ip A1:1 C444\n".encode())
+
+    def write_frame(self, frame):
+        planes = np.rint(np.tensordot(self.YCBCR, frame, axes=([1], [2])) + self.OFFSET[:, None, None])
+        self.file.write(b"FRAME\n" + planes.astype(np.uint8).tobytes())
+
+
+# Animated PNG. The frame count in the header is only known at the end, so this needs a real file
+# rather than a pipe.
+class ApngWriter(VideoWriter):
+    def _chunk(self, kind, data):
+        self.file.write(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data)))
+
+    def begin(self):
+        assert self.path != "-", "APNG output needs a seekable file"
+        self.sequence = 0
+        self.file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0))
+        self.actl_offset = self.file.tell()
+        self._chunk(b"acTL", struct.pack(">II", 0, 0)) # Frame count filled in by end()
+        self.delay = (1 / self.rate).limit_denominator(0xFFFF)
+
+    def write_frame(self, frame):
+        self._chunk(b"fcTL", struct.pack(">IIIIIHHBB", self.sequence, self.width, self.height, 0, 0,
+            self.delay.numerator, self.delay.denominator, 0, 0))
+        self.sequence += 1
+        rows = np.zeros((self.height, 1 + self.width * 3), dtype=np.uint8) # Filter type 0 on every row
+        rows[:, 1:] = frame.reshape(self.height, -1)
+        data = zlib.compress(rows.tobytes())
+        if self.written == 0:
+            self._chunk(b"IDAT", data)
+        else:
+            self._chunk(b"fdAT", struct.pack(">I", self.sequence) + data)
+            self.sequence += 1
+
+    def end(self):
+        self._chunk(b"IEND", b"")
+        self.file.seek(self.actl_offset)
+        self._chunk(b"acTL", struct.pack(">II", self.written, 0))
+        self.file.seek(0, 2)
+
+
+VIDEO_FORMATS = {"y4m": Y4mWriter, "raw": RawVideoWriter, "apng": ApngWriter}
+
+
+# Writes a trace of chosen signals, given as {name: width} with dotted hierarchical names, to a VCD
+# file, gzipped if `path` ends in .gz. For .fst it writes a VCD alongside and converts it with
+# gtkwave's vcd2fst when closed. Only changes are recorded, so quiet signals cost next to nothing.
+class TraceWriter:
+    def __init__(self, path, signals):
+        self.path = Path(path)
+        self.signals = signals
+        self.file = None
+
+    @staticmethod
+    def vcd2fst():
+        return shutil.which("vcd2fst")
+
+    def __enter__(self):
+        import vcd
+
+        if self.path.suffix == ".fst":
+            assert self.vcd2fst(), "FST output needs vcd2fst (from gtkwave) on PATH"
+            self.vcd_path = self.path.with_name(self.path.name + ".vcd")
+        else:
+            self.vcd_path = self.path
+        self.file = gzip.open(self.vcd_path, "wt") if self.path.suffix == ".gz" else open(self.vcd_path, "w")
+        self.writer = vcd.VCDWriter(self.file, timescale="1 ps", comment="Generated by embed_amaranth_core")
+        self.vars = []
+        for name, width in self.signals.items():
+            scope, _, leaf = name.rpartition(".")
+            # Signals outside the design hierarchy (the clock domains' own) would clash with top's
+            self.vars.append(self.writer.register_var(scope or "bench", leaf, "wire", size=width))
+        self.last = [None] * len(self.vars)
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def sample(self, time, values):
+        for index, value in enumerate(values):
+            if value != self.last[index]:
+                self.writer.change(self.vars[index], time, value)
+                self.last[index] = value
+
+    def close(self):
+        if self.file is not None:
+            self.writer.close()
+            self.file.close()
+            self.file = None
+            if self.vcd_path != self.path:
+                subprocess.run([self.vcd2fst(), str(self.vcd_path), str(self.path)], check=True)
+                self.vcd_path.unlink()
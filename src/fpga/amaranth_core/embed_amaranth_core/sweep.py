@@ -0,0 +1,169 @@
+# Parallel capture sweeps
+# Runs capture_frame and capture_wav style simulations over every combination of resolution, rule,
+# starting speed and input script, as many at once as there are cores, and indexes what each one
+# wrote. The simulators are single-threaded, so independent runs are the only way to use the rest
+# of the machine. Like bench.py, each run gets a fresh process (the resolution constants are read at
+# import time), so nothing here may import the design at module level.
+
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from .bench import BENCH_RESOLUTIONS, _current_resolution
+
+
+INDEX_FILE = "index.json"
+
+CAPTURES = ["frame", "wav"]
+
+
+def _run(run):
+    # Must happen before anything imports the design
+    from . import resolution
+    vars(resolution).update(run["timing"])
+
+    from . import app_toplevel
+    from .app_toplevel import AppToplevel, AutoKind
+    from .sim import AUDIO_SAMPLE_RATE, FrameClock, simulator, frame_skipper, frame_reader, \
+        i2s_reader, input_player, parse_input_script
+    app_toplevel.AUTO_DEFAULT = AutoKind[run["rule"]]
+    app_toplevel.SPEED_INITIAL = run["speed"]
+
+    directory = Path(run["directory"])
+    directory.mkdir(parents=True, exist_ok=True)
+    result = {"files": []}
+    start = time.perf_counter()
+    try:
+        top = AppToplevel()
+        sim = simulator(top, run["backend"])
+        clock = FrameClock()
+        if run["script"]:
+            sim.add_process(input_player(top, parse_input_script(Path(run["script"]).read_text()), clock))
+
+        if run["capture"] == "frame":
+            import png
+
+            def write_frame(index, rows):
+                path = directory / f"frame{index + 1}.png"
+                with open(path, "wb") as file:
+                    png.Writer(len(rows[0]) // 3, len(rows), greyscale=False).write(file, rows)
+                result["files"].append(path.name)
+
+            sim.add_process(frame_skipper(top, clock))
+            sim.add_process(frame_reader(top, run["frames"], write_frame, clock))
+            sim.run()
+            result["skipped_frames"] = clock.skipped
+        else:
+            from .sinks import WavWriter
+
+            path = directory / "log.wav"
+            reader = i2s_reader(top, int(run["seconds"] * AUDIO_SAMPLE_RATE), lambda frames: outfile.write(frames))
+            sim.add_process(reader)
+            with WavWriter(path, AUDIO_SAMPLE_RATE) as outfile:
+                try:
+                    sim.run()
+                finally:
+                    reader.flush()
+            result["files"].append(path.name)
+            result["samples"] = outfile.written
+    except Exception: # One bad run shouldn't lose a night's worth of others
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+# Runs `run` in a process of its own, so a simulator that dies outright (CXXRTL aborts on some errors
+# in the design) costs only that run, which gets recorded like any other failure
+def _run_isolated(context, run):
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        try:
+            return pool.submit(_run, run).result()
+        except concurrent.futures.process.BrokenProcessPool:
+            return {"files": [], "error": "The worker process died", "seconds": time.perf_counter() - start}
+
+
+def run_sweep():
+    import argparse
+    from amaranth import __version__ as amaranth_version
+    from .app_toplevel import AutoKind, SPEED_LEVELS, SPEED_INITIAL
+    from .sim import SIM_BACKENDS
+
+    rules = [kind.name for kind in AutoKind]
+    resolutions = ["current", *BENCH_RESOLUTIONS]
+
+    parser = argparse.ArgumentParser(prog="sweep")
+    parser.add_argument("--capture", choices=CAPTURES, action="append",
+        help="what to capture from each run; may be repeated (default: frame)")
+    parser.add_argument("--backend", choices=SIM_BACKENDS, default="pysim",
+        help="simulator to run on (default: %(default)s)")
+    parser.add_argument("--resolution", choices=resolutions, action="append",
+        help="resolution to run; may be repeated (default: current)")
+    parser.add_argument("--rule", choices=rules, action="append",
+        help="initial AutoKind rule to run; may be repeated (default: all)")
+    parser.add_argument("--speed", type=int, choices=range(SPEED_LEVELS), action="append",
+        help=f"initial speed setting (SPEED_INITIAL) to run; may be repeated (default: {SPEED_INITIAL})")
+    parser.add_argument("--input", type=Path, action="append", metavar="SCRIPT",
+        help="controller input script to play (see capture_frame --input); may be repeated (default: none)")
+    parser.add_argument("--frames", type=int, default=2,
+        help="frames to capture per run (default: %(default)s)")
+    parser.add_argument("--seconds", type=float, default=1,
+        help="audio to capture per run (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+        help="runs to simulate at once (default: one per core, %(default)s)")
+    parser.add_argument("--output", type=Path, default=Path("sweep"),
+        help="directory to collect the results in (default: %(default)s)")
+    args = parser.parse_args()
+
+    for script in args.input or []:
+        if not script.is_file():
+            parser.error(f"--input: no such file {script}")
+
+    runs = {}
+    for resolution in args.resolution or ["current"]:
+        timing = _current_resolution() if resolution == "current" else BENCH_RESOLUTIONS[resolution]
+        size = f"{timing['VID_H_ACTIVE']}x{timing['VID_V_ACTIVE']}"
+        for rule in args.rule or rules:
+            for speed in args.speed or [SPEED_INITIAL]:
+                for script in args.input or [None]:
+                    for capture in args.capture or ["frame"]:
+                        name = f"{size}-{rule}-speed{speed}-{script.stem if script else 'noinput'}-{capture}"
+                        runs[name] = dict(timing=timing, rule=rule, speed=speed, capture=capture,
+                            script=str(script.resolve()) if script else None, backend=args.backend,
+                            frames=args.frames, seconds=args.seconds, directory=str(args.output / name))
+
+    print(f"Running {len(runs)} simulations on {args.backend}, {args.jobs} at a time...")
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ThreadPoolExecutor(args.jobs) as threads:
+        pending = {name: threads.submit(_run_isolated, context, run) for name, run in runs.items()}
+        for name, future in pending.items():
+            results[name] = future.result()
+            status = "FAILED" if "error" in results[name] else f"{len(results[name]['files'])} file(s)"
+            print(f"[{len(results)}/{len(runs)}] {name}: {status} in {results[name]['seconds']:.1f}s")
+
+    index = {
+        "backend": args.backend,
+        "amaranth": amaranth_version,
+        "runs": {name: {
+            "resolution": run["timing"],
+            "rule": run["rule"],
+            "speed": run["speed"],
+            "script": run["script"],
+            "capture": run["capture"],
+            **results[name],
+            "files": [f"{name}/{file}" for file in results[name]["files"]],
+        } for name, run in runs.items()},
+    }
+    args.output.mkdir(parents=True, exist_ok=True)
+    (args.output / INDEX_FILE).write_text(json.dumps(index, indent=4, default=str) + "\n")
+    print(f"Index written to {args.output / INDEX_FILE}")
+
+    failed = [name for name, result in results.items() if "error" in result]
+    if failed:
+        sys.exit(f"{len(failed)} run(s) failed: {', '.join(failed)}")
@@ -0,0 +1,68 @@
+# Synthesis with a full yosys, for resource counts
+# The yosys bundled with Amaranth can only convert designs, so this needs one of its own: `yosys` on
+# PATH, or yowasp-yosys (the `synthesis` dev dependency group, which `pdm install` includes). Set YOSYS
+# to choose a particular one.
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+
+YOSYS_COMMANDS = ["yosys", "yowasp-yosys"]
+
+SYNTH_COMMAND = "synth_intel_alm -family cyclonev" # The Pocket's FPGA
+
+
+def find_yosys():
+    if os.environ.get("YOSYS"):
+        return os.environ["YOSYS"]
+    for command in YOSYS_COMMANDS:
+        path = shutil.which(command)
+        if path:
+            return path
+    return None
+
+
+# Runs a yosys script on RTLIL text read in as design.il, returning {name: text} of the `outputs` the
+# script writes to its working directory
+def _run_yosys(rtlil_text, script, outputs):
+    yosys = find_yosys()
+    if not yosys:
+        raise RuntimeError(f"Synthesis needs a full yosys: install one of {', '.join(YOSYS_COMMANDS)} "
+            "(`pdm install -G synthesis` installs yowasp-yosys) or set YOSYS")
+
+    # Relative paths only, as yowasp-yosys can only see its working directory
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "design.il").write_text(rtlil_text)
+        subprocess.run([yosys, "-q", "-p", "; ".join(["read_rtlil design.il", *script])], cwd=tmp, check=True)
+        return {name: Path(tmp, name).read_text() if Path(tmp, name).exists() else "" for name in outputs}
+
+
+# Synthesizes RTLIL text, returning (stat, log): the output of yosys' `stat -json`, which has cell
+# counts per module (just `top` unless `flatten` is False), and the log of any extra `commands`,
+# which run between synthesis and stat.
+def synthesize(rtlil_text, top, *, flatten=True, commands=()):
+    outputs = _run_yosys(rtlil_text, [
+        f"{SYNTH_COMMAND} -top {top}" + ("" if flatten else " -noflatten"),
+        *(f"tee -q -a commands.log {command}" for command in commands),
+        "tee -q -o stat.json stat -json",
+    ], ["stat.json", "commands.log"])
+    return json.loads(outputs["stat.json"]), outputs["commands.log"]
+
+
+# Synthesizes RTLIL text with `synth_command` (which must flatten), returning (before, after): the
+# modules of yosys' JSON netlist of the design as read, and its `top` module as synthesized
+def synthesize_netlist(rtlil_text, top, *, synth_command=SYNTH_COMMAND):
+    outputs = _run_yosys(rtlil_text, [
+        "proc; write_json before.json",
+        f"{synth_command} -top {top}",
+        "write_json after.json",
+    ], ["before.json", "after.json"])
+    return json.loads(outputs["before.json"])["modules"], json.loads(outputs["after.json"])["modules"][top]
+
+
+def cell_count(stat):
+    return stat["design"]["num_cells"]
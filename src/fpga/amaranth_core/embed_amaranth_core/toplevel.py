@@ -2,13 +2,22 @@ from amaranth import *
 from amaranth.lib import wiring, data
 from amaranth.lib.wiring import In, Out
 import enum
+from fractions import Fraction
+from math import gcd
 
 USE_EXTERNAL_DISPLAY_CLOCK = True
 
+# clk / the clock on pll_clk_2, for apps with a `compute` domain (see app_toplevel.USE_COMPUTE_DOMAIN).
+# The third output of the PLL in core_top.v has to be set to match; it runs whether or not any app
+# uses it. Must be even
+COMPUTE_CLK_RATIO = 2
+
 from .resolution import *
 
 
 assert 47 <= (74250000 / VID_DIV_RATIO / VID_V_TOTAL / VID_H_TOTAL) < 61, "Pixel clock out of range"
+assert (VID_H_TOTAL * VID_V_TOTAL * VID_DIV_RATIO).denominator == 1, "Frames must be a whole number of clocks long"
+assert COMPUTE_CLK_RATIO >= 2 and COMPUTE_CLK_RATIO % 2 == 0, "Compute clock ratio must be even"
 
 
 class PixelClockDiv(wiring.Component):
@@ -16,10 +25,13 @@ class PixelClockDiv(wiring.Component):
     clk     : Out(1) # Pixel clock
     stb     : Out(1) # Single cycle strobe at rising edge of `clk`
 
+    # `ratio` may be a Fraction, in which case pixels are a clock longer or shorter as needed to
+    # average out to it
     def __init__(self, ratio=4):
         super().__init__()
 
-        assert ratio >= 4 and ratio % 4 == 0, "Ratio must be at least 4 and divisible by 4"
+        ratio = Fraction(ratio)
+        assert ratio >= 4, "Ratio must be at least 4"
         self.ratio = ratio
 
     def elaborate(self, platform):
@@ -30,18 +42,31 @@ class PixelClockDiv(wiring.Component):
         # rgb    X--------
         # Note clock rises one cycle AFTER rgb strobe
 
-        # Generate bitmap with ratio/2 0s (low order) followed by ratio/2 1s (high order)
-        clk_reg = Signal(self.ratio, reset=((1 << (self.ratio // 2)) - 1) << (self.ratio // 2))
-        m.d.sync += clk_reg.eq(clk_reg.rotate_left(1))
-        m.d.comb += [
-            self.clk.eq(clk_reg[0]),
-            self.clk90.eq(clk_reg[self.ratio // 4]),
+        # Phase accumulator: the pixel is `modulus` long and every clock moves `step` through it.
+        # Scaled so a quarter pixel is a whole number of steps
+        scale = 4 // gcd(self.ratio.numerator, 4)
+        modulus = self.ratio.numerator * scale
+        step = self.ratio.denominator * scale
+
+        clk_phase = Signal(range(modulus))
+        clk_phase_next = Signal.like(clk_phase)
+        m.d.comb += clk_phase_next.eq(Mux(clk_phase >= modulus - step, clk_phase - (modulus - step), clk_phase + step))
+        m.d.sync += clk_phase.eq(clk_phase_next)
+
+        # Registered, so the clocks are free of glitches. The strobe is the first clock of each pixel,
+        # clk is high for the half after it and clk90 a quarter pixel behind that
+        clk_reg = Signal(1)
+        clk90_reg = Signal(1)
+        stb_reg = Signal(1, reset=1)
+        m.d.sync += [
+            clk_reg.eq((clk_phase_next >= step) & (clk_phase_next < step + modulus // 2)),
+            clk90_reg.eq((clk_phase_next >= step + modulus // 4) & (clk_phase_next < step + modulus * 3 // 4)),
+            stb_reg.eq(clk_phase_next < step),
         ]
-
-        stb_reg = Signal(self.ratio, reset=1)
-        m.d.sync += stb_reg.eq(stb_reg.rotate_left(1))
         m.d.comb += [
-            self.stb.eq(stb_reg[0])
+            self.clk.eq(clk_reg),
+            self.clk90.eq(clk90_reg),
+            self.stb.eq(stb_reg),
         ]
 
         return m
@@ -68,6 +93,7 @@ class Toplevel(wiring.Component):
 
     pll_clk_0       : In(1)
     pll_clk_1       : In(1)
+    pll_clk_2       : In(1) # Compute clock, see COMPUTE_CLK_RATIO
 
     audio_mclk      : Out(1)
     audio_lrck      : Out(1) # A better name would be audio_select but this is what the i2s standard calls it
@@ -87,6 +113,12 @@ class Toplevel(wiring.Component):
     cont3_trig      : In(16)
     cont4_trig      : In(16)
 
+    bridge_addr     : In(32) # APF bridge, synchronous to clk
+    bridge_rd       : In(1)
+    bridge_rd_data  : Out(32)
+    bridge_wr       : In(1)
+    bridge_wr_data  : In(32)
+
     def elaborate(self, platform):
         m = Module()
 
@@ -0,0 +1,221 @@
+# Multi-variant builds
+# Generates the Verilog for every combination of resolution, starting rule, starting speed and audio
+# divisor it is given, as many at once as there are cores, into a tree of its own per variant: the
+# variant's amaranth_core.v, resolution.py and video.json, and a core_top.v with the PLL set to its
+# pixel clock. Variants whose inputs haven't changed are left alone, as with `generate`. Given --dist,
+# it then packages the bitstreams compiled from each tree into dist/, listing them in variants.json
+# under the names they are packaged with. The design always shows scaler mode 0, so every variant has
+# to share one resolution for now. Like sweep.py, each variant gets a fresh process (the resolution
+# constants are read at import time), so nothing here may import the design at module level.
+
+import concurrent.futures
+import importlib.util
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+from fractions import Fraction
+from pathlib import Path
+
+from .bench import _current_resolution
+
+
+ROOT = Path(__file__).resolve().parents[4]
+CORE_TOP_PATH = ROOT / "src" / "fpga" / "core" / "core_top.v"
+VARIANTS_DIR = Path(__file__).parent.parent / "build" / "variants"
+
+BITSTREAM_FILE = "bitstream.rbf_r" # What each variant's tree expects its compiled bitstream to be called
+DIST_FILES = ["audio.json", "data.json", "input.json", "interact.json"] # Shared by every variant, as they are
+
+
+# scripts/resolution.py, which isn't part of this package
+def _resolution_script():
+    spec = importlib.util.spec_from_file_location("resolution_script", ROOT / "scripts" / "resolution.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# core_top.v with the display PLL (pll_clk_0 and pll_clk_1, 90 degrees behind) at the pixel clock
+def core_top_source(timing):
+    mhz = 74.25 / Fraction(timing["VID_DIV_RATIO"])
+    text = CORE_TOP_PATH.read_bytes().decode()
+    text = re.sub(r'(\.output_clock_frequency[01]\s*\(\s*)"[^"]*"', lambda match: f'{match[1]}"{float(mhz):0.6f} MHz"', text)
+    text = re.sub(r'(\.phase_shift1\s*\(\s*)"[^"]*"', lambda match: f'{match[1]}"{1e6 / float(mhz) / 4:0.3f} ps"', text)
+    return text
+
+
+# Writes `text` to `path` unless it already holds exactly that, so nothing downstream sees a change.
+# Keeps the line endings the file already has, as scripts/resolution.py's write_config does
+def _write_if_changed(path, text):
+    path = Path(path)
+    if path.exists():
+        old = path.read_bytes().decode()
+        if old.replace("\r\n", "\n") == text.replace("\r\n", "\n"):
+            return False
+        if "\r\n" in old and "\r\n" not in text:
+            text = text.replace("\n", "\r\n")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(text.encode())
+    return True
+
+
+def _generate(variant):
+    # Must happen before anything imports the design
+    from . import resolution
+    vars(resolution).update(variant["timing"])
+
+    from . import app_toplevel, cache
+    from .app_toplevel import AppToplevel, AutoKind
+    app_toplevel.AUTO_DEFAULT = AutoKind[variant["rule"]]
+    app_toplevel.SPEED_INITIAL = variant["speed"]
+    app_toplevel.AUDIO_DIVISOR_BITS = variant["audio_divisor_bits"]
+
+    # Only the parent process writes the cache records, so workers can't lose each other's
+    key = cache.design_key(rule=variant["rule"], speed=variant["speed"], audio_divisor_bits=variant["audio_divisor_bits"])
+    if not variant["force"] and cache.is_fresh(variant["output"], key):
+        return {"key": key}
+
+    from amaranth.back import verilog
+    from .platform import IntelPlatform
+    text = verilog.convert(AppToplevel(), platform=IntelPlatform(), name="amaranth_core", strip_internal_attrs=True)
+    return {"key": key, "text": text}
+
+
+# Runs _generate for `variant` in a process of its own, as sweep.py does, returning {"error": ...} rather
+# than raising if it fails, or if its process dies outright
+def _generate_isolated(context, variant):
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        try:
+            return pool.submit(_generate, variant).result()
+        except concurrent.futures.process.BrokenProcessPool:
+            return {"error": "The worker process died"}
+        except Exception as e:
+            return {"error": str(e)}
+
+
+# Packages every variant's compiled bitstream, with the core's JSON, into dist/core and dist/core.zip,
+# the way scripts/build.sh does for a single one
+def _package(variants, variants_source, video_source):
+    missing = [name for name, variant in variants.items() if not (Path(variant["directory"]) / BITSTREAM_FILE).exists()]
+    if missing:
+        sys.exit(f"No {BITSTREAM_FILE} compiled for {', '.join(missing)}; build each variant's tree with Quartus first")
+
+    dist = ROOT / "dist"
+    shutil.rmtree(dist / "core", ignore_errors=True)
+    (dist / "core.zip").unlink(missing_ok=True)
+    (dist / "core").mkdir(parents=True)
+
+    core = json.loads((ROOT / "core.json").read_text())
+    core["core"]["cores"] = []
+    for index, (name, variant) in enumerate(variants.items()):
+        shutil.copy(Path(variant["directory"]) / BITSTREAM_FILE, dist / "core" / f"{name}.rbf_r")
+        core["core"]["cores"].append({"name": name, "id": index, "filename": f"{name}.rbf_r"})
+    for file in DIST_FILES:
+        shutil.copy(ROOT / file, dist / "core")
+    (dist / "core" / "core.json").write_text(json.dumps(core, indent=4))
+    (dist / "core" / "variants.json").write_text(variants_source)
+    (dist / "core" / "video.json").write_text(video_source)
+    shutil.make_archive(str(dist / "core"), "zip", dist, "core")
+    print(f"Packaged {len(variants)} variant(s) into {dist / 'core.zip'}")
+
+
+def run_variants():
+    import argparse
+    from .app_toplevel import AutoKind, AUTO_DEFAULT, SPEED_LEVELS, SPEED_INITIAL, AUDIO_DIVISOR_BITS
+    from . import cache
+
+    script = _resolution_script()
+    rules = [kind.name for kind in AutoKind]
+
+    parser = argparse.ArgumentParser(prog="variants")
+    parser.add_argument("--resolution", type=script.parse_target, action="append", metavar="WIDTHxHEIGHT[@HZ]",
+        help="resolution to build, with timing picked as by scripts/resolution.py; may be repeated, at other "
+             "framerates only, as the design can't pick a scaler mode yet (default: whatever resolution.py holds)")
+    parser.add_argument("--rule", choices=rules, action="append",
+        help=f"initial AutoKind rule to build; may be repeated (default: {AUTO_DEFAULT.name})")
+    parser.add_argument("--speed", type=int, choices=range(SPEED_LEVELS), action="append",
+        help=f"initial speed setting (SPEED_INITIAL) to build; may be repeated (default: {SPEED_INITIAL})")
+    parser.add_argument("--audio-divisor-bits", type=int, choices=range(8), action="append",
+        help=f"AUDIO_DIVISOR_BITS to build; may be repeated (default: {AUDIO_DIVISOR_BITS})")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+        help="variants to generate at once (default: one per core, %(default)s)")
+    parser.add_argument("--output", type=Path, default=VARIANTS_DIR,
+        help="directory to put each variant's tree in (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+        help="elaborate every variant even if its cached output is up to date")
+    parser.add_argument("--dist", action="store_true",
+        help=f"also package each variant's {BITSTREAM_FILE} into dist/, as scripts/build.sh does, "
+             "with variants.json and video.json listing them")
+    args = parser.parse_args()
+
+    configs = {}
+    for target in args.resolution or [None]:
+        if target is None:
+            timing = _current_resolution()
+            config = dict(timing, hz=74.25e6 / (timing["VID_H_TOTAL"] * timing["VID_V_TOTAL"] * timing["VID_DIV_RATIO"]))
+            configs[f"{timing['VID_H_ACTIVE']}x{timing['VID_V_ACTIVE']}"] = config
+            continue
+        try:
+            script.check_target(*target)
+        except AssertionError as e:
+            parser.error(f"--resolution {script.target_name(*target)}: {e}")
+        found = script.solve(*target, count=1)
+        if not found:
+            parser.error(f"--resolution {script.target_name(*target)}: no configuration")
+        configs[script.target_name(*target)] = script.configure(target[0], target[1], found[0])
+    # Until the design picks a scaler slot of its own, a second resolution would show in the first's mode
+    if len({(config["VID_H_ACTIVE"], config["VID_V_ACTIVE"]) for config in configs.values()}) > 1:
+        parser.error(f"--resolution: variants of different sizes ({', '.join(configs)}) would all show in scaler mode 0")
+
+    variants = {}
+    for size, config in configs.items():
+        timing = {name: value for name, value in config.items() if name.startswith("VID_")}
+        for rule in args.rule or [AUTO_DEFAULT.name]:
+            for speed in args.speed or [SPEED_INITIAL]:
+                for audio_divisor_bits in args.audio_divisor_bits or [AUDIO_DIVISOR_BITS]:
+                    name = f"{size}-{rule}-speed{speed}-audio{audio_divisor_bits}"
+                    directory = args.output / name
+                    variants[name] = dict(timing=timing, rule=rule, speed=speed, audio_divisor_bits=audio_divisor_bits,
+                        directory=str(directory), output=str(directory / "amaranth_core.v"), force=args.force)
+
+                    # Cheap, and unchanged files are left alone, so no need to farm these out
+                    script.write_config(config, directory / "resolution.py", directory / "video.json")
+                    _write_if_changed(directory / "core_top.v", core_top_source(timing))
+
+    print(f"Generating {len(variants)} variant(s), {args.jobs} at a time...")
+    failed = []
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ThreadPoolExecutor(args.jobs) as threads:
+        pending = {name: threads.submit(_generate_isolated, context, variant) for name, variant in variants.items()}
+        for index, (name, future) in enumerate(pending.items()):
+            result = future.result()
+            if "error" in result:
+                failed.append(name)
+                status = f"FAILED, {result['error']}"
+            elif "text" not in result:
+                status = "up to date"
+            elif cache.store(variants[name]["output"], result["key"], result["text"]):
+                status = "written"
+            else:
+                status = "unchanged"
+            print(f"[{index + 1}/{len(variants)}] {name}: {status}")
+    if failed:
+        sys.exit(f"{len(failed)} variant(s) failed: {', '.join(failed)}")
+
+    if not args.dist:
+        return
+
+    # The variant list, named as _package names the bitstreams, and the scaler mode they share
+    listing = json.loads((ROOT / "variants.json").read_text())
+    listing["variants"]["variant_list"] = [{"name": name, "id": index, "filename": f"{name}.rbf_r"}
+        for index, name in enumerate(variants)]
+    variants_source = json.dumps(listing, indent=4)
+
+    video = json.loads((ROOT / "video.json").read_text())
+    video["video"]["scaler_modes"] = [script.scaler_mode(next(iter(configs.values())))]
+    video_source = json.dumps(video, indent=4)
+
+    _package(variants, variants_source, video_source)
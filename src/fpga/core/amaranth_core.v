@@ -1,162 +1,659 @@
-/* Generated by Amaranth Yosys 0.25 (PyPI ver 0.25.0.0.post77, git sha1 e02b7f64b) */
+/* Generated by Amaranth Yosys 0.39+165 (PyPI ver 0.39.0.165.post92, git sha1 22c5ab90d) */
 
-module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_key, cont1_trig, cont2_joy, cont2_key, cont2_trig, cont3_joy, cont3_key, cont3_trig, cont4_joy, cont4_key, cont4_trig, dbg_rx, dbg_tx, init_done, pll_clk_0, pll_clk_1
-, rst, user1, user2, video_de, video_hs, video_rgb, video_rgb_clk, video_rgb_clk90, video_skip, video_vs, audio_adc);
-  reg \$auto$verilog_backend.cc:2083:dump_module$1  = 0;
+module amaranth_core(rst, init_done, user1, user2, dbg_tx, dbg_rx, video_rgb_clk, video_rgb_clk90, video_rgb, video_de, video_skip, video_vs, video_hs, pll_clk_0, pll_clk_1, pll_clk_2, audio_mclk, audio_lrck, audio_adc, audio_dac, cont1_key
+, cont2_key, cont3_key, cont4_key, cont1_joy, cont2_joy, cont3_joy, cont4_joy, cont1_trig, cont2_trig, cont3_trig, cont4_trig, bridge_addr, bridge_rd, bridge_rd_data, bridge_wr, bridge_wr_data, clk);
+  reg \$auto$verilog_backend.cc:2352:dump_module$1  = 0;
+  wire \$1000 ;
+  wire \$1002 ;
+  wire \$1004 ;
+  wire \$1006 ;
+  wire \$1008 ;
   wire \$101 ;
-  wire \$104 ;
-  wire \$106 ;
-  wire \$108 ;
+  wire \$1010 ;
+  wire \$1012 ;
+  wire \$1014 ;
+  wire \$1016 ;
+  wire \$1018 ;
+  wire \$1020 ;
+  wire \$1022 ;
+  wire \$1024 ;
+  wire \$1026 ;
+  wire \$1028 ;
+  wire \$103 ;
+  wire \$1030 ;
+  wire \$1032 ;
+  wire \$1034 ;
+  wire \$1036 ;
+  wire \$1038 ;
+  wire \$1040 ;
+  wire \$1042 ;
+  wire \$1044 ;
+  wire \$1046 ;
+  wire \$1048 ;
+  wire \$105 ;
+  wire \$1050 ;
+  wire \$1052 ;
+  wire \$1054 ;
+  wire \$1056 ;
+  wire \$1058 ;
+  wire \$1060 ;
+  wire \$1062 ;
+  wire \$1064 ;
+  wire \$1066 ;
+  wire \$1068 ;
+  wire \$107 ;
+  wire \$1070 ;
+  wire \$1072 ;
+  wire \$1074 ;
+  wire \$1076 ;
+  wire \$1078 ;
+  wire \$1080 ;
+  wire \$1082 ;
+  wire \$1084 ;
+  wire \$1086 ;
+  wire \$1088 ;
+  wire \$109 ;
+  wire \$1090 ;
+  wire \$1092 ;
+  wire \$1094 ;
+  wire \$1096 ;
+  wire \$1098 ;
   wire \$11 ;
-  wire \$110 ;
+  wire \$1100 ;
+  wire \$1102 ;
+  wire \$1104 ;
+  wire \$1106 ;
+  wire \$1108 ;
+  wire \$111 ;
+  wire \$1110 ;
+  wire \$1112 ;
+  wire \$1114 ;
+  wire \$1116 ;
+  wire \$1118 ;
+  wire \$1120 ;
+  wire \$1122 ;
+  wire \$1124 ;
+  wire \$1126 ;
+  wire \$1128 ;
   wire \$113 ;
+  wire \$1130 ;
+  wire \$1132 ;
+  wire \$1134 ;
+  wire \$1136 ;
+  wire \$1138 ;
+  wire \$1140 ;
+  wire \$1142 ;
+  wire \$1144 ;
+  wire \$1146 ;
+  wire \$1148 ;
   wire \$115 ;
+  wire \$1150 ;
+  wire \$1152 ;
+  wire \$1154 ;
+  wire \$1156 ;
+  wire \$1158 ;
+  wire \$1160 ;
+  wire \$1162 ;
+  wire \$1164 ;
+  wire \$1166 ;
+  wire \$1168 ;
   wire \$117 ;
+  wire \$1170 ;
+  wire \$1172 ;
+  wire \$1174 ;
+  wire \$1176 ;
+  wire \$1178 ;
+  wire \$1180 ;
+  wire \$1182 ;
+  wire \$1184 ;
+  wire \$1186 ;
+  wire \$1188 ;
   wire \$119 ;
-  wire \$122 ;
-  wire \$124 ;
-  wire \$126 ;
-  wire \$128 ;
+  wire \$1190 ;
+  wire \$1192 ;
+  wire \$1194 ;
+  wire \$1196 ;
+  wire \$1198 ;
+  wire \$1200 ;
+  wire \$1202 ;
+  wire \$1204 ;
+  wire \$1206 ;
+  wire \$1208 ;
+  wire \$121 ;
+  wire \$1210 ;
+  wire [8:0] \$1212 ;
+  wire [8:0] \$1213 ;
+  wire [7:0] \$1215 ;
+  wire \$1217 ;
+  wire \$1219 ;
+  wire \$1224 ;
+  wire [6:0] \$1226 ;
+  wire [6:0] \$1227 ;
+  wire \$1229 ;
+  wire \$123 ;
+  wire \$1231 ;
+  wire \$1232 ;
+  wire \$1235 ;
+  wire \$1237 ;
+  wire \$1239 ;
+  wire \$1241 ;
+  wire \$1243 ;
+  wire \$1244 ;
+  wire [2:0] \$1247 ;
+  wire [2:0] \$1248 ;
+  wire \$125 ;
+  wire \$1250 ;
+  wire \$1252 ;
+  wire \$1254 ;
+  wire \$1256 ;
+  wire [10:0] \$1258 ;
+  wire [10:0] \$1259 ;
+  wire \$1261 ;
+  wire \$1263 ;
+  wire [10:0] \$1265 ;
+  wire [10:0] \$1266 ;
+  wire \$1268 ;
+  wire \$127 ;
+  wire [22:0] \$1270 ;
+  wire [22:0] \$1271 ;
+  wire [23:0] \$1273 ;
+  wire [22:0] \$1274 ;
+  wire [23:0] \$1276 ;
+  wire \$1278 ;
+  wire \$1280 ;
+  wire \$1282 ;
+  wire \$1284 ;
+  wire \$1286 ;
+  wire \$1288 ;
+  wire \$129 ;
+  wire \$1290 ;
+  wire \$1292 ;
+  wire [2:0] \$1294 ;
+  wire [2:0] \$1295 ;
+  wire \$1297 ;
+  wire \$1299 ;
   wire \$13 ;
-  wire \$130 ;
-  wire \$132 ;
-  wire \$134 ;
-  wire \$136 ;
+  wire [8:0] \$1301 ;
+  wire [8:0] \$1302 ;
+  wire \$1304 ;
+  wire \$133 ;
+  wire \$135 ;
+  wire \$138 ;
   wire \$140 ;
-  wire \$142 ;
-  wire \$145 ;
-  wire \$147 ;
+  wire \$144 ;
+  wire \$146 ;
+  wire \$149 ;
   wire \$15 ;
   wire \$151 ;
-  wire \$153 ;
-  wire \$156 ;
-  wire \$158 ;
+  wire \$155 ;
+  wire \$157 ;
+  wire \$160 ;
   wire \$162 ;
   wire \$164 ;
-  wire \$167 ;
-  wire \$169 ;
+  wire \$166 ;
+  wire \$168 ;
   wire \$17 ;
-  wire \$171 ;
-  wire \$173 ;
-  wire \$175 ;
-  wire \$177 ;
-  wire \$179 ;
-  wire \$181 ;
-  wire \$183 ;
-  wire \$185 ;
-  wire \$187 ;
-  wire \$189 ;
+  wire \$170 ;
+  wire \$172 ;
+  wire \$174 ;
+  wire \$176 ;
+  wire \$178 ;
+  wire \$180 ;
+  wire \$182 ;
+  wire [31:0] \$184 ;
+  wire [31:0] \$186 ;
+  wire \$188 ;
   wire \$19 ;
-  wire \$191 ;
-  wire \$193 ;
-  wire [8:0] \$195 ;
-  wire [8:0] \$196 ;
-  wire [7:0] \$198 ;
+  wire \$190 ;
+  wire \$192 ;
+  wire \$194 ;
+  wire \$196 ;
+  wire \$198 ;
   wire \$200 ;
   wire \$202 ;
-  wire \$207 ;
-  wire [6:0] \$209 ;
+  wire \$204 ;
+  wire \$206 ;
+  wire \$208 ;
   wire \$21 ;
-  wire [6:0] \$210 ;
+  wire \$210 ;
   wire \$212 ;
   wire \$214 ;
-  wire \$215 ;
+  wire \$216 ;
   wire \$218 ;
   wire \$220 ;
   wire \$222 ;
-  wire \$224 ;
-  wire \$226 ;
+  wire [2:0] \$224 ;
+  wire [2:0] \$225 ;
   wire \$227 ;
+  wire \$229 ;
   wire \$23 ;
-  wire [2:0] \$230 ;
-  wire [2:0] \$231 ;
+  wire \$231 ;
   wire \$233 ;
-  wire \$235 ;
-  wire \$237 ;
-  wire \$239 ;
-  wire [10:0] \$241 ;
-  wire [10:0] \$242 ;
+  wire [3:0] \$235 ;
+  wire [3:0] \$236 ;
+  wire \$238 ;
+  wire \$240 ;
+  wire \$242 ;
   wire \$244 ;
   wire \$246 ;
-  wire [10:0] \$248 ;
-  wire [10:0] \$249 ;
+  wire \$248 ;
   wire \$25 ;
-  wire \$251 ;
-  wire [22:0] \$253 ;
-  wire [22:0] \$254 ;
-  wire [23:0] \$256 ;
-  wire [22:0] \$257 ;
-  wire [23:0] \$259 ;
-  wire \$261 ;
-  wire \$263 ;
-  wire \$265 ;
-  wire \$267 ;
-  wire \$269 ;
+  wire \$250 ;
+  wire \$252 ;
+  wire \$254 ;
+  wire \$256 ;
+  wire \$258 ;
+  wire \$260 ;
+  wire \$262 ;
+  wire \$264 ;
+  wire \$266 ;
+  wire \$268 ;
   wire \$27 ;
-  wire \$271 ;
-  wire \$273 ;
-  wire \$275 ;
-  wire [2:0] \$277 ;
-  wire [2:0] \$278 ;
+  wire \$270 ;
+  wire \$272 ;
+  wire \$274 ;
+  wire \$276 ;
+  wire \$278 ;
   wire \$280 ;
   wire \$282 ;
-  wire [8:0] \$284 ;
-  wire [8:0] \$285 ;
-  wire \$287 ;
+  wire \$284 ;
+  wire \$286 ;
+  wire \$288 ;
   wire \$29 ;
+  wire \$290 ;
+  wire \$292 ;
+  wire \$294 ;
+  wire \$296 ;
+  wire \$298 ;
   wire \$3 ;
+  wire \$300 ;
+  wire \$302 ;
+  wire \$304 ;
+  wire \$306 ;
+  wire \$308 ;
   wire \$31 ;
+  wire \$310 ;
+  wire \$312 ;
+  wire \$314 ;
+  wire \$316 ;
+  wire \$318 ;
+  wire \$320 ;
+  wire \$322 ;
+  wire \$324 ;
+  wire \$326 ;
+  wire \$328 ;
   wire \$33 ;
+  wire \$330 ;
+  wire \$332 ;
+  wire \$334 ;
+  wire \$336 ;
+  wire \$338 ;
+  wire \$340 ;
+  wire \$342 ;
+  wire \$344 ;
+  wire \$346 ;
+  wire \$348 ;
   wire \$35 ;
+  wire \$350 ;
+  wire \$352 ;
+  wire \$354 ;
+  wire \$356 ;
+  wire \$358 ;
+  wire \$360 ;
+  wire \$362 ;
+  wire \$364 ;
+  wire \$366 ;
+  wire \$368 ;
   wire \$37 ;
+  wire \$370 ;
+  wire \$372 ;
+  wire \$374 ;
+  wire \$376 ;
+  wire \$378 ;
+  wire \$380 ;
+  wire \$382 ;
+  wire \$384 ;
+  wire \$386 ;
+  wire \$388 ;
   wire \$39 ;
+  wire \$390 ;
+  wire \$392 ;
+  wire \$394 ;
+  wire \$396 ;
+  wire \$398 ;
+  wire \$400 ;
+  wire \$402 ;
+  wire \$404 ;
+  wire \$406 ;
+  wire \$408 ;
   wire \$41 ;
+  wire \$410 ;
+  wire \$412 ;
+  wire \$414 ;
+  wire \$416 ;
+  wire \$418 ;
+  wire \$420 ;
+  wire \$422 ;
+  wire \$424 ;
+  wire \$426 ;
+  wire \$428 ;
   wire \$43 ;
+  wire \$430 ;
+  wire \$432 ;
+  wire \$434 ;
+  wire \$436 ;
+  wire \$438 ;
+  wire \$440 ;
+  wire \$442 ;
+  wire \$444 ;
+  wire \$446 ;
+  wire \$448 ;
   wire \$45 ;
+  wire \$450 ;
+  wire \$452 ;
+  wire \$454 ;
+  wire \$456 ;
+  wire \$458 ;
+  wire \$460 ;
+  wire \$462 ;
+  wire \$464 ;
+  wire \$466 ;
+  wire \$468 ;
   wire \$47 ;
+  wire \$470 ;
+  wire \$472 ;
+  wire \$474 ;
+  wire \$476 ;
+  wire \$478 ;
+  wire \$480 ;
+  wire \$482 ;
+  wire \$484 ;
+  wire \$486 ;
+  wire \$488 ;
   wire \$49 ;
+  wire \$490 ;
+  wire \$492 ;
+  wire \$494 ;
+  wire \$496 ;
+  wire \$498 ;
   wire \$5 ;
+  wire \$500 ;
+  wire \$502 ;
+  wire \$504 ;
+  wire \$506 ;
+  wire \$508 ;
   wire \$51 ;
+  wire \$510 ;
+  wire \$512 ;
+  wire \$514 ;
+  wire \$516 ;
+  wire \$518 ;
+  wire \$520 ;
+  wire \$522 ;
+  wire \$524 ;
+  wire \$526 ;
+  wire \$528 ;
   wire \$53 ;
+  wire \$530 ;
+  wire \$532 ;
+  wire \$534 ;
+  wire \$536 ;
+  wire \$538 ;
+  wire \$540 ;
+  wire \$542 ;
+  wire \$544 ;
+  wire \$546 ;
+  wire \$548 ;
   wire \$55 ;
+  wire \$550 ;
+  wire \$552 ;
+  wire \$554 ;
+  wire \$556 ;
+  wire \$558 ;
+  wire \$560 ;
+  wire \$562 ;
+  wire \$564 ;
+  wire \$566 ;
+  wire \$568 ;
   wire [7:0] \$57 ;
+  wire \$570 ;
+  wire \$572 ;
+  wire \$574 ;
+  wire \$576 ;
+  wire \$578 ;
+  wire \$580 ;
+  wire \$582 ;
+  wire \$584 ;
+  wire \$586 ;
+  wire \$588 ;
   wire \$59 ;
+  wire \$590 ;
+  wire \$592 ;
+  wire \$594 ;
+  wire \$596 ;
+  wire \$598 ;
+  wire \$600 ;
+  wire \$602 ;
+  wire \$604 ;
+  wire \$606 ;
+  wire \$608 ;
   wire \$61 ;
+  wire \$610 ;
+  wire \$612 ;
+  wire \$614 ;
+  wire \$616 ;
+  wire \$618 ;
+  wire \$620 ;
+  wire \$622 ;
+  wire \$624 ;
+  wire \$626 ;
+  wire \$628 ;
   wire \$63 ;
+  wire \$630 ;
+  wire \$632 ;
+  wire \$634 ;
+  wire \$636 ;
+  wire \$638 ;
+  wire \$640 ;
+  wire \$642 ;
+  wire \$644 ;
+  wire \$646 ;
+  wire \$648 ;
   wire \$65 ;
-  wire \$68 ;
+  wire \$650 ;
+  wire \$652 ;
+  wire \$654 ;
+  wire \$656 ;
+  wire \$658 ;
+  wire \$660 ;
+  wire \$662 ;
+  wire \$664 ;
+  wire \$666 ;
+  wire \$668 ;
+  wire \$67 ;
+  wire \$670 ;
+  wire \$672 ;
+  wire \$674 ;
+  wire \$676 ;
+  wire \$678 ;
+  wire \$680 ;
+  wire \$682 ;
+  wire \$684 ;
+  wire \$686 ;
+  wire \$688 ;
+  wire \$69 ;
+  wire \$690 ;
+  wire \$692 ;
+  wire \$694 ;
+  wire \$696 ;
+  wire \$698 ;
   wire \$7 ;
-  wire \$70 ;
-  wire \$72 ;
-  wire \$74 ;
+  wire \$700 ;
+  wire \$702 ;
+  wire \$704 ;
+  wire \$706 ;
+  wire \$708 ;
+  wire \$71 ;
+  wire \$710 ;
+  wire \$712 ;
+  wire \$714 ;
+  wire \$716 ;
+  wire \$718 ;
+  wire \$720 ;
+  wire \$722 ;
+  wire \$724 ;
+  wire \$726 ;
+  wire \$728 ;
+  wire \$73 ;
+  wire \$730 ;
+  wire \$732 ;
+  wire \$734 ;
+  wire \$736 ;
+  wire \$738 ;
+  wire \$740 ;
+  wire \$742 ;
+  wire \$744 ;
+  wire \$746 ;
+  wire \$748 ;
+  wire \$75 ;
+  wire \$750 ;
+  wire \$752 ;
+  wire \$754 ;
+  wire \$756 ;
+  wire \$758 ;
+  wire \$760 ;
+  wire \$762 ;
+  wire \$764 ;
+  wire \$766 ;
+  wire \$768 ;
   wire \$77 ;
+  wire \$770 ;
+  wire \$772 ;
+  wire \$774 ;
+  wire \$776 ;
+  wire \$778 ;
+  wire \$780 ;
+  wire \$782 ;
+  wire \$784 ;
+  wire \$786 ;
+  wire \$788 ;
   wire \$79 ;
+  wire \$790 ;
+  wire \$792 ;
+  wire \$794 ;
+  wire \$796 ;
+  wire \$798 ;
+  wire \$800 ;
+  wire \$802 ;
+  wire \$804 ;
+  wire \$806 ;
+  wire \$808 ;
   wire \$81 ;
+  wire \$810 ;
+  wire \$812 ;
+  wire \$814 ;
+  wire \$816 ;
+  wire \$818 ;
+  wire \$820 ;
+  wire \$822 ;
+  wire \$824 ;
+  wire \$826 ;
+  wire \$828 ;
   wire \$83 ;
-  wire \$86 ;
-  wire \$88 ;
+  wire \$830 ;
+  wire \$832 ;
+  wire \$834 ;
+  wire \$836 ;
+  wire \$838 ;
+  wire \$840 ;
+  wire \$842 ;
+  wire \$844 ;
+  wire \$846 ;
+  wire \$848 ;
+  wire \$85 ;
+  wire \$850 ;
+  wire \$852 ;
+  wire \$854 ;
+  wire \$856 ;
+  wire \$858 ;
+  wire \$860 ;
+  wire \$862 ;
+  wire \$864 ;
+  wire \$866 ;
+  wire \$868 ;
+  wire \$87 ;
+  wire \$870 ;
+  wire \$872 ;
+  wire \$874 ;
+  wire \$876 ;
+  wire \$878 ;
+  wire \$880 ;
+  wire \$882 ;
+  wire \$884 ;
+  wire \$886 ;
+  wire \$888 ;
+  wire \$89 ;
+  wire \$890 ;
+  wire \$892 ;
+  wire \$894 ;
+  wire \$896 ;
+  wire \$898 ;
   wire \$9 ;
-  wire \$90 ;
-  wire \$92 ;
+  wire \$900 ;
+  wire \$902 ;
+  wire \$904 ;
+  wire \$906 ;
+  wire \$908 ;
+  wire \$91 ;
+  wire \$910 ;
+  wire \$912 ;
+  wire \$914 ;
+  wire \$916 ;
+  wire \$918 ;
+  wire \$920 ;
+  wire \$922 ;
+  wire \$924 ;
+  wire \$926 ;
+  wire \$928 ;
+  wire \$93 ;
+  wire \$930 ;
+  wire \$932 ;
+  wire \$934 ;
+  wire \$936 ;
+  wire \$938 ;
+  wire \$940 ;
+  wire \$942 ;
+  wire \$944 ;
+  wire \$946 ;
+  wire \$948 ;
   wire \$95 ;
+  wire \$950 ;
+  wire \$952 ;
+  wire \$954 ;
+  wire \$956 ;
+  wire \$958 ;
+  wire \$960 ;
+  wire \$962 ;
+  wire \$964 ;
+  wire \$966 ;
+  wire \$968 ;
   wire \$97 ;
+  wire \$970 ;
+  wire \$972 ;
+  wire \$974 ;
+  wire \$976 ;
+  wire \$978 ;
+  wire \$980 ;
+  wire \$982 ;
+  wire \$984 ;
+  wire \$986 ;
+  wire \$988 ;
   wire \$99 ;
-  reg \$signal  = 1'h0;
-  reg \$signal$103  = 1'h0;
-  reg \$signal$103$next ;
-  reg \$signal$112  = 1'h0;
-  reg \$signal$112$next ;
-  reg \$signal$121  = 1'h0;
-  reg \$signal$121$next ;
-  reg \$signal$67  = 1'h0;
-  reg \$signal$67$next ;
-  reg \$signal$76  = 1'h0;
-  reg \$signal$76$next ;
-  reg \$signal$85  = 1'h0;
-  reg \$signal$85$next ;
-  reg \$signal$94  = 1'h0;
-  reg \$signal$94$next ;
-  reg \$signal$next ;
+  wire \$990 ;
+  wire \$992 ;
+  wire \$994 ;
+  wire \$996 ;
+  wire \$998 ;
   reg [159:0] active_state = 160'h0000000000000000000100000000000000000000;
   reg [159:0] \active_state$next ;
   reg [21:0] audgen_accum = 22'h0b5464;
@@ -195,11 +692,22 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   output audio_mclk;
   wire audio_mclk;
   wire audio_output_word_bit;
-  reg [1:0] automata_next = 2'h0;
-  reg [1:0] \automata_next$next ;
+  reg [7:0] automata_next = 8'h1e;
+  reg [7:0] \automata_next$next ;
   reg [7:0] automata_table = 8'h1e;
   reg [7:0] \automata_table$next ;
   wire boot_clk;
+  input [31:0] bridge_addr;
+  wire [31:0] bridge_addr;
+  input bridge_rd;
+  wire bridge_rd;
+  output [31:0] bridge_rd_data;
+  reg [31:0] bridge_rd_data = 32'd0;
+  reg [31:0] \bridge_rd_data$next ;
+  input bridge_wr;
+  wire bridge_wr;
+  input [31:0] bridge_wr_data;
+  wire [31:0] bridge_wr_data;
   input clk;
   wire clk;
   wire \clk$1 ;
@@ -233,17 +741,27 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   wire dbg_rx;
   input dbg_tx;
   wire dbg_tx;
+  wire display_cell;
   reg [23:0] flash_color;
   reg frame_frozen = 1'h1;
   reg \frame_frozen$next ;
   wire hold;
-  wire \hold$138 ;
-  wire \hold$149 ;
-  wire \hold$160 ;
+  wire \hold$131 ;
+  wire \hold$142 ;
+  wire \hold$153 ;
   output init_done;
   reg init_done = 1'h0;
   wire \init_done$next ;
   wire l_press;
+  reg [2:0] line_generations = 3'h1;
+  reg [2:0] \line_generations$next ;
+  reg [2:0] line_generations_next = 3'h1;
+  reg [2:0] \line_generations_next$next ;
+  reg line_step;
+  reg line_steps_backcopy = 1'h0;
+  reg \line_steps_backcopy$next ;
+  reg [1:0] line_steps_left = 2'h0;
+  reg [1:0] \line_steps_left$next ;
   reg need_automata_next = 1'h0;
   reg \need_automata_next$next ;
   reg need_frozen_exception = 1'h0;
@@ -265,22 +783,40 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   reg \pll_clk_0_was$next ;
   input pll_clk_1;
   wire pll_clk_1;
+  input pll_clk_2;
+  wire pll_clk_2;
   wire press;
-  wire \press$139 ;
-  wire \press$150 ;
-  wire \press$161 ;
+  wire \press$132 ;
+  wire \press$143 ;
+  wire \press$154 ;
   wire r_press;
   wire \release ;
-  wire \release$144 ;
-  wire \release$155 ;
-  wire \release$166 ;
+  wire \release$137 ;
+  wire \release$148 ;
+  wire \release$159 ;
   input rst;
   wire rst;
   wire \rst$2 ;
+  reg scribble_hold_0 = 1'h0;
+  reg \scribble_hold_0$next ;
+  reg scribble_hold_1 = 1'h0;
+  reg \scribble_hold_1$next ;
+  reg scribble_hold_2 = 1'h0;
+  reg \scribble_hold_2$next ;
+  reg scribble_hold_3 = 1'h0;
+  reg \scribble_hold_3$next ;
   reg scribble_now;
-  reg \scribble_now$204 ;
-  reg \scribble_now$205 ;
-  reg \scribble_now$206 ;
+  reg \scribble_now$1221 ;
+  reg \scribble_now$1222 ;
+  reg \scribble_now$1223 ;
+  reg scribble_single_0 = 1'h0;
+  reg \scribble_single_0$next ;
+  reg scribble_single_1 = 1'h0;
+  reg \scribble_single_1$next ;
+  reg scribble_single_2 = 1'h0;
+  reg \scribble_single_2$next ;
+  reg scribble_single_3 = 1'h0;
+  reg \scribble_single_3$next ;
   wire select;
   reg [7:0] speed_counter = 8'h00;
   reg [7:0] \speed_counter$next ;
@@ -319,98 +855,170 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   reg [9:0] video_y_count = 10'h000;
   reg [9:0] \video_y_count$next ;
   assign \$9  = video_update_stb & \$7 ;
-  assign \$99  = ~ cont1_key[5];
-  assign \$101  = cont1_key_last[5] & \$99 ;
-  assign \$104  = ~ cont1_key_last[5];
-  assign \$106  = cont1_key[5] & \$104 ;
-  assign \$108  = ~ cont1_key[5];
-  assign \$110  = cont1_key_last[5] & \$108 ;
-  assign \$113  = ~ cont1_key_last[4];
-  assign \$115  = cont1_key[4] & \$113 ;
-  assign \$117  = ~ cont1_key[4];
+  assign \$99  = ~ cont1_key_last[5];
+  assign \$1000  = automata_table[7:4] >> active_state[127:126];
+  assign \$1002  = automata_table[3:0] >> active_state[127:126];
+  assign \$1004  = active_state[128] ? \$1000  : \$1002 ;
+  assign \$1006  = automata_table[7:4] >> active_state[128:127];
+  assign \$1008  = automata_table[3:0] >> active_state[128:127];
+  assign \$1010  = active_state[129] ? \$1006  : \$1008 ;
+  assign \$1012  = automata_table[7:4] >> active_state[129:128];
+  assign \$1014  = automata_table[3:0] >> active_state[129:128];
+  assign \$1016  = active_state[130] ? \$1012  : \$1014 ;
+  assign \$1018  = automata_table[7:4] >> active_state[130:129];
+  assign \$101  = cont1_key[5] & \$99 ;
+  assign \$1020  = automata_table[3:0] >> active_state[130:129];
+  assign \$1022  = active_state[131] ? \$1018  : \$1020 ;
+  assign \$1024  = automata_table[7:4] >> active_state[131:130];
+  assign \$1026  = automata_table[3:0] >> active_state[131:130];
+  assign \$1028  = active_state[132] ? \$1024  : \$1026 ;
+  assign \$1030  = automata_table[7:4] >> active_state[132:131];
+  assign \$1032  = automata_table[3:0] >> active_state[132:131];
+  assign \$1034  = active_state[133] ? \$1030  : \$1032 ;
+  assign \$1036  = automata_table[7:4] >> active_state[133:132];
+  assign \$1038  = automata_table[3:0] >> active_state[133:132];
+  assign \$103  = ~ cont1_key[5];
+  assign \$1040  = active_state[134] ? \$1036  : \$1038 ;
+  assign \$1042  = automata_table[7:4] >> active_state[134:133];
+  assign \$1044  = automata_table[3:0] >> active_state[134:133];
+  assign \$1046  = active_state[135] ? \$1042  : \$1044 ;
+  assign \$1048  = automata_table[7:4] >> active_state[135:134];
+  assign \$1050  = automata_table[3:0] >> active_state[135:134];
+  assign \$1052  = active_state[136] ? \$1048  : \$1050 ;
+  assign \$1054  = automata_table[7:4] >> active_state[136:135];
+  assign \$1056  = automata_table[3:0] >> active_state[136:135];
+  assign \$1058  = active_state[137] ? \$1054  : \$1056 ;
+  assign \$105  = cont1_key_last[5] & \$103 ;
+  assign \$1060  = automata_table[7:4] >> active_state[137:136];
+  assign \$1062  = automata_table[3:0] >> active_state[137:136];
+  assign \$1064  = active_state[138] ? \$1060  : \$1062 ;
+  assign \$1066  = automata_table[7:4] >> active_state[138:137];
+  assign \$1068  = automata_table[3:0] >> active_state[138:137];
+  assign \$1070  = active_state[139] ? \$1066  : \$1068 ;
+  assign \$1072  = automata_table[7:4] >> active_state[139:138];
+  assign \$1074  = automata_table[3:0] >> active_state[139:138];
+  assign \$1076  = active_state[140] ? \$1072  : \$1074 ;
+  assign \$1078  = automata_table[7:4] >> active_state[140:139];
+  assign \$107  = ~ cont1_key_last[4];
+  assign \$1080  = automata_table[3:0] >> active_state[140:139];
+  assign \$1082  = active_state[141] ? \$1078  : \$1080 ;
+  assign \$1084  = automata_table[7:4] >> active_state[141:140];
+  assign \$1086  = automata_table[3:0] >> active_state[141:140];
+  assign \$1088  = active_state[142] ? \$1084  : \$1086 ;
+  assign \$1090  = automata_table[7:4] >> active_state[142:141];
+  assign \$1092  = automata_table[3:0] >> active_state[142:141];
+  assign \$1094  = active_state[143] ? \$1090  : \$1092 ;
+  assign \$1096  = automata_table[7:4] >> active_state[143:142];
+  assign \$1098  = automata_table[3:0] >> active_state[143:142];
+  assign \$109  = cont1_key[4] & \$107 ;
+  assign \$1100  = active_state[144] ? \$1096  : \$1098 ;
+  assign \$1102  = automata_table[7:4] >> active_state[144:143];
+  assign \$1104  = automata_table[3:0] >> active_state[144:143];
+  assign \$1106  = active_state[145] ? \$1102  : \$1104 ;
+  assign \$1108  = automata_table[7:4] >> active_state[145:144];
+  assign \$1110  = automata_table[3:0] >> active_state[145:144];
+  assign \$1112  = active_state[146] ? \$1108  : \$1110 ;
+  assign \$1114  = automata_table[7:4] >> active_state[146:145];
+  assign \$1116  = automata_table[3:0] >> active_state[146:145];
+  assign \$1118  = active_state[147] ? \$1114  : \$1116 ;
+  assign \$111  = ~ cont1_key[4];
+  assign \$1120  = automata_table[7:4] >> active_state[147:146];
+  assign \$1122  = automata_table[3:0] >> active_state[147:146];
+  assign \$1124  = active_state[148] ? \$1120  : \$1122 ;
+  assign \$1126  = automata_table[7:4] >> active_state[148:147];
+  assign \$1128  = automata_table[3:0] >> active_state[148:147];
+  assign \$1130  = active_state[149] ? \$1126  : \$1128 ;
+  assign \$1132  = automata_table[7:4] >> active_state[149:148];
+  assign \$1134  = automata_table[3:0] >> active_state[149:148];
+  assign \$1136  = active_state[150] ? \$1132  : \$1134 ;
+  assign \$1138  = automata_table[7:4] >> active_state[150:149];
+  assign \$113  = cont1_key_last[4] & \$111 ;
+  assign \$1140  = automata_table[3:0] >> active_state[150:149];
+  assign \$1142  = active_state[151] ? \$1138  : \$1140 ;
+  assign \$1144  = automata_table[7:4] >> active_state[151:150];
+  assign \$1146  = automata_table[3:0] >> active_state[151:150];
+  assign \$1148  = active_state[152] ? \$1144  : \$1146 ;
+  assign \$1150  = automata_table[7:4] >> active_state[152:151];
+  assign \$1152  = automata_table[3:0] >> active_state[152:151];
+  assign \$1154  = active_state[153] ? \$1150  : \$1152 ;
+  assign \$1156  = automata_table[7:4] >> active_state[153:152];
+  assign \$1158  = automata_table[3:0] >> active_state[153:152];
+  assign \$115  = ~ cont1_key_last[4];
+  assign \$1160  = active_state[154] ? \$1156  : \$1158 ;
+  assign \$1162  = automata_table[7:4] >> active_state[154:153];
+  assign \$1164  = automata_table[3:0] >> active_state[154:153];
+  assign \$1166  = active_state[155] ? \$1162  : \$1164 ;
+  assign \$1168  = automata_table[7:4] >> active_state[155:154];
+  assign \$1170  = automata_table[3:0] >> active_state[155:154];
+  assign \$1172  = active_state[156] ? \$1168  : \$1170 ;
+  assign \$1174  = automata_table[7:4] >> active_state[156:155];
+  assign \$1176  = automata_table[3:0] >> active_state[156:155];
+  assign \$1178  = active_state[157] ? \$1174  : \$1176 ;
+  assign \$117  = cont1_key[4] & \$115 ;
+  assign \$1180  = automata_table[7:4] >> active_state[157:156];
+  assign \$1182  = automata_table[3:0] >> active_state[157:156];
+  assign \$1184  = active_state[158] ? \$1180  : \$1182 ;
+  assign \$1186  = automata_table[7:4] >> active_state[158:157];
+  assign \$1188  = automata_table[3:0] >> active_state[158:157];
+  assign \$1190  = active_state[159] ? \$1186  : \$1188 ;
+  assign \$1192  = automata_table[7:4] >> active_state[159:158];
+  assign \$1194  = automata_table[3:0] >> active_state[159:158];
+  assign \$1196  = active_state[0] ? \$1192  : \$1194 ;
+  assign \$1198  = video_y_count >= 5'h10;
   assign \$11  = video_x_count == 8'ha5;
-  assign \$119  = cont1_key_last[4] & \$117 ;
-  assign \$122  = ~ cont1_key_last[4];
-  assign \$124  = cont1_key[4] & \$122 ;
-  assign \$126  = ~ cont1_key[4];
-  assign \$128  = cont1_key_last[4] & \$126 ;
-  assign \$130  = ~ cont1_key_last[0];
-  assign \$132  = hold & \$130 ;
-  assign \$134  = ~ hold;
-  assign \$136  = \$134  & cont1_key_last[0];
-  assign \$13  = video_update_stb & \$11 ;
-  assign \$140  = ~ cont1_key_last[2];
-  assign \$142  = \hold$138  & \$140 ;
-  assign \$145  = ~ \hold$138 ;
-  assign \$147  = \$145  & cont1_key_last[2];
-  assign \$151  = ~ cont1_key_last[3];
-  assign \$153  = \hold$149  & \$151 ;
-  assign \$156  = ~ \hold$149 ;
-  assign \$158  = \$156  & cont1_key_last[3];
-  assign \$15  = video_y_count == 7'h69;
-  assign \$162  = ~ cont1_key_last[1];
-  assign \$164  = \hold$160  & \$162 ;
-  assign \$167  = ~ \hold$160 ;
-  assign \$169  = \$167  & cont1_key_last[1];
-  assign \$171  = | opening_countdown_timer;
-  assign \$173  = video_y_count >= 5'h10;
-  assign \$175  = video_hsync_stb & \$173 ;
-  assign \$177  = video_y_count < 7'h69;
-  assign \$17  = \$13  & \$15 ;
-  assign \$179  = \$175  & \$177 ;
-  assign \$181  = video_y_count == 5'h10;
-  assign \$183  = ~ frame_frozen;
-  assign \$185  = \$181  & \$183 ;
-  assign \$187  = video_y_count >= 5'h10;
-  assign \$189  = video_hsync_stb & \$187 ;
-  assign \$191  = video_y_count < 7'h69;
-  assign \$193  = \$189  & \$191 ;
-  assign \$196  = speed_counter + 1'h1;
-  assign \$198  = speed_counter & speed_counter_mask;
-  assign \$19  = video_x_count >= 3'h4;
-  assign \$200  = ! \$198 ;
-  assign \$202  = opening_wants_frozen | pause_key_wants_frozen;
-  assign \$207  = | opening_countdown_timer;
-  assign \$210  = opening_countdown_timer - 1'h1;
-  assign \$212  = ~ frame_frozen;
-  assign \$215  = video_update_stb & video_vsync_stb;
-  assign \$214  = ~ \$215 ;
-  assign \$218  = audgen_channel_internal <= 3'h5;
-  assign \$21  = video_x_count < 8'ha4;
-  assign \$220  = ! audio_divide_counter;
-  assign \$222  = audio_output_word_bit ^ audio_high;
-  assign \$224  = audgen_silenced ? 1'h0 : \$222 ;
-  assign \$227  = video_update_stb & video_vsync_stb;
-  assign \$226  = ~ \$227 ;
-  assign \$231  = audio_divide_counter + 1'h1;
-  assign \$233  = ! video_x_count;
-  assign \$235  = ! video_y_count;
-  assign \$237  = \$233  & \$235 ;
-  assign \$23  = \$19  & \$21 ;
-  assign \$239  = video_x_count == 2'h3;
-  assign \$242  = video_x_count + 1'h1;
-  assign \$244  = video_x_count == 8'ha7;
-  assign \$246  = video_x_count == 8'ha7;
-  assign \$249  = video_y_count + 1'h1;
-  assign \$251  = video_y_count == 7'h7a;
-  assign \$254  = audgen_accum + 22'h03c000;
-  assign \$257  = audgen_accum - 22'h0b5464;
-  assign \$25  = video_y_count >= 5'h10;
-  assign \$259  = $signed(\$257 ) + $signed(23'h03c000);
-  assign \$261  = audgen_accum >= 22'h0b5464;
-  assign \$263  = ~ audgen_mclk;
-  assign \$265  = ~ audgen_slck_count[1];
-  assign \$267  = ~ audgen_mclk;
-  assign \$269  = audgen_mclk_stb & \$267 ;
-  assign \$271  = audgen_slck_count == 2'h2;
-  assign \$273  = ~ audgen_mclk;
-  assign \$275  = audgen_mclk_stb & \$273 ;
-  assign \$278  = audgen_slck_count + 1'h1;
-  assign \$27  = \$23  & \$25 ;
-  assign \$280  = ~ audgen_mclk;
-  assign \$282  = audgen_mclk_stb & \$280 ;
-  assign \$285  = audgen_lrck_count + 1'h1;
-  assign \$287  = audgen_lrck_internal == 5'h17;
+  assign \$119  = ~ cont1_key[4];
+  assign \$1200  = video_hsync_stb & \$1198 ;
+  assign \$1202  = video_y_count < 7'h69;
+  assign \$1204  = \$1200  & \$1202 ;
+  assign \$1206  = video_y_count == 5'h10;
+  assign \$1208  = ~ frame_frozen;
+  assign \$1210  = \$1206  & \$1208 ;
+  assign \$1213  = speed_counter + 1'h1;
+  assign \$1215  = speed_counter & speed_counter_mask;
+  assign \$1217  = ! \$1215 ;
+  assign \$121  = cont1_key_last[4] & \$119 ;
+  assign \$1219  = opening_wants_frozen | pause_key_wants_frozen;
+  assign \$1224  = | opening_countdown_timer;
+  assign \$1227  = opening_countdown_timer - 1'h1;
+  assign \$1229  = ~ frame_frozen;
+  assign \$1232  = video_update_stb & video_vsync_stb;
+  assign \$1231  = ~ \$1232 ;
+  assign \$1235  = audgen_channel_internal <= 3'h5;
+  assign \$1237  = ! audio_divide_counter;
+  assign \$123  = ~ cont1_key_last[0];
+  assign \$1239  = audio_output_word_bit ^ audio_high;
+  assign \$1241  = audgen_silenced ? 1'h0 : \$1239 ;
+  assign \$1244  = video_update_stb & video_vsync_stb;
+  assign \$1243  = ~ \$1244 ;
+  assign \$1248  = audio_divide_counter + 1'h1;
+  assign \$1250  = ! video_x_count;
+  assign \$1252  = ! video_y_count;
+  assign \$1254  = \$1250  & \$1252 ;
+  assign \$1256  = video_x_count == 2'h3;
+  assign \$125  = hold & \$123 ;
+  assign \$1259  = video_x_count + 1'h1;
+  assign \$1261  = video_x_count == 8'ha7;
+  assign \$1263  = video_x_count == 8'ha7;
+  assign \$1266  = video_y_count + 1'h1;
+  assign \$1268  = video_y_count == 7'h7a;
+  assign \$1271  = audgen_accum + 22'h03c000;
+  assign \$1274  = audgen_accum - 22'h0b5464;
+  assign \$1276  = $signed(\$1274 ) + $signed(23'h03c000);
+  assign \$1278  = audgen_accum >= 22'h0b5464;
+  assign \$127  = ~ hold;
+  assign \$1280  = ~ audgen_mclk;
+  assign \$1282  = ~ audgen_slck_count[1];
+  assign \$1284  = ~ audgen_mclk;
+  assign \$1286  = audgen_mclk_stb & \$1284 ;
+  assign \$1288  = audgen_slck_count == 2'h2;
+  assign \$1290  = ~ audgen_mclk;
+  assign \$1292  = audgen_mclk_stb & \$1290 ;
+  assign \$1295  = audgen_slck_count + 1'h1;
+  assign \$1297  = ~ audgen_mclk;
+  assign \$129  = \$127  & cont1_key_last[0];
+  assign \$1299  = audgen_mclk_stb & \$1297 ;
+  assign \$1302  = audgen_lrck_count + 1'h1;
+  assign \$1304  = audgen_lrck_internal == 5'h17;
   always @(posedge boot_clk)
     init_done <= 1'h1;
   always @(posedge \clk$1 , posedge \rst$2 )
@@ -432,45 +1040,56 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
     if (\rst$2 ) speed_counter_mask <= 8'h01;
     else speed_counter_mask <= \speed_counter_mask$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal  <= 1'h0;
-    else \$signal  <= \$signal$next ;
+    if (\rst$2 ) scribble_single_0 <= 1'h0;
+    else scribble_single_0 <= \scribble_single_0$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$67  <= 1'h0;
-    else \$signal$67  <= \$signal$67$next ;
+    if (\rst$2 ) scribble_hold_0 <= 1'h0;
+    else scribble_hold_0 <= \scribble_hold_0$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$76  <= 1'h0;
-    else \$signal$76  <= \$signal$76$next ;
+    if (\rst$2 ) scribble_single_1 <= 1'h0;
+    else scribble_single_1 <= \scribble_single_1$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$85  <= 1'h0;
-    else \$signal$85  <= \$signal$85$next ;
-  assign \$29  = video_y_count < 7'h6a;
+    if (\rst$2 ) scribble_hold_1 <= 1'h0;
+    else scribble_hold_1 <= \scribble_hold_1$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$94  <= 1'h0;
-    else \$signal$94  <= \$signal$94$next ;
+    if (\rst$2 ) scribble_single_2 <= 1'h0;
+    else scribble_single_2 <= \scribble_single_2$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$103  <= 1'h0;
-    else \$signal$103  <= \$signal$103$next ;
+    if (\rst$2 ) scribble_hold_2 <= 1'h0;
+    else scribble_hold_2 <= \scribble_hold_2$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$112  <= 1'h0;
-    else \$signal$112  <= \$signal$112$next ;
+    if (\rst$2 ) scribble_single_3 <= 1'h0;
+    else scribble_single_3 <= \scribble_single_3$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) \$signal$121  <= 1'h0;
-    else \$signal$121  <= \$signal$121$next ;
+    if (\rst$2 ) scribble_hold_3 <= 1'h0;
+    else scribble_hold_3 <= \scribble_hold_3$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
-    if (\rst$2 ) automata_next <= 2'h0;
+    if (\rst$2 ) automata_next <= 8'h1e;
     else automata_next <= \automata_next$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) need_automata_next <= 1'h0;
     else need_automata_next <= \need_automata_next$next ;
+  always @(posedge \clk$1 , posedge \rst$2 )
+    if (\rst$2 ) line_generations_next <= 3'h1;
+    else line_generations_next <= \line_generations_next$next ;
+  always @(posedge \clk$1 , posedge \rst$2 )
+    if (\rst$2 ) bridge_rd_data <= 32'd0;
+    else bridge_rd_data <= \bridge_rd_data$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) need_topline_backcopy <= 1'h0;
     else need_topline_backcopy <= \need_topline_backcopy$next ;
+  always @(posedge \clk$1 , posedge \rst$2 )
+    if (\rst$2 ) line_steps_left <= 2'h0;
+    else line_steps_left <= \line_steps_left$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) video_rgb <= 24'h000000;
     else video_rgb <= \video_rgb$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) active_state <= 160'h0000000000000000000100000000000000000000;
     else active_state <= \active_state$next ;
+  always @(posedge \clk$1 , posedge \rst$2 )
+    if (\rst$2 ) line_steps_backcopy <= 1'h0;
+    else line_steps_backcopy <= \line_steps_backcopy$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) speed_counter <= 8'h00;
     else speed_counter <= \speed_counter$next ;
@@ -483,6 +1102,9 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) automata_table <= 8'h1e;
     else automata_table <= \automata_table$next ;
+  always @(posedge \clk$1 , posedge \rst$2 )
+    if (\rst$2 ) line_generations <= 3'h1;
+    else line_generations <= \line_generations$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) need_topline_copy <= 1'h0;
     else need_topline_copy <= \need_topline_copy$next ;
@@ -498,13 +1120,13 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) audio_divide_counter <= 2'h3;
     else audio_divide_counter <= \audio_divide_counter$next ;
+  assign \$133  = ~ cont1_key_last[2];
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) video_vs <= 1'h0;
     else video_vs <= \video_vs$next ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) video_hs <= 1'h0;
     else video_hs <= \video_hs$next ;
-  assign \$31  = \$27  & \$29 ;
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) video_x_count <= 10'h000;
     else video_x_count <= \video_x_count$next ;
@@ -529,351 +1151,729 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   always @(posedge \clk$1 , posedge \rst$2 )
     if (\rst$2 ) audgen_lrck_count <= 8'h00;
     else audgen_lrck_count <= \audgen_lrck_count$next ;
+  assign \$135  = \hold$131  & \$133 ;
+  assign \$138  = ~ \hold$131 ;
+  assign \$13  = video_update_stb & \$11 ;
+  assign \$140  = \$138  & cont1_key_last[2];
+  assign \$144  = ~ cont1_key_last[3];
+  assign \$146  = \hold$142  & \$144 ;
+  assign \$149  = ~ \hold$142 ;
+  assign \$151  = \$149  & cont1_key_last[3];
+  assign \$155  = ~ cont1_key_last[1];
+  assign \$157  = \hold$153  & \$155 ;
+  assign \$15  = video_y_count == 7'h69;
+  assign \$160  = ~ \hold$153 ;
+  assign \$162  = \$160  & cont1_key_last[1];
+  assign \$164  = bridge_addr == 29'h10000000;
+  assign \$166  = bridge_wr & \$164 ;
+  assign \$168  = bridge_addr == 29'h10000000;
+  assign \$170  = bridge_wr & \$168 ;
+  assign \$172  = bridge_addr == 29'h10000004;
+  assign \$174  = bridge_wr & \$172 ;
+  assign \$176  = ! bridge_wr_data;
+  assign \$178  = bridge_wr_data > 3'h4;
+  assign \$17  = \$13  & \$15 ;
+  assign \$180  = bridge_addr == 29'h10000000;
+  assign \$182  = bridge_addr == 29'h10000004;
+  assign \$184  = + automata_table;
+  assign \$186  = + line_generations;
+  assign \$188  = | opening_countdown_timer;
+  assign \$190  = | line_steps_left;
+  assign \$192  = line_steps_left == 1'h1;
+  assign \$194  = \$192  & line_steps_backcopy;
+  assign \$196  = video_y_count >= 5'h10;
+  assign \$198  = video_hsync_stb & \$196 ;
+  assign \$19  = video_x_count >= 3'h4;
+  assign \$200  = video_y_count < 7'h69;
+  assign \$202  = \$198  & \$200 ;
+  assign \$204  = video_y_count == 5'h10;
+  assign \$206  = ~ frame_frozen;
+  assign \$208  = \$204  & \$206 ;
+  assign \$210  = line_generations == 1'h1;
+  assign \$212  = | line_steps_left;
+  assign \$214  = video_y_count >= 5'h10;
+  assign \$216  = video_hsync_stb & \$214 ;
+  assign \$218  = video_y_count < 7'h69;
+  assign \$21  = video_x_count < 8'ha4;
+  assign \$220  = \$216  & \$218 ;
+  assign \$222  = | line_steps_left;
+  assign \$225  = line_steps_left - 1'h1;
+  assign \$227  = video_y_count >= 5'h10;
+  assign \$229  = video_hsync_stb & \$227 ;
+  assign \$231  = video_y_count < 7'h69;
+  assign \$233  = \$229  & \$231 ;
+  assign \$236  = line_generations - 1'h1;
+  assign \$238  = automata_table[7:4] >> { active_state[0], active_state[159] };
+  assign \$23  = \$19  & \$21 ;
+  assign \$240  = automata_table[3:0] >> { active_state[0], active_state[159] };
+  assign \$242  = active_state[1] ? \$238  : \$240 ;
+  assign \$244  = automata_table[7:4] >> active_state[1:0];
+  assign \$246  = automata_table[3:0] >> active_state[1:0];
+  assign \$248  = active_state[2] ? \$244  : \$246 ;
+  assign \$250  = automata_table[7:4] >> active_state[2:1];
+  assign \$252  = automata_table[3:0] >> active_state[2:1];
+  assign \$254  = active_state[3] ? \$250  : \$252 ;
+  assign \$256  = automata_table[7:4] >> active_state[3:2];
+  assign \$258  = automata_table[3:0] >> active_state[3:2];
+  assign \$25  = video_y_count >= 5'h10;
+  assign \$260  = active_state[4] ? \$256  : \$258 ;
+  assign \$262  = automata_table[7:4] >> active_state[4:3];
+  assign \$264  = automata_table[3:0] >> active_state[4:3];
+  assign \$266  = active_state[5] ? \$262  : \$264 ;
+  assign \$268  = automata_table[7:4] >> active_state[5:4];
+  assign \$270  = automata_table[3:0] >> active_state[5:4];
+  assign \$272  = active_state[6] ? \$268  : \$270 ;
+  assign \$274  = automata_table[7:4] >> active_state[6:5];
+  assign \$276  = automata_table[3:0] >> active_state[6:5];
+  assign \$278  = active_state[7] ? \$274  : \$276 ;
+  assign \$27  = \$23  & \$25 ;
+  assign \$280  = automata_table[7:4] >> active_state[7:6];
+  assign \$282  = automata_table[3:0] >> active_state[7:6];
+  assign \$284  = active_state[8] ? \$280  : \$282 ;
+  assign \$286  = automata_table[7:4] >> active_state[8:7];
+  assign \$288  = automata_table[3:0] >> active_state[8:7];
+  assign \$290  = active_state[9] ? \$286  : \$288 ;
+  assign \$292  = automata_table[7:4] >> active_state[9:8];
+  assign \$294  = automata_table[3:0] >> active_state[9:8];
+  assign \$296  = active_state[10] ? \$292  : \$294 ;
+  assign \$298  = automata_table[7:4] >> active_state[10:9];
+  assign \$29  = video_y_count < 7'h6a;
+  assign \$300  = automata_table[3:0] >> active_state[10:9];
+  assign \$302  = active_state[11] ? \$298  : \$300 ;
+  assign \$304  = automata_table[7:4] >> active_state[11:10];
+  assign \$306  = automata_table[3:0] >> active_state[11:10];
+  assign \$308  = active_state[12] ? \$304  : \$306 ;
+  assign \$310  = automata_table[7:4] >> active_state[12:11];
+  assign \$312  = automata_table[3:0] >> active_state[12:11];
+  assign \$314  = active_state[13] ? \$310  : \$312 ;
+  assign \$316  = automata_table[7:4] >> active_state[13:12];
+  assign \$318  = automata_table[3:0] >> active_state[13:12];
+  assign \$31  = \$27  & \$29 ;
+  assign \$320  = active_state[14] ? \$316  : \$318 ;
+  assign \$322  = automata_table[7:4] >> active_state[14:13];
+  assign \$324  = automata_table[3:0] >> active_state[14:13];
+  assign \$326  = active_state[15] ? \$322  : \$324 ;
+  assign \$328  = automata_table[7:4] >> active_state[15:14];
+  assign \$330  = automata_table[3:0] >> active_state[15:14];
+  assign \$332  = active_state[16] ? \$328  : \$330 ;
+  assign \$334  = automata_table[7:4] >> active_state[16:15];
+  assign \$336  = automata_table[3:0] >> active_state[16:15];
+  assign \$338  = active_state[17] ? \$334  : \$336 ;
   assign \$33  = ~ cont1_key_last[15];
+  assign \$340  = automata_table[7:4] >> active_state[17:16];
+  assign \$342  = automata_table[3:0] >> active_state[17:16];
+  assign \$344  = active_state[18] ? \$340  : \$342 ;
+  assign \$346  = automata_table[7:4] >> active_state[18:17];
+  assign \$348  = automata_table[3:0] >> active_state[18:17];
+  assign \$350  = active_state[19] ? \$346  : \$348 ;
+  assign \$352  = automata_table[7:4] >> active_state[19:18];
+  assign \$354  = automata_table[3:0] >> active_state[19:18];
+  assign \$356  = active_state[20] ? \$352  : \$354 ;
+  assign \$358  = automata_table[7:4] >> active_state[20:19];
   assign \$35  = cont1_key[15] & \$33 ;
+  assign \$360  = automata_table[3:0] >> active_state[20:19];
+  assign \$362  = active_state[21] ? \$358  : \$360 ;
+  assign \$364  = automata_table[7:4] >> active_state[21:20];
+  assign \$366  = automata_table[3:0] >> active_state[21:20];
+  assign \$368  = active_state[22] ? \$364  : \$366 ;
+  assign \$370  = automata_table[7:4] >> active_state[22:21];
+  assign \$372  = automata_table[3:0] >> active_state[22:21];
+  assign \$374  = active_state[23] ? \$370  : \$372 ;
+  assign \$376  = automata_table[7:4] >> active_state[23:22];
+  assign \$378  = automata_table[3:0] >> active_state[23:22];
   assign \$37  = ~ cont1_key_last[15];
+  assign \$380  = active_state[24] ? \$376  : \$378 ;
+  assign \$382  = automata_table[7:4] >> active_state[24:23];
+  assign \$384  = automata_table[3:0] >> active_state[24:23];
+  assign \$386  = active_state[25] ? \$382  : \$384 ;
+  assign \$388  = automata_table[7:4] >> active_state[25:24];
+  assign \$390  = automata_table[3:0] >> active_state[25:24];
+  assign \$392  = active_state[26] ? \$388  : \$390 ;
+  assign \$394  = automata_table[7:4] >> active_state[26:25];
+  assign \$396  = automata_table[3:0] >> active_state[26:25];
+  assign \$398  = active_state[27] ? \$394  : \$396 ;
   assign \$3  = ~ pll_clk_0_was;
   assign \$39  = cont1_key[15] & \$37 ;
+  assign \$400  = automata_table[7:4] >> active_state[27:26];
+  assign \$402  = automata_table[3:0] >> active_state[27:26];
+  assign \$404  = active_state[28] ? \$400  : \$402 ;
+  assign \$406  = automata_table[7:4] >> active_state[28:27];
+  assign \$408  = automata_table[3:0] >> active_state[28:27];
+  assign \$410  = active_state[29] ? \$406  : \$408 ;
+  assign \$412  = automata_table[7:4] >> active_state[29:28];
+  assign \$414  = automata_table[3:0] >> active_state[29:28];
+  assign \$416  = active_state[30] ? \$412  : \$414 ;
+  assign \$418  = automata_table[7:4] >> active_state[30:29];
   assign \$41  = ~ cont1_key_last[15];
+  assign \$420  = automata_table[3:0] >> active_state[30:29];
+  assign \$422  = active_state[31] ? \$418  : \$420 ;
+  assign \$424  = automata_table[7:4] >> active_state[31:30];
+  assign \$426  = automata_table[3:0] >> active_state[31:30];
+  assign \$428  = active_state[32] ? \$424  : \$426 ;
+  assign \$430  = automata_table[7:4] >> active_state[32:31];
+  assign \$432  = automata_table[3:0] >> active_state[32:31];
+  assign \$434  = active_state[33] ? \$430  : \$432 ;
+  assign \$436  = automata_table[7:4] >> active_state[33:32];
+  assign \$438  = automata_table[3:0] >> active_state[33:32];
   assign \$43  = cont1_key[15] & \$41 ;
+  assign \$440  = active_state[34] ? \$436  : \$438 ;
+  assign \$442  = automata_table[7:4] >> active_state[34:33];
+  assign \$444  = automata_table[3:0] >> active_state[34:33];
+  assign \$446  = active_state[35] ? \$442  : \$444 ;
+  assign \$448  = automata_table[7:4] >> active_state[35:34];
+  assign \$450  = automata_table[3:0] >> active_state[35:34];
+  assign \$452  = active_state[36] ? \$448  : \$450 ;
+  assign \$454  = automata_table[7:4] >> active_state[36:35];
+  assign \$456  = automata_table[3:0] >> active_state[36:35];
+  assign \$458  = active_state[37] ? \$454  : \$456 ;
   assign \$45  = ~ pause_key_wants_frozen;
+  assign \$460  = automata_table[7:4] >> active_state[37:36];
+  assign \$462  = automata_table[3:0] >> active_state[37:36];
+  assign \$464  = active_state[38] ? \$460  : \$462 ;
+  assign \$466  = automata_table[7:4] >> active_state[38:37];
+  assign \$468  = automata_table[3:0] >> active_state[38:37];
+  assign \$470  = active_state[39] ? \$466  : \$468 ;
+  assign \$472  = automata_table[7:4] >> active_state[39:38];
+  assign \$474  = automata_table[3:0] >> active_state[39:38];
+  assign \$476  = active_state[40] ? \$472  : \$474 ;
+  assign \$478  = automata_table[7:4] >> active_state[40:39];
   assign \$47  = ~ cont1_key_last[8];
+  assign \$480  = automata_table[3:0] >> active_state[40:39];
+  assign \$482  = active_state[41] ? \$478  : \$480 ;
+  assign \$484  = automata_table[7:4] >> active_state[41:40];
+  assign \$486  = automata_table[3:0] >> active_state[41:40];
+  assign \$488  = active_state[42] ? \$484  : \$486 ;
+  assign \$490  = automata_table[7:4] >> active_state[42:41];
+  assign \$492  = automata_table[3:0] >> active_state[42:41];
+  assign \$494  = active_state[43] ? \$490  : \$492 ;
+  assign \$496  = automata_table[7:4] >> active_state[43:42];
+  assign \$498  = automata_table[3:0] >> active_state[43:42];
   assign \$49  = cont1_key[8] & \$47 ;
+  assign \$500  = active_state[44] ? \$496  : \$498 ;
+  assign \$502  = automata_table[7:4] >> active_state[44:43];
+  assign \$504  = automata_table[3:0] >> active_state[44:43];
+  assign \$506  = active_state[45] ? \$502  : \$504 ;
+  assign \$508  = automata_table[7:4] >> active_state[45:44];
+  assign \$510  = automata_table[3:0] >> active_state[45:44];
+  assign \$512  = active_state[46] ? \$508  : \$510 ;
+  assign \$514  = automata_table[7:4] >> active_state[46:45];
+  assign \$516  = automata_table[3:0] >> active_state[46:45];
+  assign \$518  = active_state[47] ? \$514  : \$516 ;
   assign \$51  = ~ cont1_key_last[9];
+  assign \$520  = automata_table[7:4] >> active_state[47:46];
+  assign \$522  = automata_table[3:0] >> active_state[47:46];
+  assign \$524  = active_state[48] ? \$520  : \$522 ;
+  assign \$526  = automata_table[7:4] >> active_state[48:47];
+  assign \$528  = automata_table[3:0] >> active_state[48:47];
+  assign \$530  = active_state[49] ? \$526  : \$528 ;
+  assign \$532  = automata_table[7:4] >> active_state[49:48];
+  assign \$534  = automata_table[3:0] >> active_state[49:48];
+  assign \$536  = active_state[50] ? \$532  : \$534 ;
+  assign \$538  = automata_table[7:4] >> active_state[50:49];
   assign \$53  = cont1_key[9] & \$51 ;
+  assign \$540  = automata_table[3:0] >> active_state[50:49];
+  assign \$542  = active_state[51] ? \$538  : \$540 ;
+  assign \$544  = automata_table[7:4] >> active_state[51:50];
+  assign \$546  = automata_table[3:0] >> active_state[51:50];
+  assign \$548  = active_state[52] ? \$544  : \$546 ;
+  assign \$550  = automata_table[7:4] >> active_state[52:51];
+  assign \$552  = automata_table[3:0] >> active_state[52:51];
+  assign \$554  = active_state[53] ? \$550  : \$552 ;
+  assign \$556  = automata_table[7:4] >> active_state[53:52];
+  assign \$558  = automata_table[3:0] >> active_state[53:52];
   assign \$55  = l_press & r_press;
+  assign \$560  = active_state[54] ? \$556  : \$558 ;
+  assign \$562  = automata_table[7:4] >> active_state[54:53];
+  assign \$564  = automata_table[3:0] >> active_state[54:53];
+  assign \$566  = active_state[55] ? \$562  : \$564 ;
+  assign \$568  = automata_table[7:4] >> active_state[55:54];
+  assign \$570  = automata_table[3:0] >> active_state[55:54];
+  assign \$572  = active_state[56] ? \$568  : \$570 ;
+  assign \$574  = automata_table[7:4] >> active_state[56:55];
+  assign \$576  = automata_table[3:0] >> active_state[56:55];
+  assign \$578  = active_state[57] ? \$574  : \$576 ;
   assign \$57  = + speed_counter_mask[7:1];
+  assign \$580  = automata_table[7:4] >> active_state[57:56];
+  assign \$582  = automata_table[3:0] >> active_state[57:56];
+  assign \$584  = active_state[58] ? \$580  : \$582 ;
+  assign \$586  = automata_table[7:4] >> active_state[58:57];
+  assign \$588  = automata_table[3:0] >> active_state[58:57];
+  assign \$590  = active_state[59] ? \$586  : \$588 ;
+  assign \$592  = automata_table[7:4] >> active_state[59:58];
+  assign \$594  = automata_table[3:0] >> active_state[59:58];
+  assign \$596  = active_state[60] ? \$592  : \$594 ;
+  assign \$598  = automata_table[7:4] >> active_state[60:59];
   assign \$5  = pll_clk_0 & \$3 ;
   assign \$59  = ~ cont1_key_last[7];
+  assign \$600  = automata_table[3:0] >> active_state[60:59];
+  assign \$602  = active_state[61] ? \$598  : \$600 ;
+  assign \$604  = automata_table[7:4] >> active_state[61:60];
+  assign \$606  = automata_table[3:0] >> active_state[61:60];
+  assign \$608  = active_state[62] ? \$604  : \$606 ;
+  assign \$610  = automata_table[7:4] >> active_state[62:61];
+  assign \$612  = automata_table[3:0] >> active_state[62:61];
+  assign \$614  = active_state[63] ? \$610  : \$612 ;
+  assign \$616  = automata_table[7:4] >> active_state[63:62];
+  assign \$618  = automata_table[3:0] >> active_state[63:62];
   assign \$61  = cont1_key[7] & \$59 ;
+  assign \$620  = active_state[64] ? \$616  : \$618 ;
+  assign \$622  = automata_table[7:4] >> active_state[64:63];
+  assign \$624  = automata_table[3:0] >> active_state[64:63];
+  assign \$626  = active_state[65] ? \$622  : \$624 ;
+  assign \$628  = automata_table[7:4] >> active_state[65:64];
+  assign \$630  = automata_table[3:0] >> active_state[65:64];
+  assign \$632  = active_state[66] ? \$628  : \$630 ;
+  assign \$634  = automata_table[7:4] >> active_state[66:65];
+  assign \$636  = automata_table[3:0] >> active_state[66:65];
+  assign \$638  = active_state[67] ? \$634  : \$636 ;
   assign \$63  = ~ cont1_key[7];
+  assign \$640  = automata_table[7:4] >> active_state[67:66];
+  assign \$642  = automata_table[3:0] >> active_state[67:66];
+  assign \$644  = active_state[68] ? \$640  : \$642 ;
+  assign \$646  = automata_table[7:4] >> active_state[68:67];
+  assign \$648  = automata_table[3:0] >> active_state[68:67];
+  assign \$650  = active_state[69] ? \$646  : \$648 ;
+  assign \$652  = automata_table[7:4] >> active_state[69:68];
+  assign \$654  = automata_table[3:0] >> active_state[69:68];
+  assign \$656  = active_state[70] ? \$652  : \$654 ;
+  assign \$658  = automata_table[7:4] >> active_state[70:69];
   assign \$65  = cont1_key_last[7] & \$63 ;
-  assign \$68  = ~ cont1_key_last[7];
-  assign \$70  = cont1_key[7] & \$68 ;
-  assign \$72  = ~ cont1_key[7];
-  assign \$74  = cont1_key_last[7] & \$72 ;
-  assign \$77  = ~ cont1_key_last[6];
+  assign \$660  = automata_table[3:0] >> active_state[70:69];
+  assign \$662  = active_state[71] ? \$658  : \$660 ;
+  assign \$664  = automata_table[7:4] >> active_state[71:70];
+  assign \$666  = automata_table[3:0] >> active_state[71:70];
+  assign \$668  = active_state[72] ? \$664  : \$666 ;
+  assign \$670  = automata_table[7:4] >> active_state[72:71];
+  assign \$672  = automata_table[3:0] >> active_state[72:71];
+  assign \$674  = active_state[73] ? \$670  : \$672 ;
+  assign \$676  = automata_table[7:4] >> active_state[73:72];
+  assign \$678  = automata_table[3:0] >> active_state[73:72];
+  assign \$67  = ~ cont1_key_last[7];
+  assign \$680  = active_state[74] ? \$676  : \$678 ;
+  assign \$682  = automata_table[7:4] >> active_state[74:73];
+  assign \$684  = automata_table[3:0] >> active_state[74:73];
+  assign \$686  = active_state[75] ? \$682  : \$684 ;
+  assign \$688  = automata_table[7:4] >> active_state[75:74];
+  assign \$690  = automata_table[3:0] >> active_state[75:74];
+  assign \$692  = active_state[76] ? \$688  : \$690 ;
+  assign \$694  = automata_table[7:4] >> active_state[76:75];
+  assign \$696  = automata_table[3:0] >> active_state[76:75];
+  assign \$698  = active_state[77] ? \$694  : \$696 ;
+  assign \$69  = cont1_key[7] & \$67 ;
+  assign \$700  = automata_table[7:4] >> active_state[77:76];
+  assign \$702  = automata_table[3:0] >> active_state[77:76];
+  assign \$704  = active_state[78] ? \$700  : \$702 ;
+  assign \$706  = automata_table[7:4] >> active_state[78:77];
+  assign \$708  = automata_table[3:0] >> active_state[78:77];
+  assign \$710  = active_state[79] ? \$706  : \$708 ;
+  assign \$712  = automata_table[7:4] >> active_state[79:78];
+  assign \$714  = automata_table[3:0] >> active_state[79:78];
+  assign \$716  = active_state[80] ? \$712  : \$714 ;
+  assign \$718  = automata_table[7:4] >> active_state[80:79];
+  assign \$71  = ~ cont1_key[7];
+  assign \$720  = automata_table[3:0] >> active_state[80:79];
+  assign \$722  = active_state[81] ? \$718  : \$720 ;
+  assign \$724  = automata_table[7:4] >> active_state[81:80];
+  assign \$726  = automata_table[3:0] >> active_state[81:80];
+  assign \$728  = active_state[82] ? \$724  : \$726 ;
+  assign \$730  = automata_table[7:4] >> active_state[82:81];
+  assign \$732  = automata_table[3:0] >> active_state[82:81];
+  assign \$734  = active_state[83] ? \$730  : \$732 ;
+  assign \$736  = automata_table[7:4] >> active_state[83:82];
+  assign \$738  = automata_table[3:0] >> active_state[83:82];
+  assign \$73  = cont1_key_last[7] & \$71 ;
+  assign \$740  = active_state[84] ? \$736  : \$738 ;
+  assign \$742  = automata_table[7:4] >> active_state[84:83];
+  assign \$744  = automata_table[3:0] >> active_state[84:83];
+  assign \$746  = active_state[85] ? \$742  : \$744 ;
+  assign \$748  = automata_table[7:4] >> active_state[85:84];
+  assign \$750  = automata_table[3:0] >> active_state[85:84];
+  assign \$752  = active_state[86] ? \$748  : \$750 ;
+  assign \$754  = automata_table[7:4] >> active_state[86:85];
+  assign \$756  = automata_table[3:0] >> active_state[86:85];
+  assign \$758  = active_state[87] ? \$754  : \$756 ;
+  assign \$75  = ~ cont1_key_last[6];
+  assign \$760  = automata_table[7:4] >> active_state[87:86];
+  assign \$762  = automata_table[3:0] >> active_state[87:86];
+  assign \$764  = active_state[88] ? \$760  : \$762 ;
+  assign \$766  = automata_table[7:4] >> active_state[88:87];
+  assign \$768  = automata_table[3:0] >> active_state[88:87];
+  assign \$770  = active_state[89] ? \$766  : \$768 ;
+  assign \$772  = automata_table[7:4] >> active_state[89:88];
+  assign \$774  = automata_table[3:0] >> active_state[89:88];
+  assign \$776  = active_state[90] ? \$772  : \$774 ;
+  assign \$778  = automata_table[7:4] >> active_state[90:89];
+  assign \$77  = cont1_key[6] & \$75 ;
+  assign \$780  = automata_table[3:0] >> active_state[90:89];
+  assign \$782  = active_state[91] ? \$778  : \$780 ;
+  assign \$784  = automata_table[7:4] >> active_state[91:90];
+  assign \$786  = automata_table[3:0] >> active_state[91:90];
+  assign \$788  = active_state[92] ? \$784  : \$786 ;
+  assign \$790  = automata_table[7:4] >> active_state[92:91];
+  assign \$792  = automata_table[3:0] >> active_state[92:91];
+  assign \$794  = active_state[93] ? \$790  : \$792 ;
+  assign \$796  = automata_table[7:4] >> active_state[93:92];
+  assign \$798  = automata_table[3:0] >> active_state[93:92];
   assign \$7  = video_x_count == 8'ha4;
-  assign \$79  = cont1_key[6] & \$77 ;
-  assign \$81  = ~ cont1_key[6];
-  assign \$83  = cont1_key_last[6] & \$81 ;
-  assign \$86  = ~ cont1_key_last[6];
-  assign \$88  = cont1_key[6] & \$86 ;
-  assign \$90  = ~ cont1_key[6];
-  assign \$92  = cont1_key_last[6] & \$90 ;
-  assign \$95  = ~ cont1_key_last[5];
-  assign \$97  = cont1_key[5] & \$95 ;
+  assign \$79  = ~ cont1_key[6];
+  assign \$800  = active_state[94] ? \$796  : \$798 ;
+  assign \$802  = automata_table[7:4] >> active_state[94:93];
+  assign \$804  = automata_table[3:0] >> active_state[94:93];
+  assign \$806  = active_state[95] ? \$802  : \$804 ;
+  assign \$808  = automata_table[7:4] >> active_state[95:94];
+  assign \$810  = automata_table[3:0] >> active_state[95:94];
+  assign \$812  = active_state[96] ? \$808  : \$810 ;
+  assign \$814  = automata_table[7:4] >> active_state[96:95];
+  assign \$816  = automata_table[3:0] >> active_state[96:95];
+  assign \$818  = active_state[97] ? \$814  : \$816 ;
+  assign \$81  = cont1_key_last[6] & \$79 ;
+  assign \$820  = automata_table[7:4] >> active_state[97:96];
+  assign \$822  = automata_table[3:0] >> active_state[97:96];
+  assign \$824  = active_state[98] ? \$820  : \$822 ;
+  assign \$826  = automata_table[7:4] >> active_state[98:97];
+  assign \$828  = automata_table[3:0] >> active_state[98:97];
+  assign \$830  = active_state[99] ? \$826  : \$828 ;
+  assign \$832  = automata_table[7:4] >> active_state[99:98];
+  assign \$834  = automata_table[3:0] >> active_state[99:98];
+  assign \$836  = active_state[100] ? \$832  : \$834 ;
+  assign \$838  = automata_table[7:4] >> active_state[100:99];
+  assign \$83  = ~ cont1_key_last[6];
+  assign \$840  = automata_table[3:0] >> active_state[100:99];
+  assign \$842  = active_state[101] ? \$838  : \$840 ;
+  assign \$844  = automata_table[7:4] >> active_state[101:100];
+  assign \$846  = automata_table[3:0] >> active_state[101:100];
+  assign \$848  = active_state[102] ? \$844  : \$846 ;
+  assign \$850  = automata_table[7:4] >> active_state[102:101];
+  assign \$852  = automata_table[3:0] >> active_state[102:101];
+  assign \$854  = active_state[103] ? \$850  : \$852 ;
+  assign \$856  = automata_table[7:4] >> active_state[103:102];
+  assign \$858  = automata_table[3:0] >> active_state[103:102];
+  assign \$85  = cont1_key[6] & \$83 ;
+  assign \$860  = active_state[104] ? \$856  : \$858 ;
+  assign \$862  = automata_table[7:4] >> active_state[104:103];
+  assign \$864  = automata_table[3:0] >> active_state[104:103];
+  assign \$866  = active_state[105] ? \$862  : \$864 ;
+  assign \$868  = automata_table[7:4] >> active_state[105:104];
+  assign \$870  = automata_table[3:0] >> active_state[105:104];
+  assign \$872  = active_state[106] ? \$868  : \$870 ;
+  assign \$874  = automata_table[7:4] >> active_state[106:105];
+  assign \$876  = automata_table[3:0] >> active_state[106:105];
+  assign \$878  = active_state[107] ? \$874  : \$876 ;
+  assign \$87  = ~ cont1_key[6];
+  assign \$880  = automata_table[7:4] >> active_state[107:106];
+  assign \$882  = automata_table[3:0] >> active_state[107:106];
+  assign \$884  = active_state[108] ? \$880  : \$882 ;
+  assign \$886  = automata_table[7:4] >> active_state[108:107];
+  assign \$888  = automata_table[3:0] >> active_state[108:107];
+  assign \$890  = active_state[109] ? \$886  : \$888 ;
+  assign \$892  = automata_table[7:4] >> active_state[109:108];
+  assign \$894  = automata_table[3:0] >> active_state[109:108];
+  assign \$896  = active_state[110] ? \$892  : \$894 ;
+  assign \$898  = automata_table[7:4] >> active_state[110:109];
+  assign \$89  = cont1_key_last[6] & \$87 ;
+  assign \$900  = automata_table[3:0] >> active_state[110:109];
+  assign \$902  = active_state[111] ? \$898  : \$900 ;
+  assign \$904  = automata_table[7:4] >> active_state[111:110];
+  assign \$906  = automata_table[3:0] >> active_state[111:110];
+  assign \$908  = active_state[112] ? \$904  : \$906 ;
+  assign \$910  = automata_table[7:4] >> active_state[112:111];
+  assign \$912  = automata_table[3:0] >> active_state[112:111];
+  assign \$914  = active_state[113] ? \$910  : \$912 ;
+  assign \$916  = automata_table[7:4] >> active_state[113:112];
+  assign \$918  = automata_table[3:0] >> active_state[113:112];
+  assign \$91  = ~ cont1_key_last[5];
+  assign \$920  = active_state[114] ? \$916  : \$918 ;
+  assign \$922  = automata_table[7:4] >> active_state[114:113];
+  assign \$924  = automata_table[3:0] >> active_state[114:113];
+  assign \$926  = active_state[115] ? \$922  : \$924 ;
+  assign \$928  = automata_table[7:4] >> active_state[115:114];
+  assign \$930  = automata_table[3:0] >> active_state[115:114];
+  assign \$932  = active_state[116] ? \$928  : \$930 ;
+  assign \$934  = automata_table[7:4] >> active_state[116:115];
+  assign \$936  = automata_table[3:0] >> active_state[116:115];
+  assign \$938  = active_state[117] ? \$934  : \$936 ;
+  assign \$93  = cont1_key[5] & \$91 ;
+  assign \$940  = automata_table[7:4] >> active_state[117:116];
+  assign \$942  = automata_table[3:0] >> active_state[117:116];
+  assign \$944  = active_state[118] ? \$940  : \$942 ;
+  assign \$946  = automata_table[7:4] >> active_state[118:117];
+  assign \$948  = automata_table[3:0] >> active_state[118:117];
+  assign \$950  = active_state[119] ? \$946  : \$948 ;
+  assign \$952  = automata_table[7:4] >> active_state[119:118];
+  assign \$954  = automata_table[3:0] >> active_state[119:118];
+  assign \$956  = active_state[120] ? \$952  : \$954 ;
+  assign \$958  = automata_table[7:4] >> active_state[120:119];
+  assign \$95  = ~ cont1_key[5];
+  assign \$960  = automata_table[3:0] >> active_state[120:119];
+  assign \$962  = active_state[121] ? \$958  : \$960 ;
+  assign \$964  = automata_table[7:4] >> active_state[121:120];
+  assign \$966  = automata_table[3:0] >> active_state[121:120];
+  assign \$968  = active_state[122] ? \$964  : \$966 ;
+  assign \$970  = automata_table[7:4] >> active_state[122:121];
+  assign \$972  = automata_table[3:0] >> active_state[122:121];
+  assign \$974  = active_state[123] ? \$970  : \$972 ;
+  assign \$976  = automata_table[7:4] >> active_state[123:122];
+  assign \$978  = automata_table[3:0] >> active_state[123:122];
+  assign \$97  = cont1_key_last[5] & \$95 ;
+  assign \$980  = active_state[124] ? \$976  : \$978 ;
+  assign \$982  = automata_table[7:4] >> active_state[124:123];
+  assign \$984  = automata_table[3:0] >> active_state[124:123];
+  assign \$986  = active_state[125] ? \$982  : \$984 ;
+  assign \$988  = automata_table[7:4] >> active_state[125:124];
+  assign \$990  = automata_table[3:0] >> active_state[125:124];
+  assign \$992  = active_state[126] ? \$988  : \$990 ;
+  assign \$994  = automata_table[7:4] >> active_state[126:125];
+  assign \$996  = automata_table[3:0] >> active_state[126:125];
+  assign \$998  = active_state[127] ? \$994  : \$996 ;
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \cont1_key_last$next  = cont1_key;
-    casez (\rst$2 )
-      1'h1:
-          \cont1_key_last$next  = 32'd0;
-    endcase
+    if (\rst$2 ) begin
+      \cont1_key_last$next  = 32'd0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \need_frozen_exception$next  = need_frozen_exception;
-    casez (\$35 )
-      1'h1:
-          casez (select)
-            1'h1:
-                (* full_case = 32'd1 *)
-                casez (pause_key_wants_frozen)
-                  1'h1:
-                      \need_frozen_exception$next  = 1'h1;
-                  default:
-                      \need_frozen_exception$next  = 1'h1;
-                endcase
-          endcase
-    endcase
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (need_frozen_exception)
-                  1'h1:
-                      \need_frozen_exception$next  = 1'h0;
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
+    if (\$35 ) begin
+      if (select) begin
+        (* full_case = 32'd1 *)
+        if (pause_key_wants_frozen) begin
+          \need_frozen_exception$next  = 1'h1;
+        end else begin
+          \need_frozen_exception$next  = 1'h1;
+        end
+      end
+    end
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (need_frozen_exception) begin
           \need_frozen_exception$next  = 1'h0;
-    endcase
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \need_frozen_exception$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \opening_countdown_timer_late_reset$next  = opening_countdown_timer_late_reset;
-    casez (\$39 )
-      1'h1:
-          casez (select)
-            1'h1:
-                (* full_case = 32'd1 *)
-                casez (pause_key_wants_frozen)
-                  1'h1:
-                      /* empty */;
-                  default:
-                      \opening_countdown_timer_late_reset$next  = 1'h1;
-                endcase
-          endcase
-    endcase
-    casez (opening_countdown_timer_late_reset)
-      1'h1:
-          \opening_countdown_timer_late_reset$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \opening_countdown_timer_late_reset$next  = 1'h0;
-    endcase
+    if (\$39 ) begin
+      if (select) begin
+        (* full_case = 32'd1 *)
+        if (pause_key_wants_frozen) begin
+        end else begin
+          \opening_countdown_timer_late_reset$next  = 1'h1;
+        end
+      end
+    end
+    if (opening_countdown_timer_late_reset) begin
+      \opening_countdown_timer_late_reset$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \opening_countdown_timer_late_reset$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \pause_key_wants_frozen$next  = pause_key_wants_frozen;
-    casez (\$43 )
-      1'h1:
-          (* full_case = 32'd1 *)
-          casez (select)
-            1'h1:
-                /* empty */;
-            default:
-                \pause_key_wants_frozen$next  = \$45 ;
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \pause_key_wants_frozen$next  = 1'h0;
-    endcase
+    if (\$43 ) begin
+      (* full_case = 32'd1 *)
+      if (select) begin
+      end else begin
+        \pause_key_wants_frozen$next  = \$45 ;
+      end
+    end
+    if (\rst$2 ) begin
+      \pause_key_wants_frozen$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \speed_counter_mask$next  = speed_counter_mask;
-    casez ({ r_press, l_press, \$55  })
-      3'b??1:
-          /* empty */;
-      3'b?1?:
-        begin
-          \speed_counter_mask$next [7:1] = speed_counter_mask[6:0];
-          \speed_counter_mask$next [0] = 1'h1;
-        end
-      3'b1??:
-          \speed_counter_mask$next  = \$57 ;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \speed_counter_mask$next  = 8'h01;
-    endcase
+    if (\$55 ) begin
+    end else if (l_press) begin
+      \speed_counter_mask$next [7:1] = speed_counter_mask[6:0];
+      \speed_counter_mask$next [0] = 1'h1;
+    end else if (r_press) begin
+      \speed_counter_mask$next  = \$57 ;
+    end
+    if (\rst$2 ) begin
+      \speed_counter_mask$next  = 8'h01;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$next  = \$signal ;
-    casez ({ \$65 , \$61  })
-      2'b?1:
-          casez (select)
-            1'h1:
-                \$signal$next  = 1'h1;
-          endcase
-    endcase
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (\$signal )
-                  1'h1:
-                      \$signal$next  = 1'h0;
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_single_0$next  = scribble_single_0;
+    if (\$61 ) begin
+      if (select) begin
+        \scribble_single_0$next  = 1'h1;
+      end
+    end
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (scribble_single_0) begin
+          \scribble_single_0$next  = 1'h0;
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \scribble_single_0$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$67$next  = \$signal$67 ;
-    casez ({ \$74 , \$70  })
-      2'b?1:
-          (* full_case = 32'd1 *)
-          casez (select)
-            1'h1:
-                /* empty */;
-            default:
-                \$signal$67$next  = 1'h1;
-          endcase
-      2'b1?:
-          \$signal$67$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$67$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_hold_0$next  = scribble_hold_0;
+    if (\$69 ) begin
+      (* full_case = 32'd1 *)
+      if (select) begin
+      end else begin
+        \scribble_hold_0$next  = 1'h1;
+      end
+    end else if (\$73 ) begin
+      \scribble_hold_0$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \scribble_hold_0$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$76$next  = \$signal$76 ;
-    casez ({ \$83 , \$79  })
-      2'b?1:
-          casez (select)
-            1'h1:
-                \$signal$76$next  = 1'h1;
-          endcase
-    endcase
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (\$signal$76 )
-                  1'h1:
-                      \$signal$76$next  = 1'h0;
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$76$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_single_1$next  = scribble_single_1;
+    if (\$77 ) begin
+      if (select) begin
+        \scribble_single_1$next  = 1'h1;
+      end
+    end
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (scribble_single_1) begin
+          \scribble_single_1$next  = 1'h0;
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \scribble_single_1$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$85$next  = \$signal$85 ;
-    casez ({ \$92 , \$88  })
-      2'b?1:
-          (* full_case = 32'd1 *)
-          casez (select)
-            1'h1:
-                /* empty */;
-            default:
-                \$signal$85$next  = 1'h1;
-          endcase
-      2'b1?:
-          \$signal$85$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$85$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_hold_1$next  = scribble_hold_1;
+    if (\$85 ) begin
+      (* full_case = 32'd1 *)
+      if (select) begin
+      end else begin
+        \scribble_hold_1$next  = 1'h1;
+      end
+    end else if (\$89 ) begin
+      \scribble_hold_1$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \scribble_hold_1$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$94$next  = \$signal$94 ;
-    casez ({ \$101 , \$97  })
-      2'b?1:
-          casez (select)
-            1'h1:
-                \$signal$94$next  = 1'h1;
-          endcase
-    endcase
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (\$signal$94 )
-                  1'h1:
-                      \$signal$94$next  = 1'h0;
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$94$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_single_2$next  = scribble_single_2;
+    if (\$93 ) begin
+      if (select) begin
+        \scribble_single_2$next  = 1'h1;
+      end
+    end
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (scribble_single_2) begin
+          \scribble_single_2$next  = 1'h0;
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \scribble_single_2$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$103$next  = \$signal$103 ;
-    casez ({ \$110 , \$106  })
-      2'b?1:
-          (* full_case = 32'd1 *)
-          casez (select)
-            1'h1:
-                /* empty */;
-            default:
-                \$signal$103$next  = 1'h1;
-          endcase
-      2'b1?:
-          \$signal$103$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$103$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_hold_2$next  = scribble_hold_2;
+    if (\$101 ) begin
+      (* full_case = 32'd1 *)
+      if (select) begin
+      end else begin
+        \scribble_hold_2$next  = 1'h1;
+      end
+    end else if (\$105 ) begin
+      \scribble_hold_2$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \scribble_hold_2$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$112$next  = \$signal$112 ;
-    casez ({ \$119 , \$115  })
-      2'b?1:
-          casez (select)
-            1'h1:
-                \$signal$112$next  = 1'h1;
-          endcase
-    endcase
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (\$signal$112 )
-                  1'h1:
-                      \$signal$112$next  = 1'h0;
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$112$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_single_3$next  = scribble_single_3;
+    if (\$109 ) begin
+      if (select) begin
+        \scribble_single_3$next  = 1'h1;
+      end
+    end
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (scribble_single_3) begin
+          \scribble_single_3$next  = 1'h0;
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \scribble_single_3$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \$signal$121$next  = \$signal$121 ;
-    casez ({ \$128 , \$124  })
-      2'b?1:
-          (* full_case = 32'd1 *)
-          casez (select)
-            1'h1:
-                /* empty */;
-            default:
-                \$signal$121$next  = 1'h1;
-          endcase
-      2'b1?:
-          \$signal$121$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \$signal$121$next  = 1'h0;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_hold_3$next  = scribble_hold_3;
+    if (\$117 ) begin
+      (* full_case = 32'd1 *)
+      if (select) begin
+      end else begin
+        \scribble_hold_3$next  = 1'h1;
+      end
+    end else if (\$121 ) begin
+      \scribble_hold_3$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \scribble_hold_3$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \automata_next$next  = automata_next;
-    casez ({ \press$161 , \press$150 , \press$139 , press, 1'h0 })
+    casez ({ \press$154 , \press$143 , \press$132 , press, 1'h0 })
       5'b???1?:
-          \automata_next$next  = 2'h0;
+          \automata_next$next  = 8'h1e;
       5'b??1??:
-          \automata_next$next  = 2'h1;
+          \automata_next$next  = 8'h6e;
       5'b?1???:
-          \automata_next$next  = 2'h2;
+          \automata_next$next  = 8'h6a;
       5'h1?:
-          \automata_next$next  = 2'h3;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \automata_next$next  = 2'h0;
-    endcase
+          \automata_next$next  = 8'h0e;
+    endcase
+    if (\$166 ) begin
+      \automata_next$next  = bridge_wr_data[7:0];
+    end
+    if (\rst$2 ) begin
+      \automata_next$next  = 8'h1e;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \pll_clk_0_was$next  = pll_clk_0;
-    casez (\rst$2 )
-      1'h1:
-          \pll_clk_0_was$next  = 1'h0;
-    endcase
+    if (\rst$2 ) begin
+      \pll_clk_0_was$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \need_automata_next$next  = need_automata_next;
-    casez ({ \press$161 , \press$150 , \press$139 , press, 1'h0 })
+    casez ({ \press$154 , \press$143 , \press$132 , press, 1'h0 })
       5'b???1?:
           \need_automata_next$next  = 1'h1;
       5'b??1??:
@@ -883,3601 +1883,519 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
       5'h1?:
           \need_automata_next$next  = 1'h1;
     endcase
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (need_automata_next)
-                  1'h1:
-                      \need_automata_next$next  = 1'h0;
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
+    if (\$170 ) begin
+      \need_automata_next$next  = 1'h1;
+    end
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (need_automata_next) begin
           \need_automata_next$next  = 1'h0;
-    endcase
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \need_automata_next$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \line_generations_next$next  = line_generations_next;
+    if (\$174 ) begin
+      (* full_case = 32'd1 *)
+      if (\$176 ) begin
+        \line_generations_next$next  = 3'h1;
+      end else if (\$178 ) begin
+        \line_generations_next$next  = 3'h4;
+      end else begin
+        \line_generations_next$next  = bridge_wr_data[2:0];
+      end
+    end
+    if (\rst$2 ) begin
+      \line_generations_next$next  = 3'h1;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \bridge_rd_data$next  = bridge_rd_data;
+    if (\$180 ) begin
+      \bridge_rd_data$next  = \$184 ;
+    end else if (\$182 ) begin
+      \bridge_rd_data$next  = \$186 ;
+    end
+    if (\rst$2 ) begin
+      \bridge_rd_data$next  = 32'd0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     (* full_case = 32'd1 *)
-    casez (active_state[0])
-      1'h1:
-          flash_color = 24'h000000;
-      default:
-          flash_color = 24'hffffff;
-    endcase
+    if (display_cell) begin
+      flash_color = 24'h000000;
+    end else begin
+      flash_color = 24'hffffff;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \need_topline_backcopy$next  = 1'h0;
-    casez (video_update_stb)
-      1'h1:
-          casez (\$179 )
-            1'h1:
-                casez (\$185 )
-                  1'h1:
-                      \need_topline_backcopy$next  = 1'h1;
-                endcase
-          endcase
-    endcase
-    casez (need_topline_backcopy)
-      1'h1:
-          \need_topline_backcopy$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \need_topline_backcopy$next  = 1'h0;
-    endcase
+    if (\$190 ) begin
+      if (\$194 ) begin
+        \need_topline_backcopy$next  = 1'h1;
+      end
+    end
+    if (video_update_stb) begin
+      if (\$202 ) begin
+        if (\$208 ) begin
+          \need_topline_backcopy$next  = \$210 ;
+        end
+      end
+    end
+    if (need_topline_backcopy) begin
+      \need_topline_backcopy$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \need_topline_backcopy$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    line_step = 1'h0;
+    if (\$212 ) begin
+      line_step = 1'h1;
+    end
+    if (video_update_stb) begin
+      if (\$220 ) begin
+        line_step = 1'h1;
+      end
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \line_steps_left$next  = line_steps_left;
+    if (\$222 ) begin
+      \line_steps_left$next  = \$225 [1:0];
+    end
+    if (video_update_stb) begin
+      if (\$233 ) begin
+        \line_steps_left$next  = \$236 [1:0];
+      end
+    end
+    if (\rst$2 ) begin
+      \line_steps_left$next  = 2'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \video_rgb$next  = video_rgb;
-    casez (video_update_stb)
-      1'h1:
-        begin
-          \video_rgb$next  = 24'h000000;
-          casez (video_active)
-            1'h1:
-                \video_rgb$next  = flash_color;
-          endcase
-        end
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \video_rgb$next  = 24'h000000;
-    endcase
+    if (video_update_stb) begin
+      \video_rgb$next  = 24'h000000;
+      if (video_active) begin
+        \video_rgb$next  = flash_color;
+      end
+    end
+    if (\rst$2 ) begin
+      \video_rgb$next  = 24'h000000;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \active_state$next  = active_state;
-    casez (video_update_stb)
-      1'h1:
-        begin
-          casez (video_active)
-            1'h1:
-                \active_state$next  = { active_state[0], active_state[159:1] };
-          endcase
-          casez (\$193 )
-            1'h1:
-              begin
-                (* full_case = 32'd1 *)
-                casez ({ active_state[1:0], active_state[159] })
-                  3'h0:
-                      \active_state$next [0] = automata_table[0];
-                  3'h1:
-                      \active_state$next [0] = automata_table[1];
-                  3'h2:
-                      \active_state$next [0] = automata_table[2];
-                  3'h3:
-                      \active_state$next [0] = automata_table[3];
-                  3'h4:
-                      \active_state$next [0] = automata_table[4];
-                  3'h5:
-                      \active_state$next [0] = automata_table[5];
-                  3'h6:
-                      \active_state$next [0] = automata_table[6];
-                  3'h7:
-                      \active_state$next [0] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[2:0])
-                  3'h0:
-                      \active_state$next [1] = automata_table[0];
-                  3'h1:
-                      \active_state$next [1] = automata_table[1];
-                  3'h2:
-                      \active_state$next [1] = automata_table[2];
-                  3'h3:
-                      \active_state$next [1] = automata_table[3];
-                  3'h4:
-                      \active_state$next [1] = automata_table[4];
-                  3'h5:
-                      \active_state$next [1] = automata_table[5];
-                  3'h6:
-                      \active_state$next [1] = automata_table[6];
-                  3'h7:
-                      \active_state$next [1] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[3:1])
-                  3'h0:
-                      \active_state$next [2] = automata_table[0];
-                  3'h1:
-                      \active_state$next [2] = automata_table[1];
-                  3'h2:
-                      \active_state$next [2] = automata_table[2];
-                  3'h3:
-                      \active_state$next [2] = automata_table[3];
-                  3'h4:
-                      \active_state$next [2] = automata_table[4];
-                  3'h5:
-                      \active_state$next [2] = automata_table[5];
-                  3'h6:
-                      \active_state$next [2] = automata_table[6];
-                  3'h7:
-                      \active_state$next [2] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[4:2])
-                  3'h0:
-                      \active_state$next [3] = automata_table[0];
-                  3'h1:
-                      \active_state$next [3] = automata_table[1];
-                  3'h2:
-                      \active_state$next [3] = automata_table[2];
-                  3'h3:
-                      \active_state$next [3] = automata_table[3];
-                  3'h4:
-                      \active_state$next [3] = automata_table[4];
-                  3'h5:
-                      \active_state$next [3] = automata_table[5];
-                  3'h6:
-                      \active_state$next [3] = automata_table[6];
-                  3'h7:
-                      \active_state$next [3] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[5:3])
-                  3'h0:
-                      \active_state$next [4] = automata_table[0];
-                  3'h1:
-                      \active_state$next [4] = automata_table[1];
-                  3'h2:
-                      \active_state$next [4] = automata_table[2];
-                  3'h3:
-                      \active_state$next [4] = automata_table[3];
-                  3'h4:
-                      \active_state$next [4] = automata_table[4];
-                  3'h5:
-                      \active_state$next [4] = automata_table[5];
-                  3'h6:
-                      \active_state$next [4] = automata_table[6];
-                  3'h7:
-                      \active_state$next [4] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[6:4])
-                  3'h0:
-                      \active_state$next [5] = automata_table[0];
-                  3'h1:
-                      \active_state$next [5] = automata_table[1];
-                  3'h2:
-                      \active_state$next [5] = automata_table[2];
-                  3'h3:
-                      \active_state$next [5] = automata_table[3];
-                  3'h4:
-                      \active_state$next [5] = automata_table[4];
-                  3'h5:
-                      \active_state$next [5] = automata_table[5];
-                  3'h6:
-                      \active_state$next [5] = automata_table[6];
-                  3'h7:
-                      \active_state$next [5] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[7:5])
-                  3'h0:
-                      \active_state$next [6] = automata_table[0];
-                  3'h1:
-                      \active_state$next [6] = automata_table[1];
-                  3'h2:
-                      \active_state$next [6] = automata_table[2];
-                  3'h3:
-                      \active_state$next [6] = automata_table[3];
-                  3'h4:
-                      \active_state$next [6] = automata_table[4];
-                  3'h5:
-                      \active_state$next [6] = automata_table[5];
-                  3'h6:
-                      \active_state$next [6] = automata_table[6];
-                  3'h7:
-                      \active_state$next [6] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[8:6])
-                  3'h0:
-                      \active_state$next [7] = automata_table[0];
-                  3'h1:
-                      \active_state$next [7] = automata_table[1];
-                  3'h2:
-                      \active_state$next [7] = automata_table[2];
-                  3'h3:
-                      \active_state$next [7] = automata_table[3];
-                  3'h4:
-                      \active_state$next [7] = automata_table[4];
-                  3'h5:
-                      \active_state$next [7] = automata_table[5];
-                  3'h6:
-                      \active_state$next [7] = automata_table[6];
-                  3'h7:
-                      \active_state$next [7] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[9:7])
-                  3'h0:
-                      \active_state$next [8] = automata_table[0];
-                  3'h1:
-                      \active_state$next [8] = automata_table[1];
-                  3'h2:
-                      \active_state$next [8] = automata_table[2];
-                  3'h3:
-                      \active_state$next [8] = automata_table[3];
-                  3'h4:
-                      \active_state$next [8] = automata_table[4];
-                  3'h5:
-                      \active_state$next [8] = automata_table[5];
-                  3'h6:
-                      \active_state$next [8] = automata_table[6];
-                  3'h7:
-                      \active_state$next [8] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[10:8])
-                  3'h0:
-                      \active_state$next [9] = automata_table[0];
-                  3'h1:
-                      \active_state$next [9] = automata_table[1];
-                  3'h2:
-                      \active_state$next [9] = automata_table[2];
-                  3'h3:
-                      \active_state$next [9] = automata_table[3];
-                  3'h4:
-                      \active_state$next [9] = automata_table[4];
-                  3'h5:
-                      \active_state$next [9] = automata_table[5];
-                  3'h6:
-                      \active_state$next [9] = automata_table[6];
-                  3'h7:
-                      \active_state$next [9] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[11:9])
-                  3'h0:
-                      \active_state$next [10] = automata_table[0];
-                  3'h1:
-                      \active_state$next [10] = automata_table[1];
-                  3'h2:
-                      \active_state$next [10] = automata_table[2];
-                  3'h3:
-                      \active_state$next [10] = automata_table[3];
-                  3'h4:
-                      \active_state$next [10] = automata_table[4];
-                  3'h5:
-                      \active_state$next [10] = automata_table[5];
-                  3'h6:
-                      \active_state$next [10] = automata_table[6];
-                  3'h7:
-                      \active_state$next [10] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[12:10])
-                  3'h0:
-                      \active_state$next [11] = automata_table[0];
-                  3'h1:
-                      \active_state$next [11] = automata_table[1];
-                  3'h2:
-                      \active_state$next [11] = automata_table[2];
-                  3'h3:
-                      \active_state$next [11] = automata_table[3];
-                  3'h4:
-                      \active_state$next [11] = automata_table[4];
-                  3'h5:
-                      \active_state$next [11] = automata_table[5];
-                  3'h6:
-                      \active_state$next [11] = automata_table[6];
-                  3'h7:
-                      \active_state$next [11] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[13:11])
-                  3'h0:
-                      \active_state$next [12] = automata_table[0];
-                  3'h1:
-                      \active_state$next [12] = automata_table[1];
-                  3'h2:
-                      \active_state$next [12] = automata_table[2];
-                  3'h3:
-                      \active_state$next [12] = automata_table[3];
-                  3'h4:
-                      \active_state$next [12] = automata_table[4];
-                  3'h5:
-                      \active_state$next [12] = automata_table[5];
-                  3'h6:
-                      \active_state$next [12] = automata_table[6];
-                  3'h7:
-                      \active_state$next [12] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[14:12])
-                  3'h0:
-                      \active_state$next [13] = automata_table[0];
-                  3'h1:
-                      \active_state$next [13] = automata_table[1];
-                  3'h2:
-                      \active_state$next [13] = automata_table[2];
-                  3'h3:
-                      \active_state$next [13] = automata_table[3];
-                  3'h4:
-                      \active_state$next [13] = automata_table[4];
-                  3'h5:
-                      \active_state$next [13] = automata_table[5];
-                  3'h6:
-                      \active_state$next [13] = automata_table[6];
-                  3'h7:
-                      \active_state$next [13] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[15:13])
-                  3'h0:
-                      \active_state$next [14] = automata_table[0];
-                  3'h1:
-                      \active_state$next [14] = automata_table[1];
-                  3'h2:
-                      \active_state$next [14] = automata_table[2];
-                  3'h3:
-                      \active_state$next [14] = automata_table[3];
-                  3'h4:
-                      \active_state$next [14] = automata_table[4];
-                  3'h5:
-                      \active_state$next [14] = automata_table[5];
-                  3'h6:
-                      \active_state$next [14] = automata_table[6];
-                  3'h7:
-                      \active_state$next [14] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[16:14])
-                  3'h0:
-                      \active_state$next [15] = automata_table[0];
-                  3'h1:
-                      \active_state$next [15] = automata_table[1];
-                  3'h2:
-                      \active_state$next [15] = automata_table[2];
-                  3'h3:
-                      \active_state$next [15] = automata_table[3];
-                  3'h4:
-                      \active_state$next [15] = automata_table[4];
-                  3'h5:
-                      \active_state$next [15] = automata_table[5];
-                  3'h6:
-                      \active_state$next [15] = automata_table[6];
-                  3'h7:
-                      \active_state$next [15] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[17:15])
-                  3'h0:
-                      \active_state$next [16] = automata_table[0];
-                  3'h1:
-                      \active_state$next [16] = automata_table[1];
-                  3'h2:
-                      \active_state$next [16] = automata_table[2];
-                  3'h3:
-                      \active_state$next [16] = automata_table[3];
-                  3'h4:
-                      \active_state$next [16] = automata_table[4];
-                  3'h5:
-                      \active_state$next [16] = automata_table[5];
-                  3'h6:
-                      \active_state$next [16] = automata_table[6];
-                  3'h7:
-                      \active_state$next [16] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[18:16])
-                  3'h0:
-                      \active_state$next [17] = automata_table[0];
-                  3'h1:
-                      \active_state$next [17] = automata_table[1];
-                  3'h2:
-                      \active_state$next [17] = automata_table[2];
-                  3'h3:
-                      \active_state$next [17] = automata_table[3];
-                  3'h4:
-                      \active_state$next [17] = automata_table[4];
-                  3'h5:
-                      \active_state$next [17] = automata_table[5];
-                  3'h6:
-                      \active_state$next [17] = automata_table[6];
-                  3'h7:
-                      \active_state$next [17] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[19:17])
-                  3'h0:
-                      \active_state$next [18] = automata_table[0];
-                  3'h1:
-                      \active_state$next [18] = automata_table[1];
-                  3'h2:
-                      \active_state$next [18] = automata_table[2];
-                  3'h3:
-                      \active_state$next [18] = automata_table[3];
-                  3'h4:
-                      \active_state$next [18] = automata_table[4];
-                  3'h5:
-                      \active_state$next [18] = automata_table[5];
-                  3'h6:
-                      \active_state$next [18] = automata_table[6];
-                  3'h7:
-                      \active_state$next [18] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[20:18])
-                  3'h0:
-                      \active_state$next [19] = automata_table[0];
-                  3'h1:
-                      \active_state$next [19] = automata_table[1];
-                  3'h2:
-                      \active_state$next [19] = automata_table[2];
-                  3'h3:
-                      \active_state$next [19] = automata_table[3];
-                  3'h4:
-                      \active_state$next [19] = automata_table[4];
-                  3'h5:
-                      \active_state$next [19] = automata_table[5];
-                  3'h6:
-                      \active_state$next [19] = automata_table[6];
-                  3'h7:
-                      \active_state$next [19] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[21:19])
-                  3'h0:
-                      \active_state$next [20] = automata_table[0];
-                  3'h1:
-                      \active_state$next [20] = automata_table[1];
-                  3'h2:
-                      \active_state$next [20] = automata_table[2];
-                  3'h3:
-                      \active_state$next [20] = automata_table[3];
-                  3'h4:
-                      \active_state$next [20] = automata_table[4];
-                  3'h5:
-                      \active_state$next [20] = automata_table[5];
-                  3'h6:
-                      \active_state$next [20] = automata_table[6];
-                  3'h7:
-                      \active_state$next [20] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[22:20])
-                  3'h0:
-                      \active_state$next [21] = automata_table[0];
-                  3'h1:
-                      \active_state$next [21] = automata_table[1];
-                  3'h2:
-                      \active_state$next [21] = automata_table[2];
-                  3'h3:
-                      \active_state$next [21] = automata_table[3];
-                  3'h4:
-                      \active_state$next [21] = automata_table[4];
-                  3'h5:
-                      \active_state$next [21] = automata_table[5];
-                  3'h6:
-                      \active_state$next [21] = automata_table[6];
-                  3'h7:
-                      \active_state$next [21] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[23:21])
-                  3'h0:
-                      \active_state$next [22] = automata_table[0];
-                  3'h1:
-                      \active_state$next [22] = automata_table[1];
-                  3'h2:
-                      \active_state$next [22] = automata_table[2];
-                  3'h3:
-                      \active_state$next [22] = automata_table[3];
-                  3'h4:
-                      \active_state$next [22] = automata_table[4];
-                  3'h5:
-                      \active_state$next [22] = automata_table[5];
-                  3'h6:
-                      \active_state$next [22] = automata_table[6];
-                  3'h7:
-                      \active_state$next [22] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[24:22])
-                  3'h0:
-                      \active_state$next [23] = automata_table[0];
-                  3'h1:
-                      \active_state$next [23] = automata_table[1];
-                  3'h2:
-                      \active_state$next [23] = automata_table[2];
-                  3'h3:
-                      \active_state$next [23] = automata_table[3];
-                  3'h4:
-                      \active_state$next [23] = automata_table[4];
-                  3'h5:
-                      \active_state$next [23] = automata_table[5];
-                  3'h6:
-                      \active_state$next [23] = automata_table[6];
-                  3'h7:
-                      \active_state$next [23] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[25:23])
-                  3'h0:
-                      \active_state$next [24] = automata_table[0];
-                  3'h1:
-                      \active_state$next [24] = automata_table[1];
-                  3'h2:
-                      \active_state$next [24] = automata_table[2];
-                  3'h3:
-                      \active_state$next [24] = automata_table[3];
-                  3'h4:
-                      \active_state$next [24] = automata_table[4];
-                  3'h5:
-                      \active_state$next [24] = automata_table[5];
-                  3'h6:
-                      \active_state$next [24] = automata_table[6];
-                  3'h7:
-                      \active_state$next [24] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[26:24])
-                  3'h0:
-                      \active_state$next [25] = automata_table[0];
-                  3'h1:
-                      \active_state$next [25] = automata_table[1];
-                  3'h2:
-                      \active_state$next [25] = automata_table[2];
-                  3'h3:
-                      \active_state$next [25] = automata_table[3];
-                  3'h4:
-                      \active_state$next [25] = automata_table[4];
-                  3'h5:
-                      \active_state$next [25] = automata_table[5];
-                  3'h6:
-                      \active_state$next [25] = automata_table[6];
-                  3'h7:
-                      \active_state$next [25] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[27:25])
-                  3'h0:
-                      \active_state$next [26] = automata_table[0];
-                  3'h1:
-                      \active_state$next [26] = automata_table[1];
-                  3'h2:
-                      \active_state$next [26] = automata_table[2];
-                  3'h3:
-                      \active_state$next [26] = automata_table[3];
-                  3'h4:
-                      \active_state$next [26] = automata_table[4];
-                  3'h5:
-                      \active_state$next [26] = automata_table[5];
-                  3'h6:
-                      \active_state$next [26] = automata_table[6];
-                  3'h7:
-                      \active_state$next [26] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[28:26])
-                  3'h0:
-                      \active_state$next [27] = automata_table[0];
-                  3'h1:
-                      \active_state$next [27] = automata_table[1];
-                  3'h2:
-                      \active_state$next [27] = automata_table[2];
-                  3'h3:
-                      \active_state$next [27] = automata_table[3];
-                  3'h4:
-                      \active_state$next [27] = automata_table[4];
-                  3'h5:
-                      \active_state$next [27] = automata_table[5];
-                  3'h6:
-                      \active_state$next [27] = automata_table[6];
-                  3'h7:
-                      \active_state$next [27] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[29:27])
-                  3'h0:
-                      \active_state$next [28] = automata_table[0];
-                  3'h1:
-                      \active_state$next [28] = automata_table[1];
-                  3'h2:
-                      \active_state$next [28] = automata_table[2];
-                  3'h3:
-                      \active_state$next [28] = automata_table[3];
-                  3'h4:
-                      \active_state$next [28] = automata_table[4];
-                  3'h5:
-                      \active_state$next [28] = automata_table[5];
-                  3'h6:
-                      \active_state$next [28] = automata_table[6];
-                  3'h7:
-                      \active_state$next [28] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[30:28])
-                  3'h0:
-                      \active_state$next [29] = automata_table[0];
-                  3'h1:
-                      \active_state$next [29] = automata_table[1];
-                  3'h2:
-                      \active_state$next [29] = automata_table[2];
-                  3'h3:
-                      \active_state$next [29] = automata_table[3];
-                  3'h4:
-                      \active_state$next [29] = automata_table[4];
-                  3'h5:
-                      \active_state$next [29] = automata_table[5];
-                  3'h6:
-                      \active_state$next [29] = automata_table[6];
-                  3'h7:
-                      \active_state$next [29] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[31:29])
-                  3'h0:
-                      \active_state$next [30] = automata_table[0];
-                  3'h1:
-                      \active_state$next [30] = automata_table[1];
-                  3'h2:
-                      \active_state$next [30] = automata_table[2];
-                  3'h3:
-                      \active_state$next [30] = automata_table[3];
-                  3'h4:
-                      \active_state$next [30] = automata_table[4];
-                  3'h5:
-                      \active_state$next [30] = automata_table[5];
-                  3'h6:
-                      \active_state$next [30] = automata_table[6];
-                  3'h7:
-                      \active_state$next [30] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[32:30])
-                  3'h0:
-                      \active_state$next [31] = automata_table[0];
-                  3'h1:
-                      \active_state$next [31] = automata_table[1];
-                  3'h2:
-                      \active_state$next [31] = automata_table[2];
-                  3'h3:
-                      \active_state$next [31] = automata_table[3];
-                  3'h4:
-                      \active_state$next [31] = automata_table[4];
-                  3'h5:
-                      \active_state$next [31] = automata_table[5];
-                  3'h6:
-                      \active_state$next [31] = automata_table[6];
-                  3'h7:
-                      \active_state$next [31] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[33:31])
-                  3'h0:
-                      \active_state$next [32] = automata_table[0];
-                  3'h1:
-                      \active_state$next [32] = automata_table[1];
-                  3'h2:
-                      \active_state$next [32] = automata_table[2];
-                  3'h3:
-                      \active_state$next [32] = automata_table[3];
-                  3'h4:
-                      \active_state$next [32] = automata_table[4];
-                  3'h5:
-                      \active_state$next [32] = automata_table[5];
-                  3'h6:
-                      \active_state$next [32] = automata_table[6];
-                  3'h7:
-                      \active_state$next [32] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[34:32])
-                  3'h0:
-                      \active_state$next [33] = automata_table[0];
-                  3'h1:
-                      \active_state$next [33] = automata_table[1];
-                  3'h2:
-                      \active_state$next [33] = automata_table[2];
-                  3'h3:
-                      \active_state$next [33] = automata_table[3];
-                  3'h4:
-                      \active_state$next [33] = automata_table[4];
-                  3'h5:
-                      \active_state$next [33] = automata_table[5];
-                  3'h6:
-                      \active_state$next [33] = automata_table[6];
-                  3'h7:
-                      \active_state$next [33] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[35:33])
-                  3'h0:
-                      \active_state$next [34] = automata_table[0];
-                  3'h1:
-                      \active_state$next [34] = automata_table[1];
-                  3'h2:
-                      \active_state$next [34] = automata_table[2];
-                  3'h3:
-                      \active_state$next [34] = automata_table[3];
-                  3'h4:
-                      \active_state$next [34] = automata_table[4];
-                  3'h5:
-                      \active_state$next [34] = automata_table[5];
-                  3'h6:
-                      \active_state$next [34] = automata_table[6];
-                  3'h7:
-                      \active_state$next [34] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[36:34])
-                  3'h0:
-                      \active_state$next [35] = automata_table[0];
-                  3'h1:
-                      \active_state$next [35] = automata_table[1];
-                  3'h2:
-                      \active_state$next [35] = automata_table[2];
-                  3'h3:
-                      \active_state$next [35] = automata_table[3];
-                  3'h4:
-                      \active_state$next [35] = automata_table[4];
-                  3'h5:
-                      \active_state$next [35] = automata_table[5];
-                  3'h6:
-                      \active_state$next [35] = automata_table[6];
-                  3'h7:
-                      \active_state$next [35] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[37:35])
-                  3'h0:
-                      \active_state$next [36] = automata_table[0];
-                  3'h1:
-                      \active_state$next [36] = automata_table[1];
-                  3'h2:
-                      \active_state$next [36] = automata_table[2];
-                  3'h3:
-                      \active_state$next [36] = automata_table[3];
-                  3'h4:
-                      \active_state$next [36] = automata_table[4];
-                  3'h5:
-                      \active_state$next [36] = automata_table[5];
-                  3'h6:
-                      \active_state$next [36] = automata_table[6];
-                  3'h7:
-                      \active_state$next [36] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[38:36])
-                  3'h0:
-                      \active_state$next [37] = automata_table[0];
-                  3'h1:
-                      \active_state$next [37] = automata_table[1];
-                  3'h2:
-                      \active_state$next [37] = automata_table[2];
-                  3'h3:
-                      \active_state$next [37] = automata_table[3];
-                  3'h4:
-                      \active_state$next [37] = automata_table[4];
-                  3'h5:
-                      \active_state$next [37] = automata_table[5];
-                  3'h6:
-                      \active_state$next [37] = automata_table[6];
-                  3'h7:
-                      \active_state$next [37] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[39:37])
-                  3'h0:
-                      \active_state$next [38] = automata_table[0];
-                  3'h1:
-                      \active_state$next [38] = automata_table[1];
-                  3'h2:
-                      \active_state$next [38] = automata_table[2];
-                  3'h3:
-                      \active_state$next [38] = automata_table[3];
-                  3'h4:
-                      \active_state$next [38] = automata_table[4];
-                  3'h5:
-                      \active_state$next [38] = automata_table[5];
-                  3'h6:
-                      \active_state$next [38] = automata_table[6];
-                  3'h7:
-                      \active_state$next [38] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[40:38])
-                  3'h0:
-                      \active_state$next [39] = automata_table[0];
-                  3'h1:
-                      \active_state$next [39] = automata_table[1];
-                  3'h2:
-                      \active_state$next [39] = automata_table[2];
-                  3'h3:
-                      \active_state$next [39] = automata_table[3];
-                  3'h4:
-                      \active_state$next [39] = automata_table[4];
-                  3'h5:
-                      \active_state$next [39] = automata_table[5];
-                  3'h6:
-                      \active_state$next [39] = automata_table[6];
-                  3'h7:
-                      \active_state$next [39] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[41:39])
-                  3'h0:
-                      \active_state$next [40] = automata_table[0];
-                  3'h1:
-                      \active_state$next [40] = automata_table[1];
-                  3'h2:
-                      \active_state$next [40] = automata_table[2];
-                  3'h3:
-                      \active_state$next [40] = automata_table[3];
-                  3'h4:
-                      \active_state$next [40] = automata_table[4];
-                  3'h5:
-                      \active_state$next [40] = automata_table[5];
-                  3'h6:
-                      \active_state$next [40] = automata_table[6];
-                  3'h7:
-                      \active_state$next [40] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[42:40])
-                  3'h0:
-                      \active_state$next [41] = automata_table[0];
-                  3'h1:
-                      \active_state$next [41] = automata_table[1];
-                  3'h2:
-                      \active_state$next [41] = automata_table[2];
-                  3'h3:
-                      \active_state$next [41] = automata_table[3];
-                  3'h4:
-                      \active_state$next [41] = automata_table[4];
-                  3'h5:
-                      \active_state$next [41] = automata_table[5];
-                  3'h6:
-                      \active_state$next [41] = automata_table[6];
-                  3'h7:
-                      \active_state$next [41] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[43:41])
-                  3'h0:
-                      \active_state$next [42] = automata_table[0];
-                  3'h1:
-                      \active_state$next [42] = automata_table[1];
-                  3'h2:
-                      \active_state$next [42] = automata_table[2];
-                  3'h3:
-                      \active_state$next [42] = automata_table[3];
-                  3'h4:
-                      \active_state$next [42] = automata_table[4];
-                  3'h5:
-                      \active_state$next [42] = automata_table[5];
-                  3'h6:
-                      \active_state$next [42] = automata_table[6];
-                  3'h7:
-                      \active_state$next [42] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[44:42])
-                  3'h0:
-                      \active_state$next [43] = automata_table[0];
-                  3'h1:
-                      \active_state$next [43] = automata_table[1];
-                  3'h2:
-                      \active_state$next [43] = automata_table[2];
-                  3'h3:
-                      \active_state$next [43] = automata_table[3];
-                  3'h4:
-                      \active_state$next [43] = automata_table[4];
-                  3'h5:
-                      \active_state$next [43] = automata_table[5];
-                  3'h6:
-                      \active_state$next [43] = automata_table[6];
-                  3'h7:
-                      \active_state$next [43] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[45:43])
-                  3'h0:
-                      \active_state$next [44] = automata_table[0];
-                  3'h1:
-                      \active_state$next [44] = automata_table[1];
-                  3'h2:
-                      \active_state$next [44] = automata_table[2];
-                  3'h3:
-                      \active_state$next [44] = automata_table[3];
-                  3'h4:
-                      \active_state$next [44] = automata_table[4];
-                  3'h5:
-                      \active_state$next [44] = automata_table[5];
-                  3'h6:
-                      \active_state$next [44] = automata_table[6];
-                  3'h7:
-                      \active_state$next [44] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[46:44])
-                  3'h0:
-                      \active_state$next [45] = automata_table[0];
-                  3'h1:
-                      \active_state$next [45] = automata_table[1];
-                  3'h2:
-                      \active_state$next [45] = automata_table[2];
-                  3'h3:
-                      \active_state$next [45] = automata_table[3];
-                  3'h4:
-                      \active_state$next [45] = automata_table[4];
-                  3'h5:
-                      \active_state$next [45] = automata_table[5];
-                  3'h6:
-                      \active_state$next [45] = automata_table[6];
-                  3'h7:
-                      \active_state$next [45] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[47:45])
-                  3'h0:
-                      \active_state$next [46] = automata_table[0];
-                  3'h1:
-                      \active_state$next [46] = automata_table[1];
-                  3'h2:
-                      \active_state$next [46] = automata_table[2];
-                  3'h3:
-                      \active_state$next [46] = automata_table[3];
-                  3'h4:
-                      \active_state$next [46] = automata_table[4];
-                  3'h5:
-                      \active_state$next [46] = automata_table[5];
-                  3'h6:
-                      \active_state$next [46] = automata_table[6];
-                  3'h7:
-                      \active_state$next [46] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[48:46])
-                  3'h0:
-                      \active_state$next [47] = automata_table[0];
-                  3'h1:
-                      \active_state$next [47] = automata_table[1];
-                  3'h2:
-                      \active_state$next [47] = automata_table[2];
-                  3'h3:
-                      \active_state$next [47] = automata_table[3];
-                  3'h4:
-                      \active_state$next [47] = automata_table[4];
-                  3'h5:
-                      \active_state$next [47] = automata_table[5];
-                  3'h6:
-                      \active_state$next [47] = automata_table[6];
-                  3'h7:
-                      \active_state$next [47] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[49:47])
-                  3'h0:
-                      \active_state$next [48] = automata_table[0];
-                  3'h1:
-                      \active_state$next [48] = automata_table[1];
-                  3'h2:
-                      \active_state$next [48] = automata_table[2];
-                  3'h3:
-                      \active_state$next [48] = automata_table[3];
-                  3'h4:
-                      \active_state$next [48] = automata_table[4];
-                  3'h5:
-                      \active_state$next [48] = automata_table[5];
-                  3'h6:
-                      \active_state$next [48] = automata_table[6];
-                  3'h7:
-                      \active_state$next [48] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[50:48])
-                  3'h0:
-                      \active_state$next [49] = automata_table[0];
-                  3'h1:
-                      \active_state$next [49] = automata_table[1];
-                  3'h2:
-                      \active_state$next [49] = automata_table[2];
-                  3'h3:
-                      \active_state$next [49] = automata_table[3];
-                  3'h4:
-                      \active_state$next [49] = automata_table[4];
-                  3'h5:
-                      \active_state$next [49] = automata_table[5];
-                  3'h6:
-                      \active_state$next [49] = automata_table[6];
-                  3'h7:
-                      \active_state$next [49] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[51:49])
-                  3'h0:
-                      \active_state$next [50] = automata_table[0];
-                  3'h1:
-                      \active_state$next [50] = automata_table[1];
-                  3'h2:
-                      \active_state$next [50] = automata_table[2];
-                  3'h3:
-                      \active_state$next [50] = automata_table[3];
-                  3'h4:
-                      \active_state$next [50] = automata_table[4];
-                  3'h5:
-                      \active_state$next [50] = automata_table[5];
-                  3'h6:
-                      \active_state$next [50] = automata_table[6];
-                  3'h7:
-                      \active_state$next [50] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[52:50])
-                  3'h0:
-                      \active_state$next [51] = automata_table[0];
-                  3'h1:
-                      \active_state$next [51] = automata_table[1];
-                  3'h2:
-                      \active_state$next [51] = automata_table[2];
-                  3'h3:
-                      \active_state$next [51] = automata_table[3];
-                  3'h4:
-                      \active_state$next [51] = automata_table[4];
-                  3'h5:
-                      \active_state$next [51] = automata_table[5];
-                  3'h6:
-                      \active_state$next [51] = automata_table[6];
-                  3'h7:
-                      \active_state$next [51] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[53:51])
-                  3'h0:
-                      \active_state$next [52] = automata_table[0];
-                  3'h1:
-                      \active_state$next [52] = automata_table[1];
-                  3'h2:
-                      \active_state$next [52] = automata_table[2];
-                  3'h3:
-                      \active_state$next [52] = automata_table[3];
-                  3'h4:
-                      \active_state$next [52] = automata_table[4];
-                  3'h5:
-                      \active_state$next [52] = automata_table[5];
-                  3'h6:
-                      \active_state$next [52] = automata_table[6];
-                  3'h7:
-                      \active_state$next [52] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[54:52])
-                  3'h0:
-                      \active_state$next [53] = automata_table[0];
-                  3'h1:
-                      \active_state$next [53] = automata_table[1];
-                  3'h2:
-                      \active_state$next [53] = automata_table[2];
-                  3'h3:
-                      \active_state$next [53] = automata_table[3];
-                  3'h4:
-                      \active_state$next [53] = automata_table[4];
-                  3'h5:
-                      \active_state$next [53] = automata_table[5];
-                  3'h6:
-                      \active_state$next [53] = automata_table[6];
-                  3'h7:
-                      \active_state$next [53] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[55:53])
-                  3'h0:
-                      \active_state$next [54] = automata_table[0];
-                  3'h1:
-                      \active_state$next [54] = automata_table[1];
-                  3'h2:
-                      \active_state$next [54] = automata_table[2];
-                  3'h3:
-                      \active_state$next [54] = automata_table[3];
-                  3'h4:
-                      \active_state$next [54] = automata_table[4];
-                  3'h5:
-                      \active_state$next [54] = automata_table[5];
-                  3'h6:
-                      \active_state$next [54] = automata_table[6];
-                  3'h7:
-                      \active_state$next [54] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[56:54])
-                  3'h0:
-                      \active_state$next [55] = automata_table[0];
-                  3'h1:
-                      \active_state$next [55] = automata_table[1];
-                  3'h2:
-                      \active_state$next [55] = automata_table[2];
-                  3'h3:
-                      \active_state$next [55] = automata_table[3];
-                  3'h4:
-                      \active_state$next [55] = automata_table[4];
-                  3'h5:
-                      \active_state$next [55] = automata_table[5];
-                  3'h6:
-                      \active_state$next [55] = automata_table[6];
-                  3'h7:
-                      \active_state$next [55] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[57:55])
-                  3'h0:
-                      \active_state$next [56] = automata_table[0];
-                  3'h1:
-                      \active_state$next [56] = automata_table[1];
-                  3'h2:
-                      \active_state$next [56] = automata_table[2];
-                  3'h3:
-                      \active_state$next [56] = automata_table[3];
-                  3'h4:
-                      \active_state$next [56] = automata_table[4];
-                  3'h5:
-                      \active_state$next [56] = automata_table[5];
-                  3'h6:
-                      \active_state$next [56] = automata_table[6];
-                  3'h7:
-                      \active_state$next [56] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[58:56])
-                  3'h0:
-                      \active_state$next [57] = automata_table[0];
-                  3'h1:
-                      \active_state$next [57] = automata_table[1];
-                  3'h2:
-                      \active_state$next [57] = automata_table[2];
-                  3'h3:
-                      \active_state$next [57] = automata_table[3];
-                  3'h4:
-                      \active_state$next [57] = automata_table[4];
-                  3'h5:
-                      \active_state$next [57] = automata_table[5];
-                  3'h6:
-                      \active_state$next [57] = automata_table[6];
-                  3'h7:
-                      \active_state$next [57] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[59:57])
-                  3'h0:
-                      \active_state$next [58] = automata_table[0];
-                  3'h1:
-                      \active_state$next [58] = automata_table[1];
-                  3'h2:
-                      \active_state$next [58] = automata_table[2];
-                  3'h3:
-                      \active_state$next [58] = automata_table[3];
-                  3'h4:
-                      \active_state$next [58] = automata_table[4];
-                  3'h5:
-                      \active_state$next [58] = automata_table[5];
-                  3'h6:
-                      \active_state$next [58] = automata_table[6];
-                  3'h7:
-                      \active_state$next [58] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[60:58])
-                  3'h0:
-                      \active_state$next [59] = automata_table[0];
-                  3'h1:
-                      \active_state$next [59] = automata_table[1];
-                  3'h2:
-                      \active_state$next [59] = automata_table[2];
-                  3'h3:
-                      \active_state$next [59] = automata_table[3];
-                  3'h4:
-                      \active_state$next [59] = automata_table[4];
-                  3'h5:
-                      \active_state$next [59] = automata_table[5];
-                  3'h6:
-                      \active_state$next [59] = automata_table[6];
-                  3'h7:
-                      \active_state$next [59] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[61:59])
-                  3'h0:
-                      \active_state$next [60] = automata_table[0];
-                  3'h1:
-                      \active_state$next [60] = automata_table[1];
-                  3'h2:
-                      \active_state$next [60] = automata_table[2];
-                  3'h3:
-                      \active_state$next [60] = automata_table[3];
-                  3'h4:
-                      \active_state$next [60] = automata_table[4];
-                  3'h5:
-                      \active_state$next [60] = automata_table[5];
-                  3'h6:
-                      \active_state$next [60] = automata_table[6];
-                  3'h7:
-                      \active_state$next [60] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[62:60])
-                  3'h0:
-                      \active_state$next [61] = automata_table[0];
-                  3'h1:
-                      \active_state$next [61] = automata_table[1];
-                  3'h2:
-                      \active_state$next [61] = automata_table[2];
-                  3'h3:
-                      \active_state$next [61] = automata_table[3];
-                  3'h4:
-                      \active_state$next [61] = automata_table[4];
-                  3'h5:
-                      \active_state$next [61] = automata_table[5];
-                  3'h6:
-                      \active_state$next [61] = automata_table[6];
-                  3'h7:
-                      \active_state$next [61] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[63:61])
-                  3'h0:
-                      \active_state$next [62] = automata_table[0];
-                  3'h1:
-                      \active_state$next [62] = automata_table[1];
-                  3'h2:
-                      \active_state$next [62] = automata_table[2];
-                  3'h3:
-                      \active_state$next [62] = automata_table[3];
-                  3'h4:
-                      \active_state$next [62] = automata_table[4];
-                  3'h5:
-                      \active_state$next [62] = automata_table[5];
-                  3'h6:
-                      \active_state$next [62] = automata_table[6];
-                  3'h7:
-                      \active_state$next [62] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[64:62])
-                  3'h0:
-                      \active_state$next [63] = automata_table[0];
-                  3'h1:
-                      \active_state$next [63] = automata_table[1];
-                  3'h2:
-                      \active_state$next [63] = automata_table[2];
-                  3'h3:
-                      \active_state$next [63] = automata_table[3];
-                  3'h4:
-                      \active_state$next [63] = automata_table[4];
-                  3'h5:
-                      \active_state$next [63] = automata_table[5];
-                  3'h6:
-                      \active_state$next [63] = automata_table[6];
-                  3'h7:
-                      \active_state$next [63] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[65:63])
-                  3'h0:
-                      \active_state$next [64] = automata_table[0];
-                  3'h1:
-                      \active_state$next [64] = automata_table[1];
-                  3'h2:
-                      \active_state$next [64] = automata_table[2];
-                  3'h3:
-                      \active_state$next [64] = automata_table[3];
-                  3'h4:
-                      \active_state$next [64] = automata_table[4];
-                  3'h5:
-                      \active_state$next [64] = automata_table[5];
-                  3'h6:
-                      \active_state$next [64] = automata_table[6];
-                  3'h7:
-                      \active_state$next [64] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[66:64])
-                  3'h0:
-                      \active_state$next [65] = automata_table[0];
-                  3'h1:
-                      \active_state$next [65] = automata_table[1];
-                  3'h2:
-                      \active_state$next [65] = automata_table[2];
-                  3'h3:
-                      \active_state$next [65] = automata_table[3];
-                  3'h4:
-                      \active_state$next [65] = automata_table[4];
-                  3'h5:
-                      \active_state$next [65] = automata_table[5];
-                  3'h6:
-                      \active_state$next [65] = automata_table[6];
-                  3'h7:
-                      \active_state$next [65] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[67:65])
-                  3'h0:
-                      \active_state$next [66] = automata_table[0];
-                  3'h1:
-                      \active_state$next [66] = automata_table[1];
-                  3'h2:
-                      \active_state$next [66] = automata_table[2];
-                  3'h3:
-                      \active_state$next [66] = automata_table[3];
-                  3'h4:
-                      \active_state$next [66] = automata_table[4];
-                  3'h5:
-                      \active_state$next [66] = automata_table[5];
-                  3'h6:
-                      \active_state$next [66] = automata_table[6];
-                  3'h7:
-                      \active_state$next [66] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[68:66])
-                  3'h0:
-                      \active_state$next [67] = automata_table[0];
-                  3'h1:
-                      \active_state$next [67] = automata_table[1];
-                  3'h2:
-                      \active_state$next [67] = automata_table[2];
-                  3'h3:
-                      \active_state$next [67] = automata_table[3];
-                  3'h4:
-                      \active_state$next [67] = automata_table[4];
-                  3'h5:
-                      \active_state$next [67] = automata_table[5];
-                  3'h6:
-                      \active_state$next [67] = automata_table[6];
-                  3'h7:
-                      \active_state$next [67] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[69:67])
-                  3'h0:
-                      \active_state$next [68] = automata_table[0];
-                  3'h1:
-                      \active_state$next [68] = automata_table[1];
-                  3'h2:
-                      \active_state$next [68] = automata_table[2];
-                  3'h3:
-                      \active_state$next [68] = automata_table[3];
-                  3'h4:
-                      \active_state$next [68] = automata_table[4];
-                  3'h5:
-                      \active_state$next [68] = automata_table[5];
-                  3'h6:
-                      \active_state$next [68] = automata_table[6];
-                  3'h7:
-                      \active_state$next [68] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[70:68])
-                  3'h0:
-                      \active_state$next [69] = automata_table[0];
-                  3'h1:
-                      \active_state$next [69] = automata_table[1];
-                  3'h2:
-                      \active_state$next [69] = automata_table[2];
-                  3'h3:
-                      \active_state$next [69] = automata_table[3];
-                  3'h4:
-                      \active_state$next [69] = automata_table[4];
-                  3'h5:
-                      \active_state$next [69] = automata_table[5];
-                  3'h6:
-                      \active_state$next [69] = automata_table[6];
-                  3'h7:
-                      \active_state$next [69] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[71:69])
-                  3'h0:
-                      \active_state$next [70] = automata_table[0];
-                  3'h1:
-                      \active_state$next [70] = automata_table[1];
-                  3'h2:
-                      \active_state$next [70] = automata_table[2];
-                  3'h3:
-                      \active_state$next [70] = automata_table[3];
-                  3'h4:
-                      \active_state$next [70] = automata_table[4];
-                  3'h5:
-                      \active_state$next [70] = automata_table[5];
-                  3'h6:
-                      \active_state$next [70] = automata_table[6];
-                  3'h7:
-                      \active_state$next [70] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[72:70])
-                  3'h0:
-                      \active_state$next [71] = automata_table[0];
-                  3'h1:
-                      \active_state$next [71] = automata_table[1];
-                  3'h2:
-                      \active_state$next [71] = automata_table[2];
-                  3'h3:
-                      \active_state$next [71] = automata_table[3];
-                  3'h4:
-                      \active_state$next [71] = automata_table[4];
-                  3'h5:
-                      \active_state$next [71] = automata_table[5];
-                  3'h6:
-                      \active_state$next [71] = automata_table[6];
-                  3'h7:
-                      \active_state$next [71] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[73:71])
-                  3'h0:
-                      \active_state$next [72] = automata_table[0];
-                  3'h1:
-                      \active_state$next [72] = automata_table[1];
-                  3'h2:
-                      \active_state$next [72] = automata_table[2];
-                  3'h3:
-                      \active_state$next [72] = automata_table[3];
-                  3'h4:
-                      \active_state$next [72] = automata_table[4];
-                  3'h5:
-                      \active_state$next [72] = automata_table[5];
-                  3'h6:
-                      \active_state$next [72] = automata_table[6];
-                  3'h7:
-                      \active_state$next [72] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[74:72])
-                  3'h0:
-                      \active_state$next [73] = automata_table[0];
-                  3'h1:
-                      \active_state$next [73] = automata_table[1];
-                  3'h2:
-                      \active_state$next [73] = automata_table[2];
-                  3'h3:
-                      \active_state$next [73] = automata_table[3];
-                  3'h4:
-                      \active_state$next [73] = automata_table[4];
-                  3'h5:
-                      \active_state$next [73] = automata_table[5];
-                  3'h6:
-                      \active_state$next [73] = automata_table[6];
-                  3'h7:
-                      \active_state$next [73] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[75:73])
-                  3'h0:
-                      \active_state$next [74] = automata_table[0];
-                  3'h1:
-                      \active_state$next [74] = automata_table[1];
-                  3'h2:
-                      \active_state$next [74] = automata_table[2];
-                  3'h3:
-                      \active_state$next [74] = automata_table[3];
-                  3'h4:
-                      \active_state$next [74] = automata_table[4];
-                  3'h5:
-                      \active_state$next [74] = automata_table[5];
-                  3'h6:
-                      \active_state$next [74] = automata_table[6];
-                  3'h7:
-                      \active_state$next [74] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[76:74])
-                  3'h0:
-                      \active_state$next [75] = automata_table[0];
-                  3'h1:
-                      \active_state$next [75] = automata_table[1];
-                  3'h2:
-                      \active_state$next [75] = automata_table[2];
-                  3'h3:
-                      \active_state$next [75] = automata_table[3];
-                  3'h4:
-                      \active_state$next [75] = automata_table[4];
-                  3'h5:
-                      \active_state$next [75] = automata_table[5];
-                  3'h6:
-                      \active_state$next [75] = automata_table[6];
-                  3'h7:
-                      \active_state$next [75] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[77:75])
-                  3'h0:
-                      \active_state$next [76] = automata_table[0];
-                  3'h1:
-                      \active_state$next [76] = automata_table[1];
-                  3'h2:
-                      \active_state$next [76] = automata_table[2];
-                  3'h3:
-                      \active_state$next [76] = automata_table[3];
-                  3'h4:
-                      \active_state$next [76] = automata_table[4];
-                  3'h5:
-                      \active_state$next [76] = automata_table[5];
-                  3'h6:
-                      \active_state$next [76] = automata_table[6];
-                  3'h7:
-                      \active_state$next [76] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[78:76])
-                  3'h0:
-                      \active_state$next [77] = automata_table[0];
-                  3'h1:
-                      \active_state$next [77] = automata_table[1];
-                  3'h2:
-                      \active_state$next [77] = automata_table[2];
-                  3'h3:
-                      \active_state$next [77] = automata_table[3];
-                  3'h4:
-                      \active_state$next [77] = automata_table[4];
-                  3'h5:
-                      \active_state$next [77] = automata_table[5];
-                  3'h6:
-                      \active_state$next [77] = automata_table[6];
-                  3'h7:
-                      \active_state$next [77] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[79:77])
-                  3'h0:
-                      \active_state$next [78] = automata_table[0];
-                  3'h1:
-                      \active_state$next [78] = automata_table[1];
-                  3'h2:
-                      \active_state$next [78] = automata_table[2];
-                  3'h3:
-                      \active_state$next [78] = automata_table[3];
-                  3'h4:
-                      \active_state$next [78] = automata_table[4];
-                  3'h5:
-                      \active_state$next [78] = automata_table[5];
-                  3'h6:
-                      \active_state$next [78] = automata_table[6];
-                  3'h7:
-                      \active_state$next [78] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[80:78])
-                  3'h0:
-                      \active_state$next [79] = automata_table[0];
-                  3'h1:
-                      \active_state$next [79] = automata_table[1];
-                  3'h2:
-                      \active_state$next [79] = automata_table[2];
-                  3'h3:
-                      \active_state$next [79] = automata_table[3];
-                  3'h4:
-                      \active_state$next [79] = automata_table[4];
-                  3'h5:
-                      \active_state$next [79] = automata_table[5];
-                  3'h6:
-                      \active_state$next [79] = automata_table[6];
-                  3'h7:
-                      \active_state$next [79] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[81:79])
-                  3'h0:
-                      \active_state$next [80] = automata_table[0];
-                  3'h1:
-                      \active_state$next [80] = automata_table[1];
-                  3'h2:
-                      \active_state$next [80] = automata_table[2];
-                  3'h3:
-                      \active_state$next [80] = automata_table[3];
-                  3'h4:
-                      \active_state$next [80] = automata_table[4];
-                  3'h5:
-                      \active_state$next [80] = automata_table[5];
-                  3'h6:
-                      \active_state$next [80] = automata_table[6];
-                  3'h7:
-                      \active_state$next [80] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[82:80])
-                  3'h0:
-                      \active_state$next [81] = automata_table[0];
-                  3'h1:
-                      \active_state$next [81] = automata_table[1];
-                  3'h2:
-                      \active_state$next [81] = automata_table[2];
-                  3'h3:
-                      \active_state$next [81] = automata_table[3];
-                  3'h4:
-                      \active_state$next [81] = automata_table[4];
-                  3'h5:
-                      \active_state$next [81] = automata_table[5];
-                  3'h6:
-                      \active_state$next [81] = automata_table[6];
-                  3'h7:
-                      \active_state$next [81] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[83:81])
-                  3'h0:
-                      \active_state$next [82] = automata_table[0];
-                  3'h1:
-                      \active_state$next [82] = automata_table[1];
-                  3'h2:
-                      \active_state$next [82] = automata_table[2];
-                  3'h3:
-                      \active_state$next [82] = automata_table[3];
-                  3'h4:
-                      \active_state$next [82] = automata_table[4];
-                  3'h5:
-                      \active_state$next [82] = automata_table[5];
-                  3'h6:
-                      \active_state$next [82] = automata_table[6];
-                  3'h7:
-                      \active_state$next [82] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[84:82])
-                  3'h0:
-                      \active_state$next [83] = automata_table[0];
-                  3'h1:
-                      \active_state$next [83] = automata_table[1];
-                  3'h2:
-                      \active_state$next [83] = automata_table[2];
-                  3'h3:
-                      \active_state$next [83] = automata_table[3];
-                  3'h4:
-                      \active_state$next [83] = automata_table[4];
-                  3'h5:
-                      \active_state$next [83] = automata_table[5];
-                  3'h6:
-                      \active_state$next [83] = automata_table[6];
-                  3'h7:
-                      \active_state$next [83] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[85:83])
-                  3'h0:
-                      \active_state$next [84] = automata_table[0];
-                  3'h1:
-                      \active_state$next [84] = automata_table[1];
-                  3'h2:
-                      \active_state$next [84] = automata_table[2];
-                  3'h3:
-                      \active_state$next [84] = automata_table[3];
-                  3'h4:
-                      \active_state$next [84] = automata_table[4];
-                  3'h5:
-                      \active_state$next [84] = automata_table[5];
-                  3'h6:
-                      \active_state$next [84] = automata_table[6];
-                  3'h7:
-                      \active_state$next [84] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[86:84])
-                  3'h0:
-                      \active_state$next [85] = automata_table[0];
-                  3'h1:
-                      \active_state$next [85] = automata_table[1];
-                  3'h2:
-                      \active_state$next [85] = automata_table[2];
-                  3'h3:
-                      \active_state$next [85] = automata_table[3];
-                  3'h4:
-                      \active_state$next [85] = automata_table[4];
-                  3'h5:
-                      \active_state$next [85] = automata_table[5];
-                  3'h6:
-                      \active_state$next [85] = automata_table[6];
-                  3'h7:
-                      \active_state$next [85] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[87:85])
-                  3'h0:
-                      \active_state$next [86] = automata_table[0];
-                  3'h1:
-                      \active_state$next [86] = automata_table[1];
-                  3'h2:
-                      \active_state$next [86] = automata_table[2];
-                  3'h3:
-                      \active_state$next [86] = automata_table[3];
-                  3'h4:
-                      \active_state$next [86] = automata_table[4];
-                  3'h5:
-                      \active_state$next [86] = automata_table[5];
-                  3'h6:
-                      \active_state$next [86] = automata_table[6];
-                  3'h7:
-                      \active_state$next [86] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[88:86])
-                  3'h0:
-                      \active_state$next [87] = automata_table[0];
-                  3'h1:
-                      \active_state$next [87] = automata_table[1];
-                  3'h2:
-                      \active_state$next [87] = automata_table[2];
-                  3'h3:
-                      \active_state$next [87] = automata_table[3];
-                  3'h4:
-                      \active_state$next [87] = automata_table[4];
-                  3'h5:
-                      \active_state$next [87] = automata_table[5];
-                  3'h6:
-                      \active_state$next [87] = automata_table[6];
-                  3'h7:
-                      \active_state$next [87] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[89:87])
-                  3'h0:
-                      \active_state$next [88] = automata_table[0];
-                  3'h1:
-                      \active_state$next [88] = automata_table[1];
-                  3'h2:
-                      \active_state$next [88] = automata_table[2];
-                  3'h3:
-                      \active_state$next [88] = automata_table[3];
-                  3'h4:
-                      \active_state$next [88] = automata_table[4];
-                  3'h5:
-                      \active_state$next [88] = automata_table[5];
-                  3'h6:
-                      \active_state$next [88] = automata_table[6];
-                  3'h7:
-                      \active_state$next [88] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[90:88])
-                  3'h0:
-                      \active_state$next [89] = automata_table[0];
-                  3'h1:
-                      \active_state$next [89] = automata_table[1];
-                  3'h2:
-                      \active_state$next [89] = automata_table[2];
-                  3'h3:
-                      \active_state$next [89] = automata_table[3];
-                  3'h4:
-                      \active_state$next [89] = automata_table[4];
-                  3'h5:
-                      \active_state$next [89] = automata_table[5];
-                  3'h6:
-                      \active_state$next [89] = automata_table[6];
-                  3'h7:
-                      \active_state$next [89] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[91:89])
-                  3'h0:
-                      \active_state$next [90] = automata_table[0];
-                  3'h1:
-                      \active_state$next [90] = automata_table[1];
-                  3'h2:
-                      \active_state$next [90] = automata_table[2];
-                  3'h3:
-                      \active_state$next [90] = automata_table[3];
-                  3'h4:
-                      \active_state$next [90] = automata_table[4];
-                  3'h5:
-                      \active_state$next [90] = automata_table[5];
-                  3'h6:
-                      \active_state$next [90] = automata_table[6];
-                  3'h7:
-                      \active_state$next [90] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[92:90])
-                  3'h0:
-                      \active_state$next [91] = automata_table[0];
-                  3'h1:
-                      \active_state$next [91] = automata_table[1];
-                  3'h2:
-                      \active_state$next [91] = automata_table[2];
-                  3'h3:
-                      \active_state$next [91] = automata_table[3];
-                  3'h4:
-                      \active_state$next [91] = automata_table[4];
-                  3'h5:
-                      \active_state$next [91] = automata_table[5];
-                  3'h6:
-                      \active_state$next [91] = automata_table[6];
-                  3'h7:
-                      \active_state$next [91] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[93:91])
-                  3'h0:
-                      \active_state$next [92] = automata_table[0];
-                  3'h1:
-                      \active_state$next [92] = automata_table[1];
-                  3'h2:
-                      \active_state$next [92] = automata_table[2];
-                  3'h3:
-                      \active_state$next [92] = automata_table[3];
-                  3'h4:
-                      \active_state$next [92] = automata_table[4];
-                  3'h5:
-                      \active_state$next [92] = automata_table[5];
-                  3'h6:
-                      \active_state$next [92] = automata_table[6];
-                  3'h7:
-                      \active_state$next [92] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[94:92])
-                  3'h0:
-                      \active_state$next [93] = automata_table[0];
-                  3'h1:
-                      \active_state$next [93] = automata_table[1];
-                  3'h2:
-                      \active_state$next [93] = automata_table[2];
-                  3'h3:
-                      \active_state$next [93] = automata_table[3];
-                  3'h4:
-                      \active_state$next [93] = automata_table[4];
-                  3'h5:
-                      \active_state$next [93] = automata_table[5];
-                  3'h6:
-                      \active_state$next [93] = automata_table[6];
-                  3'h7:
-                      \active_state$next [93] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[95:93])
-                  3'h0:
-                      \active_state$next [94] = automata_table[0];
-                  3'h1:
-                      \active_state$next [94] = automata_table[1];
-                  3'h2:
-                      \active_state$next [94] = automata_table[2];
-                  3'h3:
-                      \active_state$next [94] = automata_table[3];
-                  3'h4:
-                      \active_state$next [94] = automata_table[4];
-                  3'h5:
-                      \active_state$next [94] = automata_table[5];
-                  3'h6:
-                      \active_state$next [94] = automata_table[6];
-                  3'h7:
-                      \active_state$next [94] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[96:94])
-                  3'h0:
-                      \active_state$next [95] = automata_table[0];
-                  3'h1:
-                      \active_state$next [95] = automata_table[1];
-                  3'h2:
-                      \active_state$next [95] = automata_table[2];
-                  3'h3:
-                      \active_state$next [95] = automata_table[3];
-                  3'h4:
-                      \active_state$next [95] = automata_table[4];
-                  3'h5:
-                      \active_state$next [95] = automata_table[5];
-                  3'h6:
-                      \active_state$next [95] = automata_table[6];
-                  3'h7:
-                      \active_state$next [95] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[97:95])
-                  3'h0:
-                      \active_state$next [96] = automata_table[0];
-                  3'h1:
-                      \active_state$next [96] = automata_table[1];
-                  3'h2:
-                      \active_state$next [96] = automata_table[2];
-                  3'h3:
-                      \active_state$next [96] = automata_table[3];
-                  3'h4:
-                      \active_state$next [96] = automata_table[4];
-                  3'h5:
-                      \active_state$next [96] = automata_table[5];
-                  3'h6:
-                      \active_state$next [96] = automata_table[6];
-                  3'h7:
-                      \active_state$next [96] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[98:96])
-                  3'h0:
-                      \active_state$next [97] = automata_table[0];
-                  3'h1:
-                      \active_state$next [97] = automata_table[1];
-                  3'h2:
-                      \active_state$next [97] = automata_table[2];
-                  3'h3:
-                      \active_state$next [97] = automata_table[3];
-                  3'h4:
-                      \active_state$next [97] = automata_table[4];
-                  3'h5:
-                      \active_state$next [97] = automata_table[5];
-                  3'h6:
-                      \active_state$next [97] = automata_table[6];
-                  3'h7:
-                      \active_state$next [97] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[99:97])
-                  3'h0:
-                      \active_state$next [98] = automata_table[0];
-                  3'h1:
-                      \active_state$next [98] = automata_table[1];
-                  3'h2:
-                      \active_state$next [98] = automata_table[2];
-                  3'h3:
-                      \active_state$next [98] = automata_table[3];
-                  3'h4:
-                      \active_state$next [98] = automata_table[4];
-                  3'h5:
-                      \active_state$next [98] = automata_table[5];
-                  3'h6:
-                      \active_state$next [98] = automata_table[6];
-                  3'h7:
-                      \active_state$next [98] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[100:98])
-                  3'h0:
-                      \active_state$next [99] = automata_table[0];
-                  3'h1:
-                      \active_state$next [99] = automata_table[1];
-                  3'h2:
-                      \active_state$next [99] = automata_table[2];
-                  3'h3:
-                      \active_state$next [99] = automata_table[3];
-                  3'h4:
-                      \active_state$next [99] = automata_table[4];
-                  3'h5:
-                      \active_state$next [99] = automata_table[5];
-                  3'h6:
-                      \active_state$next [99] = automata_table[6];
-                  3'h7:
-                      \active_state$next [99] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[101:99])
-                  3'h0:
-                      \active_state$next [100] = automata_table[0];
-                  3'h1:
-                      \active_state$next [100] = automata_table[1];
-                  3'h2:
-                      \active_state$next [100] = automata_table[2];
-                  3'h3:
-                      \active_state$next [100] = automata_table[3];
-                  3'h4:
-                      \active_state$next [100] = automata_table[4];
-                  3'h5:
-                      \active_state$next [100] = automata_table[5];
-                  3'h6:
-                      \active_state$next [100] = automata_table[6];
-                  3'h7:
-                      \active_state$next [100] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[102:100])
-                  3'h0:
-                      \active_state$next [101] = automata_table[0];
-                  3'h1:
-                      \active_state$next [101] = automata_table[1];
-                  3'h2:
-                      \active_state$next [101] = automata_table[2];
-                  3'h3:
-                      \active_state$next [101] = automata_table[3];
-                  3'h4:
-                      \active_state$next [101] = automata_table[4];
-                  3'h5:
-                      \active_state$next [101] = automata_table[5];
-                  3'h6:
-                      \active_state$next [101] = automata_table[6];
-                  3'h7:
-                      \active_state$next [101] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[103:101])
-                  3'h0:
-                      \active_state$next [102] = automata_table[0];
-                  3'h1:
-                      \active_state$next [102] = automata_table[1];
-                  3'h2:
-                      \active_state$next [102] = automata_table[2];
-                  3'h3:
-                      \active_state$next [102] = automata_table[3];
-                  3'h4:
-                      \active_state$next [102] = automata_table[4];
-                  3'h5:
-                      \active_state$next [102] = automata_table[5];
-                  3'h6:
-                      \active_state$next [102] = automata_table[6];
-                  3'h7:
-                      \active_state$next [102] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[104:102])
-                  3'h0:
-                      \active_state$next [103] = automata_table[0];
-                  3'h1:
-                      \active_state$next [103] = automata_table[1];
-                  3'h2:
-                      \active_state$next [103] = automata_table[2];
-                  3'h3:
-                      \active_state$next [103] = automata_table[3];
-                  3'h4:
-                      \active_state$next [103] = automata_table[4];
-                  3'h5:
-                      \active_state$next [103] = automata_table[5];
-                  3'h6:
-                      \active_state$next [103] = automata_table[6];
-                  3'h7:
-                      \active_state$next [103] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[105:103])
-                  3'h0:
-                      \active_state$next [104] = automata_table[0];
-                  3'h1:
-                      \active_state$next [104] = automata_table[1];
-                  3'h2:
-                      \active_state$next [104] = automata_table[2];
-                  3'h3:
-                      \active_state$next [104] = automata_table[3];
-                  3'h4:
-                      \active_state$next [104] = automata_table[4];
-                  3'h5:
-                      \active_state$next [104] = automata_table[5];
-                  3'h6:
-                      \active_state$next [104] = automata_table[6];
-                  3'h7:
-                      \active_state$next [104] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[106:104])
-                  3'h0:
-                      \active_state$next [105] = automata_table[0];
-                  3'h1:
-                      \active_state$next [105] = automata_table[1];
-                  3'h2:
-                      \active_state$next [105] = automata_table[2];
-                  3'h3:
-                      \active_state$next [105] = automata_table[3];
-                  3'h4:
-                      \active_state$next [105] = automata_table[4];
-                  3'h5:
-                      \active_state$next [105] = automata_table[5];
-                  3'h6:
-                      \active_state$next [105] = automata_table[6];
-                  3'h7:
-                      \active_state$next [105] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[107:105])
-                  3'h0:
-                      \active_state$next [106] = automata_table[0];
-                  3'h1:
-                      \active_state$next [106] = automata_table[1];
-                  3'h2:
-                      \active_state$next [106] = automata_table[2];
-                  3'h3:
-                      \active_state$next [106] = automata_table[3];
-                  3'h4:
-                      \active_state$next [106] = automata_table[4];
-                  3'h5:
-                      \active_state$next [106] = automata_table[5];
-                  3'h6:
-                      \active_state$next [106] = automata_table[6];
-                  3'h7:
-                      \active_state$next [106] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[108:106])
-                  3'h0:
-                      \active_state$next [107] = automata_table[0];
-                  3'h1:
-                      \active_state$next [107] = automata_table[1];
-                  3'h2:
-                      \active_state$next [107] = automata_table[2];
-                  3'h3:
-                      \active_state$next [107] = automata_table[3];
-                  3'h4:
-                      \active_state$next [107] = automata_table[4];
-                  3'h5:
-                      \active_state$next [107] = automata_table[5];
-                  3'h6:
-                      \active_state$next [107] = automata_table[6];
-                  3'h7:
-                      \active_state$next [107] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[109:107])
-                  3'h0:
-                      \active_state$next [108] = automata_table[0];
-                  3'h1:
-                      \active_state$next [108] = automata_table[1];
-                  3'h2:
-                      \active_state$next [108] = automata_table[2];
-                  3'h3:
-                      \active_state$next [108] = automata_table[3];
-                  3'h4:
-                      \active_state$next [108] = automata_table[4];
-                  3'h5:
-                      \active_state$next [108] = automata_table[5];
-                  3'h6:
-                      \active_state$next [108] = automata_table[6];
-                  3'h7:
-                      \active_state$next [108] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[110:108])
-                  3'h0:
-                      \active_state$next [109] = automata_table[0];
-                  3'h1:
-                      \active_state$next [109] = automata_table[1];
-                  3'h2:
-                      \active_state$next [109] = automata_table[2];
-                  3'h3:
-                      \active_state$next [109] = automata_table[3];
-                  3'h4:
-                      \active_state$next [109] = automata_table[4];
-                  3'h5:
-                      \active_state$next [109] = automata_table[5];
-                  3'h6:
-                      \active_state$next [109] = automata_table[6];
-                  3'h7:
-                      \active_state$next [109] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[111:109])
-                  3'h0:
-                      \active_state$next [110] = automata_table[0];
-                  3'h1:
-                      \active_state$next [110] = automata_table[1];
-                  3'h2:
-                      \active_state$next [110] = automata_table[2];
-                  3'h3:
-                      \active_state$next [110] = automata_table[3];
-                  3'h4:
-                      \active_state$next [110] = automata_table[4];
-                  3'h5:
-                      \active_state$next [110] = automata_table[5];
-                  3'h6:
-                      \active_state$next [110] = automata_table[6];
-                  3'h7:
-                      \active_state$next [110] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[112:110])
-                  3'h0:
-                      \active_state$next [111] = automata_table[0];
-                  3'h1:
-                      \active_state$next [111] = automata_table[1];
-                  3'h2:
-                      \active_state$next [111] = automata_table[2];
-                  3'h3:
-                      \active_state$next [111] = automata_table[3];
-                  3'h4:
-                      \active_state$next [111] = automata_table[4];
-                  3'h5:
-                      \active_state$next [111] = automata_table[5];
-                  3'h6:
-                      \active_state$next [111] = automata_table[6];
-                  3'h7:
-                      \active_state$next [111] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[113:111])
-                  3'h0:
-                      \active_state$next [112] = automata_table[0];
-                  3'h1:
-                      \active_state$next [112] = automata_table[1];
-                  3'h2:
-                      \active_state$next [112] = automata_table[2];
-                  3'h3:
-                      \active_state$next [112] = automata_table[3];
-                  3'h4:
-                      \active_state$next [112] = automata_table[4];
-                  3'h5:
-                      \active_state$next [112] = automata_table[5];
-                  3'h6:
-                      \active_state$next [112] = automata_table[6];
-                  3'h7:
-                      \active_state$next [112] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[114:112])
-                  3'h0:
-                      \active_state$next [113] = automata_table[0];
-                  3'h1:
-                      \active_state$next [113] = automata_table[1];
-                  3'h2:
-                      \active_state$next [113] = automata_table[2];
-                  3'h3:
-                      \active_state$next [113] = automata_table[3];
-                  3'h4:
-                      \active_state$next [113] = automata_table[4];
-                  3'h5:
-                      \active_state$next [113] = automata_table[5];
-                  3'h6:
-                      \active_state$next [113] = automata_table[6];
-                  3'h7:
-                      \active_state$next [113] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[115:113])
-                  3'h0:
-                      \active_state$next [114] = automata_table[0];
-                  3'h1:
-                      \active_state$next [114] = automata_table[1];
-                  3'h2:
-                      \active_state$next [114] = automata_table[2];
-                  3'h3:
-                      \active_state$next [114] = automata_table[3];
-                  3'h4:
-                      \active_state$next [114] = automata_table[4];
-                  3'h5:
-                      \active_state$next [114] = automata_table[5];
-                  3'h6:
-                      \active_state$next [114] = automata_table[6];
-                  3'h7:
-                      \active_state$next [114] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[116:114])
-                  3'h0:
-                      \active_state$next [115] = automata_table[0];
-                  3'h1:
-                      \active_state$next [115] = automata_table[1];
-                  3'h2:
-                      \active_state$next [115] = automata_table[2];
-                  3'h3:
-                      \active_state$next [115] = automata_table[3];
-                  3'h4:
-                      \active_state$next [115] = automata_table[4];
-                  3'h5:
-                      \active_state$next [115] = automata_table[5];
-                  3'h6:
-                      \active_state$next [115] = automata_table[6];
-                  3'h7:
-                      \active_state$next [115] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[117:115])
-                  3'h0:
-                      \active_state$next [116] = automata_table[0];
-                  3'h1:
-                      \active_state$next [116] = automata_table[1];
-                  3'h2:
-                      \active_state$next [116] = automata_table[2];
-                  3'h3:
-                      \active_state$next [116] = automata_table[3];
-                  3'h4:
-                      \active_state$next [116] = automata_table[4];
-                  3'h5:
-                      \active_state$next [116] = automata_table[5];
-                  3'h6:
-                      \active_state$next [116] = automata_table[6];
-                  3'h7:
-                      \active_state$next [116] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[118:116])
-                  3'h0:
-                      \active_state$next [117] = automata_table[0];
-                  3'h1:
-                      \active_state$next [117] = automata_table[1];
-                  3'h2:
-                      \active_state$next [117] = automata_table[2];
-                  3'h3:
-                      \active_state$next [117] = automata_table[3];
-                  3'h4:
-                      \active_state$next [117] = automata_table[4];
-                  3'h5:
-                      \active_state$next [117] = automata_table[5];
-                  3'h6:
-                      \active_state$next [117] = automata_table[6];
-                  3'h7:
-                      \active_state$next [117] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[119:117])
-                  3'h0:
-                      \active_state$next [118] = automata_table[0];
-                  3'h1:
-                      \active_state$next [118] = automata_table[1];
-                  3'h2:
-                      \active_state$next [118] = automata_table[2];
-                  3'h3:
-                      \active_state$next [118] = automata_table[3];
-                  3'h4:
-                      \active_state$next [118] = automata_table[4];
-                  3'h5:
-                      \active_state$next [118] = automata_table[5];
-                  3'h6:
-                      \active_state$next [118] = automata_table[6];
-                  3'h7:
-                      \active_state$next [118] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[120:118])
-                  3'h0:
-                      \active_state$next [119] = automata_table[0];
-                  3'h1:
-                      \active_state$next [119] = automata_table[1];
-                  3'h2:
-                      \active_state$next [119] = automata_table[2];
-                  3'h3:
-                      \active_state$next [119] = automata_table[3];
-                  3'h4:
-                      \active_state$next [119] = automata_table[4];
-                  3'h5:
-                      \active_state$next [119] = automata_table[5];
-                  3'h6:
-                      \active_state$next [119] = automata_table[6];
-                  3'h7:
-                      \active_state$next [119] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[121:119])
-                  3'h0:
-                      \active_state$next [120] = automata_table[0];
-                  3'h1:
-                      \active_state$next [120] = automata_table[1];
-                  3'h2:
-                      \active_state$next [120] = automata_table[2];
-                  3'h3:
-                      \active_state$next [120] = automata_table[3];
-                  3'h4:
-                      \active_state$next [120] = automata_table[4];
-                  3'h5:
-                      \active_state$next [120] = automata_table[5];
-                  3'h6:
-                      \active_state$next [120] = automata_table[6];
-                  3'h7:
-                      \active_state$next [120] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[122:120])
-                  3'h0:
-                      \active_state$next [121] = automata_table[0];
-                  3'h1:
-                      \active_state$next [121] = automata_table[1];
-                  3'h2:
-                      \active_state$next [121] = automata_table[2];
-                  3'h3:
-                      \active_state$next [121] = automata_table[3];
-                  3'h4:
-                      \active_state$next [121] = automata_table[4];
-                  3'h5:
-                      \active_state$next [121] = automata_table[5];
-                  3'h6:
-                      \active_state$next [121] = automata_table[6];
-                  3'h7:
-                      \active_state$next [121] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[123:121])
-                  3'h0:
-                      \active_state$next [122] = automata_table[0];
-                  3'h1:
-                      \active_state$next [122] = automata_table[1];
-                  3'h2:
-                      \active_state$next [122] = automata_table[2];
-                  3'h3:
-                      \active_state$next [122] = automata_table[3];
-                  3'h4:
-                      \active_state$next [122] = automata_table[4];
-                  3'h5:
-                      \active_state$next [122] = automata_table[5];
-                  3'h6:
-                      \active_state$next [122] = automata_table[6];
-                  3'h7:
-                      \active_state$next [122] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[124:122])
-                  3'h0:
-                      \active_state$next [123] = automata_table[0];
-                  3'h1:
-                      \active_state$next [123] = automata_table[1];
-                  3'h2:
-                      \active_state$next [123] = automata_table[2];
-                  3'h3:
-                      \active_state$next [123] = automata_table[3];
-                  3'h4:
-                      \active_state$next [123] = automata_table[4];
-                  3'h5:
-                      \active_state$next [123] = automata_table[5];
-                  3'h6:
-                      \active_state$next [123] = automata_table[6];
-                  3'h7:
-                      \active_state$next [123] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[125:123])
-                  3'h0:
-                      \active_state$next [124] = automata_table[0];
-                  3'h1:
-                      \active_state$next [124] = automata_table[1];
-                  3'h2:
-                      \active_state$next [124] = automata_table[2];
-                  3'h3:
-                      \active_state$next [124] = automata_table[3];
-                  3'h4:
-                      \active_state$next [124] = automata_table[4];
-                  3'h5:
-                      \active_state$next [124] = automata_table[5];
-                  3'h6:
-                      \active_state$next [124] = automata_table[6];
-                  3'h7:
-                      \active_state$next [124] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[126:124])
-                  3'h0:
-                      \active_state$next [125] = automata_table[0];
-                  3'h1:
-                      \active_state$next [125] = automata_table[1];
-                  3'h2:
-                      \active_state$next [125] = automata_table[2];
-                  3'h3:
-                      \active_state$next [125] = automata_table[3];
-                  3'h4:
-                      \active_state$next [125] = automata_table[4];
-                  3'h5:
-                      \active_state$next [125] = automata_table[5];
-                  3'h6:
-                      \active_state$next [125] = automata_table[6];
-                  3'h7:
-                      \active_state$next [125] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[127:125])
-                  3'h0:
-                      \active_state$next [126] = automata_table[0];
-                  3'h1:
-                      \active_state$next [126] = automata_table[1];
-                  3'h2:
-                      \active_state$next [126] = automata_table[2];
-                  3'h3:
-                      \active_state$next [126] = automata_table[3];
-                  3'h4:
-                      \active_state$next [126] = automata_table[4];
-                  3'h5:
-                      \active_state$next [126] = automata_table[5];
-                  3'h6:
-                      \active_state$next [126] = automata_table[6];
-                  3'h7:
-                      \active_state$next [126] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[128:126])
-                  3'h0:
-                      \active_state$next [127] = automata_table[0];
-                  3'h1:
-                      \active_state$next [127] = automata_table[1];
-                  3'h2:
-                      \active_state$next [127] = automata_table[2];
-                  3'h3:
-                      \active_state$next [127] = automata_table[3];
-                  3'h4:
-                      \active_state$next [127] = automata_table[4];
-                  3'h5:
-                      \active_state$next [127] = automata_table[5];
-                  3'h6:
-                      \active_state$next [127] = automata_table[6];
-                  3'h7:
-                      \active_state$next [127] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[129:127])
-                  3'h0:
-                      \active_state$next [128] = automata_table[0];
-                  3'h1:
-                      \active_state$next [128] = automata_table[1];
-                  3'h2:
-                      \active_state$next [128] = automata_table[2];
-                  3'h3:
-                      \active_state$next [128] = automata_table[3];
-                  3'h4:
-                      \active_state$next [128] = automata_table[4];
-                  3'h5:
-                      \active_state$next [128] = automata_table[5];
-                  3'h6:
-                      \active_state$next [128] = automata_table[6];
-                  3'h7:
-                      \active_state$next [128] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[130:128])
-                  3'h0:
-                      \active_state$next [129] = automata_table[0];
-                  3'h1:
-                      \active_state$next [129] = automata_table[1];
-                  3'h2:
-                      \active_state$next [129] = automata_table[2];
-                  3'h3:
-                      \active_state$next [129] = automata_table[3];
-                  3'h4:
-                      \active_state$next [129] = automata_table[4];
-                  3'h5:
-                      \active_state$next [129] = automata_table[5];
-                  3'h6:
-                      \active_state$next [129] = automata_table[6];
-                  3'h7:
-                      \active_state$next [129] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[131:129])
-                  3'h0:
-                      \active_state$next [130] = automata_table[0];
-                  3'h1:
-                      \active_state$next [130] = automata_table[1];
-                  3'h2:
-                      \active_state$next [130] = automata_table[2];
-                  3'h3:
-                      \active_state$next [130] = automata_table[3];
-                  3'h4:
-                      \active_state$next [130] = automata_table[4];
-                  3'h5:
-                      \active_state$next [130] = automata_table[5];
-                  3'h6:
-                      \active_state$next [130] = automata_table[6];
-                  3'h7:
-                      \active_state$next [130] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[132:130])
-                  3'h0:
-                      \active_state$next [131] = automata_table[0];
-                  3'h1:
-                      \active_state$next [131] = automata_table[1];
-                  3'h2:
-                      \active_state$next [131] = automata_table[2];
-                  3'h3:
-                      \active_state$next [131] = automata_table[3];
-                  3'h4:
-                      \active_state$next [131] = automata_table[4];
-                  3'h5:
-                      \active_state$next [131] = automata_table[5];
-                  3'h6:
-                      \active_state$next [131] = automata_table[6];
-                  3'h7:
-                      \active_state$next [131] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[133:131])
-                  3'h0:
-                      \active_state$next [132] = automata_table[0];
-                  3'h1:
-                      \active_state$next [132] = automata_table[1];
-                  3'h2:
-                      \active_state$next [132] = automata_table[2];
-                  3'h3:
-                      \active_state$next [132] = automata_table[3];
-                  3'h4:
-                      \active_state$next [132] = automata_table[4];
-                  3'h5:
-                      \active_state$next [132] = automata_table[5];
-                  3'h6:
-                      \active_state$next [132] = automata_table[6];
-                  3'h7:
-                      \active_state$next [132] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[134:132])
-                  3'h0:
-                      \active_state$next [133] = automata_table[0];
-                  3'h1:
-                      \active_state$next [133] = automata_table[1];
-                  3'h2:
-                      \active_state$next [133] = automata_table[2];
-                  3'h3:
-                      \active_state$next [133] = automata_table[3];
-                  3'h4:
-                      \active_state$next [133] = automata_table[4];
-                  3'h5:
-                      \active_state$next [133] = automata_table[5];
-                  3'h6:
-                      \active_state$next [133] = automata_table[6];
-                  3'h7:
-                      \active_state$next [133] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[135:133])
-                  3'h0:
-                      \active_state$next [134] = automata_table[0];
-                  3'h1:
-                      \active_state$next [134] = automata_table[1];
-                  3'h2:
-                      \active_state$next [134] = automata_table[2];
-                  3'h3:
-                      \active_state$next [134] = automata_table[3];
-                  3'h4:
-                      \active_state$next [134] = automata_table[4];
-                  3'h5:
-                      \active_state$next [134] = automata_table[5];
-                  3'h6:
-                      \active_state$next [134] = automata_table[6];
-                  3'h7:
-                      \active_state$next [134] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[136:134])
-                  3'h0:
-                      \active_state$next [135] = automata_table[0];
-                  3'h1:
-                      \active_state$next [135] = automata_table[1];
-                  3'h2:
-                      \active_state$next [135] = automata_table[2];
-                  3'h3:
-                      \active_state$next [135] = automata_table[3];
-                  3'h4:
-                      \active_state$next [135] = automata_table[4];
-                  3'h5:
-                      \active_state$next [135] = automata_table[5];
-                  3'h6:
-                      \active_state$next [135] = automata_table[6];
-                  3'h7:
-                      \active_state$next [135] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[137:135])
-                  3'h0:
-                      \active_state$next [136] = automata_table[0];
-                  3'h1:
-                      \active_state$next [136] = automata_table[1];
-                  3'h2:
-                      \active_state$next [136] = automata_table[2];
-                  3'h3:
-                      \active_state$next [136] = automata_table[3];
-                  3'h4:
-                      \active_state$next [136] = automata_table[4];
-                  3'h5:
-                      \active_state$next [136] = automata_table[5];
-                  3'h6:
-                      \active_state$next [136] = automata_table[6];
-                  3'h7:
-                      \active_state$next [136] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[138:136])
-                  3'h0:
-                      \active_state$next [137] = automata_table[0];
-                  3'h1:
-                      \active_state$next [137] = automata_table[1];
-                  3'h2:
-                      \active_state$next [137] = automata_table[2];
-                  3'h3:
-                      \active_state$next [137] = automata_table[3];
-                  3'h4:
-                      \active_state$next [137] = automata_table[4];
-                  3'h5:
-                      \active_state$next [137] = automata_table[5];
-                  3'h6:
-                      \active_state$next [137] = automata_table[6];
-                  3'h7:
-                      \active_state$next [137] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[139:137])
-                  3'h0:
-                      \active_state$next [138] = automata_table[0];
-                  3'h1:
-                      \active_state$next [138] = automata_table[1];
-                  3'h2:
-                      \active_state$next [138] = automata_table[2];
-                  3'h3:
-                      \active_state$next [138] = automata_table[3];
-                  3'h4:
-                      \active_state$next [138] = automata_table[4];
-                  3'h5:
-                      \active_state$next [138] = automata_table[5];
-                  3'h6:
-                      \active_state$next [138] = automata_table[6];
-                  3'h7:
-                      \active_state$next [138] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[140:138])
-                  3'h0:
-                      \active_state$next [139] = automata_table[0];
-                  3'h1:
-                      \active_state$next [139] = automata_table[1];
-                  3'h2:
-                      \active_state$next [139] = automata_table[2];
-                  3'h3:
-                      \active_state$next [139] = automata_table[3];
-                  3'h4:
-                      \active_state$next [139] = automata_table[4];
-                  3'h5:
-                      \active_state$next [139] = automata_table[5];
-                  3'h6:
-                      \active_state$next [139] = automata_table[6];
-                  3'h7:
-                      \active_state$next [139] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[141:139])
-                  3'h0:
-                      \active_state$next [140] = automata_table[0];
-                  3'h1:
-                      \active_state$next [140] = automata_table[1];
-                  3'h2:
-                      \active_state$next [140] = automata_table[2];
-                  3'h3:
-                      \active_state$next [140] = automata_table[3];
-                  3'h4:
-                      \active_state$next [140] = automata_table[4];
-                  3'h5:
-                      \active_state$next [140] = automata_table[5];
-                  3'h6:
-                      \active_state$next [140] = automata_table[6];
-                  3'h7:
-                      \active_state$next [140] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[142:140])
-                  3'h0:
-                      \active_state$next [141] = automata_table[0];
-                  3'h1:
-                      \active_state$next [141] = automata_table[1];
-                  3'h2:
-                      \active_state$next [141] = automata_table[2];
-                  3'h3:
-                      \active_state$next [141] = automata_table[3];
-                  3'h4:
-                      \active_state$next [141] = automata_table[4];
-                  3'h5:
-                      \active_state$next [141] = automata_table[5];
-                  3'h6:
-                      \active_state$next [141] = automata_table[6];
-                  3'h7:
-                      \active_state$next [141] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[143:141])
-                  3'h0:
-                      \active_state$next [142] = automata_table[0];
-                  3'h1:
-                      \active_state$next [142] = automata_table[1];
-                  3'h2:
-                      \active_state$next [142] = automata_table[2];
-                  3'h3:
-                      \active_state$next [142] = automata_table[3];
-                  3'h4:
-                      \active_state$next [142] = automata_table[4];
-                  3'h5:
-                      \active_state$next [142] = automata_table[5];
-                  3'h6:
-                      \active_state$next [142] = automata_table[6];
-                  3'h7:
-                      \active_state$next [142] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[144:142])
-                  3'h0:
-                      \active_state$next [143] = automata_table[0];
-                  3'h1:
-                      \active_state$next [143] = automata_table[1];
-                  3'h2:
-                      \active_state$next [143] = automata_table[2];
-                  3'h3:
-                      \active_state$next [143] = automata_table[3];
-                  3'h4:
-                      \active_state$next [143] = automata_table[4];
-                  3'h5:
-                      \active_state$next [143] = automata_table[5];
-                  3'h6:
-                      \active_state$next [143] = automata_table[6];
-                  3'h7:
-                      \active_state$next [143] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[145:143])
-                  3'h0:
-                      \active_state$next [144] = automata_table[0];
-                  3'h1:
-                      \active_state$next [144] = automata_table[1];
-                  3'h2:
-                      \active_state$next [144] = automata_table[2];
-                  3'h3:
-                      \active_state$next [144] = automata_table[3];
-                  3'h4:
-                      \active_state$next [144] = automata_table[4];
-                  3'h5:
-                      \active_state$next [144] = automata_table[5];
-                  3'h6:
-                      \active_state$next [144] = automata_table[6];
-                  3'h7:
-                      \active_state$next [144] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[146:144])
-                  3'h0:
-                      \active_state$next [145] = automata_table[0];
-                  3'h1:
-                      \active_state$next [145] = automata_table[1];
-                  3'h2:
-                      \active_state$next [145] = automata_table[2];
-                  3'h3:
-                      \active_state$next [145] = automata_table[3];
-                  3'h4:
-                      \active_state$next [145] = automata_table[4];
-                  3'h5:
-                      \active_state$next [145] = automata_table[5];
-                  3'h6:
-                      \active_state$next [145] = automata_table[6];
-                  3'h7:
-                      \active_state$next [145] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[147:145])
-                  3'h0:
-                      \active_state$next [146] = automata_table[0];
-                  3'h1:
-                      \active_state$next [146] = automata_table[1];
-                  3'h2:
-                      \active_state$next [146] = automata_table[2];
-                  3'h3:
-                      \active_state$next [146] = automata_table[3];
-                  3'h4:
-                      \active_state$next [146] = automata_table[4];
-                  3'h5:
-                      \active_state$next [146] = automata_table[5];
-                  3'h6:
-                      \active_state$next [146] = automata_table[6];
-                  3'h7:
-                      \active_state$next [146] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[148:146])
-                  3'h0:
-                      \active_state$next [147] = automata_table[0];
-                  3'h1:
-                      \active_state$next [147] = automata_table[1];
-                  3'h2:
-                      \active_state$next [147] = automata_table[2];
-                  3'h3:
-                      \active_state$next [147] = automata_table[3];
-                  3'h4:
-                      \active_state$next [147] = automata_table[4];
-                  3'h5:
-                      \active_state$next [147] = automata_table[5];
-                  3'h6:
-                      \active_state$next [147] = automata_table[6];
-                  3'h7:
-                      \active_state$next [147] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[149:147])
-                  3'h0:
-                      \active_state$next [148] = automata_table[0];
-                  3'h1:
-                      \active_state$next [148] = automata_table[1];
-                  3'h2:
-                      \active_state$next [148] = automata_table[2];
-                  3'h3:
-                      \active_state$next [148] = automata_table[3];
-                  3'h4:
-                      \active_state$next [148] = automata_table[4];
-                  3'h5:
-                      \active_state$next [148] = automata_table[5];
-                  3'h6:
-                      \active_state$next [148] = automata_table[6];
-                  3'h7:
-                      \active_state$next [148] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[150:148])
-                  3'h0:
-                      \active_state$next [149] = automata_table[0];
-                  3'h1:
-                      \active_state$next [149] = automata_table[1];
-                  3'h2:
-                      \active_state$next [149] = automata_table[2];
-                  3'h3:
-                      \active_state$next [149] = automata_table[3];
-                  3'h4:
-                      \active_state$next [149] = automata_table[4];
-                  3'h5:
-                      \active_state$next [149] = automata_table[5];
-                  3'h6:
-                      \active_state$next [149] = automata_table[6];
-                  3'h7:
-                      \active_state$next [149] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[151:149])
-                  3'h0:
-                      \active_state$next [150] = automata_table[0];
-                  3'h1:
-                      \active_state$next [150] = automata_table[1];
-                  3'h2:
-                      \active_state$next [150] = automata_table[2];
-                  3'h3:
-                      \active_state$next [150] = automata_table[3];
-                  3'h4:
-                      \active_state$next [150] = automata_table[4];
-                  3'h5:
-                      \active_state$next [150] = automata_table[5];
-                  3'h6:
-                      \active_state$next [150] = automata_table[6];
-                  3'h7:
-                      \active_state$next [150] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[152:150])
-                  3'h0:
-                      \active_state$next [151] = automata_table[0];
-                  3'h1:
-                      \active_state$next [151] = automata_table[1];
-                  3'h2:
-                      \active_state$next [151] = automata_table[2];
-                  3'h3:
-                      \active_state$next [151] = automata_table[3];
-                  3'h4:
-                      \active_state$next [151] = automata_table[4];
-                  3'h5:
-                      \active_state$next [151] = automata_table[5];
-                  3'h6:
-                      \active_state$next [151] = automata_table[6];
-                  3'h7:
-                      \active_state$next [151] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[153:151])
-                  3'h0:
-                      \active_state$next [152] = automata_table[0];
-                  3'h1:
-                      \active_state$next [152] = automata_table[1];
-                  3'h2:
-                      \active_state$next [152] = automata_table[2];
-                  3'h3:
-                      \active_state$next [152] = automata_table[3];
-                  3'h4:
-                      \active_state$next [152] = automata_table[4];
-                  3'h5:
-                      \active_state$next [152] = automata_table[5];
-                  3'h6:
-                      \active_state$next [152] = automata_table[6];
-                  3'h7:
-                      \active_state$next [152] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[154:152])
-                  3'h0:
-                      \active_state$next [153] = automata_table[0];
-                  3'h1:
-                      \active_state$next [153] = automata_table[1];
-                  3'h2:
-                      \active_state$next [153] = automata_table[2];
-                  3'h3:
-                      \active_state$next [153] = automata_table[3];
-                  3'h4:
-                      \active_state$next [153] = automata_table[4];
-                  3'h5:
-                      \active_state$next [153] = automata_table[5];
-                  3'h6:
-                      \active_state$next [153] = automata_table[6];
-                  3'h7:
-                      \active_state$next [153] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[155:153])
-                  3'h0:
-                      \active_state$next [154] = automata_table[0];
-                  3'h1:
-                      \active_state$next [154] = automata_table[1];
-                  3'h2:
-                      \active_state$next [154] = automata_table[2];
-                  3'h3:
-                      \active_state$next [154] = automata_table[3];
-                  3'h4:
-                      \active_state$next [154] = automata_table[4];
-                  3'h5:
-                      \active_state$next [154] = automata_table[5];
-                  3'h6:
-                      \active_state$next [154] = automata_table[6];
-                  3'h7:
-                      \active_state$next [154] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[156:154])
-                  3'h0:
-                      \active_state$next [155] = automata_table[0];
-                  3'h1:
-                      \active_state$next [155] = automata_table[1];
-                  3'h2:
-                      \active_state$next [155] = automata_table[2];
-                  3'h3:
-                      \active_state$next [155] = automata_table[3];
-                  3'h4:
-                      \active_state$next [155] = automata_table[4];
-                  3'h5:
-                      \active_state$next [155] = automata_table[5];
-                  3'h6:
-                      \active_state$next [155] = automata_table[6];
-                  3'h7:
-                      \active_state$next [155] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[157:155])
-                  3'h0:
-                      \active_state$next [156] = automata_table[0];
-                  3'h1:
-                      \active_state$next [156] = automata_table[1];
-                  3'h2:
-                      \active_state$next [156] = automata_table[2];
-                  3'h3:
-                      \active_state$next [156] = automata_table[3];
-                  3'h4:
-                      \active_state$next [156] = automata_table[4];
-                  3'h5:
-                      \active_state$next [156] = automata_table[5];
-                  3'h6:
-                      \active_state$next [156] = automata_table[6];
-                  3'h7:
-                      \active_state$next [156] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[158:156])
-                  3'h0:
-                      \active_state$next [157] = automata_table[0];
-                  3'h1:
-                      \active_state$next [157] = automata_table[1];
-                  3'h2:
-                      \active_state$next [157] = automata_table[2];
-                  3'h3:
-                      \active_state$next [157] = automata_table[3];
-                  3'h4:
-                      \active_state$next [157] = automata_table[4];
-                  3'h5:
-                      \active_state$next [157] = automata_table[5];
-                  3'h6:
-                      \active_state$next [157] = automata_table[6];
-                  3'h7:
-                      \active_state$next [157] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez (active_state[159:157])
-                  3'h0:
-                      \active_state$next [158] = automata_table[0];
-                  3'h1:
-                      \active_state$next [158] = automata_table[1];
-                  3'h2:
-                      \active_state$next [158] = automata_table[2];
-                  3'h3:
-                      \active_state$next [158] = automata_table[3];
-                  3'h4:
-                      \active_state$next [158] = automata_table[4];
-                  3'h5:
-                      \active_state$next [158] = automata_table[5];
-                  3'h6:
-                      \active_state$next [158] = automata_table[6];
-                  3'h7:
-                      \active_state$next [158] = automata_table[7];
-                endcase
-                (* full_case = 32'd1 *)
-                casez ({ active_state[0], active_state[159:158] })
-                  3'h0:
-                      \active_state$next [159] = automata_table[0];
-                  3'h1:
-                      \active_state$next [159] = automata_table[1];
-                  3'h2:
-                      \active_state$next [159] = automata_table[2];
-                  3'h3:
-                      \active_state$next [159] = automata_table[3];
-                  3'h4:
-                      \active_state$next [159] = automata_table[4];
-                  3'h5:
-                      \active_state$next [159] = automata_table[5];
-                  3'h6:
-                      \active_state$next [159] = automata_table[6];
-                  3'h7:
-                      \active_state$next [159] = automata_table[7];
-                endcase
-              end
-          endcase
+    if (video_update_stb) begin
+      if (video_active) begin
+        \active_state$next  = { active_state[0], active_state[159:1] };
+      end
+    end
+    if (line_step) begin
+      \active_state$next  = { \$1196 , \$1190 , \$1184 , \$1178 , \$1172 , \$1166 , \$1160 , \$1154 , \$1148 , \$1142 , \$1136 , \$1130 , \$1124 , \$1118 , \$1112 , \$1106 , \$1100 , \$1094 , \$1088 , \$1082 , \$1076 , \$1070 , \$1064 , \$1058 , \$1052 , \$1046 , \$1040 , \$1034 , \$1028 , \$1022 , \$1016 , \$1010 , \$1004 , \$998 , \$992 , \$986 , \$980 , \$974 , \$968 , \$962 , \$956 , \$950 , \$944 , \$938 , \$932 , \$926 , \$920 , \$914 , \$908 , \$902 , \$896 , \$890 , \$884 , \$878 , \$872 , \$866 , \$860 , \$854 , \$848 , \$842 , \$836 , \$830 , \$824 , \$818 , \$812 , \$806 , \$800 , \$794 , \$788 , \$782 , \$776 , \$770 , \$764 , \$758 , \$752 , \$746 , \$740 , \$734 , \$728 , \$722 , \$716 , \$710 , \$704 , \$698 , \$692 , \$686 , \$680 , \$674 , \$668 , \$662 , \$656 , \$650 , \$644 , \$638 , \$632 , \$626 , \$620 , \$614 , \$608 , \$602 , \$596 , \$590 , \$584 , \$578 , \$572 , \$566 , \$560 , \$554 , \$548 , \$542 , \$536 , \$530 , \$524 , \$518 , \$512 , \$506 , \$500 , \$494 , \$488 , \$482 , \$476 , \$470 , \$464 , \$458 , \$452 , \$446 , \$440 , \$434 , \$428 , \$422 , \$416 , \$410 , \$404 , \$398 , \$392 , \$386 , \$380 , \$374 , \$368 , \$362 , \$356 , \$350 , \$344 , \$338 , \$332 , \$326 , \$320 , \$314 , \$308 , \$302 , \$296 , \$290 , \$284 , \$278 , \$272 , \$266 , \$260 , \$254 , \$248 , \$242  };
+    end
+    if (need_topline_copy) begin
+      \active_state$next  = topline_state;
+    end
+    if (\rst$2 ) begin
+      \active_state$next  = 160'h0000000000000000000100000000000000000000;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \line_steps_backcopy$next  = line_steps_backcopy;
+    if (video_update_stb) begin
+      if (\$1204 ) begin
+        (* full_case = 32'd1 *)
+        if (\$1210 ) begin
+          \line_steps_backcopy$next  = 1'h1;
+        end else begin
+          \line_steps_backcopy$next  = 1'h0;
         end
-    endcase
-    casez (need_topline_copy)
-      1'h1:
-          \active_state$next  = topline_state;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \active_state$next  = 160'h0000000000000000000100000000000000000000;
-    endcase
+      end
+    end
+    if (\rst$2 ) begin
+      \line_steps_backcopy$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \speed_counter$next  = speed_counter;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                \speed_counter$next  = \$196 [7:0];
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \speed_counter$next  = 8'h00;
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        \speed_counter$next  = \$1213 [7:0];
+      end
+    end
+    if (\rst$2 ) begin
+      \speed_counter$next  = 8'h00;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \frame_frozen$next  = frame_frozen;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-              begin
-                (* full_case = 32'd1 *)
-                casez (\$200 )
-                  1'h1:
-                      \frame_frozen$next  = \$202 ;
-                  default:
-                      \frame_frozen$next  = 1'h1;
-                endcase
-                casez (need_frozen_exception)
-                  1'h1:
-                      \frame_frozen$next  = 1'h0;
-                endcase
-              end
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        (* full_case = 32'd1 *)
+        if (\$1217 ) begin
+          \frame_frozen$next  = \$1219 ;
+        end else begin
           \frame_frozen$next  = 1'h1;
-    endcase
+        end
+        if (need_frozen_exception) begin
+          \frame_frozen$next  = 1'h0;
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \frame_frozen$next  = 1'h1;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     scribble_now = 1'h0;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-              begin
-                scribble_now = 1'h0;
-                casez (\$signal )
-                  1'h1:
-                      scribble_now = 1'h1;
-                endcase
-                casez (\$signal$67 )
-                  1'h1:
-                      scribble_now = 1'h1;
-                endcase
-              end
-          endcase
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        scribble_now = 1'h0;
+        if (scribble_single_0) begin
+          scribble_now = 1'h1;
+        end
+        if (scribble_hold_0) begin
+          scribble_now = 1'h1;
+        end
+      end
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \topline_state$next  = topline_state;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-              begin
-                casez (scribble_now)
-                  1'h1:
-                      \topline_state$next [80] = 1'h1;
-                endcase
-                casez (\scribble_now$204 )
-                  1'h1:
-                      \topline_state$next [81] = 1'h0;
-                endcase
-                casez (\scribble_now$205 )
-                  1'h1:
-                    begin
-                      \topline_state$next [0] = 1'h1;
-                      \topline_state$next [33] = 1'h1;
-                      \topline_state$next [66] = 1'h1;
-                      \topline_state$next [99] = 1'h1;
-                      \topline_state$next [132] = 1'h1;
-                    end
-                endcase
-                casez (\scribble_now$206 )
-                  1'h1:
-                    begin
-                      \topline_state$next [1] = 1'h0;
-                      \topline_state$next [35] = 1'h0;
-                      \topline_state$next [69] = 1'h0;
-                      \topline_state$next [103] = 1'h0;
-                      \topline_state$next [137] = 1'h0;
-                    end
-                endcase
-              end
-          endcase
-    endcase
-    casez (need_topline_backcopy)
-      1'h1:
-          \topline_state$next  = active_state;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \topline_state$next  = 160'h0000000000000000000100000000000000000000;
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (scribble_now) begin
+          \topline_state$next [80] = 1'h1;
+        end
+        if (\scribble_now$1221 ) begin
+          \topline_state$next [81] = 1'h0;
+        end
+        if (\scribble_now$1222 ) begin
+          \topline_state$next [0] = 1'h1;
+          \topline_state$next [33] = 1'h1;
+          \topline_state$next [66] = 1'h1;
+          \topline_state$next [99] = 1'h1;
+          \topline_state$next [132] = 1'h1;
+        end
+        if (\scribble_now$1223 ) begin
+          \topline_state$next [1] = 1'h0;
+          \topline_state$next [35] = 1'h0;
+          \topline_state$next [69] = 1'h0;
+          \topline_state$next [103] = 1'h0;
+          \topline_state$next [137] = 1'h0;
+        end
+      end
+    end
+    if (need_topline_backcopy) begin
+      \topline_state$next  = active_state;
+    end
+    if (\rst$2 ) begin
+      \topline_state$next  = 160'h0000000000000000000100000000000000000000;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \scribble_now$204  = 1'h0;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-              begin
-                \scribble_now$204  = 1'h0;
-                casez (\$signal$76 )
-                  1'h1:
-                      \scribble_now$204  = 1'h1;
-                endcase
-                casez (\$signal$85 )
-                  1'h1:
-                      \scribble_now$204  = 1'h1;
-                endcase
-              end
-          endcase
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_now$1221  = 1'h0;
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        \scribble_now$1221  = 1'h0;
+        if (scribble_single_1) begin
+          \scribble_now$1221  = 1'h1;
+        end
+        if (scribble_hold_1) begin
+          \scribble_now$1221  = 1'h1;
+        end
+      end
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \scribble_now$205  = 1'h0;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-              begin
-                \scribble_now$205  = 1'h0;
-                casez (\$signal$94 )
-                  1'h1:
-                      \scribble_now$205  = 1'h1;
-                endcase
-                casez (\$signal$103 )
-                  1'h1:
-                      \scribble_now$205  = 1'h1;
-                endcase
-              end
-          endcase
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_now$1222  = 1'h0;
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        \scribble_now$1222  = 1'h0;
+        if (scribble_single_2) begin
+          \scribble_now$1222  = 1'h1;
+        end
+        if (scribble_hold_2) begin
+          \scribble_now$1222  = 1'h1;
+        end
+      end
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \scribble_now$206  = 1'h0;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-              begin
-                \scribble_now$206  = 1'h0;
-                casez (\$signal$112 )
-                  1'h1:
-                      \scribble_now$206  = 1'h1;
-                endcase
-                casez (\$signal$121 )
-                  1'h1:
-                      \scribble_now$206  = 1'h1;
-                endcase
-              end
-          endcase
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \scribble_now$1223  = 1'h0;
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        \scribble_now$1223  = 1'h0;
+        if (scribble_single_3) begin
+          \scribble_now$1223  = 1'h1;
+        end
+        if (scribble_hold_3) begin
+          \scribble_now$1223  = 1'h1;
+        end
+      end
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \automata_table$next  = automata_table;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (need_automata_next)
-                  1'h1:
-                      (* full_case = 32'd1 *)
-                      casez (automata_next)
-                        2'h0:
-                            \automata_table$next  = 8'h1e;
-                        2'h1:
-                            \automata_table$next  = 8'h6e;
-                        2'h2:
-                            \automata_table$next  = 8'h6a;
-                        2'h3:
-                            \automata_table$next  = 8'h0e;
-                      endcase
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \automata_table$next  = 8'h1e;
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (need_automata_next) begin
+          \automata_table$next  = automata_next;
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \automata_table$next  = 8'h1e;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \line_generations$next  = line_generations;
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        \line_generations$next  = line_generations_next;
+      end
+    end
+    if (\rst$2 ) begin
+      \line_generations$next  = 3'h1;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \need_topline_copy$next  = need_topline_copy;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                \need_topline_copy$next  = 1'h1;
-          endcase
-    endcase
-    casez (need_topline_copy)
-      1'h1:
-          \need_topline_copy$next  = 1'h0;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \need_topline_copy$next  = 1'h0;
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        \need_topline_copy$next  = 1'h1;
+      end
+    end
+    if (need_topline_copy) begin
+      \need_topline_copy$next  = 1'h0;
+    end
+    if (\rst$2 ) begin
+      \need_topline_copy$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \opening_countdown_timer$next  = opening_countdown_timer;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (\$207 )
-                  1'h1:
-                      \opening_countdown_timer$next  = \$210 [5:0];
-                endcase
-          endcase
-    endcase
-    casez (opening_countdown_timer_late_reset)
-      1'h1:
-          \opening_countdown_timer$next  = 6'h3f;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \opening_countdown_timer$next  = 6'h3f;
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (\$1224 ) begin
+          \opening_countdown_timer$next  = \$1227 [5:0];
+        end
+      end
+    end
+    if (opening_countdown_timer_late_reset) begin
+      \opening_countdown_timer$next  = 6'h3f;
+    end
+    if (\rst$2 ) begin
+      \opening_countdown_timer$next  = 6'h3f;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audgen_state$next  = audgen_state;
-    casez (video_update_stb)
-      1'h1:
-          casez (video_vsync_stb)
-            1'h1:
-                casez (\$212 )
-                  1'h1:
-                      \audgen_state$next  = topline_state;
-                endcase
-          endcase
-    endcase
-    casez (audgen_word_update_stb)
-      1'h1:
-          casez (\$214 )
-            1'h1:
-                casez (audio_divide_stb)
-                  1'h1:
-                      \audgen_state$next  = { audgen_state[0], audgen_state[159:1] };
-                endcase
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_state$next  = 160'h0000000000000000000100000000000000000000;
-    endcase
+    if (video_update_stb) begin
+      if (video_vsync_stb) begin
+        if (\$1229 ) begin
+          \audgen_state$next  = topline_state;
+        end
+      end
+    end
+    if (audgen_word_update_stb) begin
+      if (\$1231 ) begin
+        if (audio_divide_stb) begin
+          \audgen_state$next  = { audgen_state[0], audgen_state[159:1] };
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \audgen_state$next  = 160'h0000000000000000000100000000000000000000;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audgen_dac$next  = audgen_dac;
-    casez (audgen_bit_update_stb)
-      1'h1:
-          \audgen_dac$next  = \$224 ;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_dac$next  = 1'h0;
-    endcase
+    if (audgen_bit_update_stb) begin
+      \audgen_dac$next  = \$1241 ;
+    end
+    if (\rst$2 ) begin
+      \audgen_dac$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audio_divide_counter$next  = audio_divide_counter;
-    casez (audgen_word_update_stb)
-      1'h1:
-          casez (\$226 )
-            1'h1:
-                \audio_divide_counter$next  = \$231 [1:0];
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audio_divide_counter$next  = 2'h3;
-    endcase
+    if (audgen_word_update_stb) begin
+      if (\$1243 ) begin
+        \audio_divide_counter$next  = \$1248 [1:0];
+      end
+    end
+    if (\rst$2 ) begin
+      \audio_divide_counter$next  = 2'h3;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \video_vs$next  = video_vs;
-    casez (video_update_stb)
-      1'h1:
-          \video_vs$next  = \$237 ;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \video_vs$next  = 1'h0;
-    endcase
+    if (video_update_stb) begin
+      \video_vs$next  = \$1254 ;
+    end
+    if (\rst$2 ) begin
+      \video_vs$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \video_hs$next  = video_hs;
-    casez (video_update_stb)
-      1'h1:
-          \video_hs$next  = \$239 ;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \video_hs$next  = 1'h0;
-    endcase
+    if (video_update_stb) begin
+      \video_hs$next  = \$1256 ;
+    end
+    if (\rst$2 ) begin
+      \video_hs$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \video_x_count$next  = video_x_count;
-    casez (video_update_stb)
-      1'h1:
-        begin
-          \video_x_count$next  = \$242 [9:0];
-          casez (\$244 )
-            1'h1:
-                \video_x_count$next  = 10'h000;
-          endcase
-        end
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \video_x_count$next  = 10'h000;
-    endcase
+    if (video_update_stb) begin
+      \video_x_count$next  = \$1259 [9:0];
+      if (\$1261 ) begin
+        \video_x_count$next  = 10'h000;
+      end
+    end
+    if (\rst$2 ) begin
+      \video_x_count$next  = 10'h000;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \video_y_count$next  = video_y_count;
-    casez (video_update_stb)
-      1'h1:
-          casez (\$246 )
-            1'h1:
-              begin
-                \video_y_count$next  = \$249 [9:0];
-                casez (\$251 )
-                  1'h1:
-                      \video_y_count$next  = 10'h000;
-                endcase
-              end
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
+    if (video_update_stb) begin
+      if (\$1263 ) begin
+        \video_y_count$next  = \$1266 [9:0];
+        if (\$1268 ) begin
           \video_y_count$next  = 10'h000;
-    endcase
+        end
+      end
+    end
+    if (\rst$2 ) begin
+      \video_y_count$next  = 10'h000;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \video_de$next  = video_de;
-    casez (video_update_stb)
-      1'h1:
-          \video_de$next  = video_active;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \video_de$next  = 1'h0;
-    endcase
+    if (video_update_stb) begin
+      \video_de$next  = video_active;
+    end
+    if (\rst$2 ) begin
+      \video_de$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
-    \audgen_accum$next  = \$254 [21:0];
-    casez (audgen_mclk_stb)
-      1'h1:
-          \audgen_accum$next  = \$259 [21:0];
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_accum$next  = 22'h0b5464;
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \audgen_accum$next  = \$1271 [21:0];
+    if (audgen_mclk_stb) begin
+      \audgen_accum$next  = \$1276 [21:0];
+    end
+    if (\rst$2 ) begin
+      \audgen_accum$next  = 22'h0b5464;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audgen_mclk$next  = audgen_mclk;
-    casez (audgen_mclk_stb)
-      1'h1:
-          \audgen_mclk$next  = \$263 ;
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_mclk$next  = 1'h0;
-    endcase
+    if (audgen_mclk_stb) begin
+      \audgen_mclk$next  = \$1280 ;
+    end
+    if (\rst$2 ) begin
+      \audgen_mclk$next  = 1'h0;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audgen_slck_update$next  = 1'h0;
-    casez (\$269 )
-      1'h1:
-          casez (\$271 )
-            1'h1:
-                \audgen_slck_update$next  = 1'h1;
-          endcase
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_slck_update$next  = 1'h1;
-    endcase
+    if (\$1286 ) begin
+      if (\$1288 ) begin
+        \audgen_slck_update$next  = 1'h1;
+      end
+    end
+    if (\rst$2 ) begin
+      \audgen_slck_update$next  = 1'h1;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audgen_slck_count$next  = audgen_slck_count;
-    casez (\$275 )
-      1'h1:
-          \audgen_slck_count$next  = \$278 [1:0];
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_slck_count$next  = 2'h3;
-    endcase
+    if (\$1292 ) begin
+      \audgen_slck_count$next  = \$1295 [1:0];
+    end
+    if (\rst$2 ) begin
+      \audgen_slck_count$next  = 2'h3;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \audgen_lrck_count$next  = audgen_lrck_count;
-    casez (\$282 )
-      1'h1:
-          \audgen_lrck_count$next  = \$285 [7:0];
-    endcase
-    casez (\rst$2 )
-      1'h1:
-          \audgen_lrck_count$next  = 8'h00;
-    endcase
+    if (\$1299 ) begin
+      \audgen_lrck_count$next  = \$1302 [7:0];
+    end
+    if (\rst$2 ) begin
+      \audgen_lrck_count$next  = 8'h00;
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     audgen_word_update_stb = 1'h0;
-    casez (audgen_slck_update)
-      1'h1:
-          casez (\$287 )
-            1'h1:
-                audgen_word_update_stb = 1'h1;
-          endcase
-    endcase
+    if (audgen_slck_update) begin
+      if (\$1304 ) begin
+        audgen_word_update_stb = 1'h1;
+      end
+    end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2083:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     audgen_bit_update_stb = 1'h0;
-    casez (audgen_slck_update)
-      1'h1:
-          audgen_bit_update_stb = 1'h1;
-    endcase
+    if (audgen_slck_update) begin
+      audgen_bit_update_stb = 1'h1;
+    end
   end
-  assign \$195  = \$196 ;
-  assign \$209  = \$210 ;
-  assign \$230  = \$231 ;
-  assign \$241  = \$242 ;
-  assign \$248  = \$249 ;
-  assign \$253  = \$254 ;
-  assign \$256  = \$259 ;
-  assign \$277  = \$278 ;
-  assign \$284  = \$285 ;
+  assign \$224  = \$225 ;
+  assign \$235  = \$236 ;
+  assign \$1212  = \$1213 ;
+  assign \$1226  = \$1227 ;
+  assign \$1247  = \$1248 ;
+  assign \$1258  = \$1259 ;
+  assign \$1265  = \$1266 ;
+  assign \$1270  = \$1271 ;
+  assign \$1273  = \$1276 ;
+  assign \$1294  = \$1295 ;
+  assign \$1301  = \$1302 ;
   assign audio_lrck = audgen_lrck;
   assign audio_dac = audgen_dac;
   assign audio_mclk = audgen_mclk;
@@ -4486,23 +2404,24 @@ module amaranth_core(audio_dac, audio_lrck, audio_mclk, clk, cont1_joy, cont1_ke
   assign audgen_channel_internal = audgen_lrck_count[5:2];
   assign audgen_channel_select = audgen_lrck;
   assign audgen_lrck = audgen_lrck_count[7];
-  assign audgen_slck = \$265 ;
-  assign audgen_mclk_stb = \$261 ;
+  assign audgen_slck = \$1282 ;
+  assign audgen_mclk_stb = \$1278 ;
   assign audio_high = audgen_state[0];
-  assign audio_divide_stb = \$220 ;
-  assign audio_output_word_bit = \$218 ;
-  assign opening_wants_frozen = \$171 ;
-  assign \release$166  = \$169 ;
-  assign \press$161  = \$164 ;
-  assign \hold$160  = cont1_key[1];
-  assign \release$155  = \$158 ;
-  assign \press$150  = \$153 ;
-  assign \hold$149  = cont1_key[3];
-  assign \release$144  = \$147 ;
-  assign \press$139  = \$142 ;
-  assign \hold$138  = cont1_key[2];
-  assign \release  = \$136 ;
-  assign press = \$132 ;
+  assign audio_divide_stb = \$1237 ;
+  assign audio_output_word_bit = \$1235 ;
+  assign opening_wants_frozen = \$188 ;
+  assign display_cell = active_state[0];
+  assign \release$159  = \$162 ;
+  assign \press$154  = \$157 ;
+  assign \hold$153  = cont1_key[1];
+  assign \release$148  = \$151 ;
+  assign \press$143  = \$146 ;
+  assign \hold$142  = cont1_key[3];
+  assign \release$137  = \$140 ;
+  assign \press$132  = \$135 ;
+  assign \hold$131  = cont1_key[2];
+  assign \release  = \$129 ;
+  assign press = \$125 ;
   assign hold = cont1_key[0];
   assign r_press = \$53 ;
   assign l_press = \$49 ;
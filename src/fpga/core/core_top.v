@@ -319,7 +319,7 @@ always @(*) begin
     32'h10xxxxxx: begin
         // example
         // bridge_rd_data <= example_device_data;
-        bridge_rd_data <= 0;
+        bridge_rd_data <= ac_bridge_rd_data;
     end
     32'hF8xxxxxx: begin
         bridge_rd_data <= cmd_bridge_rd_data;
@@ -333,6 +333,7 @@ end
     wire            reset_n;                // driven by host commands, can be used as core-wide reset
     wire            init_done;
     wire    [31:0]  cmd_bridge_rd_data;
+    wire    [31:0]  ac_bridge_rd_data;
     
 // bridge host commands
 // synchronous to clk_74a
@@ -496,22 +497,28 @@ core_bridge_cmd icb (
 
 wire pll_outclk_0;
 wire pll_outclk_1;
+wire pll_outclk_2; // Compute clock, clk_74a / COMPUTE_CLK_RATIO (toplevel.py)
+// Always generated and wired to amaranth_core, even when nothing uses it (USE_COMPUTE_DOMAIN off, the
+// default), so that turning it on needs no change here or in core_constraints.sdc
 altera_pll #(
     .fractional_vco_multiplier ( "true"          ),
     .reference_clock_frequency ( "74.25 MHz"     ),
     .operation_mode            ( "direct"        ),
-    .number_of_clocks          ( 2               ),
+    .number_of_clocks          ( 3               ),
     .output_clock_frequency0   ( "1.237500 MHz" ),
     .phase_shift0              ( "0 ps"          ),
     .duty_cycle0               ( 50              ),
     .output_clock_frequency1   ( "1.237500 MHz" ),
     .phase_shift1              ( "202020.202 ps" ),
     .duty_cycle1               ( 50              ),
+    .output_clock_frequency2   ( "37.125000 MHz" ),
+    .phase_shift2              ( "0 ps"          ),
+    .duty_cycle2               ( 50              ),
     .pll_type                  ( "General"       ),
     .pll_subtype               ( "General"       )
 ) altera_pll_i (
     .rst      ( ~reset_n             ),
-    .outclk   ( {pll_outclk_0, pll_outclk_1} ),
+    .outclk   ( {pll_outclk_2, pll_outclk_0, pll_outclk_1} ),
     .locked   (                      ),
     .fboutclk (                      ),
     .fbclk    ( 1'b0                 ),
@@ -559,6 +566,7 @@ amaranth_core ac (
 
     .pll_clk_0          ( pll_outclk_0 ),
     .pll_clk_1          ( pll_outclk_1 ),
+    .pll_clk_2          ( pll_outclk_2 ),
 
 // output  wire            audio_clk,
 // output  wire            audio_wsel,
@@ -594,7 +602,19 @@ amaranth_core ac (
     .cont1_trig         ( cont1_trig ),
     .cont2_trig         ( cont2_trig ),
     .cont3_trig         ( cont3_trig ),
-    .cont4_trig         ( cont4_trig )
+    .cont4_trig         ( cont4_trig ),
+
+// input   wire    [31:0]  bridge_addr,
+// input   wire            bridge_rd,
+// output  wire    [31:0]  bridge_rd_data,
+// input   wire            bridge_wr,
+// input   wire    [31:0]  bridge_wr_data,
+
+    .bridge_addr        ( bridge_addr ),
+    .bridge_rd          ( bridge_rd ),
+    .bridge_rd_data     ( ac_bridge_rd_data ),
+    .bridge_wr          ( bridge_wr ),
+    .bridge_wr_data     ( bridge_wr_data )
 
 );
 